@@ -816,7 +816,10 @@ def status(ctx, task_id: str, verbose: bool):
         "(TASK-AB-WAVECTL01). The feature-YAML tier may only LOWER the "
         "auto-detect result, never raise it. Auto-detect defaults to 1 for "
         "local backends (TASK-VPT-001: reduced from 2 due to KV cache "
-        "contention; the YAML cannot raise this cap), unlimited otherwise."
+        "contention; the YAML cannot raise this cap), unlimited otherwise. "
+        "The LLM gate sets no in-flight ceiling by default; an explicit "
+        "GUARDKIT_LLM_MAX_INFLIGHT_<PROVIDER> below this value makes the "
+        "extra tasks wait for a slot (warned at wave start)."
     ),
 )
 @click.option(
@@ -829,6 +832,18 @@ def status(ctx, task_id: str, verbose: bool):
         "'dynamic' checks GPU memory before each wave (TASK-VRF-006)."
     ),
 )
+@click.option(
+    "--scheduler",
+    "scheduler",
+    default=None,
+    type=click.Choice(["waves", "dag"]),
+    help=(
+        "Task scheduler: 'waves' runs parallel_groups behind a barrier per "
+        "wave (default); 'dag' starts each task as soon as its dependencies "
+        "finish, longest critical path first, with the post-wave gates as "
+        "per-frontier checkpoints. Default from GUARDKIT_FEATURE_SCHEDULER."
+    ),
+)
 @click.option(
     "--skip-validation",
     "skip_validation",
@@ -901,6 +916,7 @@ def feature(
     timeout_multiplier: Optional[float],
     max_parallel: Optional[int],
     max_parallel_strategy: str,
+    scheduler: Optional[str],
     skip_validation: bool,
     task_log_interval: int,
     bootstrap_failure_mode: Optional[str],
@@ -1093,6 +1109,7 @@ def feature(
             honesty_early_abort_window=honesty_early_abort_window,
             model=model,  # TASK-FIX-LGFM: thread --model to per-task AutoBuildOrchestrator (load-bearing for LangGraph)
             coach_model=coach_model,  # TASK-FIX-COACHBUDG01: optional per-role override for Coach
+            scheduler=scheduler,
         )
 
         # Resolve base branch: --base-branch > cwd HEAD > "main" (TASK-FIX-WTBC)
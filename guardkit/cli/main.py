@@ -27,6 +27,7 @@ from guardkit.cli.system_context import context_switch
 from guardkit.cli.task import task
 from guardkit.cli.task_review import task_review
 from guardkit.cli.task_work import task_work
+from guardkit.cli.telemetry import telemetry
 from guardkit.cli.template import template
 
 # Load .env files automatically
@@ -141,6 +142,9 @@ cli.add_command(task_review)
 # autobuild machinery (delegation, never a second distillation).
 cli.add_command(task_work)
 
+# Add Telemetry command group (columnar event store + cross-run queries)
+cli.add_command(telemetry)
+
 # Add Template command group (deterministic render+parse gate, DIM1-F4/PB-8)
 cli.add_command(template)
 
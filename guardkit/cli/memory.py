@@ -3,12 +3,14 @@
 Commands:
 - memory harvest: Harvest documentation episodes and publish to NATS
 - memory harvest --dry-run: Preview harvest without NATS connection
+- memory harvest --incremental: Publish only new/changed docs (local manifest)
 
 Example:
     $ guardkit memory harvest
     $ guardkit memory harvest --dry-run
     $ guardkit memory harvest --docs-root /path/to/docs
     $ guardkit memory harvest --env-file /path/to/.env
+    $ guardkit memory harvest --incremental
 """
 
 from __future__ import annotations
@@ -38,21 +40,37 @@ from rich.table import Table
 # .claude/rules/uv-sources-must-survive-every-install-path.md.
 try:
     from guardkit.memory.harvest_walker import walk_harvest_dirs
-    from guardkit.memory.harvest_publisher import publish_episodes
+    from guardkit.memory.harvest_publisher import (
+        publish_episode_batches,
+        publish_episodes,
+    )
     from guardkit.memory.graph_export import (
-        build_export_episodes,
-        read_falkordb_episodics,
+        ExportCheckpoint,
+        GraphExportResult,
+        default_checkpoint_path,
+        export_episode_batches,
+        falkordb_page_reader,
+        list_export_graphs,
+        stream_export_batches,
     )
 except ImportError as _memory_import_exc:  # optional `memory` extra not installed
     walk_harvest_dirs = None  # type: ignore[assignment]
     publish_episodes = None  # type: ignore[assignment]
-    build_export_episodes = None  # type: ignore[assignment]
-    read_falkordb_episodics = None  # type: ignore[assignment]
+    publish_episode_batches = None  # type: ignore[assignment]
+    ExportCheckpoint = None  # type: ignore[assignment,misc]
+    GraphExportResult = None  # type: ignore[assignment,misc]
+    default_checkpoint_path = None  # type: ignore[assignment]
+    export_episode_batches = None  # type: ignore[assignment]
+    falkordb_page_reader = None  # type: ignore[assignment]
+    list_export_graphs = None  # type: ignore[assignment]
+    stream_export_batches = None  # type: ignore[assignment]
     _MEMORY_IMPORT_ERROR = _memory_import_exc
 else:
     _MEMORY_IMPORT_ERROR = None
 
 from guardkit.knowledge.fleet_memory_client import get_memory_client
+from guardkit.memory.harvest_manifest import HarvestManifest, default_manifest_path
+from guardkit.memory.harvest_taxonomy import natural_key_for
 from guardkit.knowledge.outcome_manager import capture_task_outcome_verified
 from guardkit.knowledge.entities.outcome import OutcomeType
 
@@ -157,6 +175,34 @@ def _format_counts_table(counts: dict[str, int]) -> Table:
     return table
 
 
+def _advance_manifest(manifest: HarvestManifest, harvest_result, publish_summary) -> None:
+    """Record a successful incremental publish in the harvest manifest.
+
+    The publisher reports counts, not which episodes it skipped, so a run that
+    did not publish every episode leaves the manifest untouched: the next
+    incremental run then retries the same set instead of forgetting a doc.
+
+    Args:
+        manifest: Manifest the walk was diffed against.
+        harvest_result: HarvestResult from the incremental walk.
+        publish_summary: PublishSummary from publish_episodes.
+    """
+    if publish_summary.published != len(harvest_result.episodes):
+        console.print(
+            "[yellow]⚠[/yellow] Not every episode was published; harvest manifest "
+            "left unchanged so the next --incremental run retries them"
+        )
+        return
+
+    for episode in harvest_result.episodes:
+        manifest.record(
+            natural_key_for(episode.source_ref, episode.episode_type), episode
+        )
+    manifest.tombstone(harvest_result.tombstones)
+    path = manifest.save()
+    logger.info("Updated harvest manifest %s", path)
+
+
 # ============================================================================
 # Memory Command Group
 # ============================================================================
@@ -195,7 +241,27 @@ def memory():
     default=None,
     help="Path to .env file for NATS credentials (optional)",
 )
-def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Publish only new or changed docs, diffed against the local harvest manifest "
+    "(deleted docs are tombstoned locally only; nothing is unpublished)",
+)
+@click.option(
+    "--manifest",
+    "manifest_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Harvest manifest for --incremental "
+    "(default: $GUARDKIT_HARVEST_MANIFEST or <repo>/.guardkit/harvest-manifest.json)",
+)
+def harvest(
+    dry_run: bool,
+    docs_root: Path | None,
+    env_file: Path | None,
+    incremental: bool,
+    manifest_path: Path | None,
+):
     """Harvest documentation episodes and publish to NATS.
 
     Walks the curated harvest directories (docs/features/, docs/guides/, etc.),
@@ -208,6 +274,12 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
     Without --dry-run, runs walker then publisher. Requires GUARDKIT_NATS_PASSWORD
     environment variable or --env-file.
 
+    With --incremental, docs whose content matches the local harvest manifest
+    are skipped, and docs that were published but no longer exist are reported
+    as tombstones. The manifest is only updated after a successful publish.
+    Tombstones are local only: the episode schema has no deletion, so nothing
+    is published for a deleted doc and fleet-memory keeps its last episode.
+
     Examples:
         # Dry run (no NATS connection)
         guardkit memory harvest --dry-run
@@ -217,6 +289,9 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
 
         # Use custom env file for credentials
         guardkit memory harvest --env-file /path/to/.env
+
+        # Nightly: publish only what changed since the last harvest
+        guardkit memory harvest --incremental
     """
     # nats-core (the `memory` extra) is optional — see module header note.
     if _MEMORY_IMPORT_ERROR is not None:
@@ -241,8 +316,19 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
     # === Walker Phase ===
     console.print("\n[bold cyan]Walking harvest directories...[/bold cyan]\n")
 
+    manifest: HarvestManifest | None = None
+    if incremental:
+        manifest = HarvestManifest.load(
+            manifest_path or default_manifest_path(docs_root)
+        )
+        logger.info(
+            "Incremental harvest against %s (%d entries)",
+            manifest.path,
+            len(manifest.entries),
+        )
+
     try:
-        harvest_result = walk_harvest_dirs(docs_root)
+        harvest_result = walk_harvest_dirs(docs_root, manifest=manifest)
     except Exception as e:
         console.print(f"[red]Walker error:[/red] {e}")
         logger.exception("Walker failed")
@@ -251,6 +337,19 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
     # Print walker summary
     console.print(f"[green]✓[/green] Harvested {len(harvest_result.episodes)} episodes")
 
+    if manifest is not None:
+        console.print(
+            f"[green]✓[/green] Unchanged since last publish: {harvest_result.unchanged}"
+        )
+        if harvest_result.tombstones:
+            console.print(
+                f"[yellow]⚠[/yellow] Tombstoned {len(harvest_result.tombstones)} "
+                f"deleted documents in the local manifest only — no deletion is "
+                f"published; their last episodes stay in fleet-memory"
+            )
+            for key in harvest_result.tombstones:
+                logger.info("Tombstone (local only): %s", key)
+
     if harvest_result.skipped_empty > 0:
         console.print(
             f"[yellow]⚠[/yellow] Skipped {harvest_result.skipped_empty} empty documents"
@@ -277,6 +376,14 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
         console.print("\n[bold green]Dry run complete[/bold green] (no NATS publish)\n")
         sys.exit(0)
 
+    if manifest is not None and not harvest_result.episodes:
+        # Nothing to send: don't open a NATS connection just to record deletions.
+        if harvest_result.tombstones:
+            manifest.tombstone(harvest_result.tombstones)
+            manifest.save()
+        console.print("\n[bold green]Harvest complete[/bold green] (nothing changed)\n")
+        sys.exit(0)
+
     # === Publisher Phase ===
     console.print("\n[bold cyan]Publishing episodes to NATS...[/bold cyan]\n")
 
@@ -314,6 +421,9 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
         pub_counts_table = _format_counts_table(publish_summary.counts_per_type)
         console.print(pub_counts_table)
 
+    if manifest is not None:
+        _advance_manifest(manifest, harvest_result, publish_summary)
+
     console.print("\n[bold green]Harvest complete[/bold green]\n")
 
     # Exit 0 on success (including when oversized docs were skipped)
@@ -364,6 +474,31 @@ def harvest(dry_run: bool, docs_root: Path | None, env_file: Path | None):
     default=None,
     help="Path to .env file for NATS + FalkorDB credentials (optional).",
 )
+@click.option(
+    "--workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Graphs read concurrently (default: 4).",
+)
+@click.option(
+    "--page-size",
+    default=500,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Episodic nodes read and published per batch.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Resume checkpoint (default: ~/.guardkit/graph-export/<host>_<port>.json).",
+)
+@click.option(
+    "--restart",
+    is_flag=True,
+    help="Ignore any saved checkpoint and export every graph from the start.",
+)
 def migrate_graph(
     project: str,
     all_projects: bool,
@@ -372,6 +507,10 @@ def migrate_graph(
     dry_run: bool,
     limit: int | None,
     env_file: Path | None,
+    workers: int | None,
+    page_size: int,
+    checkpoint_path: Path | None,
+    restart: bool,
 ):
     """Migrate FalkorDB (Graphiti) Episodic prose to fleet-memory as scoped documents.
 
@@ -382,7 +521,13 @@ def migrate_graph(
     pure-embeddings). Idempotent: re-runs dedup server-side on the natural key.
 
     With --dry-run, only reads + builds (reports counts); no NATS. Without it, publishes
-    (requires GUARDKIT_NATS_PASSWORD).
+    (requires GUARDKIT_NATS_PASSWORD once there is something to send; a run with
+    nothing left to publish never connects).
+
+    Graphs are read concurrently and streamed page by page into the publisher, so
+    memory stays flat however large the graphs are. Progress is checkpointed per
+    published batch: an interrupted migration resumes where it stopped (--restart
+    to start over); a migration that finishes clears its checkpoint.
 
     RELAY REBUILD REQUIRED first: DocumentPayload.content (FEAT-MEM-09 WS-1a) is only
     stored by a rebuilt relay image; an older relay SILENTLY DROPS content.
@@ -393,8 +538,8 @@ def migrate_graph(
         guardkit memory migrate-graph --all-projects      # fleet-wide
     """
     # nats-core (`memory` extra) is optional — see module header note. falkordb
-    # (`falkordb` extra) is imported lazily inside read_falkordb_episodics and
-    # surfaces as a "FalkorDB read error" below if absent.
+    # (`falkordb` extra) is imported lazily here and surfaces as a "FalkorDB read
+    # error" below if absent.
     if _MEMORY_IMPORT_ERROR is not None:
         _memory_extra_missing(_MEMORY_IMPORT_ERROR)
 
@@ -412,20 +557,74 @@ def migrate_graph(
     )
 
     try:
-        graphs = list(
-            read_falkordb_episodics(
-                fdb_host, fdb_port, project_filter=project_filter, limit_per_graph=limit
-            )
-        )
+        from falkordb import FalkorDB
+
+        db = FalkorDB(host=fdb_host, port=fdb_port)
+        graph_names = list_export_graphs(db, project_filter)
     except Exception as e:
         console.print(f"[red]FalkorDB read error:[/red] {e}")
         logger.exception("FalkorDB read failed")
         sys.exit(1)
 
-    result = build_export_episodes(graphs)
+    # Dry runs never checkpoint: they publish nothing, so there is nothing to resume.
+    checkpoint = None
+    if not dry_run:
+        checkpoint = ExportCheckpoint.load(
+            checkpoint_path or default_checkpoint_path(fdb_host, fdb_port)
+        )
+        if restart:
+            checkpoint.clear()
+        elif checkpoint.graphs:
+            console.print(
+                f"[cyan]Resuming from checkpoint[/cyan] {checkpoint.path} "
+                f"({sum(checkpoint.is_done(g) for g in graph_names)} of "
+                f"{len(graph_names)} graph(s) already migrated)"
+            )
+
+    result = GraphExportResult()
+    batches = export_episode_batches(
+        stream_export_batches(
+            graph_names,
+            falkordb_page_reader(db),
+            page_size=page_size,
+            workers=workers,
+            checkpoint=checkpoint,
+            limit_per_graph=limit,
+        ),
+        result,
+        checkpoint,
+    )
+
+    publish_summary = None
+    if dry_run:
+        for _batch in batches:
+            pass
+    else:
+        console.print(
+            "[yellow]⚠ Ensure the fleet-memory relay was rebuilt with "
+            "DocumentPayload.content (WS-1a), else content is silently dropped.[/yellow]"
+        )
+        console.print("\n[bold cyan]Publishing episodes to NATS...[/bold cyan]\n")
+        try:
+            publish_summary = asyncio.run(publish_episode_batches(batches, client=None))
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            console.print(
+                "\n[yellow]Tip:[/yellow] Set GUARDKIT_NATS_PASSWORD or use --env-file"
+            )
+            sys.exit(1)
+        except Exception as e:
+            console.print(f"[red]Publisher error:[/red] {e}")
+            logger.exception("Publisher failed")
+            if checkpoint is not None:
+                console.print(
+                    f"[yellow]Progress saved to {checkpoint.path}; re-run to resume.[/yellow]"
+                )
+            sys.exit(1)
 
+    built = sum(result.counts_per_project.values())
     console.print(
-        f"[green]✓[/green] Built {len(result.episodes)} document episodes "
+        f"[green]✓[/green] Built {built} document episodes "
         f"from {result.graphs_scanned} graph(s)"
     )
     console.print(
@@ -441,35 +640,22 @@ def migrate_graph(
         console.print("\n[bold green]Dry run complete[/bold green] (no NATS publish)\n")
         sys.exit(0)
 
-    if not result.episodes:
+    if not built:
         console.print("\n[yellow]No episodes to publish.[/yellow]\n")
-        sys.exit(0)
-
-    console.print(
-        "\n[yellow]⚠ Ensure the fleet-memory relay was rebuilt with "
-        "DocumentPayload.content (WS-1a), else content is silently dropped.[/yellow]"
-    )
-    console.print("\n[bold cyan]Publishing episodes to NATS...[/bold cyan]\n")
-
-    try:
-        publish_summary = asyncio.run(publish_episodes(result.episodes, client=None))
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        console.print(
-            "\n[yellow]Tip:[/yellow] Set GUARDKIT_NATS_PASSWORD or use --env-file"
-        )
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]Publisher error:[/red] {e}")
-        logger.exception("Publisher failed")
-        sys.exit(1)
-
-    console.print(f"[green]✓[/green] Published {publish_summary.published} episodes")
+    else:
+        console.print(f"[green]✓[/green] Published {publish_summary.published} episodes")
     if publish_summary.skipped_oversized > 0:
         console.print(
             f"[yellow]⚠[/yellow] Skipped {publish_summary.skipped_oversized} "
             f"oversized episodes during publish"
         )
+    if result.graphs_failed:
+        console.print(
+            f"[yellow]⚠[/yellow] {result.graphs_failed} graph(s) could not be read; "
+            f"re-run to resume them from {checkpoint.path}"
+        )
+    elif all(checkpoint.is_done(g) for g in graph_names):
+        checkpoint.clear()
     console.print("\n[bold green]Graph migration complete[/bold green]\n")
     sys.exit(0)
 
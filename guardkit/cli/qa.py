@@ -418,6 +418,12 @@ def _today() -> str:
 )
 @click.option("--base", default=None, help="Git base ref for revert-hunk / file derivation.")
 @click.option("--timeout", default=600, show_default=True, help="Per-mutant test timeout (s).")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Mutants run concurrently (default: GUARDKIT_MUTATION_WORKERS or min(8, CPUs)).",
+)
 @click.option("--no-file", "no_file", is_flag=True, default=False, help="Do not write finding files.")
 @click.option(
     "--strict",
@@ -433,6 +439,7 @@ def mutate(
     operators: tuple[str, ...],
     base: str | None,
     timeout: int,
+    workers: int | None,
     no_file: bool,
     strict: bool,
 ) -> None:
@@ -459,6 +466,7 @@ def mutate(
             operators=list(operators),
             base=base,
             timeout=timeout,
+            workers=workers,
         )
     except MutationError as exc:
         console.print("[bold red]✗ mutation stage could not run[/bold red]", highlight=False)
@@ -700,6 +708,8 @@ def review(
     )
     from guardkit.qa.review_seat import (
         DEFAULT_SEAT,
+        REVIEW_INGEST_MAX_FILE_CHARS,
+        REVIEW_INGEST_MAX_TOTAL_CHARS,
         is_review_seat_enabled,
         run_advisory_review,
     )
@@ -755,19 +765,23 @@ def review(
 
     # Build the review subject (the one genuinely-new S-1 piece). A range that
     # cannot be read is a loud config error (exit 2) — never a faked empty review.
+    caps = {
+        "max_file_chars": REVIEW_INGEST_MAX_FILE_CHARS,
+        "max_total_chars": REVIEW_INGEST_MAX_TOTAL_CHARS,
+    }
     try:
         if base is not None:
-            payload = ingest_range(Path(repo_root), base, head)
+            payload = ingest_range(Path(repo_root), base, head, **caps)
         elif commit is not None:
-            payload = ingest_commit(Path(repo_root), commit)
+            payload = ingest_commit(Path(repo_root), commit, **caps)
         elif merge is not None:
-            payload = ingest_merge(Path(repo_root), merge)
+            payload = ingest_merge(Path(repo_root), merge, **caps)
         elif staged:
-            payload = ingest_working_tree(Path(repo_root), scope="staged")
+            payload = ingest_working_tree(Path(repo_root), scope="staged", **caps)
         elif unstaged:
-            payload = ingest_working_tree(Path(repo_root), scope="unstaged")
+            payload = ingest_working_tree(Path(repo_root), scope="unstaged", **caps)
         else:
-            payload = ingest_working_tree(Path(repo_root), scope="all")
+            payload = ingest_working_tree(Path(repo_root), scope="all", **caps)
     except DiffIngestError as exc:
         console.print("[bold red]✗ could not read the review subject[/bold red]", highlight=False)
         console.print(str(exc), highlight=False)
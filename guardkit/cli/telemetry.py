@@ -0,0 +1,206 @@
+"""``guardkit telemetry`` — compact and query AutoBuild instrumentation events.
+
+Commands:
+- telemetry compact: Convert finished runs' events.jsonl into events.parquet
+- telemetry query: Aggregate tokens, latency p50/p95, cost and error classes
+
+Example:
+    $ guardkit telemetry compact
+    $ guardkit telemetry query --by model --since 2026-07-01
+    $ guardkit telemetry query ~/.guardkit/archive/myrepo --price my-model=3:15
+    $ guardkit telemetry query --json
+
+Both commands default to ``.guardkit/autobuild`` and accept any number of
+event files or directories (searched recursively). ``query`` reads a run's
+``events.parquet`` when it is up to date and falls back to ``events.jsonl``
+otherwise, so it works on a base install; ``compact`` needs the optional
+``telemetry`` extra (pyarrow).
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from guardkit.orchestrator.instrumentation.event_store import (
+    EVENTS_JSONL,
+    GROUP_BY_FIELDS,
+    aggregate_events,
+    compact_events,
+    discover_event_sources,
+    parquet_is_fresh,
+    parse_price,
+)
+
+console = Console()
+
+_DEFAULT_ROOT = Path(".guardkit") / "autobuild"
+
+
+def _telemetry_extra_missing(exc: ImportError) -> None:
+    """Print an actionable message for missing pyarrow and exit. Never returns."""
+    console.print(f"[red]Error:[/red] {exc}")
+    console.print(
+        r"[yellow]Install it with:[/yellow] pip install 'guardkit-py\[telemetry]'"
+    )
+    sys.exit(1)
+
+
+def _fmt(value: Optional[float], spec: str = ",.0f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+@click.group()
+def telemetry() -> None:
+    """AutoBuild telemetry: compact event logs and aggregate across runs."""
+
+
+@telemetry.command()
+@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Rewrite events.parquet even when it is already up to date.",
+)
+def compact(paths: Tuple[Path, ...], force: bool) -> None:
+    """Compact events.jsonl files under PATHS into columnar events.parquet.
+
+    PATHS default to .guardkit/autobuild. The JSONL files are kept.
+    """
+    roots = list(paths) or [_DEFAULT_ROOT]
+    events_dirs = sorted(
+        {p.parent for root in roots if root.is_dir() for p in root.rglob(EVENTS_JSONL)}
+    )
+    if not events_dirs:
+        console.print("[yellow]No events.jsonl files found.[/yellow]")
+        return
+
+    table = Table(title="Telemetry compaction")
+    table.add_column("Run directory")
+    table.add_column("Events", justify="right")
+    table.add_column("JSONL", justify="right")
+    table.add_column("Parquet", justify="right")
+    for events_dir in events_dirs:
+        if not force and parquet_is_fresh(events_dir):
+            table.add_row(str(events_dir), "up to date", "", "")
+            continue
+        try:
+            result = compact_events(events_dir)
+        except ImportError as exc:
+            _telemetry_extra_missing(exc)
+        table.add_row(
+            str(events_dir),
+            f"{result.rows:,}",
+            f"{result.source_bytes:,}",
+            f"{result.output_bytes:,}",
+        )
+    console.print(table)
+
+
+@telemetry.command()
+@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.option(
+    "--by",
+    "group_by",
+    type=click.Choice(GROUP_BY_FIELDS),
+    default="model",
+    show_default=True,
+    help="Field to group LLM usage by.",
+)
+@click.option(
+    "--since",
+    default=None,
+    help="Only events with an ISO timestamp at or after this (e.g. 2026-07-01).",
+)
+@click.option(
+    "--price",
+    "price_specs",
+    multiple=True,
+    metavar="MODEL=IN:OUT",
+    help="USD per million input:output tokens for MODEL (repeatable).",
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit the report as JSON.")
+def query(
+    paths: Tuple[Path, ...],
+    group_by: str,
+    since: Optional[str],
+    price_specs: Tuple[str, ...],
+    as_json: bool,
+) -> None:
+    """Aggregate tokens, latency, cost and error classes across runs.
+
+    PATHS (files or directories) default to .guardkit/autobuild.
+    """
+    prices: Dict[str, Tuple[float, float]] = {}
+    for spec in price_specs:
+        try:
+            model, in_rate, out_rate = parse_price(spec)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--price") from exc
+        prices[model] = (in_rate, out_rate)
+
+    sources = discover_event_sources(list(paths) or [_DEFAULT_ROOT])
+    try:
+        report = aggregate_events(
+            sources, group_by=group_by, since=since, prices=prices
+        )
+    except ImportError as exc:
+        _telemetry_extra_missing(exc)
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    if not sources:
+        console.print("[yellow]No event files found.[/yellow]")
+        return
+
+    table = Table(
+        title=f"LLM usage by {group_by} "
+        f"({report.runs} runs, {report.events:,} events, {len(sources)} files)"
+    )
+    table.add_column(group_by)
+    for name in ("Calls", "Errors", "Input tok", "Output tok", "p50 ms", "p95 ms", "Cost $"):
+        table.add_column(name, justify="right")
+    for key, usage in sorted(report.groups.items()):
+        table.add_row(
+            key,
+            f"{usage.calls:,}",
+            f"{usage.errors:,}",
+            f"{usage.input_tokens:,}",
+            f"{usage.output_tokens:,}",
+            _fmt(usage.latency.percentile(0.50)),
+            _fmt(usage.latency.percentile(0.95)),
+            _fmt(usage.cost_usd, ",.2f"),
+        )
+    console.print(table)
+
+    if report.prefix_cache:
+        prefix = Table(title="Prefix cache by agent role (estimated)")
+        prefix.add_column("agent_role")
+        for name in ("Calls", "Hit rate", "Reusable tok", "Input tok", "Reuse"):
+            prefix.add_column(name, justify="right")
+        for role, usage in sorted(report.prefix_cache.items()):
+            prefix.add_row(
+                role,
+                f"{usage.calls:,}",
+                _fmt(usage.hit_rate, ".0%"),
+                f"{usage.reusable_tokens:,}",
+                f"{usage.input_tokens:,}",
+                _fmt(usage.reuse_ratio, ".0%"),
+            )
+        console.print(prefix)
+
+    if report.error_classes:
+        errors = Table(title="Error classes")
+        errors.add_column("Class")
+        errors.add_column("Count", justify="right")
+        for name, count in report.error_classes.most_common():
+            errors.add_row(name, f"{count:,}")
+        console.print(errors)
@@ -244,6 +244,8 @@ class AutoBuildContextLoader:
         graphiti: Optional[Any] = None,
         verbose: bool = False,
         worktree_path: Optional[Path] = None,
+        emitter: Optional[Any] = None,
+        run_id: str = "",
     ) -> None:
         """Initialize AutoBuildContextLoader.
 
@@ -254,10 +256,15 @@ class AutoBuildContextLoader:
             worktree_path: Optional worktree path for local turn state file reads
                 (TASK-RFX-5FED). Enables fast local file reads instead of the
                 memory backend.
+            emitter: Optional EventEmitter passed to the retriever so each
+                retrieval emits a GraphitiQueryEvent with query-cache counts.
+            run_id: AutoBuild run identifier for emitted events.
         """
         self.graphiti = graphiti
         self.verbose = verbose
         self.worktree_path = worktree_path
+        self.emitter = emitter
+        self.run_id = run_id
         self._retriever: Optional[JobContextRetriever] = None
 
     @property
@@ -268,7 +275,9 @@ class AutoBuildContextLoader:
             JobContextRetriever if the memory backend is available, None otherwise.
         """
         if self._retriever is None and self.graphiti is not None:
-            self._retriever = JobContextRetriever(self.graphiti)
+            self._retriever = JobContextRetriever(
+                self.graphiti, emitter=self.emitter, run_id=self.run_id
+            )
         return self._retriever
 
     async def get_player_context(
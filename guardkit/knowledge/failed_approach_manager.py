@@ -172,7 +172,8 @@ async def capture_failed_approach(
             episode_body=json.dumps(episode_body),
             group_id=FAILED_APPROACHES_GROUP_ID,
             source="auto_captured",
-            entity_type="failed_approach"
+            entity_type="failed_approach",
+            write_behind=True,
         )
         logger.info(f"[Memory] Captured failed approach {failure_id}")
     except Exception as e:
@@ -347,7 +348,8 @@ async def increment_occurrence(failure_id: str) -> Optional[FailedApproachEpisod
             episode_body=json.dumps(episode_body),
             group_id=FAILED_APPROACHES_GROUP_ID,
             source="auto_captured",
-            entity_type="failed_approach"
+            entity_type="failed_approach",
+            write_behind=True,
         )
 
         logger.info(f"[Memory] Incremented occurrence for {failure_id} to {updated_failure.occurrences}")
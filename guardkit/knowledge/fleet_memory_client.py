@@ -116,14 +116,21 @@ class FleetMemoryClient:
         return self._initialized and not self._pending_init
 
     def reset_circuit_breaker(self) -> None:
-        """No-op circuit-breaker reset (graphiti-client interface parity).
-
-        GraphitiClient wraps FalkorDB access in a circuit breaker;
-        fleet-memory reads hit Postgres directly with no breaker, so this is
-        a documented no-op. ``JobContextRetriever`` calls this (hasattr-guarded)
-        between queries; providing it explicitly future-proofs any non-guarded
-        caller.
+        """Close the write-behind publisher's circuit breaker (graphiti parity).
+
+        GraphitiClient wraps FalkorDB access in a circuit breaker; fleet-memory
+        reads hit Postgres directly with no breaker. The only breaker on this
+        client guards the write-behind episode queue
+        (``fleet_memory_queue``): resetting it lets the next queued batch try
+        the broker straight away. ``JobContextRetriever`` calls this
+        (hasattr-guarded) between queries. A no-op when no queue has started
+        for this client's project.
         """
+        from guardkit.knowledge import fleet_memory_queue
+
+        queue = fleet_memory_queue.peek_episode_queue(self.config.project)
+        if queue is not None:
+            queue.reset_breaker()
         return None
 
     def _check_read_backend_available(self) -> bool:
@@ -375,6 +382,7 @@ class FleetMemoryClient:
         metadata: Optional[Any] = None,
         timeout_override: Optional[float] = None,
         dedup_token: Optional[str] = None,
+        write_behind: bool = False,
     ) -> Optional[str]:
         """Publish an episode to fleet-memory via NATS (typed payload, fail-open).
 
@@ -409,6 +417,14 @@ class FleetMemoryClient:
                 compute it ONCE per write so a retry inside that write still
                 dedupes. Omit it for writes that SHOULD collapse by natural key
                 (the harvest re-runs).
+            write_behind: Hand the episode to the write-behind queue
+                (``fleet_memory_queue``) and return at once instead of
+                publishing from this call. The publish then happens batched,
+                retried, and spooled to disk if the broker stays dark. Returns
+                ``None`` — nothing has been sent yet — so only callers that
+                ignore the result should pass it.
+                ``GUARDKIT_MEMORY_WRITE_BEHIND=0`` turns it back into a
+                synchronous publish.
 
         Returns:
             The natural key (``"{payload_type}:{project}:{identifier}"``) on a successful
@@ -448,6 +464,31 @@ class FleetMemoryClient:
                 )
                 return None
 
+            from guardkit.knowledge import fleet_memory_queue
+
+            if write_behind and fleet_memory_queue.write_behind_enabled():
+                # A missing NATS password fails every publish the same way;
+                # surface it here instead of queueing an unsendable episode.
+                from guardkit.memory.harvest_publisher import read_nats_password
+
+                read_nats_password()
+                fleet_memory_queue.get_episode_queue(self.config.project).put(
+                    fleet_memory_queue.PendingEpisode(
+                        name=name,
+                        episode_body=episode_body,
+                        group_id=group_id,
+                        source=source,
+                        project=self.config.project,
+                        dedup_token=dedup_token,
+                    )
+                )
+                logger.debug(
+                    "[Memory] Queued %s episode %r for write-behind publish",
+                    mapping.payload_type,
+                    name,
+                )
+                return None
+
             # Build the typed MemoryEpisodeV1 (body shaped for the relay's registry).
             from guardkit.knowledge.fleet_memory_payloads import build_memory_episode
 
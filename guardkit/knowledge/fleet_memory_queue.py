@@ -0,0 +1,600 @@
+"""Write-behind queue for fleet-memory episode publishes.
+
+``FleetMemoryClient.add_episode`` publishes from the calling path: connect to
+NATS, send, hang up. On a turn loop that round trip is pure latency — the turn
+does not read the write back. Callers that only need the episode *sent
+eventually* pass ``write_behind=True`` and the episode lands here instead:
+
+- **Batched.** A single daemon worker drains the queue in batches, so one NATS
+  connection carries many episodes instead of one connection per episode.
+- **Bounded.** At most ``max_pending`` episodes are held in memory. Overflow is
+  appended to an on-disk spool (JSONL), one per project. The spool is bounded
+  too: past ``max_spool_bytes`` new spills are dropped, and episodes older than
+  ``max_spool_age`` are dropped on replay instead of sent.
+- **Retried with jitter.** A failed batch is retried with full-jitter
+  exponential backoff. Re-publishing is safe: every episode carries its
+  deterministic ``Nats-Msg-Id``, so the broker dedupes a resend. A failure no
+  retry can fix — a configuration error such as an unset
+  ``GUARDKIT_NATS_PASSWORD`` (``ValueError``) — drops the batch instead.
+- **Circuit breaker.** After ``breaker_threshold`` consecutive failed publish
+  attempts the breaker opens and the worker stops trying for ``breaker_cooldown``
+  seconds; batches that cannot be sent are spooled.
+  ``FleetMemoryClient.reset_circuit_breaker`` closes it again.
+- **Drain on shutdown.** :func:`shutdown_episode_queue` (registered with
+  :mod:`atexit`) drains what it can within a deadline and spools the rest.
+  The spool is replayed by the next worker for the same project that finds
+  the broker healthy, so a crash or a dark broker delays episodes rather than
+  losing them.
+
+Same honesty caveat as ``add_episode``: a publish is a send, not a store
+receipt. A write-behind caller learns even less — the call returns before
+the send — so callers that must report a publish (the build-outcome capture)
+stay on the synchronous path.
+
+Environment:
+    ``GUARDKIT_MEMORY_WRITE_BEHIND=0`` makes ``write_behind=True`` publish
+    synchronously again; ``GUARDKIT_MEMORY_SPOOL_DIR`` (default
+    ``~/.guardkit/memory-spool``) moves the spools, which live in one
+    subdirectory per project.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Awaitable, Callable, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_ENV_VAR = "GUARDKIT_MEMORY_WRITE_BEHIND"
+SPOOL_DIR_ENV_VAR = "GUARDKIT_MEMORY_SPOOL_DIR"
+
+_SPOOL_FILENAME = "episodes.jsonl"
+_REPLAY_SUFFIX = ".replay"
+
+#: Seconds :func:`shutdown_episode_queue` may spend draining at exit.
+SHUTDOWN_DRAIN_SECONDS = 10.0
+
+#: Publisher failures no retry can fix (configuration errors, rejected
+#: payloads). The batch is dropped rather than retried and spooled.
+_PERMANENT_ERRORS = (ValueError, TypeError)
+
+
+def write_behind_enabled() -> bool:
+    """False when ``GUARDKIT_MEMORY_WRITE_BEHIND`` disables the queue."""
+    flag = os.environ.get(WRITE_BEHIND_ENV_VAR, "").strip().lower()
+    return flag not in ("0", "false", "off", "no")
+
+
+def spool_dir() -> Path:
+    """Directory holding the per-project overflow / crash spools."""
+    raw = os.environ.get(SPOOL_DIR_ENV_VAR, "").strip()
+    return Path(raw).expanduser() if raw else Path.home() / ".guardkit" / "memory-spool"
+
+
+def project_spool_path(project: str) -> Path:
+    """The spool file for *project*'s episodes."""
+    scope = re.sub(r"[^A-Za-z0-9._-]", "_", project).strip(".") or "default"
+    return spool_dir() / scope / _SPOOL_FILENAME
+
+
+@dataclass(frozen=True)
+class PendingEpisode:
+    """Everything needed to build and publish one episode later.
+
+    Plain strings only, so an episode survives a round trip through the spool.
+    ``project`` is captured at enqueue time — the episode belongs to the repo
+    that emitted it, whichever worker eventually sends it. ``spooled_at`` is
+    the wall-clock time the episode first reached the spool.
+    """
+
+    name: str
+    episode_body: str
+    group_id: str
+    source: str
+    project: str
+    dedup_token: Optional[str] = None
+    spooled_at: Optional[float] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, line: str) -> "PendingEpisode":
+        return cls(**json.loads(line))
+
+
+#: Publishes one batch; raises when the batch should be retried.
+BatchPublisher = Callable[[List[PendingEpisode]], Awaitable[None]]
+
+
+async def publish_pending_batch(batch: List[PendingEpisode]) -> None:
+    """Default :data:`BatchPublisher`: build each episode and send them together.
+
+    An episode that cannot be built (unmapped group, bad body) or that the
+    broker refuses as oversized is logged and dropped — retrying cannot fix
+    it. A connection failure raises, so the whole batch is retried.
+    """
+    from guardkit.knowledge.fleet_memory_mapping import resolve
+    from guardkit.knowledge.fleet_memory_payloads import (
+        build_memory_episode,
+        with_broker_dedup_scope,
+    )
+    from guardkit.memory.harvest_publisher import publish_episodes
+
+    episodes = []
+    for item in batch:
+        mapping = resolve(item.group_id)
+        if mapping is None or mapping.disposition == "retire":
+            continue
+        episode = build_memory_episode(
+            mapping,
+            name=item.name,
+            episode_body=item.episode_body,
+            source=item.source,
+            project=item.project,
+        )
+        if episode is None:
+            logger.warning(
+                "[Memory] Could not build queued episode %r for %r; dropped",
+                item.name,
+                item.group_id,
+            )
+            continue
+        episodes.append(with_broker_dedup_scope(episode, item.dedup_token or ""))
+    if not episodes:
+        return
+    summary = await publish_episodes(episodes)
+    logger.info(
+        "[Memory] Write-behind published %d episode(s) (skipped_oversized=%d)",
+        summary.published,
+        summary.skipped_oversized,
+    )
+
+
+class _CircuitBreaker:
+    """Consecutive-failure breaker: open for ``cooldown`` seconds, then half-open."""
+
+    def __init__(
+        self,
+        threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        return self._clock() - self._opened_at >= self._cooldown
+
+    def retry_in(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._cooldown - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._threshold:
+            # A failed half-open probe re-opens for a full cooldown.
+            self._opened_at = self._clock()
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+class EpisodeWriteBehindQueue:
+    """Bounded, batched, spool-backed publisher of :class:`PendingEpisode` items.
+
+    Args:
+        publisher: Sends one batch; raises to request a retry. Defaults to
+            :func:`publish_pending_batch`.
+        spool_path: Overflow / crash spool (JSONL). Defaults to
+            ``project_spool_path(project)``.
+        project: Project whose episodes this queue carries; scopes the
+            default spool.
+        max_pending: In-memory bound; later episodes spill to the spool.
+        max_spool_bytes: Spool size past which further spills are dropped.
+        max_spool_age: Seconds a spooled episode may wait; older ones are
+            dropped on replay.
+        batch_size: Most episodes sent per publisher call.
+        linger: Seconds the worker waits for a partial batch to fill.
+        max_attempts: Publisher calls per batch before it is spooled.
+        base_delay: First retry backoff ceiling (seconds); doubles per attempt.
+        max_delay: Backoff ceiling (seconds).
+        breaker_threshold: Consecutive failed attempts that open the breaker.
+        breaker_cooldown: Seconds the open breaker blocks publishing.
+    """
+
+    def __init__(
+        self,
+        publisher: Optional[BatchPublisher] = None,
+        *,
+        spool_path: Optional[Path] = None,
+        project: str = "guardkit",
+        max_pending: int = 1000,
+        max_spool_bytes: int = 16 * 1024 * 1024,
+        max_spool_age: float = 7 * 24 * 3600.0,
+        batch_size: int = 50,
+        linger: float = 0.2,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        breaker_threshold: int = 3,
+        breaker_cooldown: float = 30.0,
+    ) -> None:
+        self._publisher = publisher or publish_pending_batch
+        self._spool_path = spool_path or project_spool_path(project)
+        self._max_pending = max_pending
+        self._max_spool_bytes = max_spool_bytes
+        self._max_spool_age = max_spool_age
+        self._batch_size = batch_size
+        self._linger = linger
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._breaker = _CircuitBreaker(breaker_threshold, breaker_cooldown)
+
+        self._cond = threading.Condition()
+        self._pending: Deque[PendingEpisode] = deque()
+        self._inflight = 0
+        self._closing = False
+        self._deadline: Optional[float] = None
+        self._worker: Optional[threading.Thread] = None
+        self._spool_lock = threading.Lock()
+        self._spooled_while_closing = False
+
+    @property
+    def spool_path(self) -> Path:
+        return self._spool_path
+
+    # ------------------------------------------------------------------
+    # Producer side (the caller's critical path: no I/O unless spilling)
+    # ------------------------------------------------------------------
+
+    def put(self, item: PendingEpisode) -> None:
+        """Queue *item* for publishing; spill it to the spool when full or closed."""
+        with self._cond:
+            if not self._closing and len(self._pending) < self._max_pending:
+                self._pending.append(item)
+                self._ensure_worker()
+                self._cond.notify_all()
+                return
+        self._spool([item])
+        with self._cond:
+            if not self._closing:
+                self._ensure_worker()
+                self._cond.notify_all()
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending) + self._inflight
+
+    def reset_breaker(self) -> None:
+        """Close the breaker so the next batch is tried immediately."""
+        with self._cond:
+            self._breaker.reset()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every in-memory episode has been sent or spooled."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._inflight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = SHUTDOWN_DRAIN_SECONDS) -> bool:
+        """Drain within *timeout*, spool whatever is left, and stop the worker.
+
+        Returns True when everything queued in memory was published; False
+        when some of it had to be spooled for a later run.
+        """
+        with self._cond:
+            self._closing = True
+            self._deadline = time.monotonic() + timeout
+            worker = self._worker
+            self._cond.notify_all()
+        if worker is not None:
+            worker.join(timeout + 1.0)
+        with self._cond:
+            leftover = list(self._pending)
+            self._pending.clear()
+        if leftover:
+            self._spool(leftover)
+        return not self._spooled_while_closing
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        # Caller holds self._cond.
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="fleet-memory-write-behind", daemon=True
+            )
+            self._worker.start()
+
+    def _past_deadline(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _next_batch(self) -> Optional[List[PendingEpisode]]:
+        """Block for the next batch; None when the worker should stop."""
+        with self._cond:
+            while True:
+                if self._closing and (not self._pending or self._past_deadline()):
+                    return None
+                if self._pending and self._breaker.allow():
+                    break
+                wait: Optional[float]
+                if self._pending:
+                    if self._closing:
+                        # Open breaker at shutdown: do not wait out the cooldown.
+                        return None
+                    wait = self._breaker.retry_in()
+                elif self._spool_waiting():
+                    if self._breaker.allow():
+                        return []  # idle and healthy: replay the spool
+                    wait = self._breaker.retry_in()
+                else:
+                    wait = None  # idle until put() or close() notifies
+                self._cond.wait(wait)
+            if len(self._pending) < self._batch_size and not self._closing:
+                self._cond.wait(self._linger)
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self._batch_size, len(self._pending)))
+            ]
+            self._inflight = len(batch)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            if batch:
+                if not self._send(batch):
+                    self._spool(batch)
+                with self._cond:
+                    self._inflight = 0
+                    self._cond.notify_all()
+            elif not self._replay_spool():
+                with self._cond:
+                    # Still unsendable: back off before the next replay.
+                    self._cond.wait_for(lambda: self._closing, self._max_delay)
+        with self._cond:
+            self._cond.notify_all()
+
+    def _send(self, batch: List[PendingEpisode]) -> bool:
+        """Publish *batch* with jittered retries; False when it must be spooled.
+
+        A :data:`_PERMANENT_ERRORS` failure drops the batch (True): neither a
+        retry nor a replay can fix it, and it says nothing about the broker.
+        """
+        for attempt in range(self._max_attempts):
+            with self._cond:
+                if not self._breaker.allow() or (attempt and self._past_deadline()):
+                    return False
+            try:
+                asyncio.run(self._publisher(batch))
+            except _PERMANENT_ERRORS as exc:
+                logger.error(
+                    "[Memory] Write-behind batch of %d cannot be published: %s "
+                    "— dropped",
+                    len(batch),
+                    exc,
+                )
+                return True
+            except Exception as exc:
+                with self._cond:
+                    self._breaker.record_failure()
+                logger.warning(
+                    "[Memory] Write-behind batch of %d failed (attempt %d/%d): %s",
+                    len(batch),
+                    attempt + 1,
+                    self._max_attempts,
+                    exc,
+                )
+                if attempt + 1 < self._max_attempts:
+                    ceiling = min(self._max_delay, self._base_delay * (2 ** attempt))
+                    with self._cond:
+                        # Interruptible sleep: a shutdown ends the backoff early.
+                        self._cond.wait_for(
+                            self._past_deadline, timeout=random.uniform(0, ceiling)
+                        )
+                continue
+            with self._cond:
+                self._breaker.record_success()
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Spool
+    # ------------------------------------------------------------------
+
+    def _spool(self, items: List[PendingEpisode]) -> None:
+        now = time.time()
+        lines = [
+            replace(item, spooled_at=item.spooled_at or now).to_json() + "\n"
+            for item in items
+        ]
+        incoming = sum(len(line.encode("utf-8")) for line in lines)
+        with self._spool_lock:
+            try:
+                size = self._spool_path.stat().st_size
+            except OSError:
+                size = 0
+            if size + incoming > self._max_spool_bytes:
+                logger.warning(
+                    "[Memory] Spool %s is full (%d bytes); dropped %d episode(s)",
+                    self._spool_path,
+                    size,
+                    len(items),
+                )
+                return
+            try:
+                self._spool_path.parent.mkdir(parents=True, exist_ok=True)
+                with self._spool_path.open("a", encoding="utf-8") as fh:
+                    fh.writelines(lines)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            except OSError as exc:
+                logger.warning(
+                    "[Memory] Could not spool %d episode(s) to %s: %s — dropped",
+                    len(items),
+                    self._spool_path,
+                    exc,
+                )
+                return
+        with self._cond:
+            if self._closing:
+                self._spooled_while_closing = True
+        logger.info(
+            "[Memory] Spooled %d episode(s) to %s for a later publish",
+            len(items),
+            self._spool_path,
+        )
+
+    def _spool_waiting(self) -> bool:
+        try:
+            return self._spool_path.stat().st_size > 0
+        except OSError:
+            return False
+
+    def _iter_spool(self, path: Path) -> Iterator[PendingEpisode]:
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield PendingEpisode.from_json(line)
+                except (TypeError, ValueError):
+                    logger.warning("[Memory] Skipping unreadable spool line in %s", path)
+
+    def _adopt_orphaned_replays(self) -> List[Path]:
+        """Replay files left behind by a process that died mid-replay."""
+        orphans: List[Path] = []
+        prefix = f"{self._spool_path.name}{_REPLAY_SUFFIX}-"
+        try:
+            candidates = list(self._spool_path.parent.glob(f"{prefix}*"))
+        except OSError:
+            return orphans
+        for path in candidates:
+            try:
+                pid = int(path.name[len(prefix):])
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                orphans.append(path)
+            except (ValueError, OSError):
+                continue
+        return orphans
+
+    def _replay_spool(self) -> bool:
+        """Send the spool in batches; anything still unsendable is re-spooled.
+
+        The spool is renamed first, so episodes spilled while the replay runs
+        go to a fresh file and another process never replays the same file.
+        Returns False when some episodes had to go back to the spool.
+        """
+        replay = self._spool_path.with_name(
+            f"{self._spool_path.name}{_REPLAY_SUFFIX}-{os.getpid()}"
+        )
+        with self._spool_lock:
+            try:
+                os.replace(self._spool_path, replay)
+            except OSError:
+                return True
+            for orphan in self._adopt_orphaned_replays():
+                try:
+                    with replay.open("a", encoding="utf-8") as fh:
+                        fh.write(orphan.read_text(encoding="utf-8"))
+                    orphan.unlink()
+                except OSError:
+                    continue
+        batch: List[PendingEpisode] = []
+        failed: List[PendingEpisode] = []
+        expired = 0
+        cutoff = time.time() - self._max_spool_age
+        for item in self._iter_spool(replay):
+            if item.spooled_at is not None and item.spooled_at < cutoff:
+                expired += 1
+                continue
+            batch.append(item)
+            if len(batch) == self._batch_size:
+                if failed or not self._send(batch):
+                    failed.extend(batch)
+                batch = []
+        if batch and (failed or not self._send(batch)):
+            failed.extend(batch)
+        if expired:
+            logger.warning(
+                "[Memory] Dropped %d spooled episode(s) older than %.0fs from %s",
+                expired,
+                self._max_spool_age,
+                self._spool_path,
+            )
+        if failed:
+            self._spool(failed)
+        try:
+            replay.unlink()
+        except OSError:
+            pass
+        return not failed
+
+
+_queues: Dict[str, EpisodeWriteBehindQueue] = {}
+_queue_lock = threading.Lock()
+
+
+def get_episode_queue(project: str = "guardkit") -> EpisodeWriteBehindQueue:
+    """The process-wide write-behind queue for *project* (created on first use)."""
+    with _queue_lock:
+        queue = _queues.get(project)
+        if queue is None:
+            queue = _queues[project] = EpisodeWriteBehindQueue(project=project)
+        return queue
+
+
+def peek_episode_queue(project: str = "guardkit") -> Optional[EpisodeWriteBehindQueue]:
+    """The live queue for *project*, or None if none has started. Never creates one."""
+    with _queue_lock:
+        return _queues.get(project)
+
+
+def shutdown_episode_queue(timeout: float = SHUTDOWN_DRAIN_SECONDS) -> bool:
+    """Drain and stop every project's queue. Registered with :mod:`atexit`."""
+    with _queue_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    deadline = time.monotonic() + timeout
+    drained = True
+    for queue in queues:
+        drained = queue.close(max(0.0, deadline - time.monotonic())) and drained
+    return drained
+
+
+atexit.register(shutdown_episode_queue)
@@ -48,11 +48,13 @@ References:
 """
 
 import asyncio
+import contextvars
 import hashlib
 import json
 import logging
 import time
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
@@ -65,6 +67,24 @@ from .relevance_tuning import (
     MetricsCollector,
     default_config,
 )
+from .query_cache import (
+    QueryCacheStats,
+    get_shared_query_cache,
+    query_cache_enabled,
+)
+
+if TYPE_CHECKING:
+    from guardkit.orchestrator.instrumentation.emitter import EventEmitter
+
+# Per-retrieve shared-cache counters; asyncio.gather children inherit the
+# same object, so parallel category queries all count into one retrieve.
+_retrieve_cache_stats: contextvars.ContextVar[Optional[QueryCacheStats]] = (
+    contextvars.ContextVar("guardkit_retrieve_cache_stats", default=None)
+)
+
+# Turn states change every turn; cap their shared-cache lifetime well below
+# the category TTL so a later turn never reads a stale turn history.
+_TURN_STATES_CACHE_TTL = 30.0
 
 
 @dataclass
@@ -385,6 +405,8 @@ class JobContextRetriever:
         graphiti: Any,
         relevance_config: Optional[RelevanceConfig] = None,
         cache_ttl: float = 300.0,
+        emitter: Optional["EventEmitter"] = None,
+        run_id: str = "",
     ) -> None:
         """Initialize JobContextRetriever with a memory client.
 
@@ -393,11 +415,18 @@ class JobContextRetriever:
             relevance_config: Optional RelevanceConfig for custom thresholds.
                 If not provided, default thresholds are used.
             cache_ttl: Cache time-to-live in seconds (default: 300).
-                Set to 0 to disable caching.
+                Set to 0 to disable caching (both the per-instance retrieve
+                cache and the process-wide category search cache).
+            emitter: Optional EventEmitter; when set, each retrieval that
+                queried the backend emits a GraphitiQueryEvent carrying the
+                shared-cache hit/miss counts.
+            run_id: AutoBuild run identifier used in emitted events.
         """
         self.graphiti = graphiti
         self.relevance_config = relevance_config or default_config()
         self.cache_ttl = cache_ttl
+        self.emitter = emitter
+        self.run_id = run_id
         # Cache: Dict[cache_key, Tuple[RetrievedContext, timestamp]]
         self._cache: Dict[str, Tuple[RetrievedContext, float]] = {}
 
@@ -520,6 +549,9 @@ class JobContextRetriever:
         cached = self._get_from_cache(cache_key)
         if cached is not None:
             return cached
+        started = time.monotonic()
+        stats = QueryCacheStats()
+        _retrieve_cache_stats.set(stats)
         # Analyze task characteristics
         analyzer = TaskAnalyzer(self.graphiti)
         characteristics = await analyzer.analyze(task, phase)
@@ -724,6 +756,7 @@ class JobContextRetriever:
 
         # Store result in cache
         self._store_in_cache(cache_key, result)
+        await self._emit_query_event(task, result, started, stats)
 
         return result
 
@@ -757,6 +790,9 @@ class JobContextRetriever:
         cached = self._get_from_cache(cache_key)
         if cached is not None:
             return cached
+        started = time.monotonic()
+        stats = QueryCacheStats()
+        _retrieve_cache_stats.set(stats)
 
         # Analyze task characteristics
         analyzer = TaskAnalyzer(self.graphiti)
@@ -960,6 +996,7 @@ class JobContextRetriever:
 
         # Store result in cache
         self._store_in_cache(cache_key, result)
+        await self._emit_query_event(task, result, started, stats)
 
         return result
 
@@ -986,8 +1023,10 @@ class JobContextRetriever:
             Tuple of (filtered_results, tokens_used)
         """
         try:
-            # Query the memory backend
-            results = await self.graphiti.search(query, group_ids=group_ids)
+            # Query the memory backend (through the shared category cache)
+            results = await self._search(
+                query, group_ids, fetch=lambda: self.graphiti.search(query, group_ids=group_ids)
+            )
 
             # Handle None or empty results
             if not results:
@@ -1044,10 +1083,16 @@ class JobContextRetriever:
             query = f"turn {feature_id} {task_id}"
 
             # Query the memory backend with num_results=5 for last 5 turns
-            results = await self.graphiti.search(
+            results = await self._search(
                 query,
-                group_ids=["turn_states"],
+                ["turn_states"],
+                fetch=lambda: self.graphiti.search(
+                    query,
+                    group_ids=["turn_states"],
+                    num_results=5,
+                ),
                 num_results=5,
+                ttl=_TURN_STATES_CACHE_TTL,
             )
 
             # Handle None or empty results
@@ -1087,6 +1132,93 @@ class JobContextRetriever:
             )
             return [], 0
 
+    async def _search(
+        self,
+        query: str,
+        group_ids: List[str],
+        fetch: Any,
+        num_results: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run a backend search through the process-wide query cache.
+
+        Identical searches from retrievers of other tasks (or other worker
+        threads) on the same backend are answered from the shared cache, and
+        concurrent identical misses share one in-flight request. Bypassed
+        when ``cache_ttl <= 0`` or ``GUARDKIT_CONTEXT_QUERY_CACHE=0``.
+
+        Args:
+            query: Search query
+            group_ids: memory group IDs searched
+            fetch: Zero-argument coroutine factory performing the search
+            num_results: Requested result count (part of the cache key)
+            ttl: Optional lifetime cap for this search's cache entry
+
+        Returns:
+            The search results as returned by the backend
+        """
+        if not query_cache_enabled():
+            return await fetch()
+        effective_ttl = self.cache_ttl if ttl is None else min(ttl, self.cache_ttl)
+        return await get_shared_query_cache().get_or_fetch(
+            self.graphiti,
+            ("search", query, tuple(group_ids), num_results),
+            fetch,
+            ttl=effective_ttl,
+            stats=_retrieve_cache_stats.get(),
+        )
+
+    async def _emit_query_event(
+        self,
+        task: Dict[str, Any],
+        result: RetrievedContext,
+        started: float,
+        stats: QueryCacheStats,
+    ) -> None:
+        """Emit a GraphitiQueryEvent for a completed retrieval.
+
+        No-op without an emitter. Emission failures are logged, never raised.
+
+        Args:
+            task: Task dictionary the retrieval ran for
+            result: The retrieved context
+            started: ``time.monotonic()`` at retrieval start
+            stats: Shared-cache counters collected during the retrieval
+        """
+        if self.emitter is None:
+            return
+        try:
+            from guardkit.orchestrator.instrumentation.schemas import GraphitiQueryEvent
+
+            items = sum(
+                len(getattr(result, name) or [])
+                for name in (
+                    "feature_context", "similar_outcomes", "relevant_patterns",
+                    "architecture_context", "warnings", "domain_knowledge",
+                    "role_constraints", "quality_gate_configs", "turn_states",
+                    "implementation_modes",
+                )
+            )
+            role = task.get("current_actor")
+            event = GraphitiQueryEvent(
+                run_id=self.run_id,
+                feature_id=task.get("feature_id") or None,
+                task_id=task.get("id", ""),
+                agent_role=role if role in ("player", "coach", "resolver", "router") else "player",
+                attempt=max(1, int(task.get("turn_number") or 1)),
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                query_type="context_loader",
+                items_returned=items,
+                tokens_injected=result.budget_used,
+                latency_ms=(time.monotonic() - started) * 1000,
+                status="ok",
+                cache_hits=stats.hits + stats.coalesced,
+                cache_misses=stats.misses,
+            )
+            await self.emitter.emit(event)
+        except Exception as e:
+            logger.debug("[Memory] Failed to emit context retrieval event: %s", e)
+
     def _trim_to_budget(
         self,
         items: List[Dict[str, Any]],
@@ -1107,10 +1239,8 @@ class JobContextRetriever:
         trimmed = []
         tokens_used = 0
 
-        for item in items:
-            # Estimate tokens for this item
-            item_tokens = self._estimate_tokens(item)
-
+        # Count every candidate in one batched call (shared token counter).
+        for item, item_tokens in zip(items, self._estimate_tokens_many(items)):
             # Check if we can fit this item
             if tokens_used + item_tokens <= budget:
                 trimmed.append(item)
@@ -1124,17 +1254,30 @@ class JobContextRetriever:
     def _estimate_tokens(self, item: Dict[str, Any]) -> int:
         """Estimate token count for a context item.
 
-        Uses a simple character-based estimation (~4 chars per token).
-
         Args:
             item: Context item dictionary
 
         Returns:
             Estimated token count
         """
-        # Convert to string for character count
-        item_str = json.dumps(item, default=str)
-        char_count = len(item_str)
+        return self._estimate_tokens_many([item])[0]
+
+    def _estimate_tokens_many(self, items: List[Dict[str, Any]]) -> List[int]:
+        """Estimate token counts for context items in one batch.
+
+        Items are counted as their JSON serialization through the shared
+        token counter (``instrumentation.digests``): tokenizer counts when
+        tiktoken is installed, otherwise the conservative CHARS_PER_TOKEN
+        estimate. Every item counts as at least one token.
+
+        Args:
+            items: Context item dictionaries
+
+        Returns:
+            Estimated token counts, aligned with ``items``
+        """
+        from guardkit.orchestrator.instrumentation.digests import count_tokens_many
 
-        # Estimate tokens (approximately 4 chars per token)
-        return max(1, char_count // self.CHARS_PER_TOKEN)
+        texts = [json.dumps(item, default=str) for item in items]
+        counts = count_tokens_many(texts, fallback_chars_per_token=self.CHARS_PER_TOKEN)
+        return [max(1, count) for count in counts]
@@ -170,7 +170,10 @@ async def capture_task_outcome(
             summary="Successfully implemented"
         )
     """
-    capture = await capture_task_outcome_verified(
+    # Nobody reads the publish result here, so the episode goes through the
+    # write-behind queue and the caller is not held on the broker
+    # round-trip (see fleet_memory_queue).
+    capture = await _capture_task_outcome(
         outcome_type=outcome_type,
         task_id=task_id,
         task_title=task_title,
@@ -189,6 +192,7 @@ async def capture_task_outcome(
         duration_minutes=duration_minutes,
         feature_id=feature_id,
         related_adr_ids=related_adr_ids,
+        write_behind=True,
     )
     return capture.outcome_id
 
@@ -252,6 +256,57 @@ async def capture_task_outcome_verified(
         if capture.published:
             print(f"sent to memory as: {capture.episode_key}")
     """
+    return await _capture_task_outcome(
+        outcome_type=outcome_type,
+        task_id=task_id,
+        task_title=task_title,
+        task_requirements=task_requirements,
+        success=success,
+        summary=summary,
+        approach_used=approach_used,
+        patterns_used=patterns_used,
+        problems_encountered=problems_encountered,
+        lessons_learned=lessons_learned,
+        tests_written=tests_written,
+        test_coverage=test_coverage,
+        review_cycles=review_cycles,
+        started_at=started_at,
+        completed_at=completed_at,
+        duration_minutes=duration_minutes,
+        feature_id=feature_id,
+        related_adr_ids=related_adr_ids,
+        write_behind=False,
+    )
+
+
+async def _capture_task_outcome(
+    *,
+    outcome_type: OutcomeType,
+    task_id: str,
+    task_title: str,
+    task_requirements: str,
+    success: bool,
+    summary: str,
+    approach_used: Optional[str],
+    patterns_used: Optional[List[str]],
+    problems_encountered: Optional[List[str]],
+    lessons_learned: Optional[List[str]],
+    tests_written: Optional[int],
+    test_coverage: Optional[float],
+    review_cycles: Optional[int],
+    started_at: Optional[datetime],
+    completed_at: Optional[datetime],
+    duration_minutes: Optional[int],
+    feature_id: Optional[str],
+    related_adr_ids: Optional[List[str]],
+    write_behind: bool,
+) -> OutcomeCapture:
+    """Build and write one outcome episode; shared by both public captures.
+
+    ``write_behind`` is only for callers that discard the publish result: a
+    queued episode comes back with ``episode_key=None`` because nothing has
+    been sent yet.
+    """
     # Generate unique ID
     outcome_id = _generate_outcome_id()
 
@@ -310,6 +365,7 @@ async def capture_task_outcome_verified(
             # payload is untouched, so the store still upserts on the per-task
             # natural key. See fleet_memory_payloads.with_broker_dedup_scope.
             dedup_token=outcome_id,
+            write_behind=write_behind,
         )
     except Exception as e:
         logger.warning(f"[Memory] Failed to publish outcome {outcome_id}: {e}")
@@ -317,6 +373,15 @@ async def capture_task_outcome_verified(
             outcome_id, None, f"the writer raised {type(e).__name__}: {e}"
         )
 
+    if episode_key is None and write_behind:
+        logger.debug(
+            f"[Memory] Outcome {outcome_id} for {task_id} handed to the "
+            f"write-behind queue"
+        )
+        return OutcomeCapture(
+            outcome_id, None, "queued for a write-behind publish"
+        )
+
     if episode_key is None:
         # The client is fail-open: it has already logged the real reason.
         logger.warning(
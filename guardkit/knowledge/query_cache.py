@@ -0,0 +1,265 @@
+"""Process-wide cache for memory-backend category searches.
+
+``JobContextRetriever`` issues the same category searches (role constraints,
+quality gate configs, feature overview, ...) for every task in a wave. Its
+own per-instance cache is keyed per task, so an N-wide wave repeats each
+search N times. This module provides the shared layer underneath:
+
+- **Shared** — one :class:`SharedQueryCache` per process, keyed by backend
+  identity + query + group ids + result count, so retrievers built on
+  different per-thread clients of the same backend share entries.
+- **Bounded** — LRU eviction by entry count *and* by the approximate byte
+  size of the cached results.
+- **Single-flight** — concurrent identical misses (same or different event
+  loops/threads) wait on the one in-flight search instead of issuing their
+  own. Failures are delivered to every waiter and never cached.
+
+Set ``GUARDKIT_CONTEXT_QUERY_CACHE=0`` to bypass the shared cache.
+
+References:
+    - TASK-GR6-012: Performance optimization (per-instance retrieve cache)
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUERY_CACHE_ENV_VAR = "GUARDKIT_CONTEXT_QUERY_CACHE"
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def query_cache_enabled() -> bool:
+    """Return False when ``GUARDKIT_CONTEXT_QUERY_CACHE`` switches the cache off."""
+    raw = os.environ.get(QUERY_CACHE_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def backend_key(client: Any) -> Tuple[Hashable, Optional[weakref.ref]]:
+    """Identify the backend a client searches.
+
+    Clients with a dataclass ``config`` (e.g. ``FleetMemoryClient``) are
+    identified by their class and configuration, so per-thread clients of
+    the same backend share entries. Any other client is identified by
+    object identity; the returned weak reference lets the cache reject an
+    entry whose client has been garbage-collected and its id reused.
+
+    Returns:
+        Tuple of (hashable key, weak reference or None).
+    """
+    config = getattr(client, "config", None)
+    if dataclasses.is_dataclass(config) and not isinstance(config, type):
+        try:
+            values = dataclasses.astuple(config)
+            hash(values)
+            return ("config", type(client).__qualname__, values), None
+        except TypeError:
+            pass
+    try:
+        ref: Optional[weakref.ref] = weakref.ref(client)
+    except TypeError:
+        ref = None
+    return ("object", id(client)), ref
+
+
+@dataclass
+class _Entry:
+    value: List[Dict[str, Any]]
+    size: int
+    expires_at: float
+    client_ref: Optional[weakref.ref]
+
+
+@dataclass
+class QueryCacheStats:
+    """Counters for one cache (or one caller's view of it).
+
+    Attributes:
+        hits: Lookups answered from a stored entry.
+        misses: Lookups that ran the search themselves.
+        coalesced: Lookups that waited on another caller's in-flight search.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class SharedQueryCache:
+    """LRU- and byte-bounded search-result cache with single-flight misses.
+
+    Args:
+        max_entries: Maximum number of cached searches.
+        max_bytes: Maximum summed JSON size of cached results.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = QueryCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters (in-flight searches finish)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.stats = QueryCacheStats()
+
+    def _lookup(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stale = entry.expires_at <= time.monotonic() or (
+            entry.client_ref is not None and entry.client_ref() is None
+        )
+        if stale:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _store(
+        self,
+        key: Hashable,
+        value: List[Dict[str, Any]],
+        ttl: float,
+        client_ref: Optional[weakref.ref],
+    ) -> None:
+        try:
+            size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return
+        if size > self.max_bytes:
+            return
+        self._drop(key)
+        self._entries[key] = _Entry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + ttl,
+            client_ref=client_ref,
+        )
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._drop(next(iter(self._entries)))
+
+    async def get_or_fetch(
+        self,
+        client: Any,
+        query_key: Hashable,
+        fetch: Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]],
+        ttl: float,
+        stats: Optional[QueryCacheStats] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for ``query_key`` on ``client``'s backend.
+
+        On a miss the first caller runs ``fetch``; concurrent callers for the
+        same key wait for that result. Successful results are cached for
+        ``ttl`` seconds; exceptions propagate to every waiter and are not
+        cached. Callers always receive their own deep copy.
+
+        Args:
+            client: The memory client (identifies the backend).
+            query_key: Hashable description of the search.
+            fetch: Coroutine factory performing the search.
+            ttl: Seconds a successful result stays valid (<= 0: no caching).
+            stats: Optional per-caller counters, updated alongside the
+                cache-wide ``stats``.
+
+        Returns:
+            The search results (deep copy).
+        """
+        if ttl <= 0:
+            return await fetch()
+
+        backend, client_ref = backend_key(client)
+        key = (backend, query_key)
+        counters = [self.stats] + ([stats] if stats is not None else [])
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                for c in counters:
+                    c.hits += 1
+                return copy.deepcopy(cached)
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                self._inflight[key] = future
+                for c in counters:
+                    c.misses += 1
+            else:
+                for c in counters:
+                    c.coalesced += 1
+
+        if pending is not None:
+            return copy.deepcopy(await asyncio.wrap_future(pending))
+
+        try:
+            value = await fetch()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(
+                exc if isinstance(exc, Exception) else RuntimeError(repr(exc))
+            )
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if value is not None:
+                self._store(key, value, ttl, client_ref)
+        future.set_result(value)
+        return copy.deepcopy(value)
+
+
+_shared_cache = SharedQueryCache()
+
+
+def get_shared_query_cache() -> SharedQueryCache:
+    """Return the process-wide :class:`SharedQueryCache`."""
+    return _shared_cache
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "QUERY_CACHE_ENV_VAR",
+    "QueryCacheStats",
+    "SharedQueryCache",
+    "backend_key",
+    "get_shared_query_cache",
+    "query_cache_enabled",
+]
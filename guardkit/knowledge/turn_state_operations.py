@@ -111,7 +111,11 @@ async def capture_turn_state(
             episode_body=episode_body_json,
             group_id="turn_states",
             source="auto_captured",
-            entity_type="turn_state"
+            entity_type="turn_state",
+            # Turn states are written once per turn and never read back on
+            # this path; queue them so the turn loop is not held on the
+            # broker round-trip.
+            write_behind=True,
         )
 
         logger.info(f"[Memory] Captured turn state: {entity.id}")
@@ -0,0 +1,485 @@
+"""Warm, per-worktree pytest worker for repeated Coach test runs.
+
+Every Coach turn used to start a fresh ``<venv_python> -m pytest …``
+interpreter: interpreter startup, ``import pytest`` and every ``pytest11``
+plugin import are paid again before a single test is collected — 20-60 s per
+turn on large target repos.
+
+A :class:`PytestWorker` is a long-lived server process started once under the
+pinned interpreter. It pre-imports pytest and its entry-point plugins, then
+serves run requests over a pipe: each request ``fork()``s a child from the
+pre-imported parent, the child ``chdir``s, redirects fd 1/2 to a capture file
+and calls ``pytest.main(argv)``. Project modules are only ever imported in the
+short-lived child, so each run starts from the parent's clean module state —
+no leakage between turns.
+
+The reply is the child's exit code plus its combined stdout/stderr, i.e. the
+same text ``subprocess.run(..., capture_output=True)`` returned, so
+:func:`guardkit.lib.pytest_summary.parse_pytest_summary` and every absence
+classifier downstream read it unchanged. The argv is passed through verbatim,
+so the caller's interpreter pin and per-test ``--timeout`` injection behave as
+before; the whole-run timeout still raises :class:`subprocess.TimeoutExpired`.
+
+Each worktree gets a small pool of servers (``GUARDKIT_COACH_PYTEST_WORKERS``,
+default ``min(4, cpu_count)``) so the parallel tasks of a wave, which share
+one worktree, keep running their Coach test runs side by side. A run that
+finds every server of its pool busy does not queue behind them: it runs cold.
+
+Opt-in via ``GUARDKIT_COACH_PYTEST_WORKER=1`` and POSIX-only (``os.fork``).
+Any worker failure falls back to a cold ``subprocess.run`` — the worker is an
+accelerator, never a new way for the oracle to go absent.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import select
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+__all__ = [
+    "PytestWorker",
+    "PytestWorkerError",
+    "pytest_worker_enabled",
+    "pytest_worker_pool_size",
+    "run_pytest",
+    "shutdown_pytest_workers",
+]
+
+logger = logging.getLogger(__name__)
+
+_ENABLE_ENV_VAR = "GUARDKIT_COACH_PYTEST_WORKER"
+
+# Warm servers per worktree; runs beyond this many at once go cold.
+_POOL_SIZE_ENV_VAR = "GUARDKIT_COACH_PYTEST_WORKERS"
+
+# Seconds to wait for the server to finish pre-importing pytest + plugins.
+_STARTUP_TIMEOUT_S = 60.0
+
+# Extra seconds the client waits beyond the run timeout: the server enforces
+# the timeout itself (kills the child's process group) and still replies.
+_REPLY_GRACE_S = 10.0
+
+# Server program, run as ``<interpreter> -c _WORKER_SOURCE``. Self-contained:
+# the bootstrap venv does not necessarily have guardkit installed.
+_WORKER_SOURCE = r'''
+import importlib, json, os, signal, sys, tempfile, time, traceback
+
+def _preload():
+    import pytest  # noqa: F401
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group="pytest11")
+    except Exception:
+        eps = ()
+    for ep in eps:
+        try:
+            importlib.import_module(ep.module)
+        except Exception:
+            pass
+
+def _reply(payload):
+    _out.write(json.dumps(payload) + "\n")
+    _out.flush()
+
+def _run(request):
+    fd, path = tempfile.mkstemp(prefix="guardkit-pytest-worker-")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 3
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.dup2(fd, 1)
+            os.dup2(fd, 2)
+            os.chdir(request["cwd"])
+            import pytest
+            code = int(pytest.main(list(request["argv"])))
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else 1
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+    os.close(fd)
+    timeout = request.get("timeout")
+    deadline = None if timeout is None else time.monotonic() + timeout
+    timed_out = False
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            timed_out = True
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            _, status = os.waitpid(pid, 0)
+            break
+        time.sleep(0.02)
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as fh:
+            output = fh.read()
+    finally:
+        os.unlink(path)
+    _reply({
+        "returncode": os.waitstatus_to_exitcode(status),
+        "output": output,
+        "timed_out": timed_out,
+    })
+
+_out = sys.stdout
+try:
+    _preload()
+except Exception as exc:
+    _reply({"ready": False, "error": repr(exc)})
+    sys.exit(1)
+_reply({"ready": True, "pid": os.getpid()})
+for line in sys.stdin:
+    if not line.strip():
+        continue
+    try:
+        _run(json.loads(line))
+    except Exception as exc:
+        _reply({"error": repr(exc)})
+'''
+
+
+class PytestWorkerError(RuntimeError):
+    """The worker could not start or stopped answering; run cold instead."""
+
+
+def pytest_worker_enabled() -> bool:
+    """True when ``GUARDKIT_COACH_PYTEST_WORKER`` opts in and ``fork`` exists."""
+    flag = os.environ.get(_ENABLE_ENV_VAR, "").strip().lower()
+    return flag in ("1", "true", "on", "yes") and hasattr(os, "fork")
+
+
+class PytestWorker:
+    """One warm pytest server bound to an interpreter and environment.
+
+    The protocol has one outstanding request at a time, so requests to one
+    server are serialised; concurrency comes from the per-worktree pool in
+    :func:`run_pytest`, which hands each run a server of its own.
+
+    Parameters
+    ----------
+    interpreter : str
+        Interpreter to run pytest under (the Coach's pinned venv python).
+    env : Mapping[str, str]
+        Environment for the server and therefore every forked run.
+    cwd : Path
+        Working directory the server starts in. Each request carries its own
+        run directory.
+    """
+
+    def __init__(self, interpreter: str, env: Mapping[str, str], cwd: Path):
+        self.interpreter = interpreter
+        self.env = dict(env)
+        self.cwd = Path(cwd)
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is running."""
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """Start the server and wait until pytest + plugins are imported.
+
+        Raises
+        ------
+        PytestWorkerError
+            If the server exits or does not report ready in time.
+        """
+        try:
+            self._proc = subprocess.Popen(
+                [self.interpreter, "-c", _WORKER_SOURCE],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd=str(self.cwd),
+                env=self.env,
+            )
+        except OSError as exc:
+            raise PytestWorkerError(f"could not start pytest worker: {exc}") from exc
+        reply = self._read_reply(_STARTUP_TIMEOUT_S)
+        if not reply.get("ready"):
+            self.close()
+            raise PytestWorkerError(
+                f"pytest worker failed to preload pytest: {reply.get('error')}"
+            )
+        logger.info(
+            "pytest worker ready (pid=%s, interpreter=%s)",
+            reply.get("pid"), self.interpreter,
+        )
+
+    def run(
+        self,
+        argv: Sequence[str],
+        cwd: Path,
+        timeout: Optional[float] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run ``pytest argv`` in a fresh fork and return its result.
+
+        ``stdout`` holds the combined stdout/stderr of the run; ``stderr`` is
+        empty. ``args`` is the equivalent cold command line.
+
+        Time spent waiting for the server (another request in flight) counts
+        against ``timeout``; a server still busy when it runs out raises
+        :class:`PytestWorkerError` so the caller can run cold.
+
+        Raises
+        ------
+        subprocess.TimeoutExpired
+            When the run exceeded ``timeout`` (the child was killed).
+        PytestWorkerError
+            When the server is gone, stayed busy, or replied with a protocol
+            error.
+        """
+        args = [self.interpreter, "-m", "pytest", *argv]
+        started = time.monotonic()
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise PytestWorkerError("pytest worker stayed busy")
+        try:
+            if timeout is not None:
+                timeout = max(0.0, timeout - (time.monotonic() - started))
+            if not self.alive:
+                raise PytestWorkerError("pytest worker is not running")
+            request = {"argv": list(argv), "cwd": str(cwd), "timeout": timeout}
+            try:
+                self._proc.stdin.write(json.dumps(request) + "\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as exc:
+                self.close()
+                raise PytestWorkerError(f"pytest worker pipe closed: {exc}") from exc
+            reply_timeout = None if timeout is None else timeout + _REPLY_GRACE_S
+            reply = self._read_reply(reply_timeout)
+        finally:
+            self._lock.release()
+        if "error" in reply:
+            raise PytestWorkerError(f"pytest worker error: {reply['error']}")
+        if reply.get("timed_out"):
+            raise subprocess.TimeoutExpired(args, timeout, output=reply.get("output"))
+        return subprocess.CompletedProcess(
+            args, int(reply["returncode"]), stdout=reply.get("output", ""), stderr=""
+        )
+
+    def _read_reply(self, timeout: Optional[float]) -> Dict:
+        assert self._proc is not None and self._proc.stdout is not None
+        ready, _, _ = select.select([self._proc.stdout], [], [], timeout)
+        if not ready:
+            self.close()
+            raise PytestWorkerError("pytest worker did not reply in time")
+        line = self._proc.stdout.readline()
+        if not line:
+            self.close()
+            raise PytestWorkerError("pytest worker exited")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as exc:
+            self.close()
+            raise PytestWorkerError(f"malformed pytest worker reply: {exc}") from exc
+
+    def close(self) -> None:
+        """Stop the server (idempotent)."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+def pytest_worker_pool_size() -> int:
+    """Warm servers per worktree (``GUARDKIT_COACH_PYTEST_WORKERS``)."""
+    raw = os.environ.get(_POOL_SIZE_ENV_VAR, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return min(4, os.cpu_count() or 1)
+
+
+class _WorkerPool:
+    """The warm servers of one (interpreter, worktree, environment) key.
+
+    A run checks a server out for its whole duration, so no two runs share
+    one. Servers start lazily, up to ``size``; when all are checked out,
+    :meth:`checkout` answers ``None`` instead of waiting.
+    """
+
+    def __init__(self, interpreter: str, env: Mapping[str, str], cwd: Path, size: int):
+        self.interpreter = interpreter
+        self.env = dict(env)
+        self.cwd = cwd
+        self.size = size
+        self._idle: List[PytestWorker] = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def checkout(self) -> Optional[PytestWorker]:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                self._count -= 1
+            if self._count >= self.size:
+                return None
+            self._count += 1
+        worker = PytestWorker(self.interpreter, self.env, self.cwd)
+        try:
+            worker.start()
+        except BaseException:
+            with self._lock:
+                self._count -= 1
+            raise
+        return worker
+
+    def release(self, worker: PytestWorker) -> None:
+        with self._lock:
+            if worker.alive:
+                self._idle.append(worker)
+            else:
+                self._count -= 1
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+        for worker in idle:
+            worker.close()
+
+
+_workers: Dict[Tuple[str, str, str], _WorkerPool] = {}
+_workers_lock = threading.Lock()
+
+
+def _env_fingerprint(env: Mapping[str, str]) -> str:
+    digest = hashlib.sha256()
+    for key in sorted(env):
+        digest.update(f"{key}={env[key]}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _get_pool(
+    interpreter: str, env: Mapping[str, str], worker_key: Union[str, Path]
+) -> _WorkerPool:
+    key = (interpreter, str(worker_key), _env_fingerprint(env))
+    with _workers_lock:
+        pool = _workers.get(key)
+        if pool is None:
+            pool = _WorkerPool(
+                interpreter, env, Path(worker_key), pytest_worker_pool_size()
+            )
+            _workers[key] = pool
+        return pool
+
+
+def _get_worker(
+    interpreter: str, env: Mapping[str, str], worker_key: Union[str, Path]
+) -> Optional[PytestWorker]:
+    """Check out an idle warm server for the key, or ``None`` if all are busy."""
+    return _get_pool(interpreter, env, worker_key).checkout()
+
+
+def _release_worker(
+    interpreter: str,
+    env: Mapping[str, str],
+    worker_key: Union[str, Path],
+    worker: PytestWorker,
+) -> None:
+    _get_pool(interpreter, env, worker_key).release(worker)
+
+
+def run_pytest(
+    interpreter: str,
+    argv: List[str],
+    *,
+    cwd: Path,
+    env: Mapping[str, str],
+    timeout: Optional[float],
+    worker_key: Union[str, Path],
+) -> subprocess.CompletedProcess:
+    """Run ``<interpreter> -m pytest argv`` through a warm worker when enabled.
+
+    ``worker_key`` identifies the worker pool (the Coach passes its worktree
+    path, so isolated-copy runs of the same worktree share warm servers).
+    Falls back to a cold ``subprocess.run`` with identical arguments when the
+    worker is disabled or fails, or when every server of the pool is busy
+    with a concurrent run.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        When the run exceeds ``timeout`` — on either path.
+    """
+    if pytest_worker_enabled():
+        try:
+            worker = _get_worker(interpreter, env, worker_key)
+        except PytestWorkerError as exc:
+            logger.warning(
+                "pytest worker unavailable (%s); running pytest cold", exc
+            )
+            worker = None
+        else:
+            if worker is None:
+                logger.debug(
+                    "every pytest worker for %s is busy; running pytest cold",
+                    worker_key,
+                )
+        if worker is not None:
+            try:
+                return worker.run(argv, cwd=cwd, timeout=timeout)
+            except PytestWorkerError as exc:
+                logger.warning(
+                    "pytest worker unavailable (%s); running pytest cold", exc
+                )
+            finally:
+                _release_worker(interpreter, env, worker_key, worker)
+    return subprocess.run(
+        [interpreter, "-m", "pytest", *argv],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=dict(env),
+    )
+
+
+def shutdown_pytest_workers() -> None:
+    """Stop every warm worker. Registered with :mod:`atexit`."""
+    with _workers_lock:
+        pools = list(_workers.values())
+        _workers.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(shutdown_pytest_workers)
@@ -15,8 +15,13 @@ Design notes:
   sanitised group name for unmapped ones — fail-open, never silently drop content).
 - ``disposition="retire"`` groups are skipped (already covered by the FEAT-HARV harvest
   corpus — no double-ingest).
-- Publishing reuses ``harvest_publisher.publish_episodes`` unchanged (per-episode 900KB
-  guard + idempotent ``episode_id`` = ``natural_key`` → JetStream dedup).
+- Publishing reuses ``harvest_publisher`` (per-episode 900KB guard + idempotent
+  ``episode_id`` = ``natural_key`` → JetStream dedup).
+- Large graphs are streamed, not loaded: ``stream_export_batches`` pages each graph's
+  Episodic nodes by internal-id cursor and exports several graphs concurrently into a
+  bounded queue, and ``export_episode_batches`` feeds the batches to
+  ``harvest_publisher.publish_episode_batches`` while advancing an ``ExportCheckpoint``,
+  so memory stays flat and an interrupted export resumes where it stopped.
 
 This module does NO NATS work and NO FalkorDB writes — it reads and constructs episodes.
 """
@@ -25,10 +30,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import queue
+import threading
+import uuid
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator, Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from nats_core.events import MemoryEpisodeV1
 
@@ -37,6 +47,15 @@ from guardkit.knowledge.fleet_memory_payloads import sanitize_identifier
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 500
+"""Episodic nodes read (and episodes built) per FalkorDB round trip."""
+
+DEFAULT_EXPORT_WORKERS = 4
+"""Graphs read concurrently. The reads are I/O-bound, so this is not tied to CPUs."""
+
+PageReader = Callable[[str, int, int], list[tuple[int, dict]]]
+"""``(graph_name, after_id, page_size) -> [(node_id, properties), ...]`` ordered by id."""
+
 
 @dataclass
 class GraphExportResult:
@@ -49,6 +68,8 @@ class GraphExportResult:
         skipped_empty: Nodes skipped for empty/whitespace content.
         skipped_no_group: Graphs skipped because the name has no ``project__group`` shape.
         counts_per_project: Episode count by (sanitised) project.
+        graphs_failed: Streaming only - graphs whose read failed part way; their
+            checkpoint is left open so the next run resumes them.
     """
 
     episodes: list[MemoryEpisodeV1] = field(default_factory=list)
@@ -57,6 +78,107 @@ class GraphExportResult:
     skipped_empty: int = 0
     skipped_no_group: int = 0
     counts_per_project: dict[str, int] = field(default_factory=dict)
+    graphs_failed: int = 0
+
+    def add_batch(self, batch: "ExportBatch") -> None:
+        """Fold a streamed batch's statistics in (the episodes are not kept)."""
+        self.skipped_retired += batch.skipped_retired
+        self.skipped_empty += batch.skipped_empty
+        if batch.episodes:
+            self.counts_per_project[batch.project] = (
+                self.counts_per_project.get(batch.project, 0) + len(batch.episodes)
+            )
+        if batch.final:
+            self.graphs_scanned += 1
+            self.skipped_no_group += int(batch.no_group)
+            self.graphs_failed += int(batch.failed)
+
+
+@dataclass
+class ExportBatch:
+    """One page of a graph's export, as produced by ``stream_export_batches``.
+
+    Attributes:
+        graph_name: FalkorDB graph the page was read from.
+        project: Sanitised project of that graph ("" for non-project graphs).
+        episodes: Episodes built from the page.
+        cursor: Internal id of the last node read; the graph's resume point.
+        skipped_retired: Nodes skipped because the group is retire-disposition.
+        skipped_empty: Nodes skipped for empty content.
+        final: Last batch for this graph in this run.
+        complete: Final batch and the graph has no nodes left after ``cursor``.
+        failed: Final batch because a read failed.
+        no_group: Final batch for a graph with no ``project__group`` name.
+    """
+
+    graph_name: str
+    project: str
+    episodes: list[MemoryEpisodeV1] = field(default_factory=list)
+    cursor: int = -1
+    skipped_retired: int = 0
+    skipped_empty: int = 0
+    final: bool = False
+    complete: bool = False
+    failed: bool = False
+    no_group: bool = False
+
+
+class ExportCheckpoint:
+    """Per-graph resume cursors for a streaming export, persisted as JSON.
+
+    Each graph records the internal id of the last node whose episode reached
+    the broker, and whether the graph is finished. The file is rewritten
+    atomically after every published batch.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: Path, graphs: Optional[dict[str, dict]] = None) -> None:
+        self.path = Path(path)
+        self.graphs: dict[str, dict] = dict(graphs or {})
+
+    @classmethod
+    def load(cls, path: Path | str) -> "ExportCheckpoint":
+        """Read a checkpoint, starting fresh when it is missing or unreadable."""
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable export checkpoint %s: %s", path, exc)
+            return cls(path)
+        if not isinstance(data, dict) or data.get("schema_version") != cls.SCHEMA_VERSION:
+            logger.warning("Ignoring export checkpoint %s with unknown schema", path)
+            return cls(path)
+        return cls(path, data.get("graphs") or {})
+
+    def cursor(self, graph_name: str) -> int:
+        return int(self.graphs.get(graph_name, {}).get("after_id", -1))
+
+    def is_done(self, graph_name: str) -> bool:
+        return bool(self.graphs.get(graph_name, {}).get("done", False))
+
+    def advance(self, graph_name: str, cursor: int, *, done: bool = False) -> None:
+        self.graphs[graph_name] = {"after_id": int(cursor), "done": done}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        document = {"schema_version": self.SCHEMA_VERSION, "graphs": self.graphs}
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}")
+        tmp.write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        """Forget all progress (a finished export's next run starts from zero)."""
+        self.graphs.clear()
+        self.path.unlink(missing_ok=True)
+
+
+def default_checkpoint_path(host: str, port: int) -> Path:
+    """Checkpoint location for an export from ``host:port``."""
+    safe_host = sanitize_identifier(host).lower() or "falkordb"
+    return Path.home() / ".guardkit" / "graph-export" / f"{safe_host}_{port}.json"
 
 
 def graph_name_to_project_group(graph_name: str) -> Optional[tuple[str, str]]:
@@ -221,6 +343,207 @@ def build_export_episodes(
     return result
 
 
+def _export_graph(
+    graph_name: str,
+    after_id: int,
+    read_page: PageReader,
+    page_size: int,
+    limit: Optional[int],
+    emit: Callable[[ExportBatch], bool],
+) -> None:
+    """Page through one graph, emitting a batch per page (the last one ``final``)."""
+    pg = graph_name_to_project_group(graph_name)
+    if pg is None:
+        emit(ExportBatch(graph_name, "", cursor=after_id, final=True, complete=True,
+                         no_group=True))
+        return
+    project, group_id = pg
+    retired = _domain_tags_for(group_id) is None
+    read = 0
+
+    while True:
+        size = page_size if limit is None else min(page_size, limit - read)
+        if size <= 0:
+            # Sampling cap reached; the graph is not finished.
+            emit(ExportBatch(graph_name, project, cursor=after_id, final=True))
+            return
+        try:
+            rows = read_page(graph_name, after_id, size)
+        except Exception as exc:
+            logger.warning("FalkorDB read failed for graph %r: %s", graph_name, exc)
+            emit(ExportBatch(graph_name, project, cursor=after_id, final=True,
+                             failed=True))
+            return
+
+        batch = ExportBatch(graph_name, project)
+        for node_id, node in rows:
+            after_id = node_id
+            episode = None if retired else build_document_episode(project, group_id, node)
+            if episode is not None:
+                batch.episodes.append(episode)
+            elif retired:
+                batch.skipped_retired += 1
+            else:
+                batch.skipped_empty += 1
+        batch.cursor = after_id
+        read += len(rows)
+        if len(rows) < size:
+            batch.final = batch.complete = True
+        if not emit(batch) or batch.final:
+            return
+
+
+def stream_export_batches(
+    graph_names: Iterable[str],
+    read_page: PageReader,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: Optional[int] = None,
+    checkpoint: Optional[ExportCheckpoint] = None,
+    limit_per_graph: Optional[int] = None,
+) -> Iterator[ExportBatch]:
+    """Export graphs concurrently as a bounded stream of per-page batches.
+
+    Up to ``workers`` graphs are read at once, each page by page from its
+    checkpoint cursor; finished graphs in ``checkpoint`` are skipped. Batches
+    pass through a queue of ``2 * workers`` slots, so at most that many pages
+    (plus one per worker being built) are in memory however large the graphs
+    are. Batches of one graph arrive in cursor order; graphs interleave.
+    Closing the iterator early stops the readers.
+
+    Args:
+        graph_names: Graphs to export.
+        read_page: Page reader (``falkordb_page_reader`` for a live database).
+        page_size: Nodes per page.
+        workers: Graphs read concurrently (default ``DEFAULT_EXPORT_WORKERS``).
+        checkpoint: Resume cursors; read here, advanced by the consumer.
+        limit_per_graph: Optional cap on nodes read per graph this run.
+
+    Yields:
+        ``ExportBatch`` per page; each graph ends with a ``final`` batch.
+    """
+    pending: "queue.SimpleQueue[tuple[str, int]]" = queue.SimpleQueue()
+    total = 0
+    for name in graph_names:
+        if checkpoint is not None and checkpoint.is_done(name):
+            continue
+        pending.put((name, checkpoint.cursor(name) if checkpoint is not None else -1))
+        total += 1
+    if not total:
+        return
+
+    workers = max(1, min(workers or DEFAULT_EXPORT_WORKERS, total))
+    out: "queue.Queue[Optional[ExportBatch]]" = queue.Queue(maxsize=2 * workers)
+    stop = threading.Event()
+
+    def emit(item: Optional[ExportBatch]) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker() -> None:
+        try:
+            while not stop.is_set():
+                try:
+                    name, after_id = pending.get_nowait()
+                except queue.Empty:
+                    break
+                _export_graph(name, after_id, read_page, page_size, limit_per_graph, emit)
+        finally:
+            emit(None)
+
+    threads = [
+        threading.Thread(target=worker, name=f"graph-export-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        finished = 0
+        while finished < workers:
+            item = out.get()
+            if item is None:
+                finished += 1
+                continue
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def export_episode_batches(
+    batches: Iterable[ExportBatch],
+    result: GraphExportResult,
+    checkpoint: Optional[ExportCheckpoint] = None,
+) -> Iterator[list[MemoryEpisodeV1]]:
+    """Adapt an export stream for ``harvest_publisher.publish_episode_batches``.
+
+    Statistics are folded into ``result`` as batches arrive. A batch's
+    checkpoint is advanced only when the consumer asks for the next one — that
+    is, after it finished publishing this one — so a crash loses at most the
+    batch in flight, which the idempotent episode ids make safe to resend.
+
+    Args:
+        batches: Output of ``stream_export_batches``.
+        result: Accumulates counts (its ``episodes`` list stays empty).
+        checkpoint: Advanced and saved per batch; None for dry runs.
+
+    Yields:
+        The non-empty episode lists, in stream order.
+    """
+    for batch in batches:
+        result.add_batch(batch)
+        if batch.episodes:
+            yield batch.episodes
+        if checkpoint is not None and not batch.failed:
+            checkpoint.advance(batch.graph_name, batch.cursor, done=batch.complete)
+            checkpoint.save()
+
+
+def list_export_graphs(db: Any, project_filter: Optional[str] = None) -> list[str]:
+    """Project-scoped graph names in ``db`` (matching ``project_filter`` when set)."""
+    names = []
+    for graph_name in db.list_graphs():
+        pg = graph_name_to_project_group(graph_name)
+        if pg is None:
+            continue
+        if project_filter is not None and pg[0] != project_filter:
+            continue
+        names.append(graph_name)
+    return names
+
+
+def falkordb_page_reader(db: Any) -> PageReader:
+    """Build a ``PageReader`` over a ``falkordb.FalkorDB`` connection.
+
+    Pages by internal node id (``WHERE id(n) > $after ... ORDER BY id LIMIT``)
+    rather than ``SKIP``: FalkorDB answers an id range with an index seek, so
+    every page costs the same however deep into the graph it is, whereas
+    ``SKIP n`` rescans the first n nodes each time.
+    """
+    query = (
+        "MATCH (n:Episodic) WHERE id(n) > $after "
+        "RETURN id(n) AS nid, properties(n) AS props ORDER BY nid LIMIT $limit"
+    )
+
+    def read_page(graph_name: str, after_id: int, page_size: int) -> list[tuple[int, dict]]:
+        res = db.select_graph(graph_name).query(
+            query, {"after": int(after_id), "limit": int(page_size)}
+        )
+        # Non-dict rows still advance the cursor (built as empty, then skipped).
+        return [
+            (int(row[0]), row[1] if isinstance(row[1], dict) else {})
+            for row in res.result_set
+        ]
+
+    return read_page
+
+
 def read_falkordb_episodics(
     host: str,
     port: int = 6379,
@@ -230,9 +553,10 @@ def read_falkordb_episodics(
     """Yield ``(graph_name, episodic_node_dicts)`` from FalkorDB.
 
     Connects to FalkorDB, lists graphs, and for each graph whose name is project-scoped
-    (and matches ``project_filter`` when given) runs ``MATCH (n:Episodic) RETURN
-    properties(n)``. Only the raw Episodic (source) layer is read — never the extracted
-    Entity/edge layer.
+    (and matches ``project_filter`` when given) reads every ``Episodic`` node's
+    properties. Only the raw Episodic (source) layer is read — never the extracted
+    Entity/edge layer. Each graph is materialised whole; exports of large graphs should
+    use ``stream_export_batches`` with ``falkordb_page_reader`` instead.
 
     Args:
         host: FalkorDB host (e.g. ``whitestocks``).
@@ -247,20 +571,23 @@ def read_falkordb_episodics(
     from falkordb import FalkorDB
 
     db = FalkorDB(host=host, port=port)
-    for graph_name in db.list_graphs():
-        pg = graph_name_to_project_group(graph_name)
-        if pg is None:
-            continue
-        project, _group_id = pg
-        if project_filter is not None and project != project_filter:
-            continue
-        query = "MATCH (n:Episodic) RETURN properties(n) AS props"
-        if limit_per_graph is not None:
-            query += f" LIMIT {int(limit_per_graph)}"
+    read_page = falkordb_page_reader(db)
+    for graph_name in list_export_graphs(db, project_filter):
+        nodes: list[dict] = []
+        after_id = -1
+        read = 0
         try:
-            res = db.select_graph(graph_name).query(query)
+            while limit_per_graph is None or read < limit_per_graph:
+                size = DEFAULT_PAGE_SIZE
+                if limit_per_graph is not None:
+                    size = min(size, limit_per_graph - read)
+                rows = read_page(graph_name, after_id, size)
+                read += len(rows)
+                nodes.extend(node for _node_id, node in rows if node)
+                if len(rows) < size:
+                    break
+                after_id = rows[-1][0]
         except Exception as exc:  # pragma: no cover - defensive against a bad graph
             logger.warning("FalkorDB read failed for graph %r: %s", graph_name, exc)
             continue
-        nodes = [row[0] for row in res.result_set if isinstance(row[0], dict)]
         yield graph_name, nodes
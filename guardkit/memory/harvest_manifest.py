@@ -0,0 +1,221 @@
+"""Local publish manifest for incremental harvests.
+
+Records, per natural key, what the last successful harvest publish sent:
+the content hash of the body and the episode_id it went out under. An
+incremental walk compares each document against its entry and only builds
+(and publishes) the ones whose content changed or that are new; documents
+that disappeared from the allow-list are tombstoned.
+
+Tombstones live in this manifest only. MemoryEpisodeV1 has no deletion, so
+nothing is published for a tombstoned document: fleet-memory keeps serving
+its last episode until it is removed on the store side.
+
+Stdlib only, like harvest_taxonomy: the CLI and tests can read and write a
+manifest without the optional `memory` extra (nats-core) installed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Protocol
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_ENV_VAR = "GUARDKIT_HARVEST_MANIFEST"
+"""Overrides where the manifest lives (default ``<repo>/.guardkit/harvest-manifest.json``)."""
+
+MANIFEST_SCHEMA_VERSION = 1
+
+
+class _PublishedEpisode(Protocol):
+    """The MemoryEpisodeV1 fields the manifest records (no nats-core import)."""
+
+    episode_id: str
+    episode_type: str
+    source_ref: str
+    body: str
+
+
+def content_hash(body: str) -> str:
+    """SHA-256 of a document body, as stored in the manifest.
+
+    Args:
+        body: Document body text exactly as it would be published.
+
+    Returns:
+        Hex digest prefixed with the algorithm (e.g. "sha256:ab12...").
+    """
+    return "sha256:" + hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def default_manifest_path(repo_root: Path | str) -> Path:
+    """Resolve the manifest location for a repository.
+
+    Args:
+        repo_root: Repository root the harvest walks.
+
+    Returns:
+        The GUARDKIT_HARVEST_MANIFEST path when set, else
+        ``<repo_root>/.guardkit/harvest-manifest.json``.
+    """
+    override = os.environ.get(MANIFEST_ENV_VAR, "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path(repo_root) / ".guardkit" / "harvest-manifest.json"
+
+
+@dataclass
+class ManifestEntry:
+    """What was last published for one natural key.
+
+    Attributes:
+        source_ref: Repo-relative path of the document.
+        episode_type: Episode type from HARVEST_MAP.
+        content_hash: Hash of the published body; None once tombstoned.
+        episode_id: episode_id the body was last published under.
+        published_at: ISO-8601 time of the last publish.
+        tombstoned_at: ISO-8601 time the document was seen to be gone, or
+            None while it still exists.
+    """
+
+    source_ref: str
+    episode_type: str
+    content_hash: str | None
+    episode_id: str
+    published_at: str | None = None
+    tombstoned_at: str | None = None
+
+    @property
+    def is_tombstone(self) -> bool:
+        return self.tombstoned_at is not None
+
+
+class HarvestManifest:
+    """Natural key -> ManifestEntry map persisted as JSON.
+
+    The manifest only moves forward after a publish succeeded: callers
+    ``record`` the episodes that went out and ``tombstone`` the keys that
+    vanished, then ``save``. A run that fails half way leaves the previous
+    manifest in place, so the next incremental run retries the same set.
+    """
+
+    def __init__(
+        self,
+        entries: dict[str, ManifestEntry] | None = None,
+        path: Path | None = None,
+    ) -> None:
+        self.entries: dict[str, ManifestEntry] = dict(entries or {})
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path | str) -> "HarvestManifest":
+        """Read a manifest, starting empty when it is missing or unreadable.
+
+        An unreadable manifest is not an error: the only cost of starting
+        empty is one full republish, which is what a non-incremental run does.
+
+        Args:
+            path: Manifest file location.
+
+        Returns:
+            HarvestManifest bound to ``path``.
+        """
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path=path)
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "Ignoring unreadable harvest manifest %s (%s); "
+                "the next publish will be a full one",
+                path,
+                exc,
+            )
+            return cls(path=path)
+
+        if not isinstance(data, dict) or data.get("schema_version") != MANIFEST_SCHEMA_VERSION:
+            logger.warning(
+                "Ignoring harvest manifest %s with unknown schema; "
+                "the next publish will be a full one",
+                path,
+            )
+            return cls(path=path)
+
+        entries: dict[str, ManifestEntry] = {}
+        for key, raw in (data.get("entries") or {}).items():
+            try:
+                entries[key] = ManifestEntry(**raw)
+            except TypeError:
+                logger.debug("Dropping malformed manifest entry %s", key)
+        return cls(entries, path=path)
+
+    def save(self, path: Path | str | None = None) -> Path:
+        """Write the manifest atomically (temp file + ``os.replace``).
+
+        Args:
+            path: Destination; defaults to the path the manifest was loaded from.
+
+        Returns:
+            The path written.
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("HarvestManifest.save() needs a path")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "entries": {
+                key: asdict(entry) for key, entry in sorted(self.entries.items())
+            },
+        }
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+        tmp.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, target)
+        self.path = target
+        return target
+
+    def is_current(self, natural_key: str, body_hash: str) -> bool:
+        """True when ``natural_key`` was last published with this exact body."""
+        entry = self.entries.get(natural_key)
+        return entry is not None and not entry.is_tombstone and entry.content_hash == body_hash
+
+    def live_keys(self) -> set[str]:
+        """Natural keys whose document was present at the last publish."""
+        return {key for key, entry in self.entries.items() if not entry.is_tombstone}
+
+    def record(self, natural_key: str, episode: _PublishedEpisode) -> None:
+        """Note that ``episode`` was published under ``natural_key``."""
+        self.entries[natural_key] = ManifestEntry(
+            source_ref=episode.source_ref,
+            episode_type=episode.episode_type,
+            content_hash=content_hash(episode.body),
+            episode_id=episode.episode_id,
+            published_at=_now(),
+        )
+
+    def tombstone(self, natural_keys: Iterable[str]) -> None:
+        """Mark documents that are no longer in the allow-list as deleted.
+
+        The entry (and its last episode_id) is kept so the deletion stays
+        visible; a document that later reappears is simply published again.
+        Local bookkeeping only: no deletion reaches fleet-memory.
+        """
+        stamp = _now()
+        for key in natural_keys:
+            entry = self.entries.get(key)
+            if entry is None or entry.is_tombstone:
+                continue
+            entry.content_hash = None
+            entry.tombstoned_at = stamp
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
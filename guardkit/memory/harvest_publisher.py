@@ -12,7 +12,7 @@ import logging
 import os
 from collections import Counter
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from nats_core.client import NATSClient
 from nats_core.config import NATSConfig
@@ -174,31 +174,11 @@ async def publish_episodes(
         await client.connect()
 
         for episode in episodes:
-            try:
-                await client.publish_episode(episode)
+            if await _publish_one(client, episode):
                 published += 1
                 type_counts[episode.episode_type] += 1
-                logger.debug(
-                    "Published episode %s (type=%s, size=%d bytes)",
-                    episode.episode_id,
-                    episode.episode_type,
-                    len(episode.body.encode()),
-                )
-            except ValueError as e:
-                # Catch oversized episode error per-episode
-                if "exceeding the" in str(e) and "byte" in str(e):
-                    skipped_oversized += 1
-                    logger.warning(
-                        "Skipped oversized episode %s (type=%s, size=%d bytes): %s. "
-                        "Chunk the content upstream to stay under 900KB.",
-                        episode.episode_id,
-                        episode.episode_type,
-                        len(episode.body.encode()),
-                        str(e),
-                    )
-                else:
-                    # Re-raise other ValueErrors
-                    raise
+            else:
+                skipped_oversized += 1
 
     finally:
         # Always disconnect, even if errors occurred — but never wait on it
@@ -210,3 +190,101 @@ async def publish_episodes(
         skipped_oversized=skipped_oversized,
         counts_per_type=dict(type_counts),
     )
+
+
+async def publish_episode_batches(
+    batches: Iterable[Sequence[MemoryEpisodeV1]],
+    client: NATSClient | None = None,
+) -> PublishSummary:
+    """Publish a stream of episode batches over one NATS connection.
+
+    The streaming counterpart of ``publish_episodes`` for exports too large to
+    hold in memory: only the batch being sent is resident. The next batch is
+    pulled (off the event loop, since producers may block on I/O) only after
+    every episode of the previous one was published, so a producer that
+    checkpoints on pull — ``graph_export.export_episode_batches`` — never
+    records progress the broker has not seen.
+
+    The connection (and the password it needs) is only set up once the first
+    non-empty batch arrives: a stream with nothing to send never touches NATS.
+
+    Args:
+        batches: Iterable of episode batches; a generator is closed when the
+            publish ends, error or not.
+        client: Optional pre-configured NATSClient (primarily for testing).
+            If None, builds a client from GUARDKIT_NATS_PASSWORD environment.
+
+    Returns:
+        PublishSummary totalled across all batches.
+
+    Raises:
+        ValueError: If GUARDKIT_NATS_PASSWORD is missing/blank (when client=None
+            and there is something to publish).
+        RuntimeError: If connection or other unexpected errors occur.
+    """
+    published = 0
+    skipped_oversized = 0
+    type_counts: Counter[str] = Counter()
+    iterator = iter(batches)
+    connected = False
+
+    try:
+        while True:
+            batch = await asyncio.to_thread(next, iterator, None)
+            if batch is None:
+                break
+            if batch and not connected:
+                if client is None:
+                    client = build_nats_client(read_nats_password())
+                connected = True
+                await client.connect()
+            for episode in batch:
+                if await _publish_one(client, episode):
+                    published += 1
+                    type_counts[episode.episode_type] += 1
+                else:
+                    skipped_oversized += 1
+
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        if connected:
+            await _disconnect_bounded(client)
+
+    return PublishSummary(
+        published=published,
+        skipped_oversized=skipped_oversized,
+        counts_per_type=dict(type_counts),
+    )
+
+
+async def _publish_one(client: NATSClient, episode: MemoryEpisodeV1) -> bool:
+    """Publish one episode; False if it was skipped as oversized.
+
+    Raises:
+        ValueError: For any rejection other than the 900KB size guard.
+    """
+    try:
+        await client.publish_episode(episode)
+    except ValueError as e:
+        # Catch oversized episode error per-episode
+        if "exceeding the" in str(e) and "byte" in str(e):
+            logger.warning(
+                "Skipped oversized episode %s (type=%s, size=%d bytes): %s. "
+                "Chunk the content upstream to stay under 900KB.",
+                episode.episode_id,
+                episode.episode_type,
+                len(episode.body.encode()),
+                str(e),
+            )
+            return False
+        # Re-raise other ValueErrors
+        raise
+    logger.debug(
+        "Published episode %s (type=%s, size=%d bytes)",
+        episode.episode_id,
+        episode.episode_type,
+        len(episode.body.encode()),
+    )
+    return True
@@ -4,6 +4,12 @@ Walks the curated allow-list directories (from HARVEST_MAP in harvest_taxonomy),
 builds MemoryEpisodeV1 episodes for each markdown file, and returns both the
 episodes and skip reports.
 
+Passing a HarvestManifest makes the walk incremental: documents whose body
+hash matches the manifest are counted as unchanged and never built, and
+manifest keys that no longer map to a document come back as tombstones.
+Commit times for every walked file are resolved by one ``git log`` pass
+rather than one subprocess per file.
+
 This module performs NO NATS work - it only constructs episode objects and
 handles file system traversal. The publisher (harvest_publisher) handles
 NATS publishing.
@@ -14,12 +20,13 @@ from __future__ import annotations
 import logging
 import subprocess
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
 from nats_core.events import MAX_EPISODE_BODY_BYTES, MemoryEpisodeV1
 
+from guardkit.memory.harvest_manifest import HarvestManifest, content_hash
 from guardkit.memory.harvest_taxonomy import (
     HARVEST_MAP,
     derive_episode_id,
@@ -40,12 +47,19 @@ class HarvestResult:
             docs that exceeded MAX_EPISODE_BODY_BYTES.
         skipped_empty: Count of empty/whitespace-only bodies filtered out.
         counts_per_type: Count of episodes by episode_type.
+        unchanged: Incremental walks only - docs skipped because their body
+            matches what the manifest says was last published.
+        tombstones: Incremental walks only - natural keys the manifest holds
+            as published whose document is gone (deleted, moved out of the
+            allow-list, or emptied).
     """
 
     episodes: list[MemoryEpisodeV1]
     skipped_oversized: list[tuple[str, int]]
     skipped_empty: int
     counts_per_type: dict[str, int]
+    unchanged: int = 0
+    tombstones: list[str] = field(default_factory=list)
 
 
 def _get_file_mtime(file_path: Path, repo_root: Path) -> datetime:
@@ -82,6 +96,59 @@ def _get_file_mtime(file_path: Path, repo_root: Path) -> datetime:
     return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
 
 
+def _batch_file_mtimes(
+    repo_root: Path,
+    directories: list[Path],
+) -> dict[str, datetime] | None:
+    """Resolve the last-commit time of every file under ``directories`` at once.
+
+    Walks ``git log --name-only`` newest-first over the given directories; the
+    first commit that names a path is its last commit, which is exactly what
+    ``_get_file_mtime`` asks ``git log -1`` for one file at a time.
+
+    Args:
+        repo_root: Repository root directory (the walk's root, which may be a
+            subdirectory of the git work tree).
+        directories: Absolute directories being harvested.
+
+    Returns:
+        Map of repo_root-relative POSIX path -> author time for every file
+        with history, or None if git is unavailable (callers then fall back
+        to ``_get_file_mtime`` per file).
+    """
+    if not directories:
+        return {}
+    pathspecs = [str(d.relative_to(repo_root)) for d in directories]
+    try:
+        result = subprocess.run(
+            [
+                "git", "-c", "core.quotepath=off", "log",
+                "--format=%x00%aI", "--name-only", "--relative", "--no-renames",
+                "--", *pathspecs,
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    mtimes: dict[str, datetime] = {}
+    current: datetime | None = None
+    for line in result.stdout.splitlines():
+        if line.startswith("\x00"):
+            try:
+                current = datetime.fromisoformat(line[1:].strip())
+            except ValueError:
+                current = None
+        elif line and current is not None:
+            mtimes.setdefault(line, current)
+    return mtimes
+
+
 def _is_empty_body(body: str) -> bool:
     """Check if body is empty or whitespace-only.
 
@@ -98,6 +165,9 @@ def _build_episode(
     file_path: Path,
     repo_root: Path,
     episode_type: str,
+    *,
+    body: str | None = None,
+    occurred_at: datetime | None = None,
 ) -> MemoryEpisodeV1 | None:
     """Build MemoryEpisodeV1 for a single file.
 
@@ -105,6 +175,9 @@ def _build_episode(
         file_path: Absolute path to the markdown file.
         repo_root: Repository root directory.
         episode_type: Episode type from taxonomy mapping.
+        body: File content when the caller already read it.
+        occurred_at: Modification time when the caller already resolved it;
+            otherwise looked up with ``_get_file_mtime``.
 
     Returns:
         MemoryEpisodeV1 instance, or None if body is empty.
@@ -113,7 +186,8 @@ def _build_episode(
         ValueError: If body size exceeds MAX_EPISODE_BODY_BYTES.
     """
     # Read file content
-    body = file_path.read_text(encoding="utf-8")
+    if body is None:
+        body = file_path.read_text(encoding="utf-8")
 
     # Filter empty bodies
     if _is_empty_body(body):
@@ -139,7 +213,8 @@ def _build_episode(
     name = file_path.stem
 
     # Get file modification time
-    occurred_at = _get_file_mtime(file_path, repo_root)
+    if occurred_at is None:
+        occurred_at = _get_file_mtime(file_path, repo_root)
 
     # Build episode
     return MemoryEpisodeV1(
@@ -155,15 +230,25 @@ def _build_episode(
     )
 
 
-def walk_harvest_dirs(repo_root: Path | str) -> HarvestResult:
+def walk_harvest_dirs(
+    repo_root: Path | str,
+    *,
+    manifest: HarvestManifest | None = None,
+) -> HarvestResult:
     """Walk harvest directories and build MemoryEpisodeV1 episodes.
 
     Enumerates all *.md files under HARVEST_MAP directories, maps each to its
     episode_type, builds MemoryEpisodeV1 with full provenance, filters empty
     bodies, and skips oversized docs (>= MAX_EPISODE_BODY_BYTES).
 
+    With a manifest the walk is incremental: only new or changed documents
+    are built, and published keys with no document left are reported in
+    ``tombstones``. The manifest itself is not modified - the caller records
+    the episodes once they are actually published.
+
     Args:
         repo_root: Path to repository root directory. Can be Path or string.
+        manifest: Last-published state to diff against (incremental mode).
 
     Returns:
         HarvestResult with episodes, skip reports, and statistics.
@@ -180,6 +265,7 @@ def walk_harvest_dirs(repo_root: Path | str) -> HarvestResult:
     skipped_oversized: list[tuple[str, int]] = []
     skipped_empty = 0
     type_counts: Counter[str] = Counter()
+    unchanged = 0
 
     # Collect all directories to scan from HARVEST_MAP.
     # ONLY owner=="harvest" entries are walked here: owner=="reindex" directories
@@ -195,6 +281,10 @@ def walk_harvest_dirs(repo_root: Path | str) -> HarvestResult:
             if dir_path.exists() and dir_path.is_dir():
                 dirs_to_scan.add(dir_path)
 
+    # One git pass for every file's commit time (None -> per-file fallback).
+    commit_times = _batch_file_mtimes(repo_root, sorted(dirs_to_scan))
+    present_keys: set[str] = set()
+
     # Walk each directory
     for dir_path in dirs_to_scan:
         # Find all .md files recursively
@@ -213,9 +303,33 @@ def walk_harvest_dirs(repo_root: Path | str) -> HarvestResult:
                 )
                 continue
 
+            body = md_file.read_text(encoding="utf-8")
+            if manifest is not None and not _is_empty_body(body):
+                natural_key = natural_key_for(relative_path_str, episode_type)
+                present_keys.add(natural_key)
+                if manifest.is_current(natural_key, content_hash(body)):
+                    unchanged += 1
+                    continue
+
+            if commit_times is None:
+                occurred_at = None
+            elif relative_path_str in commit_times:
+                occurred_at = commit_times[relative_path_str]
+            else:
+                # Untracked: git has no date for it, so don't ask again.
+                occurred_at = datetime.fromtimestamp(
+                    md_file.stat().st_mtime, tz=timezone.utc
+                )
+
             # Build episode
             try:
-                episode = _build_episode(md_file, repo_root, episode_type)
+                episode = _build_episode(
+                    md_file,
+                    repo_root,
+                    episode_type,
+                    body=body,
+                    occurred_at=occurred_at,
+                )
 
                 if episode is None:
                     # Empty body - filtered out
@@ -251,9 +365,15 @@ def walk_harvest_dirs(repo_root: Path | str) -> HarvestResult:
                     # Other ValueError - re-raise
                     raise
 
+    tombstones: list[str] = []
+    if manifest is not None:
+        tombstones = sorted(manifest.live_keys() - present_keys)
+
     return HarvestResult(
         episodes=episodes,
         skipped_oversized=skipped_oversized,
         skipped_empty=skipped_empty,
         counts_per_type=dict(type_counts),
+        unchanged=unchanged,
+        tombstones=tombstones,
     )
@@ -43,6 +43,11 @@ from guardkit.orchestrator.exceptions import (
     TaskStateError,
     TaskWorkResult,
 )
+from guardkit.orchestrator.instrumentation.concurrency import (
+    LLMRequestGate,
+    LLMSlot,
+    get_llm_request_gate,
+)
 from guardkit.orchestrator.instrumentation.emitter import NullEmitter
 from guardkit.orchestrator.instrumentation.llm_instrumentation import (
     classify_error,
@@ -52,6 +57,12 @@ from guardkit.orchestrator.instrumentation.llm_instrumentation import (
     sanitise_tool_name,
 )
 from guardkit.orchestrator.instrumentation.redaction import SecretRedactor
+from guardkit.orchestrator.instrumentation.prompt_layout import (
+    PrefixCacheEstimate,
+    PromptLayout,
+    SectionStability,
+    get_prefix_cache_tracker,
+)
 from guardkit.orchestrator.instrumentation.schemas import LLMCallEvent, ToolExecEvent
 from guardkit.orchestrator.paths import TaskArtifactPaths
 from guardkit.orchestrator.prompts import load_protocol
@@ -600,6 +611,17 @@ MAX_SDK_TIMEOUT = 3600
 MAX_SDK_STREAM_RETRIES = 1
 SDK_STREAM_RETRY_BACKOFF = 30  # seconds
 
+# State directories _find_task_file searches, in order (resolved through the
+# shared task index, guardkit.tasks.task_index).
+_TASK_FILE_STATES: Tuple[str, ...] = (
+    "backlog",
+    "design_approved",
+    "in_progress",
+    "in_review",
+    "completed",
+    "blocked",
+)
+
 
 def turn_pressure(turn: int, max_turns: int) -> Tuple[bool, bool]:
     """The ONE rule for "is the Player running out of turns?".
@@ -1033,6 +1055,21 @@ class TaskWorkStreamParser:
     # Alternative pytest pattern for simpler output: "5 passed in 0.23s"
     PYTEST_SIMPLE_PATTERN = re.compile(r"(\d+)\s+passed(?:\s+in\s+[\d.]+s)?", re.IGNORECASE)
 
+    # Literal anchors: a pattern only runs when the literals every one of its
+    # matches must contain are present, and a pattern that must *start* with
+    # a literal is searched from that literal's first occurrence. Both give
+    # the same first match as a full search, so a multi-megabyte tool output
+    # costs a few substring scans plus regex work near the real hits.
+    # IGNORECASE literals are checked against _gate_text(), never used as
+    # positions.
+    _FOLD_TABLE = str.maketrans({"\u0131": "i", "\u0130": "i", "\u017f": "s", "\u212a": "k"})
+
+    # Accumulated file sets are bounded: a runaway stream (e.g. a tool that
+    # echoes every path in a monorepo) must not grow parser memory without
+    # limit. Paths longer than PATH_MAX are regex noise, not files.
+    MAX_TRACKED_FILES = 10_000
+    MAX_FILE_PATH_LENGTH = 4096
+
     def __init__(self) -> None:
         """Initialize the parser with empty accumulated state."""
         self._phases: Dict[str, Dict[str, Any]] = {}
@@ -1060,22 +1097,64 @@ class TaskWorkStreamParser:
         self._solid_score: Optional[int] = None
         self._dry_score: Optional[int] = None
         self._yagni_score: Optional[int] = None
+        self._files_dropped = 0
 
     def _match_pattern(
         self,
         pattern: re.Pattern,
         text: str,
+        pos: int = 0,
     ) -> Optional[re.Match]:
         """Helper to match a pattern against text.
 
         Args:
             pattern: Compiled regex pattern
             text: Text to search
+            pos: Index to start searching from
 
         Returns:
             Match object if found, None otherwise
         """
-        return pattern.search(text)
+        return pattern.search(text, pos)
+
+    @classmethod
+    def _gate_text(cls, message: str) -> str:
+        """Lower-cased text for IGNORECASE literal gates.
+
+        ``re.IGNORECASE`` also matches a few non-ASCII letters to ASCII ones
+        (dotless i, long s, Kelvin sign); fold those first so a gate never
+        rejects text the pattern would match.
+        """
+        if message.isascii():
+            return message.lower()
+        return message.translate(cls._FOLD_TABLE).lower()
+
+    @staticmethod
+    def _first_index(text: str, *literals: str) -> int:
+        """Earliest index of any literal in text, or -1 when none occur."""
+        found = [i for i in (text.find(lit) for lit in literals) if i >= 0]
+        return min(found) if found else -1
+
+    def _add_file(self, files: set, file_path: str) -> bool:
+        """Add a path to an accumulated file set within the size bounds.
+
+        Returns:
+            True if the path is (now) in the set
+        """
+        if file_path in files:
+            return True
+        if len(file_path) > self.MAX_FILE_PATH_LENGTH:
+            return False
+        if len(files) >= self.MAX_TRACKED_FILES:
+            if not self._files_dropped:
+                logger.warning(
+                    f"Stream parser file set reached {self.MAX_TRACKED_FILES} "
+                    f"entries; further paths are not tracked"
+                )
+            self._files_dropped += 1
+            return False
+        files.add(file_path)
+        return True
 
     # TS-lane D.1c: the TypeScript/JavaScript test-file naming conventions.
     # A vitest/jest suite is ``<subject>.test.ts`` or ``<subject>.spec.ts``
@@ -1180,19 +1259,19 @@ class TaskWorkStreamParser:
             return
 
         if tool_name == "Write":
-            self._files_created.add(file_path)
-            self._files_authored.add(file_path)
+            self._add_file(self._files_created, file_path)
+            self._add_file(self._files_authored, file_path)
             logger.debug(f"Tool call tracked - file created: {file_path}")
             # Track test files separately
             if self._is_test_file(file_path):
-                self._test_files_created.add(file_path)
+                self._add_file(self._test_files_created, file_path)
                 logger.debug(f"Test file tracked: {file_path}")
         elif tool_name == "Edit":
-            self._files_modified.add(file_path)
-            self._files_authored.add(file_path)
+            self._add_file(self._files_modified, file_path)
+            self._add_file(self._files_authored, file_path)
             logger.debug(f"Tool call tracked - file modified: {file_path}")
 
-    def _parse_tool_invocations(self, message: str) -> None:
+    def _parse_tool_invocations(self, message: str, gate: Optional[str] = None) -> None:
         """Parse tool invocations from message and track file operations.
 
         Detects Write and Edit tool calls in the message text and extracts
@@ -1201,28 +1280,41 @@ class TaskWorkStreamParser:
 
         Args:
             message: Stream message that may contain tool invocations
+            gate: ``_gate_text(message)``, when the caller already has it
         """
         # Track XML-style tool invocations: <invoke name="Write">...<parameter name="file_path">
-        tool_match = self._match_pattern(self.TOOL_INVOKE_PATTERN, message)
-        if tool_match:
-            tool_name = tool_match.group(1)
-            file_path_match = self._match_pattern(self.TOOL_FILE_PATH_PATTERN, message)
-            if file_path_match:
-                file_path = file_path_match.group(1).strip()
-                self._track_tool_call(tool_name, {"file_path": file_path})
+        invoke_pos = message.find("<invoke")
+        if invoke_pos >= 0:
+            tool_match = self._match_pattern(self.TOOL_INVOKE_PATTERN, message, invoke_pos)
+            param_pos = message.find("<parameter") if tool_match else -1
+            if param_pos >= 0:
+                tool_name = tool_match.group(1)
+                file_path_match = self._match_pattern(
+                    self.TOOL_FILE_PATH_PATTERN, message, param_pos
+                )
+                if file_path_match:
+                    file_path = file_path_match.group(1).strip()
+                    self._track_tool_call(tool_name, {"file_path": file_path})
+
+        if gate is None:
+            gate = self._gate_text(message)
+        if "file" not in gate:
+            return
 
         # Track tool result messages (e.g., "File created successfully at: /path")
-        for result_match in self.TOOL_RESULT_CREATED_PATTERN.finditer(message):
-            file_path = result_match.group(1).strip()
-            if file_path and self._is_valid_file_path(file_path):
-                self._files_created.add(file_path)
-                logger.debug(f"Tool result tracked - file created: {file_path}")
-
-        for result_match in self.TOOL_RESULT_MODIFIED_PATTERN.finditer(message):
-            file_path = result_match.group(1).strip()
-            if file_path and self._is_valid_file_path(file_path):
-                self._files_modified.add(file_path)
-                logger.debug(f"Tool result tracked - file modified: {file_path}")
+        if "created" in gate or "written" in gate:
+            for result_match in self.TOOL_RESULT_CREATED_PATTERN.finditer(message):
+                file_path = result_match.group(1).strip()
+                if file_path and self._is_valid_file_path(file_path):
+                    if self._add_file(self._files_created, file_path):
+                        logger.debug(f"Tool result tracked - file created: {file_path}")
+
+        if "modified" in gate or "updated" in gate or "edited" in gate:
+            for result_match in self.TOOL_RESULT_MODIFIED_PATTERN.finditer(message):
+                file_path = result_match.group(1).strip()
+                if file_path and self._is_valid_file_path(file_path):
+                    if self._add_file(self._files_modified, file_path):
+                        logger.debug(f"Tool result tracked - file modified: {file_path}")
 
     def parse_message(self, message: str) -> None:
         """Parse a single stream message and accumulate results.
@@ -1236,6 +1328,10 @@ class TaskWorkStreamParser:
         - File modification lists
         - Tool invocations (Write/Edit) for file tracking
 
+        Each pattern is gated on its literal anchors (see the class
+        constants), so text with no anchor for a pattern is never handed to
+        that regex.
+
         Args:
             message: Single message from the task-work SDK stream
 
@@ -1246,11 +1342,18 @@ class TaskWorkStreamParser:
         if not message:
             return
 
+        gate = self._gate_text(message)
+
         # Tool invocation tracking (Write/Edit operations)
-        self._parse_tool_invocations(message)
+        self._parse_tool_invocations(message, gate)
 
         # Phase detection
-        phase_match = self._match_pattern(self.PHASE_MARKER_PATTERN, message)
+        phase_pos = message.find("Phase")
+        phase_match = (
+            self._match_pattern(self.PHASE_MARKER_PATTERN, message, phase_pos)
+            if phase_pos >= 0
+            else None
+        )
         if phase_match:
             phase_num = phase_match.group(1)
             phase_text = phase_match.group(2)[:100]  # Truncate long descriptions
@@ -1262,7 +1365,12 @@ class TaskWorkStreamParser:
             logger.debug(f"Detected phase {phase_num}: {phase_text}")
 
         # Phase completion
-        complete_match = self._match_pattern(self.PHASE_COMPLETE_PATTERN, message)
+        complete_pos = self._first_index(message, "\u2713", "\u2714")
+        complete_match = (
+            self._match_pattern(self.PHASE_COMPLETE_PATTERN, message, complete_pos)
+            if complete_pos >= 0 and "phase" in gate
+            else None
+        )
         if complete_match:
             phase_num = complete_match.group(1)
             phase_key = f"phase_{phase_num}"
@@ -1273,18 +1381,30 @@ class TaskWorkStreamParser:
             logger.debug(f"Phase {phase_num} completed")
 
         # Test results - try individual patterns first
-        tests_passed_match = self._match_pattern(self.TESTS_PASSED_PATTERN, message)
-        if tests_passed_match:
-            self._tests_passed = int(tests_passed_match.group(1))
-            logger.debug(f"Tests passed: {self._tests_passed}")
+        has_passed = "passed" in gate
+        has_failed = "failed" in gate
+        if "test" in gate:
+            tests_passed_match = (
+                self._match_pattern(self.TESTS_PASSED_PATTERN, message) if has_passed else None
+            )
+            if tests_passed_match:
+                self._tests_passed = int(tests_passed_match.group(1))
+                logger.debug(f"Tests passed: {self._tests_passed}")
 
-        tests_failed_match = self._match_pattern(self.TESTS_FAILED_PATTERN, message)
-        if tests_failed_match:
-            self._tests_failed = int(tests_failed_match.group(1))
-            logger.debug(f"Tests failed: {self._tests_failed}")
+            tests_failed_match = (
+                self._match_pattern(self.TESTS_FAILED_PATTERN, message) if has_failed else None
+            )
+            if tests_failed_match:
+                self._tests_failed = int(tests_failed_match.group(1))
+                logger.debug(f"Tests failed: {self._tests_failed}")
 
         # Parse pytest summary output (e.g., "===== 5 passed, 2 failed in 0.23s =====")
-        pytest_summary_match = self._match_pattern(self.PYTEST_SUMMARY_PATTERN, message)
+        summary_pos = message.find("=")
+        pytest_summary_match = (
+            self._match_pattern(self.PYTEST_SUMMARY_PATTERN, message, summary_pos)
+            if summary_pos >= 0
+            else None
+        )
         if pytest_summary_match:
             if pytest_summary_match.group(1):
                 passed_count = int(pytest_summary_match.group(1))
@@ -1320,41 +1440,55 @@ class TaskWorkStreamParser:
                     self._tests_skipped = 0
 
         # Also try simpler pytest pattern (e.g., "5 passed in 0.23s")
-        if self._tests_passed is None:
+        if self._tests_passed is None and has_passed:
             simple_match = self._match_pattern(self.PYTEST_SIMPLE_PATTERN, message)
             if simple_match:
                 self._tests_passed = int(simple_match.group(1))
                 logger.debug(f"Pytest simple - tests passed: {self._tests_passed}")
 
         # Coverage
-        coverage_match = self._match_pattern(self.COVERAGE_PATTERN, message)
+        coverage_pos = message.find("overage")
+        coverage_match = (
+            self._match_pattern(self.COVERAGE_PATTERN, message, max(coverage_pos - 1, 0))
+            if coverage_pos >= 0
+            else None
+        )
         if coverage_match:
             self._coverage = float(coverage_match.group(1))
             logger.debug(f"Coverage: {self._coverage}%")
 
         # Quality gates
-        if self._match_pattern(self.QUALITY_GATES_PASSED_PATTERN, message):
-            self._quality_gates_passed = True
-            logger.debug("Quality gates: PASSED")
-        elif self._match_pattern(self.QUALITY_GATES_FAILED_PATTERN, message):
-            self._quality_gates_passed = False
-            logger.debug("Quality gates: FAILED")
+        if "quality" in gate and "gates" in gate:
+            if self._match_pattern(self.QUALITY_GATES_PASSED_PATTERN, message):
+                self._quality_gates_passed = True
+                logger.debug("Quality gates: PASSED")
+            elif has_failed and self._match_pattern(self.QUALITY_GATES_FAILED_PATTERN, message):
+                self._quality_gates_passed = False
+                logger.debug("Quality gates: FAILED")
 
         # File modifications (use sets to avoid duplicates)
-        for file_match in self.FILES_MODIFIED_PATTERN.finditer(message):
-            file_path = file_match.group(1)
-            if self._is_valid_file_path(file_path):
-                self._files_modified.add(file_path)
-                logger.debug(f"File modified: {file_path}")
-
-        for file_match in self.FILES_CREATED_PATTERN.finditer(message):
-            file_path = file_match.group(1)
-            if self._is_valid_file_path(file_path):
-                self._files_created.add(file_path)
-                logger.debug(f"File created: {file_path}")
+        modified_pos = self._first_index(message, "Modified:", "Changed:")
+        if modified_pos >= 0:
+            for file_match in self.FILES_MODIFIED_PATTERN.finditer(message, modified_pos):
+                file_path = file_match.group(1)
+                if self._is_valid_file_path(file_path):
+                    if self._add_file(self._files_modified, file_path):
+                        logger.debug(f"File modified: {file_path}")
+
+        created_pos = self._first_index(message, "Created:", "Added:")
+        if created_pos >= 0:
+            for file_match in self.FILES_CREATED_PATTERN.finditer(message, created_pos):
+                file_path = file_match.group(1)
+                if self._is_valid_file_path(file_path):
+                    if self._add_file(self._files_created, file_path):
+                        logger.debug(f"File created: {file_path}")
 
         # Architectural review scores
-        arch_score_match = self._match_pattern(self.ARCH_SCORE_PATTERN, message)
+        arch_score_match = (
+            self._match_pattern(self.ARCH_SCORE_PATTERN, message)
+            if "architectural" in gate and "score" in gate
+            else None
+        )
         if arch_score_match:
             try:
                 self._arch_score = int(arch_score_match.group(1))
@@ -1362,7 +1496,11 @@ class TaskWorkStreamParser:
             except ValueError:
                 logger.warning(f"Invalid arch score format: {arch_score_match.group(1)}")
 
-        subscores_match = self._match_pattern(self.ARCH_SUBSCORES_PATTERN, message)
+        subscores_match = (
+            self._match_pattern(self.ARCH_SUBSCORES_PATTERN, message)
+            if "solid" in gate and "yagni" in gate
+            else None
+        )
         if subscores_match:
             try:
                 self._solid_score = int(subscores_match.group(1))
@@ -1461,6 +1599,7 @@ class TaskWorkStreamParser:
         self._solid_score = None
         self._dry_score = None
         self._yagni_score = None
+        self._files_dropped = 0
 
 
 @dataclass
@@ -1543,6 +1682,7 @@ class AgentInvoker:
         model_name: Optional[str] = None,  # TASK-FIX-MODELPLUMB
         coach_model_name: Optional[str] = None,  # TASK-FIX-COACHBUDG01
         evidence_repos: Optional[List["EvidenceRepo"]] = None,  # TASK-AB-XREPOEV01
+        llm_gate: Optional[LLMRequestGate] = None,
     ):
         """Initialize AgentInvoker.
 
@@ -1581,6 +1721,14 @@ class AgentInvoker:
                 git changes into the Player report as repo-qualified paths
                 (``<repo>:<path>``) and CoachVerifier resolves those claims
                 against the right repo root.
+            llm_gate: Optional LLMRequestGate every ``_invoke_with_role`` call
+                takes a slot from. Defaults to the process-wide gate shared by
+                all tasks (None when ``GUARDKIT_LLM_GATE=0``), so rate limits
+                seen by one task throttle its siblings within the same wave.
+                A slot is held for a whole agent session, so an explicit
+                in-flight ceiling (``GUARDKIT_LLM_MAX_INFLIGHT_<PROVIDER>``)
+                also caps how many tasks of a wave run at once; by default
+                only AIMD decreases after 429s or latency spikes do.
         """
         self.worktree_path = Path(worktree_path)
         self._venv_python: Optional[str] = venv_python
@@ -1620,6 +1768,7 @@ class AgentInvoker:
         self._last_session_id: Optional[str] = None
         # TASK-INST-005b: EventEmitter for instrumentation telemetry
         self._emitter = emitter if emitter is not None else NullEmitter()
+        self._llm_gate: Optional[LLMRequestGate] = llm_gate
         # TASK-FIX-MODELPLUMB: default model identifier for invocations that
         # don't specify one. Threaded from the CLI --model flag through
         # AutoBuildOrchestrator. Used as a fallback inside _invoke_with_role
@@ -2986,7 +3135,7 @@ JSON verdict.
             feedback: Optional feedback from previous Coach turn
             acceptance_criteria: Optional list of acceptance criteria with id and text
             context: Job-specific context from the memory backend (role constraints, quality gates,
-                turn states). Included before requirements for prompt context.
+                turn states). Rendered in the per-turn block, after the task requirements.
             design_context: Optional design context for UI implementation tasks
 
         Returns:
@@ -3063,21 +3212,20 @@ Please address all feedback points in this turn.
 {",".join(example_promises)}
   ],'''
 
+        # Prefix-cache-stable layout: the role instructions and promise rules
+        # are identical for every Player call, the task block for every turn
+        # of a task; only the turn header, job context, feedback and the
+        # turn-specific report path/schema change per turn. Rendering them in
+        # that order lets vLLM prefix caching reuse everything up to the turn
+        # block (see instrumentation.prompt_layout).
+        layout = PromptLayout(role="player")
         # TASK-AB-INVARIANTTEST01: responsibility 2 carries the
         # invariant-not-snapshot constraint (location 1 of the three
         # Player-prompt locations; locations 2-3 live in
         # installer/core/agents/autobuild-player.md, and the matching
         # Coach-side detection is advisory guard #8 in
         # _render_absence_of_failure_guards).
-        prompt = f"""You are the Player agent. Implement the following task.
-
-Task ID: {task_id}
-Turn: {turn}
-{context_section}{design_section}
-## Requirements
-
-{requirements}
-{criteria_section}{feedback_section}
+        layout.add("instructions", """You are the Player agent. Implement the following task.
 
 ## Your Responsibilities
 
@@ -3096,6 +3244,27 @@ Turn: {turn}
 3. Run the tests and verify they pass
 4. Create your report with completion promises for each acceptance criterion
 
+**IMPORTANT**: For each acceptance criterion, create a completion_promise with:
+- criterion_id: The ID (e.g., "AC-001")
+- criterion_text: The full criterion text
+- status: "complete" or "incomplete"
+- evidence: What you did to satisfy this criterion
+- test_file: Path to test file validating this criterion (if applicable)
+- implementation_files: List of files modified/created for this criterion
+
+Follow the report format specified in your agent definition.
+""", SectionStability.STATIC)
+        layout.add("task", f"""
+Task ID: {task_id}
+{design_section}
+## Requirements
+
+{requirements}
+{criteria_section}""", SectionStability.TASK)
+        layout.add("turn", f"""
+Turn: {turn}
+{context_section}{feedback_section}""", SectionStability.TURN)
+        layout.add("report_format", f"""
 ## Report Format
 
 After implementing, write your report to:
@@ -3116,24 +3285,15 @@ Your report MUST be valid JSON with these fields:
   "requirements_addressed": ["requirements", "completed"],
   "requirements_remaining": ["requirements", "still", "pending"],{promises_example}
 }}
-
-**IMPORTANT**: For each acceptance criterion, create a completion_promise with:
-- criterion_id: The ID (e.g., "AC-001")
-- criterion_text: The full criterion text
-- status: "complete" or "incomplete"
-- evidence: What you did to satisfy this criterion
-- test_file: Path to test file validating this criterion (if applicable)
-- implementation_files: List of files modified/created for this criterion
-
-Follow the report format specified in your agent definition.
-"""
+""", SectionStability.TURN)
         # TASK-PSN-003: Append format reinforcement for complex tasks.
         # Placing it at the END of the prompt exploits recency bias so the
-        # schema stays fresh even after many SDK turns.
+        # schema stays fresh even after many SDK turns (TURN tier keeps it
+        # last).
         if acceptance_criteria and len(acceptance_criteria) >= REINFORCEMENT_CRITERIA_THRESHOLD:
-            prompt += PROMISE_FORMAT_REMINDER
+            layout.add("format_reminder", PROMISE_FORMAT_REMINDER, SectionStability.TURN)
 
-        return prompt
+        return layout.render()
 
     def _format_design_elements(self, elements: List[Dict[str, Any]]) -> str:
         """Format design elements for prompt.
@@ -3579,10 +3739,17 @@ blocks earlier in your response (e.g. while sketching alternatives), the
 orchestrator takes only the **last** fenced block.
 """
 
-        prompt = f"""You are the Coach agent. Validate the Player's implementation.
+        # Prefix-cache layout, authored order kept (reorder=False): the
+        # sections reference each other positionally ("the evidence bundle
+        # above") and the v4 contract is byte-parity with the training corpus,
+        # so only the task header ahead of the turn line is a stable prefix.
+        # Tagging it still lets the llm.call event report Coach prefix reuse.
+        layout = PromptLayout(role="coach", reorder=False)
+        layout.add("header", f"""You are the Coach agent. Validate the Player's implementation.
 
 Task ID: {task_id}
-Turn: {turn}
+""", SectionStability.TASK)
+        layout.add("body", f"""Turn: {turn}
 
 {synthesis_banner}## Original Requirements
 
@@ -3594,7 +3761,8 @@ Turn: {turn}
 {evidence_section}{honesty_section}{guards_section}{gather_findings_section}{coach_context_section}{visual_verification_section}
 {responsibilities}
 {decision_format_block}
-"""
+""", SectionStability.TURN)
+        prompt = layout.render()
         # TASK-SELFFIX-003: enforce the overall synthesis-prompt budget.
         # Only applies to the synthesis path (toolless Coach verdict).
         if synthesis:
@@ -4818,26 +4986,55 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
                         self._kill_child_claude_processes()
                         return
 
-            if self._cancellation_event:
-                monitor = asyncio.create_task(_cancel_monitor())
-
-            # TASK-HMIG-006 AC-007: surface the resume-intent drop loudly
-            # when the caller offers a resume_session_id and the resolved
-            # harness does not support resume (e.g. LangGraphHarness Wave-2
-            # skeleton). The translator at the selector layer silently
-            # drops the kwarg; this warning is the user-facing
-            # acknowledgement that the resume intent will not be honoured
-            # and the next turn starts fresh. The check is cheap and runs
-            # BEFORE measure_latency() opens so the latency band reported
-            # for the LLM call event is unaffected.
-            if resume_session_id is not None and not harness.supports_resume:
-                logger.warning(
-                    "TASK-HMIG-006 AC-007: resume_session_id=%s... was supplied but "
-                    "harness %s does not support_resume; starting fresh session.",
-                    resume_session_id[:16],
-                    type(harness).__name__,
+            # Live concurrency control: wait for a per-provider slot (token
+            # bucket + AIMD in-flight limit) shared with every other task in
+            # the process. Taken before the cancel monitor starts and before
+            # measure_latency() opens, so queueing never counts as latency;
+            # _acquire_llm_slot honours the cancellation event while queued.
+            # From here on the slot is released on every exit path.
+            llm_gate = self._llm_gate or get_llm_request_gate()
+            llm_slot = None
+            if llm_gate is not None:
+                llm_slot = await self._acquire_llm_slot(
+                    llm_gate,
+                    detect_provider(os.environ.get("ANTHROPIC_BASE_URL", ""), model),
+                    agent_type,
                 )
 
+            try:
+                # Prefix-cache estimate for prompts built through PromptLayout
+                # (LayoutPrompt carries its layout; any other prompt -> None).
+                prompt_layout = getattr(prompt, "layout", None)
+                prefix_estimate = (
+                    get_prefix_cache_tracker().observe(prompt_layout)
+                    if prompt_layout is not None
+                    else None
+                )
+
+                # TASK-HMIG-006 AC-007: surface the resume-intent drop loudly
+                # when the caller offers a resume_session_id and the resolved
+                # harness does not support resume (e.g. LangGraphHarness
+                # Wave-2 skeleton). The translator at the selector layer
+                # silently drops the kwarg; this warning is the user-facing
+                # acknowledgement that the resume intent will not be honoured
+                # and the next turn starts fresh. The check is cheap and runs
+                # BEFORE measure_latency() opens so the latency band reported
+                # for the LLM call event is unaffected.
+                if resume_session_id is not None and not harness.supports_resume:
+                    logger.warning(
+                        "TASK-HMIG-006 AC-007: resume_session_id=%s... was supplied but "
+                        "harness %s does not support_resume; starting fresh session.",
+                        resume_session_id[:16],
+                        type(harness).__name__,
+                    )
+
+                if self._cancellation_event:
+                    monitor = asyncio.create_task(_cancel_monitor())
+            except BaseException:
+                if llm_slot is not None:
+                    llm_slot.release()
+                raise
+
             try:
                 # TASK-INST-005b: Wrap harness call with latency measurement.
                 with measure_latency() as latency:
@@ -5041,7 +5238,7 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
                 # TASK-INST-005b: Emit llm.call event (fire-and-forget).
                 # Token extraction reads usage off the raw SDK ResultMessage
                 # objects that live in response_messages via event.raw.
-                self._emit_llm_call_event(
+                call_event = self._emit_llm_call_event(
                     agent_type=agent_type,
                     model=model,
                     latency_ms=latency.ms,
@@ -5049,7 +5246,10 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
                     status=call_status,
                     error=call_error,
                     task_id=heartbeat_task_id,
+                    prefix_estimate=prefix_estimate,
                 )
+                if llm_slot is not None:
+                    llm_slot.release(call_event)
 
         except asyncio.TimeoutError:
             raise SDKTimeoutError(
@@ -5108,6 +5308,40 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
             return (None, harness_events)
         return None
 
+    async def _acquire_llm_slot(
+        self, llm_gate: LLMRequestGate, provider: str, agent_type: str
+    ) -> LLMSlot:
+        """Wait for an LLM gate slot, giving up when the invocation is cancelled.
+
+        The cancel monitor only starts once the slot is held, so the wait
+        polls the cancellation event itself (at the monitor's 2 s cadence).
+        A slot granted as the wait is abandoned is released, never leaked.
+
+        Raises:
+            asyncio.CancelledError: The cancellation event was set while queued.
+        """
+        acquire = asyncio.ensure_future(llm_gate.acquire(provider))
+        try:
+            while True:
+                done, _ = await asyncio.wait({acquire}, timeout=2)
+                if done:
+                    return acquire.result()
+                if self._cancellation_event and self._cancellation_event.is_set():
+                    logger.info(
+                        f"Cancellation event detected while {agent_type} waited "
+                        f"for an LLM slot ({provider}); not starting the call."
+                    )
+                    raise asyncio.CancelledError(
+                        f"{agent_type} cancelled while waiting for an LLM slot"
+                    )
+        except BaseException:
+            if acquire.cancel():
+                with suppress(asyncio.CancelledError):
+                    await acquire
+            elif not acquire.cancelled() and acquire.exception() is None:
+                acquire.result().release()
+            raise
+
     def _extract_server_resolved_model(self, response_messages: List[Any]) -> Optional[str]:
         """Extract server-resolved model from SDK response messages.
 
@@ -5150,7 +5384,8 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
         status: str,
         error: Optional[Exception],
         task_id: str,
-    ) -> None:
+        prefix_estimate: Optional[PrefixCacheEstimate] = None,
+    ) -> Optional[LLMCallEvent]:
         """Construct and fire-and-forget an LLMCallEvent.
 
         Emission is non-blocking via asyncio.create_task(). If the emitter
@@ -5165,6 +5400,12 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
             status: "ok" or "error".
             error: The exception if status is "error", else None.
             task_id: Task identifier extracted from prompt.
+            prefix_estimate: Prefix reuse estimate for prompts built through
+                ``PromptLayout``; recorded as an estimated prefix cache hit.
+
+        Returns:
+            The constructed event (also fed to the LLM request gate), or
+            None if construction failed.
         """
         try:
             input_tokens, output_tokens = extract_token_usage(response_messages)
@@ -5189,6 +5430,22 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
             # Detect provider from environment base URL
             base_url = os.environ.get("ANTHROPIC_BASE_URL", "")
 
+            # The harness surfaces API 429s as AgentInvocationError, which
+            # classify_error() files under "other"; recognise them by text
+            # so the LLM request gate backs off on them.
+            error_type = classify_error(error)
+            if error_type == "other" and detect_rate_limit(str(error))[0]:
+                error_type = "rate_limited"
+
+            prefix_fields: Dict[str, Any] = {}
+            if prefix_estimate is not None:
+                prefix_fields = {
+                    "prefix_cache_hit": prefix_estimate.hit,
+                    "prefix_cache_estimated": True,
+                    "prefix_reusable_tokens": prefix_estimate.reusable_tokens,
+                    "prefix_fingerprint": prefix_estimate.fingerprint,
+                }
+
             event = LLMCallEvent(
                 run_id=run_id,
                 task_id=task_id,
@@ -5202,7 +5459,8 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
                 latency_ms=latency_ms,
                 prompt_profile=prompt_profile,
                 status=status,
-                error_type=classify_error(error),
+                error_type=error_type,
+                **prefix_fields,
             )
 
             async def _safe_emit() -> None:
@@ -5222,6 +5480,7 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
             except RuntimeError:
                 # No running event loop — skip emission silently
                 logger.debug("No running event loop for LLM call event emission")
+            return event
         except Exception as build_exc:
             # Event construction failure must never block the SDK call path
             logger.warning(
@@ -5229,6 +5488,7 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
                 "Instrumentation skipped for this call.",
                 build_exc,
             )
+            return None
 
     # TASK-INST-005c: Shared SecretRedactor instance (lazy-initialised)
     _tool_exec_redactor: Optional["SecretRedactor"] = None
@@ -6076,24 +6336,10 @@ CRITICAL READING RULES — apply these BEFORE any approval decision:
         Returns:
             Path to task file if found, None otherwise
         """
-        # Standard task directories
-        task_dirs = [
-            self.worktree_path / "tasks" / "backlog",
-            self.worktree_path / "tasks" / "design_approved",
-            self.worktree_path / "tasks" / "in_progress",
-            self.worktree_path / "tasks" / "in_review",
-            self.worktree_path / "tasks" / "completed",
-            self.worktree_path / "tasks" / "blocked",
-        ]
+        from guardkit.tasks.task_index import locate_task
 
-        for task_dir in task_dirs:
-            if not task_dir.exists():
-                continue
-            # Look for task file matching task_id
-            for task_file in task_dir.rglob(f"{task_id}*.md"):
-                return task_file
-
-        return None
+        location = locate_task(task_id, self.worktree_path, _TASK_FILE_STATES)
+        return location.path if location is not None else None
 
     def _lookup_task_type(self, task_id: str) -> Optional[str]:
         """Resolve a task's ``task_type`` from its frontmatter.
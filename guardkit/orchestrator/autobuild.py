@@ -74,6 +74,7 @@ from guardkit.lib.secret_scrub import scrub_for_publication
 from guardkit.orchestrator.agent_invoker import AgentInvoker, AgentInvocationResult
 from guardkit.orchestrator import evidence_repos as evidence_repos_lib
 from guardkit.orchestrator.evidence_repos import EvidenceRepo
+from guardkit.orchestrator.git_service import check_ignore_rules
 from guardkit.orchestrator.phase_specialists import (
     detect_stack_template,
     render_missing_phase_list,
@@ -6295,8 +6296,21 @@ class AutoBuildOrchestrator:
         Returns a one-line operator recommendation when the path matches
         a ``.gitignore`` rule, or ``None`` on no-match / any error. Mirrors
         TASK-FIX-IGNR's ``--no-index`` invocation so untracked paths the
-        Player keeps re-claiming surface their gitignore origin.
+        Player keeps re-claiming surface their gitignore origin. Asks the
+        worktree's git service first and forks git only when it cannot answer.
         """
+        answered = check_ignore_rules(worktree_path, [candidate_path])
+        if candidate_path in answered:
+            rule = answered[candidate_path]
+            if rule is None:
+                return None
+            rule_parts = rule.split(":", 2)
+            if len(rule_parts) >= 3 and rule_parts[2].strip().startswith("!"):
+                return None
+            return (
+                f"Path matches a .gitignore rule "
+                f"(git check-ignore -v): {rule}\t{candidate_path}"
+            )
         try:
             proc = subprocess.run(
                 [
@@ -6506,6 +6520,8 @@ class AutoBuildOrchestrator:
             loader = AutoBuildContextLoader(
                 graphiti=client, verbose=self.verbose,
                 worktree_path=getattr(self, '_active_worktree_path', None),
+                emitter=getattr(self, '_emitter', None),
+                run_id=getattr(self, '_run_id', ""),
             )
             self._thread_loaders[thread_id] = (loader, loop)
             logger.info(f"Created per-thread context loader for thread {thread_id}")
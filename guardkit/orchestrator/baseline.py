@@ -31,6 +31,15 @@ Hard constraints (WS3 §3 / prompt):
   turns a genuine regression green. When failing test IDs cannot be parsed
   (non-pytest stack output), it fails CLOSED — the charge stands.
 
+Baseline store: the probe result is also cached in a content-addressed store
+under ``<repo_root>/.guardkit/baseline-cache/``, keyed by the worktree's git
+tree hash + the bootstrap lock hash (``EnvironmentBootstrapper._compute_hash``)
++ the probe command. A restart after a crash, or a new feature run on an
+unmoved ``main``, reuses the stored result instead of re-running the suite.
+When only the tree moved, a *partial re-probe* re-runs the previously failing
+tests plus the tests of changed modules; a test it skips can only be missing
+from the baseline — charged, never excused (the honest direction again).
+
 Stack scope: the failing-test-ID extractor is pytest node-id shaped (the F2
 ledger's "adapter #1" convention — see ``guardkit/qa/formats/known_failures.py``).
 Other stacks (flutter/dotnet/jest) still get the pass/fail baseline + the
@@ -40,13 +49,17 @@ wave-0 warning; the ID-level diff is a future per-stack adapter. This mirrors
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import shlex
+import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Sequence, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from guardkit.orchestrator.stale_test_attribution import (
     extract_failing_test_lines,
@@ -57,6 +70,32 @@ logger = logging.getLogger(__name__)
 
 _BASELINE_DIFF_ENV = "GUARDKIT_AUTOBUILD_BASELINE_DIFF"
 _BASELINE_FILENAME = "baseline.json"
+_BASELINE_CACHE_ENV = "GUARDKIT_AUTOBUILD_BASELINE_CACHE"
+_BASELINE_CACHE_DIRNAME = "baseline-cache"
+
+# Most-recent entries kept in the baseline store; older ones are evicted.
+_BASELINE_CACHE_MAX_ENTRIES = 32
+
+# Git timeout (seconds) for the tree-hash / diff plumbing.
+_GIT_TIMEOUT = 30
+
+# A change to any of these reshapes collection or configuration for the whole
+# suite, so a partial re-probe cannot be trusted.
+_SUITE_WIDE_FILES = frozenset(
+    {"conftest.py", "pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"}
+)
+
+# pytest options whose value is a separate argv token (``-k expr``).
+_PYTEST_VALUE_OPTIONS = frozenset({
+    "-k", "-m", "-p", "-c", "-o", "-W", "-n",
+    "--maxfail", "--timeout", "--rootdir", "--basetemp", "--durations",
+    "--tb", "--deselect", "--ignore", "--ignore-glob", "--cov",
+    "--cov-report", "--cov-config", "--junitxml", "--confcutdir",
+    "--log-level", "--import-mode",
+})
+
+# Shell syntax that makes a smoke command more than one pytest invocation.
+_SHELL_METACHARS = ("&&", "||", ";", "|", ">", "<", "`", "$(")
 
 
 def baseline_diff_enabled() -> bool:
@@ -72,6 +111,20 @@ def baseline_diff_enabled() -> bool:
     return raw.strip().lower() not in {"0", "false", "off", "no"}
 
 
+def baseline_cache_enabled() -> bool:
+    """Whether the content-addressed baseline store is consulted (default ON).
+
+    Kill-switch: ``GUARDKIT_AUTOBUILD_BASELINE_CACHE=0`` (or ``false``/``off``/
+    ``no``) forces a full probe every run. Default ON because an exact hit is
+    keyed on the tree + lock + command it measured, and a partial re-probe can
+    only under-excuse.
+    """
+    raw = os.environ.get(_BASELINE_CACHE_ENV)
+    if raw is None:
+        return True
+    return raw.strip().lower() not in {"0", "false", "off", "no"}
+
+
 def to_node_id(failing_line: str) -> str:
     """Normalise a ``"FAILED path::test - reason"`` line to a bare node id.
 
@@ -108,6 +161,9 @@ class BaselineResult:
     failing_node_ids: List[str] = field(default_factory=list)
     failing_count: int = 0
     timestamp: str = ""
+    # How the result was obtained: "full" probe, "cached" store hit, or
+    # "partial" re-probe on top of a stored result.
+    probe_scope: str = "full"
 
     def to_dict(self) -> dict:
         return {
@@ -118,6 +174,7 @@ class BaselineResult:
             "failing_node_ids": list(self.failing_node_ids),
             "failing_count": self.failing_count,
             "timestamp": self.timestamp,
+            "probe_scope": self.probe_scope,
             # A loud marker that this is NOT the F2 ledger (LPA-09).
             "note": (
                 "session-scoped observation; NOT the qa/known-failures.yaml "
@@ -135,6 +192,7 @@ class BaselineResult:
             failing_node_ids=[str(x) for x in (data.get("failing_node_ids") or [])],
             failing_count=int(data.get("failing_count", 0)),
             timestamp=str(data.get("timestamp", "")),
+            probe_scope=str(data.get("probe_scope", "full")),
         )
 
 
@@ -157,12 +215,52 @@ def write_baseline(path: Path, result: BaselineResult) -> None:
     tmp.replace(path)
 
 
+# Parsed-file memo for the Coach-side readers, which run on every Coach turn
+# of every task. Keyed by path; an entry is valid while the file's
+# (mtime_ns, size) stamp is unchanged.
+_parsed_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+_parsed_cache_lock = threading.Lock()
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _memoized_parse(kind: str, path: Path, parse: Any) -> Any:
+    """``parse(path)``, re-used until ``path`` changes on disk."""
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    key = (kind, str(path))
+    with _parsed_cache_lock:
+        hit = _parsed_cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    value = parse(path)
+    with _parsed_cache_lock:
+        _parsed_cache[key] = (stamp, value)
+    return value
+
+
+def _parse_baseline_file(path: Path) -> Optional[dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def read_baseline_from_worktree(worktree_path: Path) -> Optional[BaselineResult]:
     """Find and load the feature ``baseline.json`` under a worktree, if any.
 
     Globs ``.guardkit/autobuild/*/baseline.json`` (only the feature dir carries
     a ``baseline.json``; task dirs carry ``task_work_results.json``). Returns
     ``None`` when absent / unreadable (fail open — the diff is simply inert).
+    The parsed file is memoized until it changes on disk.
     """
     root = Path(worktree_path) / ".guardkit" / "autobuild"
     if not root.is_dir():
@@ -172,44 +270,49 @@ def read_baseline_from_worktree(worktree_path: Path) -> Optional[BaselineResult]
     except OSError:
         return None
     for candidate in matches:
+        data = _memoized_parse("baseline", candidate, _parse_baseline_file)
+        if data is None:
+            continue
         try:
-            return BaselineResult.from_dict(
-                json.loads(candidate.read_text(encoding="utf-8"))
-            )
-        except (OSError, ValueError):
+            return BaselineResult.from_dict(data)
+        except (TypeError, ValueError):
             continue
     return None
 
 
-def load_known_failure_ids(worktree_root: Path) -> Set[str]:
-    """Read the F2 ledger's known-failure ``test_id``s (READ-ONLY, fail open).
-
-    Parses ``<worktree_root>/qa/known-failures.yaml`` leniently — any error
-    (missing file, bad YAML, no PyYAML) yields an empty set. This module NEVER
-    writes the ledger (LPA-09); it only consults it to avoid charging a
-    human-triaged known failure.
-    """
-    ledger_path = Path(worktree_root) / "qa" / "known-failures.yaml"
-    if not ledger_path.exists():
-        return set()
+def _parse_ledger_ids(ledger_path: Path) -> FrozenSet[str]:
     try:
         import yaml  # lazy — optional dependency in some envs
     except ImportError:
         logger.debug("baseline diff: PyYAML unavailable; F2 ledger not consulted")
-        return set()
+        return frozenset()
     try:
         data = yaml.safe_load(ledger_path.read_text(encoding="utf-8"))
     except (OSError, yaml.YAMLError):  # type: ignore[attr-defined]
-        return set()
+        return frozenset()
     if not isinstance(data, dict):
-        return set()
+        return frozenset()
     ids: Set[str] = set()
     for entry in data.get("known_failures") or []:
         if isinstance(entry, dict):
             tid = entry.get("test_id")
             if isinstance(tid, str) and tid.strip():
                 ids.add(tid.strip())
-    return ids
+    return frozenset(ids)
+
+
+def load_known_failure_ids(worktree_root: Path) -> Set[str]:
+    """Read the F2 ledger's known-failure ``test_id``s (READ-ONLY, fail open).
+
+    Parses ``<worktree_root>/qa/known-failures.yaml`` leniently — any error
+    (missing file, bad YAML, no PyYAML) yields an empty set. This module NEVER
+    writes the ledger (LPA-09); it only consults it to avoid charging a
+    human-triaged known failure. The parse is memoized until the ledger
+    changes on disk.
+    """
+    ledger_path = Path(worktree_root) / "qa" / "known-failures.yaml"
+    ids = _memoized_parse("ledger", ledger_path, _parse_ledger_ids)
+    return set(ids) if ids else set()
 
 
 def compute_charged_failures(
@@ -296,6 +399,315 @@ def wave0_baseline_warning(result: BaselineResult) -> Optional[str]:
     )
 
 
+# ---------------------------------------------------------------------------
+# Content-addressed baseline store + partial re-probe
+# ---------------------------------------------------------------------------
+
+
+def _git(cwd: Path, args: Sequence[str]) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("baseline store: git %s failed: %s", args[0], exc)
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def worktree_tree_hash(worktree_path: Path) -> Optional[str]:
+    """Git tree hash of ``HEAD`` when the worktree has no tracked changes.
+
+    ``None`` (no caching) when git fails or tracked files are modified — the
+    tree hash would then not describe what the probe measures. Untracked
+    files are not considered (autobuild state lives there).
+    """
+    status = _git(worktree_path, ["status", "--porcelain", "--untracked-files=no"])
+    if status is None or status.strip():
+        return None
+    tree = _git(worktree_path, ["rev-parse", "HEAD^{tree}"])
+    return tree.strip() if tree else None
+
+
+def changed_paths_between(
+    worktree_path: Path, old_tree: str, new_tree: str
+) -> Optional[List[str]]:
+    """Paths that differ between two trees, or ``None`` when git fails."""
+    out = _git(worktree_path, ["diff", "--name-only", "--no-renames", old_tree, new_tree])
+    if out is None:
+        return None
+    return [line.strip() for line in out.splitlines() if line.strip()]
+
+
+def _is_test_path(path: str) -> bool:
+    name = Path(path).name
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def tracked_test_files(worktree_path: Path) -> Optional[List[str]]:
+    """Tracked pytest files (``test_*.py`` / ``*_test.py``), or ``None``."""
+    out = _git(worktree_path, ["ls-files", "-z", "*test_*.py", "*_test.py"])
+    if out is None:
+        return None
+    return [path for path in out.split("\0") if _is_test_path(path)]
+
+
+class BaselineStore:
+    """Content-addressed store of baseline probe results.
+
+    One JSON file per key under ``<repo_root>/.guardkit/baseline-cache/``.
+    The key covers everything the probe outcome depends on that guardkit can
+    see: the tree hash, the bootstrap lock hash, the command and its expected
+    exit. Entries sharing lock + command form a *lineage*; the newest entry of
+    a lineage seeds a partial re-probe when only the tree moved.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Main repository root (not the worktree), so the store outlives the
+        per-feature worktrees.
+    max_entries : int, optional
+        Entries kept after each write, newest first.
+    """
+
+    def __init__(self, repo_root: Path, max_entries: int = _BASELINE_CACHE_MAX_ENTRIES):
+        self.root = Path(repo_root) / ".guardkit" / _BASELINE_CACHE_DIRNAME
+        self.max_entries = max_entries
+
+    @staticmethod
+    def _digest(*parts: str) -> str:
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    @classmethod
+    def lineage(cls, lock_hash: str, command: str, expected_exit: int) -> str:
+        """Identity of a probe setup, independent of the tree it ran on."""
+        return cls._digest(lock_hash, command, str(expected_exit))
+
+    @classmethod
+    def key(
+        cls, tree_hash: str, lock_hash: str, command: str, expected_exit: int
+    ) -> str:
+        """Content address of one probe outcome."""
+        return cls._digest(tree_hash, cls.lineage(lock_hash, command, expected_exit))
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[BaselineResult]:
+        """The stored result for ``key``, or ``None``."""
+        entry = self._read(self._path(key))
+        if entry is None:
+            return None
+        try:
+            return BaselineResult.from_dict(entry["result"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def latest_for(self, lineage: str) -> Optional[Tuple[str, BaselineResult]]:
+        """Newest ``(tree_hash, result)`` recorded for ``lineage``."""
+        if not self.root.is_dir():
+            return None
+        try:
+            candidates = sorted(
+                self.root.glob("*.json"),
+                key=lambda p: p.stat().st_mtime_ns,
+                reverse=True,
+            )
+        except OSError:
+            return None
+        for candidate in candidates:
+            entry = self._read(candidate)
+            if entry is None or entry.get("lineage") != lineage:
+                continue
+            try:
+                return str(entry["tree_hash"]), BaselineResult.from_dict(entry["result"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return None
+
+    def put(
+        self, key: str, lineage: str, tree_hash: str, result: BaselineResult
+    ) -> None:
+        """Store ``result`` under ``key`` (atomic) and evict old entries."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(
+            json.dumps(
+                {"lineage": lineage, "tree_hash": tree_hash, "result": result.to_dict()},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        try:
+            entries = sorted(
+                self.root.glob("*.json"),
+                key=lambda p: p.stat().st_mtime_ns,
+                reverse=True,
+            )
+            for stale in entries[self.max_entries:]:
+                stale.unlink()
+        except OSError as exc:
+            logger.debug("baseline store: eviction failed: %s", exc)
+
+    @staticmethod
+    def _read(path: Path) -> Optional[dict]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+
+def partial_probe_targets(
+    previous: BaselineResult,
+    changed_paths: Sequence[str],
+    test_files: Iterable[str],
+    worktree_path: Path,
+) -> Optional[List[str]]:
+    """pytest targets for a partial re-probe, or ``None`` for a full probe.
+
+    Re-runs every previously failing node id (so a fixed test leaves the
+    baseline — a stale entry would excuse a task that breaks it again), every
+    changed test file, and the test subtree of each changed source package
+    (:func:`_package_tests`). A test left out can only be missing from the
+    baseline, i.e. charged rather than excused.
+
+    ``None`` — run everything — whenever the partial probe cannot vouch for
+    the result: the previous result is red without parseable ids, a path
+    other than a Python module changed (config, data, lock files, fixtures),
+    a suite-wide file (``conftest.py``, pytest / project config) changed, a
+    changed module's package has no test subtree, or nothing is left to run.
+    """
+    if not previous.passed and not previous.failing_node_ids:
+        return None
+    test_files = list(test_files)
+
+    targets: Set[str] = set()
+    for path in changed_paths:
+        if Path(path).name in _SUITE_WIDE_FILES or not path.endswith(".py"):
+            return None
+        if _is_test_path(path):
+            targets.add(path)
+            continue
+        package_tests = _package_tests(path, test_files)
+        if not package_tests:
+            return None
+        targets.update(package_tests)
+    targets.update(previous.failing_node_ids)
+    existing = sorted(
+        target
+        for target in targets
+        if (Path(worktree_path) / target.split("::", 1)[0]).exists()
+    )
+    return existing or None
+
+
+def _package_tests(module_path: str, test_files: Sequence[str]) -> List[str]:
+    """Test files under the test subtree that mirrors ``module_path``'s package.
+
+    The package is the module's directory below ``src/`` and the top-level
+    package (``guardkit/orchestrator/quality_gates/x.py`` →
+    ``orchestrator/quality_gates``). A test file belongs to it when that
+    sequence of directories appears in the test file's own directory
+    (``tests/orchestrator/quality_gates/``, ``tests/unit/orchestrator/...``).
+    With no such subtree the package is walked up one level at a time; a
+    module at the top of the tree maps to no subtree (empty list).
+    """
+    parts = list(Path(module_path).parent.parts)
+    if parts[:1] == ["src"]:
+        parts = parts[1:]
+    package = parts[1:]
+    while package:
+        matched = [
+            test_file
+            for test_file in test_files
+            if _contains_run(Path(test_file).parent.parts, package)
+        ]
+        if matched:
+            return matched
+        package = package[:-1]
+    return []
+
+
+def _contains_run(parts: Sequence[str], run: Sequence[str]) -> bool:
+    """True when ``run`` appears as consecutive items of ``parts``."""
+    run = tuple(run)
+    return any(
+        tuple(parts[k : k + len(run)]) == run
+        for k in range(len(parts) - len(run) + 1)
+    )
+
+
+def narrow_pytest_command(command: str, targets: Sequence[str]) -> Optional[str]:
+    """Rewrite a single pytest invocation to run ``targets`` only.
+
+    The original positional paths are the suite's roots: targets outside them
+    are dropped, and the roots are replaced by the remaining targets. Flags
+    are kept. ``None`` when the command is not one plain pytest invocation
+    (``pytest …`` / ``<python> -m pytest …``) or no target is in scope.
+    """
+    if any(meta in command for meta in _SHELL_METACHARS):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if argv[:1] == ["pytest"]:
+        prefix, rest = argv[:1], argv[1:]
+    elif len(argv) >= 3 and argv[1:3] == ["-m", "pytest"]:
+        prefix, rest = argv[:3], argv[3:]
+    else:
+        return None
+
+    flags: List[str] = []
+    roots: List[str] = []
+    i = 0
+    while i < len(rest):
+        token = rest[i]
+        if token.startswith("-"):
+            flags.append(token)
+            if token in _PYTEST_VALUE_OPTIONS and i + 1 < len(rest):
+                flags.append(rest[i + 1])
+                i += 1
+        else:
+            roots.append(token)
+        i += 1
+
+    def _in_scope(target: str) -> bool:
+        if not roots:
+            return True
+        target_file = target.split("::", 1)[0]
+        for root in roots:
+            root_path = root.split("::", 1)[0].rstrip("/")
+            if root_path in ("", "."):
+                return True
+            if target_file == root_path or target_file.startswith(root_path + "/"):
+                return True
+        return False
+
+    scoped = [target for target in targets if _in_scope(target)]
+    if not scoped:
+        return None
+    return " ".join(shlex.quote(token) for token in [*prefix, *flags, *scoped])
+
+
 def now_isoformat() -> str:
     """Timestamp helper (isolated so tests can monkeypatch it)."""
     return datetime.now().isoformat()
@@ -0,0 +1,251 @@
+"""Plumbing-based checkpoint commits with a short git-lock critical section.
+
+The porcelain checkpoint (``git add -A`` + ``git commit`` + ``git rev-parse``)
+holds the worktree git lock for the whole tree scan, blob hashing and commit,
+so parallel tasks sharing a worktree queue behind each other's checkpoints.
+This engine splits a checkpoint in two:
+
+1. **Snapshot** (no lock): stage the working tree into a *private* index
+   seeded from the real one (``GIT_INDEX_FILE``) and ``git write-tree`` it.
+   Object writes are safe without the lock and the real ``index.lock`` is
+   never taken.
+2. **Commit** (under the lock): confirm HEAD has not moved since the snapshot
+   (if it has, re-stage -- cheap, the private index's stat data is warm),
+   ``git commit-tree`` -- which prints the new hash, so no ``rev-parse`` --
+   ``git update-ref HEAD <new> <old>``, then install the private index as the
+   real one so ``git status`` agrees with the new HEAD.
+
+Anything the engine cannot do exactly like ``git commit`` raises
+:class:`PlumbingUnavailable` *before* HEAD moves, and the caller falls back to
+the porcelain sequence: repos with commit hooks (hooks must still run, e.g. a
+target repo's secret scan), unborn branches, or any plumbing failure.
+
+Example:
+    >>> engine = PlumbingCheckpointEngine(repo_root)
+    >>> snapshot = engine.snapshot(add_argv)      # outside the git lock
+    >>> with git_lock:
+    ...     commit_hash = engine.commit(snapshot, "message", add_argv)
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PLUMBING_ENV_VAR = "GUARDKIT_CHECKPOINT_PLUMBING"
+
+# Hooks ``git commit`` would run; ``commit-tree`` runs none of them.
+_COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+
+
+def plumbing_enabled() -> bool:
+    """Return False when ``GUARDKIT_CHECKPOINT_PLUMBING`` switches the engine off."""
+    raw = os.environ.get(PLUMBING_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+class PlumbingUnavailable(Exception):
+    """The plumbing path cannot reproduce ``git commit``; use porcelain.
+
+    Always raised before HEAD is updated, so falling back never produces a
+    second commit.
+    """
+
+
+@dataclass
+class Snapshot:
+    """A staged, written tree awaiting its commit.
+
+    Attributes:
+        head: HEAD commit the snapshot was taken against.
+        tree: Tree object id of the staged working tree.
+        index_path: Private index file holding the staged state.
+    """
+
+    head: str
+    tree: str
+    index_path: Path
+
+
+class PlumbingCheckpointEngine:
+    """Commit a repo's working tree via ``write-tree``/``commit-tree``.
+
+    Args:
+        repo_root: Working tree root (main checkout or linked worktree).
+        timeout: Per-git-command timeout in seconds (None = unbounded).
+    """
+
+    def __init__(self, repo_root: Path, timeout: Optional[int] = None) -> None:
+        self.repo_root = Path(repo_root)
+        self.timeout = timeout
+        self._paths: Optional[Dict[str, Path]] = None
+
+    # ------------------------------------------------------------------ git
+
+    def _git(
+        self, args: Sequence[str], index: Optional[Path] = None
+    ) -> subprocess.CompletedProcess:
+        env = None
+        if index is not None:
+            env = {**os.environ, "GIT_INDEX_FILE": str(index)}
+        return subprocess.run(
+            list(args),
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=self.timeout,
+            env=env,
+        )
+
+    def _git_paths(self) -> Dict[str, Path]:
+        """Resolve (once) the real index file and hooks directory."""
+        if self._paths is None:
+            out = self._git(
+                ["git", "rev-parse", "--git-path", "index", "--git-path", "hooks"]
+            ).stdout.splitlines()
+            index, hooks = (self.repo_root / p.strip() for p in out[:2])
+            self._paths = {"index": index, "hooks": hooks}
+        return self._paths
+
+    def _has_commit_hooks(self) -> bool:
+        hooks = self._git_paths()["hooks"]
+        return any(os.access(hooks / name, os.X_OK) for name in _COMMIT_HOOKS)
+
+    def _head(self) -> str:
+        result = subprocess.run(
+            ["git", "rev-parse", "-q", "--verify", "HEAD^{commit}"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+        )
+        head = result.stdout.strip()
+        if result.returncode != 0 or not head:
+            raise PlumbingUnavailable("HEAD is unborn")
+        return head
+
+    def _stage(self, index: Path, add_argv: Sequence[str]) -> str:
+        self._git(add_argv, index=index)
+        return self._git(["git", "write-tree"], index=index).stdout.strip()
+
+    # ------------------------------------------------------------- protocol
+
+    def snapshot(self, add_argv: Sequence[str]) -> Snapshot:
+        """Stage the working tree into a private index and write its tree.
+
+        Does not need the repo's git lock.
+
+        Args:
+            add_argv: The ``git add`` argv (including exclude pathspecs).
+
+        Returns:
+            Snapshot to pass to :meth:`commit` (or :meth:`discard`).
+
+        Raises:
+            PlumbingUnavailable: Hooks are active, HEAD is unborn, or a git
+                command failed.
+        """
+        try:
+            if self._has_commit_hooks():
+                raise PlumbingUnavailable("repository has commit hooks")
+            head = self._head()
+            real_index = self._git_paths()["index"]
+            private = real_index.with_name(
+                f"guardkit-checkpoint-index.{os.getpid()}.{threading.get_ident()}"
+            )
+            if real_index.exists():
+                shutil.copyfile(real_index, private)
+            else:
+                private.unlink(missing_ok=True)
+            try:
+                tree = self._stage(private, add_argv)
+            except BaseException:
+                private.unlink(missing_ok=True)
+                raise
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as exc:
+            raise PlumbingUnavailable(f"snapshot failed: {exc}") from exc
+        return Snapshot(head=head, tree=tree, index_path=private)
+
+    def commit(
+        self, snapshot: Snapshot, message: str, add_argv: Sequence[str]
+    ) -> str:
+        """Commit ``snapshot`` on HEAD. Must be called under the git lock.
+
+        Args:
+            snapshot: Result of :meth:`snapshot`.
+            message: Commit message.
+            add_argv: The ``git add`` argv, re-run if HEAD moved meanwhile.
+
+        Returns:
+            The new commit hash.
+
+        Raises:
+            PlumbingUnavailable: The commit could not be created; HEAD is
+                unchanged.
+        """
+        try:
+            head = self._head()
+            tree = snapshot.tree
+            if head != snapshot.head:
+                # Another checkpoint landed between snapshot and lock: our
+                # tree may predate its changes, so stage again under the lock.
+                tree = self._stage(snapshot.index_path, add_argv)
+            commit_hash = self._git(
+                ["git", "commit-tree", tree, "-p", head, "-m", message]
+            ).stdout.strip()
+            self._git(
+                ["git", "update-ref", "-m", f"commit: {message}", "HEAD", commit_hash, head]
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+            self.discard(snapshot)
+            raise PlumbingUnavailable(f"commit failed: {exc}") from exc
+        self._install_index(snapshot)
+        return commit_hash
+
+    def _install_index(self, snapshot: Snapshot) -> None:
+        """Make the private index the real one (git's lockfile protocol)."""
+        real_index = self._git_paths()["index"]
+        lock = real_index.with_name(real_index.name + ".lock")
+        try:
+            fd = os.open(lock, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            logger.warning(
+                "Checkpoint committed but %s is held by another git process; "
+                "the index is left as-is until the next checkpoint.",
+                lock,
+            )
+            self.discard(snapshot)
+            return
+        try:
+            with os.fdopen(fd, "wb") as dst, open(snapshot.index_path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(lock, real_index)
+        except OSError as exc:
+            lock.unlink(missing_ok=True)
+            logger.warning("Failed to install checkpoint index: %s", exc)
+        finally:
+            self.discard(snapshot)
+
+    @staticmethod
+    def discard(snapshot: Snapshot) -> None:
+        """Remove the snapshot's private index."""
+        try:
+            snapshot.index_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+__all__: List[str] = [
+    "PLUMBING_ENV_VAR",
+    "PlumbingCheckpointEngine",
+    "PlumbingUnavailable",
+    "Snapshot",
+    "plumbing_enabled",
+]
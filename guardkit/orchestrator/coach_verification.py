@@ -29,6 +29,7 @@ from guardkit.orchestrator.evidence_repos import (
     resolve_qualified_path,
     split_qualified,
 )
+from guardkit.orchestrator.git_service import check_ignore_rules, tracked_paths
 
 logger = logging.getLogger(__name__)
 
@@ -829,6 +830,10 @@ class CoachVerifier:
         #                              so the gate surfaces a warning
         #                              rather than rejecting the turn on
         #                              what is almost always a noise path.
+        # Warm the worktree's git service for the whole dropped set: one
+        # batched query each instead of a git fork per path and probe.
+        tracked_paths(self.worktree_path, dropped)
+        check_ignore_rules(self.worktree_path, dropped)
         discrepancies: List[Discrepancy] = []
         for path in dropped:
             classification = self._classify_dropped_path(path)
@@ -1051,6 +1056,12 @@ class CoachVerifier:
         # Untracked and on disk. Distinguish a genuinely-gitignored file
         # (``git add -A`` would silently skip it — a real honesty signal)
         # from an unaccounted / fabricated one.
+        answered = check_ignore_rules(self.worktree_path, [path])
+        if path in answered:
+            rule = answered[path]
+            if rule is None or _check_ignore_match_is_negation(rule):
+                return "fabricated"
+            return "gitignored"
         try:
             result = subprocess.run(
                 ["git", "check-ignore", "-v", "--no-index", "--", path],
@@ -1101,6 +1112,9 @@ class CoachVerifier:
         so this is the authoritative short-circuit for the check-ignore
         ``!``-negation false-positive (red-baseline retro, L12 item 6).
         """
+        answered = tracked_paths(self.worktree_path, [path])
+        if path in answered:
+            return answered[path]
         try:
             ls_result = subprocess.run(
                 ["git", "ls-files", "--error-unmatch", "--", path],
@@ -1179,6 +1193,9 @@ class CoachVerifier:
         ``"unknown"`` rather than raising, so the discrepancy still
         surfaces with a usable (if degraded) message.
         """
+        rule = check_ignore_rules(self.worktree_path, [path]).get(path)
+        if rule is not None:
+            return rule
         try:
             result = subprocess.run(
                 ["git", "check-ignore", "-v", "--no-index", "--", path],
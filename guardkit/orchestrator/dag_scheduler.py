@@ -0,0 +1,312 @@
+"""
+Dependency-driven (DAG) task scheduling for feature execution.
+
+The default ``waves`` scheduler runs ``orchestration.parallel_groups`` one
+group at a time: every task in wave N waits for the *slowest* task in wave
+N-1, even when it only depends on a quick task that finished long before.
+On 20-40 task features that barrier alone leaves workers idle for hours.
+
+The ``dag`` scheduler dispatches each task as soon as its declared
+``dependencies`` are terminal, ranking the ready set by longest remaining
+critical path so the tasks that gate the most downstream work start first.
+The post-wave smoke / wiring gates are kept, but as *per-dependency-frontier
+checkpoints*: the checkpoint for group N fires once every task in group N is
+terminal. Only a *gated* group's checkpoint holds anything back, and then
+only the tasks that depend on a group-N task; everything else keeps running.
+The orchestrator gates the groups its smoke gate fires for — the wiring gate
+is advisory (it never terminates on findings), so it runs at every frontier
+without holding dependents.
+
+This module holds the pure scheduling state; the dispatch loop lives in
+``FeatureOrchestrator._execute_dag``.
+
+Example:
+    >>> from guardkit.orchestrator.dag_scheduler import DagScheduler
+    >>> scheduler = DagScheduler(
+    ...     parallel_groups=[["A", "B"], ["C"]],
+    ...     dependencies={"A": [], "B": [], "C": ["A"]},
+    ...     priorities={"A": 20.0, "B": 5.0, "C": 10.0},
+    ... )
+    >>> scheduler.ready()
+    ['A', 'B']
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+
+SCHEDULER_WAVES = "waves"
+SCHEDULER_DAG = "dag"
+VALID_SCHEDULERS = (SCHEDULER_WAVES, SCHEDULER_DAG)
+
+# Env override for the feature scheduler. Read at resolution time (not module
+# import) so tests can monkeypatch it per-test.
+SCHEDULER_ENV_VAR = "GUARDKIT_FEATURE_SCHEDULER"
+
+# Fallback duration, per complexity point, for a task with neither history
+# nor a positive ``estimated_minutes``. Only the *relative* ordering of the
+# ready set depends on it, so the absolute value is unimportant.
+_DEFAULT_SECONDS_PER_COMPLEXITY = 6 * 60
+
+
+def resolve_scheduler_mode(override: Optional[str] = None) -> str:
+    """Resolve the feature scheduler mode.
+
+    Precedence: explicit ``override`` (CLI flag / constructor argument) >
+    ``GUARDKIT_FEATURE_SCHEDULER`` > ``"waves"`` (the historical behaviour).
+
+    Raises
+    ------
+    ValueError
+        If the resolved value is not one of :data:`VALID_SCHEDULERS`.
+    """
+    value = override if override is not None else os.environ.get(SCHEDULER_ENV_VAR)
+    if value is None or not str(value).strip():
+        return SCHEDULER_WAVES
+    mode = str(value).strip().lower()
+    if mode not in VALID_SCHEDULERS:
+        raise ValueError(
+            f"Invalid feature scheduler {value!r}; expected one of "
+            f"{', '.join(VALID_SCHEDULERS)}"
+        )
+    return mode
+
+
+def _observed_duration_seconds(task: Any) -> Optional[float]:
+    """Wall-clock duration of a previous attempt, from the feature YAML.
+
+    ``started_at`` / ``completed_at`` survive in the feature file across
+    resumes, so a task that already ran once (failed, timed out, reset by
+    ``--resume``) carries its own history. Returns ``None`` when either
+    timestamp is missing or unparseable, or the span is not positive.
+    """
+    started = getattr(task, "started_at", None)
+    completed = getattr(task, "completed_at", None)
+    if not started or not completed:
+        return None
+    try:
+        span = (
+            datetime.fromisoformat(completed) - datetime.fromisoformat(started)
+        ).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return span if span > 0 else None
+
+
+def task_duration_seconds(
+    task: Any,
+    estimate_floor: Callable[[Optional[int]], int],
+) -> float:
+    """Expected duration of ``task`` in seconds, for critical-path ranking.
+
+    Resolution order:
+
+    1. History — the observed duration of a previous attempt.
+    2. ``estimate_floor(task.estimated_minutes)`` — the same estimate-derived
+       floor the per-task timeout uses
+       (``FeatureOrchestrator._task_estimate_floor_seconds``).
+    3. ``complexity × 6 min`` when the task has no positive estimate.
+    """
+    observed = _observed_duration_seconds(task)
+    if observed is not None:
+        return observed
+    floor = estimate_floor(getattr(task, "estimated_minutes", None))
+    if floor > 0:
+        return float(floor)
+    complexity = getattr(task, "complexity", None) or 1
+    return float(max(1, complexity) * _DEFAULT_SECONDS_PER_COMPLEXITY)
+
+
+def critical_path_priorities(
+    dependencies: Mapping[str, Sequence[str]],
+    durations: Mapping[str, float],
+) -> Dict[str, float]:
+    """Longest remaining critical path for every task.
+
+    ``priority(t) = duration(t) + max(priority(d) for d dependent on t)``,
+    i.e. the time from starting ``t`` until the last task that transitively
+    waits on it can finish. Dependencies that are not in ``dependencies``
+    (unknown predecessors) are ignored, matching
+    ``FeatureOrchestrator._dependencies_satisfied``.
+
+    Raises
+    ------
+    ValueError
+        If the dependency graph contains a cycle.
+    """
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in dependencies}
+    for task_id, deps in dependencies.items():
+        for dep_id in deps:
+            if dep_id in dependents:
+                dependents[dep_id].append(task_id)
+
+    priorities: Dict[str, float] = {}
+    visiting: Set[str] = set()
+
+    def _visit(task_id: str) -> float:
+        if task_id in priorities:
+            return priorities[task_id]
+        if task_id in visiting:
+            raise ValueError(f"Dependency cycle detected at {task_id}")
+        visiting.add(task_id)
+        downstream = max(
+            (_visit(child) for child in dependents[task_id]), default=0.0
+        )
+        visiting.discard(task_id)
+        priorities[task_id] = float(durations.get(task_id, 0.0)) + downstream
+        return priorities[task_id]
+
+    for task_id in dependencies:
+        _visit(task_id)
+    return priorities
+
+
+class DagScheduler:
+    """Ready-set bookkeeping for dependency-driven feature execution.
+
+    Tracks each task through ``pending → running → done`` and each parallel
+    group's frontier checkpoint through ``unresolved → running → resolved``.
+
+    A pending task is *ready* when every known dependency is done AND the
+    checkpoint of every gated group containing one of those dependencies
+    has resolved. Ready tasks are ordered by descending critical-path priority,
+    then by group and declaration order so ties stay deterministic.
+
+    Parameters
+    ----------
+    parallel_groups : List[List[str]]
+        ``orchestration.parallel_groups`` from the feature YAML. Group
+        numbers are 1-indexed, matching the wave numbers the smoke gate's
+        ``after_wave`` refers to.
+    dependencies : Mapping[str, Sequence[str]]
+        Declared dependencies per task id.
+    priorities : Mapping[str, float]
+        Critical-path priority per task id (see
+        :func:`critical_path_priorities`). Missing ids rank last.
+    resolved_checkpoints : Iterable[int], optional
+        Groups whose checkpoint already passed in a previous run
+        (``feature.execution.completed_waves``).
+    gated_groups : Optional[Iterable[int]], optional
+        Groups whose checkpoint must resolve before their dependents may
+        start. ``None`` (the default) gates every group.
+    """
+
+    def __init__(
+        self,
+        parallel_groups: List[List[str]],
+        dependencies: Mapping[str, Sequence[str]],
+        priorities: Mapping[str, float],
+        resolved_checkpoints: Iterable[int] = (),
+        gated_groups: Optional[Iterable[int]] = None,
+    ):
+        self._groups: Dict[int, List[str]] = {
+            number: list(task_ids)
+            for number, task_ids in enumerate(parallel_groups, 1)
+        }
+        self._group_of: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+        for number, task_ids in self._groups.items():
+            for task_id in task_ids:
+                self._group_of.setdefault(task_id, number)
+                self._order.setdefault(task_id, len(self._order))
+        self._dependencies: Dict[str, List[str]] = {
+            task_id: [
+                dep_id
+                for dep_id in dependencies.get(task_id, ())
+                if dep_id in self._group_of
+            ]
+            for task_id in self._group_of
+        }
+        self._priorities = dict(priorities)
+        self._pending: Set[str] = set(self._group_of)
+        self._running: Set[str] = set()
+        self._done: Set[str] = set()
+        self._checkpoints_running: Set[int] = set()
+        self._checkpoints_resolved: Set[int] = {
+            number for number in resolved_checkpoints if number in self._groups
+        }
+        self._gated_groups: Set[int] = (
+            set(self._groups) if gated_groups is None else set(gated_groups)
+        )
+
+    def group_of(self, task_id: str) -> int:
+        """1-indexed parallel group (wave) number of ``task_id``."""
+        return self._group_of[task_id]
+
+    @property
+    def running_count(self) -> int:
+        """Number of tasks currently dispatched."""
+        return len(self._running)
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether any task is still waiting to be dispatched."""
+        return bool(self._pending)
+
+    def pending(self) -> List[str]:
+        """Tasks not yet dispatched, in declaration order."""
+        return sorted(self._pending, key=self._order.__getitem__)
+
+    def ready(self) -> List[str]:
+        """Pending tasks whose dependency frontier is satisfied, best first."""
+        ready = [
+            task_id for task_id in self._pending if self._frontier_satisfied(task_id)
+        ]
+        ready.sort(
+            key=lambda task_id: (
+                -self._priorities.get(task_id, 0.0),
+                self._group_of[task_id],
+                self._order[task_id],
+            )
+        )
+        return ready
+
+    def _frontier_satisfied(self, task_id: str) -> bool:
+        for dep_id in self._dependencies[task_id]:
+            if dep_id not in self._done:
+                return False
+            dep_group = self._group_of[dep_id]
+            if (
+                dep_group in self._gated_groups
+                and dep_group not in self._checkpoints_resolved
+            ):
+                return False
+        return True
+
+    def mark_running(self, task_id: str) -> None:
+        """Record that ``task_id`` has been dispatched."""
+        self._pending.discard(task_id)
+        self._running.add(task_id)
+
+    def mark_done(self, task_id: str) -> None:
+        """Record that ``task_id`` reached a terminal state (any outcome)."""
+        self._pending.discard(task_id)
+        self._running.discard(task_id)
+        self._done.add(task_id)
+
+    def checkpoints_due(self) -> List[int]:
+        """Groups whose tasks are all terminal but whose checkpoint has not run.
+
+        Returned in ascending group order, so when several frontiers close at
+        once the gates fire in the same order the wave scheduler would use.
+        """
+        return [
+            number
+            for number, task_ids in sorted(self._groups.items())
+            if number not in self._checkpoints_resolved
+            and number not in self._checkpoints_running
+            and all(task_id in self._done for task_id in task_ids)
+        ]
+
+    def start_checkpoint(self, group_number: int) -> None:
+        """Record that the checkpoint for ``group_number`` is running."""
+        self._checkpoints_running.add(group_number)
+
+    def resolve_checkpoint(self, group_number: int) -> None:
+        """Record that the checkpoint for ``group_number`` has finished."""
+        self._checkpoints_running.discard(group_number)
+        self._checkpoints_resolved.add(group_number)
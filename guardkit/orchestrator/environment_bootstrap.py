@@ -37,6 +37,7 @@ import hashlib
 import json
 import logging
 import os
+import platform
 import re
 import shlex
 import shutil
@@ -48,6 +49,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
 
+from guardkit.orchestrator.venv_cache import (
+    CACHE_FORMAT_VERSION,
+    VenvTemplateCache,
+    read_pyvenv_cfg,
+)
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from guardkit.orchestrator.toolchain_declaration import ToolchainDeclaration
 
@@ -504,6 +511,13 @@ class BootstrapResult:
         PEP-668 flag, requires-python). Populated for both essential and
         non-relevant failures; ``essential=True`` entries are the ones that
         drove ``installs_failed``.
+    content_hash : Optional[str]
+        Lock hash of the manifests this result covers (see
+        ``EnvironmentBootstrapper._compute_hash``); None when no manifests
+        were detected. Keys the wave-0 baseline store.
+    venv_cache_hit : bool
+        True when the worktree venv was cloned from the venv template cache
+        and the Python installs were skipped.
     """
 
     success: bool
@@ -518,6 +532,8 @@ class BootstrapResult:
     non_relevant_failures: int = 0
     skipped_stacks: List[str] = field(default_factory=list)
     failure_details: List[BootstrapFailureDetail] = field(default_factory=list)
+    content_hash: Optional[str] = None
+    venv_cache_hit: bool = False
 
 
 # ============================================================================
@@ -1549,6 +1565,7 @@ class EnvironmentBootstrapper:
         root: Path,
         state_file: Optional[Path] = None,
         retry_cooldown_seconds: int = 60,
+        venv_cache: Optional[VenvTemplateCache] = None,
     ) -> None:
         """
         Initialize the bootstrapper.
@@ -1563,8 +1580,14 @@ class EnvironmentBootstrapper:
         retry_cooldown_seconds : int, optional
             Seconds to wait before retrying a previously failed install with
             the same content hash.  Defaults to 60.
+        venv_cache : Optional[VenvTemplateCache], optional
+            Venv template cache used to clone a fresh worktree's ``.venv``
+            instead of installing cold.  Defaults to
+            ``VenvTemplateCache.from_env()`` (None when
+            ``GUARDKIT_VENV_CACHE=0``).
         """
         self._root = root
+        self._venv_cache = venv_cache if venv_cache is not None else VenvTemplateCache.from_env()
         self._state_file = state_file or (root / ".guardkit" / "bootstrap_state.json")
         self._retry_cooldown_seconds = retry_cooldown_seconds
         self._venv_python: Optional[Path] = None
@@ -1641,6 +1664,7 @@ class EnvironmentBootstrapper:
                 manifests_found=manifests_found,
                 venv_python=self._resolve_skip_venv_python(saved),
                 duration_seconds=time.monotonic() - start_time,
+                content_hash=content_hash,
             )
 
         # Recover venv from previous run if available
@@ -1677,10 +1701,13 @@ class EnvironmentBootstrapper:
         # Gated to Python-stack manifests so non-Python features (Node /
         # .NET / Go / Rust / Flutter — all leak-free per FFC6 review F8)
         # do not pay the venv-creation cost.
+        fresh_worktree_venv = False
+        eager_requires_python: Optional[str] = None
         if any(m.stack == "python" for m in manifests) and (
             self._venv_python is None
             or not str(self._venv_python).startswith(str(self._root))
         ):
+            fresh_worktree_venv = not (self._root / ".venv").exists()
             try:
                 # Pin the eager venv to the project's requires-python (first
                 # python manifest that declares one) so uv does not silently
@@ -1708,6 +1735,18 @@ class EnvironmentBootstrapper:
                 # Leave self._venv_python unset; the existing fallback
                 # paths in _run_install handle the externally-managed and
                 # uv-no-venv cases independently.
+                fresh_worktree_venv = False
+
+        # Venv template cache: a freshly created worktree venv whose key
+        # (manifests + install commands + interpreter) was bootstrapped
+        # before is replaced by a clone of that venv, and the Python
+        # installs below are skipped.
+        venv_cache_key: Optional[str] = None
+        venv_cache_hit = False
+        if fresh_worktree_venv and self._venv_cache is not None:
+            venv_cache_key = self._venv_cache_key(manifests, eager_requires_python)
+            if venv_cache_key is not None:
+                venv_cache_hit = self._restore_venv_from_cache(venv_cache_key)
 
         # Run install commands
         installs_attempted = 0
@@ -1733,6 +1772,13 @@ class EnvironmentBootstrapper:
                 relevant_stacks is None or manifest.stack in relevant_stacks
             )
 
+            if venv_cache_hit and manifest.stack == "python":
+                logger.info(
+                    "Skipping install for python (%s): venv cloned from cache",
+                    manifest.path.name,
+                )
+                continue
+
             if manifest.is_project_complete():
                 # Full project install (standard path)
                 installs_attempted += 1
@@ -1813,6 +1859,17 @@ class EnvironmentBootstrapper:
                 f".claude/rules/absence-of-failure-is-not-success.md."
             )
 
+        if (
+            venv_cache_key is not None
+            and not venv_cache_hit
+            and self._venv_python == self._root / ".venv" / "bin" / "python"
+            and not any(d.stack == "python" for d in failure_details)
+        ):
+            try:
+                self._venv_cache.store(venv_cache_key, self._root)
+            except Exception as exc:  # noqa: BLE001 — caching must never block bootstrap
+                logger.warning("venv cache: store failed: %s", exc)
+
         # WS3-S3 ENVTAMPER-a (§5.1): post-install skip-guard dependency parity +
         # resolution-origin probe. Removes the motive for the ABL-001 self-mock by
         # surfacing missing skip-guarded extras (and vendored-stub directories,
@@ -1849,8 +1906,20 @@ class EnvironmentBootstrapper:
             non_relevant_failures=non_relevant_failures,
             skipped_stacks=sorted(skipped_stacks),
             failure_details=failure_details,
+            content_hash=content_hash,
+            venv_cache_hit=venv_cache_hit,
         )
 
+    def is_current(self, manifests: List[DetectedManifest]) -> bool:
+        """True when :meth:`bootstrap` would skip these manifests (hash match).
+
+        Lets a caller decide whether an install is coming before it pays for
+        one, e.g. to find a quiet moment for it first.
+        """
+        if not manifests:
+            return True
+        return self._should_skip(self._compute_hash(manifests))
+
     def _compute_hash(self, manifests: List[DetectedManifest]) -> str:
         """
         Compute a SHA-256 hash of all manifest file contents.
@@ -1881,6 +1950,120 @@ class EnvironmentBootstrapper:
                 )
         return hasher.hexdigest()
 
+    def _venv_cache_key(
+        self,
+        manifests: List[DetectedManifest],
+        requires_python: Optional[str],
+    ) -> Optional[str]:
+        """
+        Compute the venv template cache key for this worktree.
+
+        Like :meth:`_compute_hash` but worktree-independent (manifest paths
+        are root-relative) and extended with everything else that shapes the
+        venv: install commands, extras, project completeness, ``uv.lock``,
+        the platform and the interpreter recorded in the fresh venv's
+        ``pyvenv.cfg``.
+
+        Parameters
+        ----------
+        manifests : List[DetectedManifest]
+            All detected manifests (only Python ones contribute).
+        requires_python : Optional[str]
+            The interpreter constraint the eager venv was pinned to.
+
+        Returns
+        -------
+        Optional[str]
+            Hex digest, or None when the venv is not cacheable: a declared
+            or non-pip/uv Python install (its effects may live outside
+            ``.venv``), a manifest outside the worktree, or no interpreter
+            information.
+        """
+        cfg = read_pyvenv_cfg(self._root / ".venv")
+        version = cfg.get("version_info") or cfg.get("version")
+        if not version:
+            return None
+
+        hasher = hashlib.sha256()
+        for part in (
+            f"format={CACHE_FORMAT_VERSION}",
+            f"platform={sys.platform}-{platform.machine()}",
+            f"python={version}@{cfg.get('home', '')}",
+            f"requires-python={requires_python or ''}",
+            f"uv={_uv_on_path()}",
+        ):
+            hasher.update(part.encode("utf-8") + b"\0")
+
+        python_manifests = sorted(
+            (m for m in manifests if m.stack == "python"), key=lambda m: str(m.path)
+        )
+        for manifest in python_manifests:
+            cmd = list(manifest.install_command)
+            pip_cmd = len(cmd) >= 3 and cmd[0] == sys.executable and cmd[1:3] == ["-m", "pip"]
+            if manifest.declared or not (pip_cmd or cmd[:1] == ["uv"]):
+                return None
+            try:
+                rel = manifest.path.resolve().relative_to(self._root.resolve())
+                content = manifest.path.read_bytes()
+                uv_lock = manifest.path.parent / "uv.lock"
+                lock_content = uv_lock.read_bytes() if uv_lock.is_file() else b""
+            except (OSError, ValueError):
+                return None
+            if pip_cmd:
+                cmd[0] = "<python>"
+            for part in (
+                str(rel),
+                json.dumps(cmd),
+                ",".join(manifest.python_extras),
+                str(manifest.is_project_complete()),
+            ):
+                hasher.update(part.encode("utf-8") + b"\0")
+            hasher.update(content + b"\0" + lock_content + b"\0")
+        return hasher.hexdigest()
+
+    def _restore_venv_from_cache(self, key: str) -> bool:
+        """
+        Replace the freshly created ``<root>/.venv`` with a cached clone.
+
+        The fresh venv is moved aside first and put back if the restore
+        fails, so a miss or a broken template leaves bootstrap exactly where
+        it was.
+
+        Parameters
+        ----------
+        key : str
+            Venv cache key from :meth:`_venv_cache_key`.
+
+        Returns
+        -------
+        bool
+            True on a cache hit (``self._venv_python`` points at the clone).
+        """
+        assert self._venv_cache is not None
+        venv_dir = self._root / ".venv"
+        aside = self._root / ".venv.guardkit-fresh"
+        try:
+            if not (self._venv_cache.root / key / "venv").is_dir():
+                return False
+            shutil.rmtree(aside, ignore_errors=True)
+            os.rename(venv_dir, aside)
+        except OSError as exc:
+            logger.debug("venv cache: cannot move fresh venv aside: %s", exc)
+            return False
+
+        python = self._venv_cache.restore(key, self._root)
+        if python is None:
+            shutil.rmtree(venv_dir, ignore_errors=True)
+            os.rename(aside, venv_dir)
+            return False
+
+        shutil.rmtree(aside, ignore_errors=True)
+        self._venv_python = python
+        logger.info(
+            "venv cache: cloned worktree venv from template %s", key[:12]
+        )
+        return True
+
     def _should_skip(self, content_hash: str) -> bool:
         """
         Determine whether the bootstrap should be skipped for this content hash.
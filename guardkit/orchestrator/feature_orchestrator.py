@@ -49,6 +49,7 @@ from guardkit.orchestrator.feature_loader import (
     FeatureTask,
     FeatureNotFoundError,
     FeatureValidationError,
+    SmokeGates,
     derive_bootstrap_extras,
 )
 from guardkit.orchestrator import evidence_repos as evidence_repos_lib
@@ -72,10 +73,17 @@ from guardkit.orchestrator.stale_test_attribution import (
 )
 from guardkit.orchestrator.baseline import (
     BaselineResult,
+    BaselineStore,
+    baseline_cache_enabled,
+    changed_paths_between,
     feature_baseline_path,
+    narrow_pytest_command,
     now_isoformat,
+    partial_probe_targets,
     probe_baseline_result,
+    tracked_test_files,
     wave0_baseline_warning,
+    worktree_tree_hash,
     write_baseline,
 )
 from guardkit.orchestrator.feature_validator import (
@@ -102,6 +110,14 @@ from guardkit.orchestrator.environment_bootstrap import (
 )
 from guardkit.models.task_types import TaskType, normalise_task_type
 from guardkit.tasks.task_loader import TaskLoader
+from guardkit.orchestrator.dag_scheduler import (
+    SCHEDULER_DAG,
+    SCHEDULER_WAVES,
+    DagScheduler,
+    critical_path_priorities,
+    resolve_scheduler_mode,
+    task_duration_seconds,
+)
 from guardkit.orchestrator.parallel_strategy import (
     MaxParallelMode,
     ParallelConfig,
@@ -118,7 +134,9 @@ from guardkit.worktrees import (
 from guardkit.cli.display import WaveProgressDisplay
 
 # Import instrumentation (TASK-INST-004)
+from guardkit.orchestrator.instrumentation.concurrency import llm_gate_ceiling
 from guardkit.orchestrator.instrumentation.emitter import NullEmitter
+from guardkit.orchestrator.instrumentation.llm_instrumentation import detect_provider
 from guardkit.orchestrator.instrumentation.schemas import WaveCompletedEvent
 
 logger = logging.getLogger(__name__)
@@ -653,6 +671,7 @@ class FeatureOrchestrator:
         honesty_early_abort_window: int = 3,
         model: Optional[str] = None,
         coach_model: Optional[str] = None,
+        scheduler: Optional[str] = None,
     ):
         """
         Initialize FeatureOrchestrator.
@@ -714,11 +733,18 @@ class FeatureOrchestrator:
             defaulting to ``"warn"`` (preserve current behavior). ``"block"``
             raises :class:`FeatureOrchestrationError` when bootstrap attempts
             at least one install and every essential-stack install failed.
+        scheduler : Optional[str], optional
+            Task scheduler: ``"waves"`` runs ``parallel_groups`` behind a
+            barrier per wave; ``"dag"`` dispatches each task as soon as its
+            dependencies are terminal, highest critical path first. When
+            None, reads ``GUARDKIT_FEATURE_SCHEDULER``, defaulting to
+            ``"waves"``. See :mod:`guardkit.orchestrator.dag_scheduler`.
 
         Raises
         ------
         ValueError
-            If max_turns < 1 or if both resume and fresh are True
+            If max_turns < 1, if both resume and fresh are True, or if
+            scheduler is not a known mode
         """
         if max_turns < 1:
             raise ValueError("max_turns must be at least 1")
@@ -812,6 +838,7 @@ class FeatureOrchestrator:
         floored_task_timeout = max(task_timeout_floor, task_timeout)
         self.task_timeout = int(floored_task_timeout * self.timeout_multiplier)
         self.max_parallel = max_parallel
+        self.scheduler = resolve_scheduler_mode(scheduler)
         self._parallel_config = parallel_config if parallel_config is not None else ParallelConfig.from_legacy(max_parallel)
         self.skip_validation = skip_validation
         self._emitter = emitter if emitter is not None else NullEmitter()  # TASK-INST-004
@@ -851,6 +878,14 @@ class FeatureOrchestrator:
         # Red-baseline retro (L12 item 1): the wave-0 baseline probe result,
         # a session-scoped observation (NOT the F2 ledger).
         self._measured_baseline: Optional[BaselineResult] = None
+        # Lock hash of the most recent bootstrap (set in
+        # :meth:`_bootstrap_environment`); keys the baseline store.
+        self._bootstrap_lock_hash: Optional[str] = None
+        # Serialises mutation + save of the feature YAML. Under the dag
+        # scheduler, task threads and frontier checkpoint threads update the
+        # same Feature concurrently. Re-entrant: a checkpoint may re-run a
+        # wave whose tasks save through the same helpers.
+        self._feature_state_lock = threading.RLock()
 
         logger.info(
             f"FeatureOrchestrator initialized: repo={self.repo_root}, "
@@ -860,6 +895,7 @@ class FeatureOrchestrator:
             f"enable_context={self.enable_context}, task_timeout={self.task_timeout}s"
             f"{f', timeout_multiplier={self.timeout_multiplier}x' if self.timeout_multiplier != 1.0 else ''}"
             f"{f', max_parallel={self.max_parallel}' if self.max_parallel is not None else ''}"
+            f"{f', scheduler={self.scheduler}' if self.scheduler != SCHEDULER_WAVES else ''}"
         )
 
     def _raise_fd_limit(self, target: int = 4096) -> None:
@@ -1659,6 +1695,34 @@ class FeatureOrchestrator:
                 f"that the target path is readable. See TASK-FIX-AB61."
             ) from exc
 
+    @staticmethod
+    def _bootstrap_python_extras(
+        worktree: Worktree, feature: Optional[Feature]
+    ) -> tuple[str, ...]:
+        """``bootstrap_extras`` for the Python pyproject install (TASK-GK-BS-001)."""
+        if feature is None:
+            return ()
+        return tuple(derive_bootstrap_extras(feature, worktree.path))
+
+    def _bootstrap_pending(self, worktree: Worktree, feature: Feature) -> bool:
+        """Whether :meth:`_bootstrap_environment` would install anything now.
+
+        A manifest scan plus hash check, no install. The dag scheduler uses it
+        to drain in-flight tasks only for a frontier that actually changed
+        the dependency manifests. Errors answer ``True``: the bootstrap
+        itself then decides, at a quiet moment.
+        """
+        try:
+            detector = ProjectEnvironmentDetector(
+                worktree.path,
+                python_extras=self._bootstrap_python_extras(worktree, feature),
+            )
+            manifests = detector.detect()
+            return not EnvironmentBootstrapper(worktree.path).is_current(manifests)
+        except Exception as exc:  # noqa: BLE001 — fall back to bootstrapping
+            logger.debug("Bootstrap pending check failed: %s", exc)
+            return True
+
     def _bootstrap_environment(
         self,
         worktree: Worktree,
@@ -1698,16 +1762,12 @@ class FeatureOrchestrator:
             to hard-fail (see :meth:`_should_hardfail_bootstrap`).
         """
         try:
-            python_extras: tuple[str, ...] = ()
-            if feature is not None:
-                python_extras = tuple(
-                    derive_bootstrap_extras(feature, worktree.path)
+            python_extras = self._bootstrap_python_extras(worktree, feature)
+            if python_extras:
+                logger.info(
+                    "Bootstrap will install Python extras: %s",
+                    list(python_extras),
                 )
-                if python_extras:
-                    logger.info(
-                        "Bootstrap will install Python extras: %s",
-                        list(python_extras),
-                    )
             detector = ProjectEnvironmentDetector(
                 worktree.path,
                 python_extras=python_extras,
@@ -1753,6 +1813,7 @@ class FeatureOrchestrator:
             # TASK-FIX-7A04: Evaluate hard-fail gate. In "warn" mode this is a
             # no-op; in "block" mode we raise on total-failure + essential-stack.
             self._maybe_hardfail_bootstrap(result)
+            self._bootstrap_lock_hash = result.content_hash
 
             # TASK-FIX-7A05: capture the bootstrap interpreter so downstream
             # AutoBuildOrchestrator / Coach pytest invocations use it
@@ -2305,6 +2366,13 @@ The detailed specifications are in the task markdown file.
             f"[/dim]"
         )
 
+        if self.scheduler == SCHEDULER_DAG:
+            # Dependency-driven dispatch: no global barrier between waves;
+            # the post-wave gates fire as per-frontier checkpoints instead.
+            wave_results = self._dag_phase(feature, worktree)
+            self._run_final_wave_boot_smoke(feature, worktree, wave_results)
+            return wave_results
+
         for wave_number, task_ids in enumerate(
             feature.orchestration.parallel_groups, 1
         ):
@@ -2439,6 +2507,334 @@ The detailed specifications are in the task markdown file.
 
         return wave_results
 
+    def _dag_phase(
+        self,
+        feature: Feature,
+        worktree: Worktree,
+    ) -> List[WaveExecutionResult]:
+        """Phase 2 under the ``dag`` scheduler.
+
+        Dispatches each task as soon as its dependency frontier is satisfied
+        instead of waiting for the whole previous wave (see
+        :mod:`guardkit.orchestrator.dag_scheduler`). Returns one
+        :class:`WaveExecutionResult` per parallel group that ran, in group
+        order, so the finalize phase and the final boot-smoke check consume
+        the same shape as the wave scheduler produces.
+        """
+        return asyncio.run(self._execute_dag(feature, worktree))
+
+    async def _execute_dag(
+        self,
+        feature: Feature,
+        worktree: Worktree,
+    ) -> List[WaveExecutionResult]:
+        """Dependency-driven dispatch loop behind :meth:`_dag_phase`.
+
+        Each ready task runs through :meth:`_execute_wave_parallel` as a
+        one-task batch, so the skip / defer / timeout / late-approval
+        handling is identical to the wave scheduler. Concurrency is bounded
+        by the resolved ``max_parallel`` across ALL in-flight tasks, not per
+        group.
+
+        When every task in group N is terminal, group N's ``wave.completed``
+        event is emitted and its frontier checkpoint
+        (:meth:`_run_frontier_checkpoint`) runs in a worker thread. If the
+        smoke gate fires for group N, tasks depending on a group-N task wait
+        for the checkpoint; everything else keeps running.
+        ``stop_on_failure`` (a failed task) or a terminating checkpoint stops
+        further dispatch; in-flight tasks are allowed to finish.
+
+        The wave loop's inter-wave bootstrap installs into the shared venv,
+        so it never runs beside a task: when a checkpoint leaves the
+        dependency manifests changed (:meth:`_bootstrap_pending`), dispatch
+        pauses, in-flight work drains, and the bootstrap runs alone.
+        """
+        groups = feature.orchestration.parallel_groups
+        tasks_by_id = {task.id: task for task in feature.tasks}
+        dependencies = {
+            task_id: list(tasks_by_id[task_id].dependencies)
+            if task_id in tasks_by_id else []
+            for group in groups for task_id in group
+        }
+        durations = {
+            task_id: task_duration_seconds(
+                tasks_by_id[task_id], self._task_estimate_floor_seconds
+            )
+            for task_id in dependencies if task_id in tasks_by_id
+        }
+        try:
+            priorities = critical_path_priorities(dependencies, durations)
+        except ValueError as exc:
+            raise DependencyError(str(exc)) from exc
+
+        # Only a group the smoke gate fires for holds back its dependents:
+        # a smoke failure may re-run the group, which must not happen under
+        # a dependent that already started. The wiring gate is advisory and
+        # runs at every frontier without gating.
+        gated_groups = [
+            number for number in range(1, len(groups) + 1)
+            if feature.smoke_gates is not None
+            and should_fire_for_wave(feature.smoke_gates, number)
+        ]
+        scheduler = DagScheduler(
+            groups,
+            dependencies,
+            priorities,
+            resolved_checkpoints=feature.execution.completed_waves,
+            gated_groups=gated_groups,
+        )
+        group_results: Dict[int, List[TaskExecutionResult]] = {}
+        final_results: Dict[int, WaveExecutionResult] = {}
+        started_groups: set = set()
+        in_flight: Dict["asyncio.Future[Any]", Tuple[str, Any]] = {}
+        # TASK-FIX-A7B2 contention map, shared by every in-flight task. An
+        # entry is dropped when its task finishes so Coach only ever sees
+        # peers that are actually running concurrently.
+        changed_files: Dict[str, Any] = {}
+        changed_files_lock = threading.Lock()
+        stop_dispatch = False
+        bootstrap_due = False
+
+        logger.info(
+            "DAG scheduler: %d tasks across %d groups; critical path %.0fs",
+            len(dependencies), len(groups), max(priorities.values(), default=0.0),
+        )
+
+        while True:
+            if bootstrap_due and not stop_dispatch:
+                if not in_flight:
+                    future = asyncio.ensure_future(asyncio.to_thread(
+                        self._bootstrap_environment, worktree, feature=feature
+                    ))
+                    in_flight[future] = ("bootstrap", 0)
+            elif not stop_dispatch:
+                for group_number in scheduler.checkpoints_due():
+                    scheduler.start_checkpoint(group_number)
+                    group_task_ids = list(groups[group_number - 1])
+                    results = group_results.get(group_number, [])
+                    wave_result = WaveExecutionResult(
+                        wave_number=group_number,
+                        task_ids=group_task_ids,
+                        results=results,
+                        all_succeeded=all(r.success for r in results),
+                    )
+                    await self._emit_frontier_completed(feature, wave_result)
+                    future = asyncio.ensure_future(asyncio.to_thread(
+                        self._run_frontier_checkpoint,
+                        group_number, group_task_ids, feature, worktree,
+                        wave_result,
+                    ))
+                    in_flight[future] = ("checkpoint", group_number)
+
+                ready = scheduler.ready()
+                max_parallel = resolve_max_parallel(
+                    self._parallel_config,
+                    wave_number=min(
+                        (scheduler.group_of(t) for t in ready), default=1
+                    ),
+                    wave_size=len(ready) + scheduler.running_count,
+                    log=False,
+                )
+                for task_id in ready:
+                    if (
+                        max_parallel is not None and max_parallel > 0
+                        and scheduler.running_count >= max_parallel
+                    ):
+                        break
+                    group_number = scheduler.group_of(task_id)
+                    if group_number not in started_groups:
+                        started_groups.add(group_number)
+                        self._record_current_wave(feature, group_number)
+                        if self._wave_display:
+                            self._wave_display.start_wave(
+                                group_number, list(groups[group_number - 1]),
+                                max_parallel=max_parallel,
+                            )
+                    scheduler.mark_running(task_id)
+                    smoke_command, smoke_expected_exit = (
+                        self._per_task_smoke_command(feature, group_number)
+                    )
+                    future = asyncio.ensure_future(self._execute_wave_parallel(
+                        group_number, [task_id], feature, worktree,
+                        smoke_command=smoke_command,
+                        smoke_expected_exit=smoke_expected_exit,
+                        wave_size=scheduler.running_count,
+                        wave_changed_files=changed_files,
+                        wave_files_lock=changed_files_lock,
+                    ))
+                    in_flight[future] = ("task", task_id)
+
+            if not in_flight:
+                if scheduler.has_pending and not stop_dispatch:
+                    # Nothing running and nothing ready: the declared
+                    # dependencies cross group boundaries in a way no
+                    # frontier can ever satisfy (the wave scheduler raises
+                    # the same error at the offending wave).
+                    raise DependencyError(
+                        "Tasks have unsatisfiable dependencies under the dag "
+                        f"scheduler: {', '.join(scheduler.pending())}"
+                    )
+                break
+
+            done, _ = await asyncio.wait(
+                list(in_flight), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                kind, key = in_flight.pop(future)
+                if kind == "bootstrap":
+                    future.result()
+                    bootstrap_due = False
+                    continue
+                if kind == "checkpoint":
+                    wave_result, terminate = future.result()
+                    final_results[key] = wave_result
+                    scheduler.resolve_checkpoint(key)
+                    if terminate:
+                        stop_dispatch = True
+                    elif not bootstrap_due:
+                        # Dependents of this frontier may need what it
+                        # installed (the wave loop's inter-wave bootstrap).
+                        bootstrap_due = await asyncio.to_thread(
+                            self._bootstrap_pending, worktree, feature
+                        )
+                    continue
+
+                results = future.result()
+                scheduler.mark_done(key)
+                with changed_files_lock:
+                    changed_files.pop(key, None)
+                group_number = scheduler.group_of(key)
+                group_results.setdefault(group_number, []).extend(results)
+                if self.stop_on_failure and not stop_dispatch and any(
+                    not r.success for r in results
+                ):
+                    console.print(
+                        f"[yellow]⚠[/yellow] {key} failed; no further tasks "
+                        "will be dispatched (stop_on_failure=True)"
+                    )
+                    stop_dispatch = True
+
+        wave_results: List[WaveExecutionResult] = []
+        for group_number, task_ids in enumerate(groups, 1):
+            if group_number in final_results:
+                wave_results.append(final_results[group_number])
+            elif group_number in group_results:
+                results = group_results[group_number]
+                wave_results.append(WaveExecutionResult(
+                    wave_number=group_number,
+                    task_ids=list(task_ids),
+                    results=results,
+                    all_succeeded=(
+                        len(results) == len(task_ids)
+                        and all(r.success for r in results)
+                    ),
+                ))
+        return wave_results
+
+    def _run_frontier_checkpoint(
+        self,
+        wave_number: int,
+        task_ids: List[str],
+        feature: Feature,
+        worktree: Worktree,
+        wave_result: WaveExecutionResult,
+    ) -> Tuple[WaveExecutionResult, bool]:
+        """Per-frontier replacement for the post-wave barrier (DAG scheduler).
+
+        Runs, for one closed group, what the wave loop runs after a wave: the
+        smoke gate (when it fires for this group), the wiring gate and
+        wave-completion persistence. The inter-wave bootstrap is left to
+        :meth:`_execute_dag`, which runs it only with nothing else in flight.
+        Feature-state writes go through the helpers that hold
+        ``_feature_state_lock``, shared with the task threads. Both gate
+        helpers may re-execute the group through :meth:`_execute_wave`,
+        which calls ``asyncio.run`` — so this method is invoked on a worker
+        thread, never on the DAG event loop.
+
+        Returns
+        -------
+        Tuple[WaveExecutionResult, bool]
+            The (possibly re-run) group result, and whether dispatch must
+            stop — a failed group under ``stop_on_failure`` or a terminating
+            gate outcome.
+        """
+        passed = sum(1 for r in wave_result.results if r.success)
+        failed = len(wave_result.results) - passed
+        skipped = sum(
+            1 for r in wave_result.results if r.final_decision == "skipped"
+        )
+        recovered = sum(1 for r in wave_result.results if r.recovery_count > 0)
+        if self._wave_display:
+            self._wave_display.complete_wave(
+                wave_number, passed, failed, skipped, recovered
+            )
+        else:
+            status = (
+                "[green]✓ PASSED[/green]" if wave_result.all_succeeded
+                else "[red]✗ FAILED[/red]"
+            )
+            console.print(
+                f"  Wave {wave_number} frontier {status}: "
+                f"{passed} passed, {failed} failed"
+            )
+
+        if not wave_result.all_succeeded and self.stop_on_failure:
+            return wave_result, True
+
+        if feature.smoke_gates is not None and should_fire_for_wave(
+            feature.smoke_gates, wave_number
+        ):
+            outcome = self._run_post_wave_smoke_gate(
+                wave_number, task_ids, feature, worktree, wave_result
+            )
+            wave_result = outcome.final_wave_result
+            if outcome.terminate:
+                return wave_result, True
+
+        wiring_outcome = self._run_post_wave_wiring_gate(
+            wave_number, task_ids, feature, worktree, wave_result
+        )
+        wave_result = wiring_outcome.final_wave_result
+        if wiring_outcome.terminate:
+            return wave_result, True
+
+        smoke_blocked = (
+            wave_result.smoke_gate_result is not None
+            and not wave_result.smoke_gate_result.passed
+        )
+        if wave_result.all_succeeded and not smoke_blocked:
+            self._mark_wave_completed(feature, wave_number)
+        return wave_result, False
+
+    async def _emit_frontier_completed(
+        self, feature: Feature, wave_result: WaveExecutionResult
+    ) -> None:
+        """``wave.completed`` for a closed dag group, as :meth:`_execute_wave` emits it.
+
+        Fired when the group's last task is terminal, before its checkpoint;
+        a gate re-run through :meth:`_execute_wave` emits its own
+        ``-retry-N`` event, exactly as under the wave scheduler.
+        """
+        task_ids = wave_result.task_ids
+        results = wave_result.results
+        try:
+            await self._emit_wave_completed(
+                feature_id=feature.id,
+                wave_id=f"wave-{wave_result.wave_number}",
+                wave_number=wave_result.wave_number,
+                worker_count=len(task_ids),
+                queue_depth_start=len(task_ids),
+                queue_depth_end=len(task_ids) - len(results),
+                tasks_completed=sum(1 for r in results if r.success),
+                task_failures=sum(1 for r in results if not r.success),
+                rate_limit_count=0,
+                p95_task_latency_ms=None,
+                run_id=f"run-{feature.id}",
+                task_id=feature.id,
+            )
+        except Exception as exc:
+            logger.warning("Failed to emit wave.completed event: %s", exc)
+
     def _boot_smoke_skip_reason(
         self,
         feature: Feature,
@@ -2641,9 +3037,10 @@ The detailed specifications are in the task markdown file.
 
         TASK-AB-COACHRUNPARITY01 (arm a). Owns the retry loop extracted from the
         wave-enumerate loop so the control flow stays readable and the retry
-        logic is unit-testable. The caller is the wave-enumerate loop; this
-        helper is tightly coupled to it (it calls back into ``_execute_wave``)
-        and must not be invoked from any other context.
+        logic is unit-testable. The callers are the wave-enumerate loop and
+        the DAG scheduler's :meth:`_run_frontier_checkpoint`; this helper is
+        tightly coupled to them (it calls back into ``_execute_wave``) and
+        must not be invoked from any other context.
 
         Behaviour, per smoke result:
 
@@ -3291,6 +3688,27 @@ The detailed specifications are in the task markdown file.
                 )
             # Loop: re-run the wiring gate against the re-executed wave.
 
+    def _warn_if_llm_gate_caps_wave(self, wave_number: int, concurrency: int) -> None:
+        """Warn when the LLM gate's in-flight ceiling is below wave concurrency.
+
+        Each running agent session holds one gate slot, so tasks beyond an
+        explicit ``GUARDKIT_LLM_MAX_INFLIGHT_<PROVIDER>`` queue on the gate
+        instead of running. The defaults set no ceiling.
+        """
+        provider = detect_provider(os.environ.get("ANTHROPIC_BASE_URL", ""), None)
+        ceiling = llm_gate_ceiling(provider)
+        if ceiling is not None and concurrency > ceiling:
+            logger.warning(
+                "Wave %d runs %d tasks in parallel but the LLM gate allows %d "
+                "in-flight %s sessions (GUARDKIT_LLM_MAX_INFLIGHT_%s); the rest "
+                "wait for a slot.",
+                wave_number,
+                concurrency,
+                ceiling,
+                provider,
+                provider.upper().replace("-", "_"),
+            )
+
     async def _execute_wave_parallel(
         self,
         wave_number: int,
@@ -3300,6 +3718,9 @@ The detailed specifications are in the task markdown file.
         seed_feedback: Optional[str] = None,
         smoke_command: Optional[str] = None,
         smoke_expected_exit: int = 0,
+        wave_size: Optional[int] = None,
+        wave_changed_files: Optional[Dict[str, Any]] = None,
+        wave_files_lock: Optional[threading.Lock] = None,
     ) -> List[TaskExecutionResult]:
         """
         Execute all tasks in a wave in parallel using asyncio.
@@ -3319,6 +3740,15 @@ The detailed specifications are in the task markdown file.
             Parent feature
         worktree : Worktree
             Shared worktree
+        wave_size : Optional[int]
+            Number of concurrently executing peers reported to each task's
+            Coach for isolation (TASK-ABFIX-005). Defaults to
+            ``len(task_ids)``; the DAG scheduler passes the in-flight count
+            because it dispatches one task per call.
+        wave_changed_files, wave_files_lock : optional
+            Shared per-task file-edit map and its lock (TASK-FIX-A7B2).
+            Default to a fresh map scoped to this call; the DAG scheduler
+            passes one map shared by every in-flight task.
 
         Returns
         -------
@@ -3335,8 +3765,12 @@ The detailed specifications are in the task markdown file.
         # each Player finishes. Coach reads peer entries to detect source-file
         # contention and refuse the TASK-ABFIX-005 conditional approval when
         # the contention is real source-file damage (not transient infra).
-        wave_changed_files: Dict[str, Any] = {}
-        wave_files_lock: threading.Lock = threading.Lock()
+        if wave_changed_files is None:
+            wave_changed_files = {}
+        if wave_files_lock is None:
+            wave_files_lock = threading.Lock()
+        if wave_size is None:
+            wave_size = len(task_ids)
 
         # Track wave start time for per-task budget propagation (TASK-ABFIX-004)
         wave_start_time = time.monotonic()
@@ -3455,7 +3889,7 @@ The detailed specifications are in the task markdown file.
                         cancellation_event=cancel_event,
                         timeout_event=timeout_event,
                         time_budget_seconds=task_budget,
-                        wave_size=len(task_ids),
+                        wave_size=wave_size,
                         effective_task_timeout=effective_task_timeout,
                         wave_changed_files=wave_changed_files,  # TASK-FIX-A7B2
                         wave_files_lock=wave_files_lock,  # TASK-FIX-A7B2
@@ -3484,6 +3918,12 @@ The detailed specifications are in the task markdown file.
             tasks_to_execute = bound_concurrency(
                 tasks_to_execute, effective_max_parallel
             )
+            self._warn_if_llm_gate_caps_wave(
+                wave_number,
+                min(effective_max_parallel, len(tasks_to_execute))
+                if effective_max_parallel and effective_max_parallel > 0
+                else len(tasks_to_execute),
+            )
 
             # TASK-CEF-004: Log gather start for cancellation diagnostics
             # TASK-ATR-001: Show per-task timeouts (may differ via frontmatter override)
@@ -3817,9 +4257,7 @@ The detailed specifications are in the task markdown file.
         completion only after the smoke phase resolves successfully.
         """
         # Update current wave tracking
-        feature.execution.current_wave = wave_number
-        feature.execution.last_updated = datetime.now().isoformat()
-        FeatureLoader.save_feature(feature, self.repo_root)
+        self._record_current_wave(feature, wave_number)
 
         # TASK-AB-COACHRUNPARITY01 (arm b) + TASK-FIX-PARITYWAVE01: the
         # deliverable's runtime entry point, derived once here (this method
@@ -4039,14 +4477,57 @@ The detailed specifications are in the task markdown file.
         Stores the result on ``self._measured_baseline`` so the Coach
         test-gate baseline diff (item 2) can suppress mid-build
         mis-attribution of these pre-existing failures.
+
+        The result is read from / written to the content-addressed
+        :class:`BaselineStore` (tree hash + bootstrap lock hash + command), so
+        a restart on an unchanged tree costs no suite run, and a moved tree
+        costs only a partial re-probe (see :meth:`_probe_baseline_cached`).
         """
         self._measured_baseline = None
         smoke = getattr(feature, "smoke_gates", None)
         if smoke is None:
             return
+        if baseline_cache_enabled():
+            result = self._probe_baseline_cached(smoke, worktree)
+        else:
+            result = self._probe_baseline(smoke, worktree)
+        if result is None:
+            return
+        self._measured_baseline = result
+
+        try:
+            write_baseline(
+                feature_baseline_path(worktree.path, feature.id), result
+            )
+        except OSError as exc:
+            logger.warning("Could not write baseline.json: %s", exc)
+
+        warning = wave0_baseline_warning(result)
+        if warning is not None:
+            logger.warning(warning)
+            console.print(f"[yellow]⚠[/yellow] {warning}")
+        else:
+            logger.info(
+                "Baseline probe: feature suite GREEN before wave 1 "
+                "(command: %s).", result.command
+            )
+
+    def _probe_baseline(
+        self,
+        smoke: SmokeGates,
+        worktree: Worktree,
+        command: Optional[str] = None,
+    ) -> Optional[BaselineResult]:
+        """Run the baseline probe once; ``None`` when it could not run.
+
+        ``command`` overrides ``smoke.command`` (a partial re-probe); the
+        recorded command is always ``smoke.command``, the suite the baseline
+        describes.
+        """
+        config = smoke if command is None else smoke.model_copy(update={"command": command})
         try:
             smoke_result = run_smoke_gate(
-                smoke,
+                config,
                 cwd=worktree.path,
                 wave_number=0,
                 venv_python=self._bootstrap_venv_python,
@@ -4055,37 +4536,116 @@ The detailed specifications are in the task markdown file.
             logger.warning(
                 "Baseline probe could not run '%s' in %s: %s "
                 "(continuing; probe is report-only).",
-                smoke.command, worktree.path, exc,
+                config.command, worktree.path, exc,
             )
-            return
+            return None
 
         combined = f"{smoke_result.stdout or ''}\n{smoke_result.stderr or ''}"
-        result = probe_baseline_result(
-            command=smoke_result.command,
+        return probe_baseline_result(
+            command=smoke.command,
             expected_exit=smoke.expected_exit,
             passed=smoke_result.passed,
             exit_code=smoke_result.exit_code,
             output=combined,
             timestamp=now_isoformat(),
         )
-        self._measured_baseline = result
 
-        try:
-            write_baseline(
-                feature_baseline_path(worktree.path, feature.id), result
-            )
-        except OSError as exc:
-            logger.warning("Could not write baseline.json: %s", exc)
+    def _probe_baseline_cached(
+        self,
+        smoke: SmokeGates,
+        worktree: Worktree,
+    ) -> Optional[BaselineResult]:
+        """Baseline probe through the content-addressed store.
+
+        1. Exact hit on (tree hash, lock hash, command) → the stored result,
+           no run.
+        2. A stored result for the same lock + command on an older tree →
+           partial re-probe of its failing ids plus the test subtrees of the
+           changed packages (:func:`partial_probe_targets`), when the smoke command is
+           one plain pytest invocation that can be narrowed.
+        3. Otherwise a full probe.
+
+        Results of (2) and (3) are stored under the current key. A worktree
+        with tracked modifications has no tree hash and always runs a full,
+        unstored probe.
+        """
+        tree_hash = worktree_tree_hash(worktree.path)
+        if tree_hash is None:
+            return self._probe_baseline(smoke, worktree)
 
-        warning = wave0_baseline_warning(result)
-        if warning is not None:
-            logger.warning(warning)
-            console.print(f"[yellow]⚠[/yellow] {warning}")
-        else:
+        store = BaselineStore(self.repo_root)
+        lock_hash = self._bootstrap_lock_hash or ""
+        lineage = store.lineage(lock_hash, smoke.command, smoke.expected_exit)
+        key = store.key(tree_hash, lock_hash, smoke.command, smoke.expected_exit)
+
+        cached = store.get(key)
+        if cached is not None:
             logger.info(
-                "Baseline probe: feature suite GREEN before wave 1 "
-                "(command: %s).", result.command
+                "Baseline probe: reusing stored result for tree %s "
+                "(command: %s); no suite run.",
+                tree_hash[:12], smoke.command,
             )
+            cached.probe_scope = "cached"
+            return cached
+
+        result = self._probe_baseline_partial(smoke, worktree, store, lineage, tree_hash)
+        if result is None:
+            result = self._probe_baseline(smoke, worktree)
+        if result is None:
+            return None
+        try:
+            store.put(key, lineage, tree_hash, result)
+        except OSError as exc:
+            logger.warning("Could not write baseline store entry: %s", exc)
+        return result
+
+    def _probe_baseline_partial(
+        self,
+        smoke: SmokeGates,
+        worktree: Worktree,
+        store: BaselineStore,
+        lineage: str,
+        tree_hash: str,
+    ) -> Optional[BaselineResult]:
+        """Partial re-probe on top of the lineage's newest stored result.
+
+        ``None`` whenever a full probe is needed: no stored result, an
+        unreadable diff, a change the partial probe cannot vouch for
+        (non-Python, suite-wide, or with no test subtree), a command that
+        cannot be narrowed, or a narrowed run that did not finish as pass /
+        test failures. A green result is never carried over without a run.
+        """
+        latest = store.latest_for(lineage)
+        if latest is None:
+            return None
+        previous_tree, previous = latest
+        changed = changed_paths_between(worktree.path, previous_tree, tree_hash)
+        if changed is None:
+            return None
+        test_files = tracked_test_files(worktree.path)
+        if test_files is None:
+            return None
+        targets = partial_probe_targets(previous, changed, test_files, worktree.path)
+        if targets is None:
+            return None
+        narrowed = narrow_pytest_command(smoke.command, targets)
+        if narrowed is None:
+            return None
+
+        logger.info(
+            "Baseline probe: partial re-probe of %d target(s) after %d changed "
+            "path(s) since tree %s: %s",
+            len(targets), len(changed), previous_tree[:12], narrowed,
+        )
+        result = self._probe_baseline(smoke, worktree, command=narrowed)
+        if result is None:
+            return None
+        # Pass, or tests ran and failed with parseable ids; anything else
+        # (collection error, usage error, timeout) needs the full probe.
+        if not result.passed and (result.exit_code != 1 or not result.failing_node_ids):
+            return None
+        result.probe_scope = "partial"
+        return result
 
     def _resolve_wave_task_timeouts(self, feature: Feature) -> Dict[str, int]:
         """Resolve the EFFECTIVE per-task timeout for every queued task.
@@ -5070,45 +5630,46 @@ The detailed specifications are in the task markdown file.
         wave_number : Optional[int]
             Current wave number (1-indexed)
         """
-        task = FeatureLoader.find_task(feature, task_id)
-        if not task:
-            return
+        with self._feature_state_lock:
+            task = FeatureLoader.find_task(feature, task_id)
+            if not task:
+                return
 
-        if result:
-            # TASK-FPTC-003: deferred is terminal-but-not-failed. Preserve
-            # the explicit "deferred" status in the saved feature state so
-            # /feature-complete (TASK-FPTC-005) can find it without
-            # round-tripping through the success flag.
-            if result.final_decision == "deferred":
-                task.status = "deferred"
-            else:
-                task.status = "completed" if result.success else "failed"
-            task.turns_completed = result.total_turns
-            task.current_turn = 0  # Reset current turn on completion
-            task.completed_at = datetime.now().isoformat()
-            task.result = {
-                "total_turns": result.total_turns,
-                "final_decision": result.final_decision,
-                "error": result.error,
-                "deferred_reason": result.deferred_reason,
-            }
-
-        # Update execution counters
-        feature.execution.tasks_completed = sum(
-            1 for t in feature.tasks if t.status == "completed"
-        )
-        feature.execution.tasks_failed = sum(
-            1 for t in feature.tasks if t.status == "failed"
-        )
+            if result:
+                # TASK-FPTC-003: deferred is terminal-but-not-failed. Preserve
+                # the explicit "deferred" status in the saved feature state so
+                # /feature-complete (TASK-FPTC-005) can find it without
+                # round-tripping through the success flag.
+                if result.final_decision == "deferred":
+                    task.status = "deferred"
+                else:
+                    task.status = "completed" if result.success else "failed"
+                task.turns_completed = result.total_turns
+                task.current_turn = 0  # Reset current turn on completion
+                task.completed_at = datetime.now().isoformat()
+                task.result = {
+                    "total_turns": result.total_turns,
+                    "final_decision": result.final_decision,
+                    "error": result.error,
+                    "deferred_reason": result.deferred_reason,
+                }
+
+            # Update execution counters
+            feature.execution.tasks_completed = sum(
+                1 for t in feature.tasks if t.status == "completed"
+            )
+            feature.execution.tasks_failed = sum(
+                1 for t in feature.tasks if t.status == "failed"
+            )
 
-        # Update wave tracking
-        if wave_number is not None:
-            feature.execution.current_wave = wave_number
+            # Update wave tracking
+            if wave_number is not None:
+                feature.execution.current_wave = wave_number
 
-        # Update timestamp
-        feature.execution.last_updated = datetime.now().isoformat()
+            # Update timestamp
+            feature.execution.last_updated = datetime.now().isoformat()
 
-        FeatureLoader.save_feature(feature, self.repo_root)
+            FeatureLoader.save_feature(feature, self.repo_root)
 
     def _update_task_started(
         self,
@@ -5125,16 +5686,24 @@ The detailed specifications are in the task markdown file.
         task_id : str
             Task ID to mark as started
         """
-        task = FeatureLoader.find_task(feature, task_id)
-        if not task:
-            return
+        with self._feature_state_lock:
+            task = FeatureLoader.find_task(feature, task_id)
+            if not task:
+                return
 
-        task.status = "in_progress"
-        task.started_at = datetime.now().isoformat()
-        task.current_turn = 1  # Starting first turn
-        feature.execution.last_updated = datetime.now().isoformat()
+            task.status = "in_progress"
+            task.started_at = datetime.now().isoformat()
+            task.current_turn = 1  # Starting first turn
+            feature.execution.last_updated = datetime.now().isoformat()
 
-        FeatureLoader.save_feature(feature, self.repo_root)
+            FeatureLoader.save_feature(feature, self.repo_root)
+
+    def _record_current_wave(self, feature: Feature, wave_number: int) -> None:
+        """Persist ``current_wave`` (the wave / dag group being executed)."""
+        with self._feature_state_lock:
+            feature.execution.current_wave = wave_number
+            feature.execution.last_updated = datetime.now().isoformat()
+            FeatureLoader.save_feature(feature, self.repo_root)
 
     def _mark_wave_completed(
         self,
@@ -5151,11 +5720,12 @@ The detailed specifications are in the task markdown file.
         wave_number : int
             Wave number that completed (1-indexed)
         """
-        if wave_number not in feature.execution.completed_waves:
-            feature.execution.completed_waves.append(wave_number)
-        feature.execution.last_updated = datetime.now().isoformat()
+        with self._feature_state_lock:
+            if wave_number not in feature.execution.completed_waves:
+                feature.execution.completed_waves.append(wave_number)
+            feature.execution.last_updated = datetime.now().isoformat()
 
-        FeatureLoader.save_feature(feature, self.repo_root)
+            FeatureLoader.save_feature(feature, self.repo_root)
 
     def _unmark_wave_completed(
         self,
@@ -5175,12 +5745,13 @@ The detailed specifications are in the task markdown file.
         wave_number : int
             Wave number to un-record (1-indexed)
         """
-        if wave_number not in feature.execution.completed_waves:
-            return
-        feature.execution.completed_waves.remove(wave_number)
-        feature.execution.last_updated = datetime.now().isoformat()
+        with self._feature_state_lock:
+            if wave_number not in feature.execution.completed_waves:
+                return
+            feature.execution.completed_waves.remove(wave_number)
+            feature.execution.last_updated = datetime.now().isoformat()
 
-        FeatureLoader.save_feature(feature, self.repo_root)
+            FeatureLoader.save_feature(feature, self.repo_root)
 
     def _display_summary(
         self,
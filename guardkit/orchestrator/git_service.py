@@ -0,0 +1,370 @@
+"""Per-worktree git query service — path queries without a fork per path.
+
+The ignore/tracking probes (``preflight_ignore_gate.check_ignore_one``,
+``CoachVerifier._classify_dropped_path``,
+``AutoBuildOrchestrator._git_check_ignore_rec``) each spawned a one-shot
+``git check-ignore`` and ``git ls-files --error-unmatch`` per candidate path:
+a plan with 80 targets forked 160 git processes before turn 1.
+
+A :class:`WorktreeGitService` keeps two coprocesses open per worktree and
+answers whole batches over them:
+
+* ``git check-ignore --stdin -v -z --no-index --non-matching`` — the rule the
+  one-shot ``git check-ignore -v --no-index`` reports (negations included,
+  exactly as before; interpreting them stays with the caller).
+* ``git cat-file --batch-check`` on ``:./<path>`` — stage-0 index membership,
+  what ``ls-files --error-unmatch`` answers for a file.
+
+Answers are cached until the state they depend on moves: the index, ``HEAD``,
+``info/exclude``, and every ``.gitignore`` on the path from the worktree root
+to a queried path. A change to any of them drops the caches AND restarts the
+coprocesses (a live ``check-ignore`` keeps ignore files it has already read).
+
+The service only answers what it can answer exactly. A path outside the
+worktree, a directory or pathspec glob (``ls-files`` matches those by prefix
+or pattern; the index lookup does not), or any coprocess failure or timeout
+leaves the path out of the result — the caller then runs its own one-shot
+probe, with its own error semantics. ``GUARDKIT_GIT_SERVICE=0`` disables the
+service entirely.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+GIT_SERVICE_ENV_VAR = "GUARDKIT_GIT_SERVICE"
+
+# Per-batch deadline; a coprocess that misses it is killed and the caller
+# falls back to one-shot probes.
+_QUERY_TIMEOUT_SECONDS = 30
+
+# Paths per write: keeps each request and its answers well inside a pipe
+# buffer, so neither side can block the other.
+_BATCH_SIZE = 128
+
+# Live services (two coprocesses each); the least recently used is closed.
+_MAX_SERVICES = 16
+
+_GLOB_CHARS = frozenset("*?[")
+
+_StatKey = Optional[Tuple[int, int, int]]
+
+
+def git_service_enabled() -> bool:
+    """False when ``GUARDKIT_GIT_SERVICE`` disables the coprocess service."""
+    flag = os.environ.get(GIT_SERVICE_ENV_VAR, "").strip().lower()
+    return flag not in ("0", "false", "off", "no")
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _Coprocess:
+    """One long-lived ``git`` process fed on stdin, answering on stdout."""
+
+    def __init__(self, argv: Sequence[str], cwd: Path) -> None:
+        self._argv = list(argv)
+        self._cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self._argv,
+                cwd=str(self._cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env={**os.environ, "GIT_FLUSH": "1"},
+            )
+        return self._proc
+
+    def ask(self, payload: bytes, answers: int, sep: bytes) -> Optional[List[bytes]]:
+        """Send ``payload``; read ``answers`` ``sep``-terminated fields back.
+
+        ``None`` on any failure (spawn error, early exit, timeout); the
+        process is killed so the next call starts a fresh one.
+        """
+        try:
+            proc = self._ensure()
+        except OSError as exc:
+            logger.debug("git service: could not start %s: %s", self._argv[:2], exc)
+            return None
+        timer = threading.Timer(_QUERY_TIMEOUT_SECONDS, proc.kill)
+        timer.start()
+        try:
+            assert proc.stdin is not None and proc.stdout is not None
+            proc.stdin.write(payload)
+            proc.stdin.flush()
+            buf = bytearray()
+            while buf.count(sep) < answers:
+                chunk = proc.stdout.read1(65536)
+                if not chunk:
+                    raise EOFError("git exited mid-query")
+                buf += chunk
+        except (OSError, EOFError, ValueError) as exc:
+            logger.debug("git service: %s failed: %s", self._argv[:2], exc)
+            self.close()
+            return None
+        finally:
+            timer.cancel()
+        return bytes(buf).split(sep)[:answers]
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                if stream is not None:
+                    stream.close()
+            except OSError:
+                pass
+
+
+class WorktreeGitService:
+    """Batched, cached ``check-ignore`` / index-membership queries for one worktree.
+
+    Query paths are interpreted exactly as the one-shot probes run with
+    ``cwd=worktree_path`` interpret them. Results are keyed by the path
+    strings the caller passed in; a path missing from a result was not
+    answered (see the module docstring).
+    """
+
+    def __init__(self, worktree_path: Path) -> None:
+        self.worktree_path = Path(worktree_path)
+        self._lock = threading.Lock()
+        self._layout: Optional[Tuple[Path, Path, Path]] = None
+        self._layout_failed = False
+        self._base = self.worktree_path
+        self._ignore = _Coprocess(
+            ["git", "check-ignore", "--stdin", "-v", "-z", "--no-index", "--non-matching"],
+            self.worktree_path,
+        )
+        self._index = _Coprocess(["git", "cat-file", "--batch-check"], self.worktree_path)
+        self._state: Optional[Tuple[_StatKey, bytes, _StatKey]] = None
+        self._ignore_files: Dict[Path, _StatKey] = {}
+        self._rules: Dict[str, Optional[str]] = {}
+        self._tracked: Dict[str, bool] = {}
+
+    # ------------------------------------------------------------------
+    # Public queries
+    # ------------------------------------------------------------------
+
+    def check_ignore(self, paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """``path → <source>:<linenum>:<pattern>`` (or ``None`` when no rule matches)."""
+        wanted = list(dict.fromkeys(paths))
+        with self._lock:
+            rel = self._prepare(wanted)
+            missing = [p for p in wanted if p in rel and p not in self._rules]
+            for start in range(0, len(missing), _BATCH_SIZE):
+                batch = missing[start:start + _BATCH_SIZE]
+                payload = b"".join(os.fsencode(rel[p]) + b"\0" for p in batch)
+                fields = self._ignore.ask(payload, 4 * len(batch), b"\0")
+                if fields is None:
+                    break
+                for i, path in enumerate(batch):
+                    source, line, pattern = (
+                        os.fsdecode(f) for f in fields[4 * i:4 * i + 3]
+                    )
+                    self._rules[path] = f"{source}:{line}:{pattern}" if source else None
+            return {p: self._rules[p] for p in wanted if p in self._rules}
+
+    def tracked(self, paths: Iterable[str]) -> Dict[str, bool]:
+        """``path → True`` when ``path`` is a file in the index (stage 0)."""
+        wanted = list(dict.fromkeys(paths))
+        with self._lock:
+            rel = self._prepare(wanted)
+            missing = [
+                p for p in wanted
+                if p in rel and p not in self._tracked and self._index_answerable(rel[p])
+            ]
+            for start in range(0, len(missing), _BATCH_SIZE):
+                batch = missing[start:start + _BATCH_SIZE]
+                names = [f":./{rel[p]}" for p in batch]
+                payload = "".join(name + "\n" for name in names).encode()
+                lines = self._index.ask(payload, len(batch), b"\n")
+                if lines is None:
+                    break
+                for path, name, raw in zip(batch, names, lines):
+                    answer = raw.decode(errors="replace")
+                    if answer == f"{name} missing":
+                        self._tracked[path] = False
+                    elif answer.endswith(" blob") or " blob " in answer:
+                        self._tracked[path] = True
+                    # Anything else (ambiguous, a submodule commit) stays
+                    # unanswered: the one-shot ls-files probe decides it.
+            return {p: self._tracked[p] for p in wanted if p in self._tracked}
+
+    def close(self) -> None:
+        with self._lock:
+            self._ignore.close()
+            self._index.close()
+
+    # ------------------------------------------------------------------
+    # State tracking
+    # ------------------------------------------------------------------
+
+    def _git_layout(self) -> Optional[Tuple[Path, Path, Path]]:
+        """``(toplevel, git_dir, common_dir)`` — one ``rev-parse`` per service."""
+        if self._layout is None and not self._layout_failed:
+            try:
+                proc = subprocess.Popen(
+                    ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir",
+                     "--git-common-dir"],
+                    cwd=str(self.worktree_path),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+                out, _ = proc.communicate(timeout=_QUERY_TIMEOUT_SECONDS)
+            except (OSError, subprocess.TimeoutExpired):
+                proc = None
+                out = b""
+            lines = os.fsdecode(out).splitlines()
+            if proc is None or proc.returncode != 0 or len(lines) != 3:
+                self._layout_failed = True
+                return None
+            git_dir = Path(lines[1])
+            common = Path(lines[2])
+            if not common.is_absolute():
+                common = self.worktree_path / common
+            self._layout = (Path(lines[0]), git_dir, common)
+            self._base = self.worktree_path.resolve()
+        return self._layout
+
+    def _relative(self, path: str, toplevel: Path) -> Optional[str]:
+        """``path`` relative to the worktree, or ``None`` when unanswerable."""
+        if not path or "\n" in path or "\0" in path:
+            return None
+        absolute = os.path.normpath(os.path.join(self._base, path))
+        try:
+            Path(absolute).relative_to(toplevel)
+        except ValueError:
+            return None
+        rel = os.path.relpath(absolute, self._base)
+        if rel == "." or rel.startswith(".."):
+            return None
+        if path.endswith("/"):
+            rel += "/"
+        return Path(rel).as_posix()
+
+    def _index_answerable(self, rel: str) -> bool:
+        if rel.endswith("/") or _GLOB_CHARS.intersection(rel):
+            return False
+        return not (self._base / rel).is_dir()
+
+    def _prepare(self, paths: List[str]) -> Dict[str, str]:
+        """Resolve answerable paths and drop caches the tree has outgrown."""
+        layout = self._git_layout()
+        if layout is None:
+            return {}
+        toplevel, git_dir, common_dir = layout
+        rel: Dict[str, str] = {}
+        for path in paths:
+            r = self._relative(path, toplevel)
+            if r is not None:
+                rel[path] = r
+
+        try:
+            head = (git_dir / "HEAD").read_bytes()
+        except OSError:
+            head = b""
+        state = (
+            _stat_key(git_dir / "index"),
+            head,
+            _stat_key(common_dir / "info" / "exclude"),
+        )
+        stale = self._state is not None and state != self._state
+
+        ignore_files: Dict[Path, _StatKey] = {}
+        for r in rel.values():
+            directory = (self._base / r).parent
+            while True:
+                candidate = directory / ".gitignore"
+                if candidate not in ignore_files:
+                    ignore_files[candidate] = _stat_key(candidate)
+                if directory == toplevel or toplevel not in directory.parents:
+                    break
+                directory = directory.parent
+        for candidate, key in ignore_files.items():
+            if candidate in self._ignore_files and self._ignore_files[candidate] != key:
+                stale = True
+                break
+
+        if stale:
+            self._rules.clear()
+            self._tracked.clear()
+            self._ignore_files.clear()
+            self._ignore.close()
+            self._index.close()
+        self._state = state
+        self._ignore_files.update(ignore_files)
+        return rel
+
+
+_services: "OrderedDict[Path, WorktreeGitService]" = OrderedDict()
+_services_lock = threading.Lock()
+
+
+def git_service(worktree_path: Path) -> Optional[WorktreeGitService]:
+    """The shared service for ``worktree_path``; ``None`` when disabled."""
+    if not git_service_enabled():
+        return None
+    key = Path(worktree_path).absolute()
+    evicted: Optional[WorktreeGitService] = None
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = WorktreeGitService(key)
+            if len(_services) > _MAX_SERVICES:
+                _, evicted = _services.popitem(last=False)
+        else:
+            _services.move_to_end(key)
+    if evicted is not None:
+        evicted.close()
+    return service
+
+
+def check_ignore_rules(
+    worktree_path: Path, paths: Iterable[str]
+) -> Dict[str, Optional[str]]:
+    """Batched ``git check-ignore -v --no-index`` rules; ``{}`` when disabled."""
+    service = git_service(worktree_path)
+    return service.check_ignore(paths) if service is not None else {}
+
+
+def tracked_paths(worktree_path: Path, paths: Iterable[str]) -> Dict[str, bool]:
+    """Batched index membership (``ls-files --error-unmatch``); ``{}`` when disabled."""
+    service = git_service(worktree_path)
+    return service.tracked(paths) if service is not None else {}
+
+
+def close_git_services() -> None:
+    """Stop every service's coprocesses. Registered with :mod:`atexit`."""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.close()
+
+
+atexit.register(close_git_services)
@@ -13,6 +13,27 @@ Integration:
     Injected into FeatureOrchestrator; consulted after each wave to
     determine the next wave's worker count.
 
+Within a wave, ``LLMRequestGate`` applies the same signals live: every
+``AgentInvoker._invoke_with_role`` call takes a slot from a process-wide,
+per-provider gate (token bucket + AIMD in-flight limit), and the call's
+``LLMCallEvent`` is fed back on release. A 429 halves that provider's
+in-flight limit immediately instead of after the wave; successful calls
+grow it back by ~1 per round of calls, up to the provider ceiling.
+
+A slot covers a whole agent session (one ``_invoke_with_role`` call), not a
+single HTTP request, so an in-flight ceiling also caps how many tasks of a
+wave make progress at once. The defaults therefore set no ceiling: until a
+429 or latency spike halves it (starting from the calls then in flight),
+``--max-parallel`` alone decides wave parallelism. An explicit
+``GUARDKIT_LLM_MAX_INFLIGHT_<PROVIDER>`` is a hard cap, and the orchestrator
+warns at wave start when ``--max-parallel`` exceeds it.
+
+Gate ceilings per provider (``detect_provider`` names) come from
+``DEFAULT_PROVIDER_LIMITS`` and can be overridden with
+``GUARDKIT_LLM_MAX_INFLIGHT_<PROVIDER>`` and ``GUARDKIT_LLM_RATE_<PROVIDER>``
+(calls/second, ``0`` = no rate limit), e.g. ``GUARDKIT_LLM_RATE_LOCAL_VLLM``.
+``GUARDKIT_LLM_GATE=0`` disables the gate.
+
 Example:
     >>> from guardkit.orchestrator.instrumentation.concurrency import (
     ...     ConcurrencyController,
@@ -24,12 +45,21 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Literal, Optional
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Deque, Dict, List, Literal, Optional
 
-from guardkit.orchestrator.instrumentation.schemas import WaveCompletedEvent
+from guardkit.orchestrator.instrumentation.schemas import (
+    LLMCallEvent,
+    WaveCompletedEvent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -221,3 +251,418 @@ class ConcurrencyController:
             decision.new_workers,
             decision.reason,
         )
+
+
+# ---------------------------------------------------------------------------
+# Live LLM request gate (intra-wave AIMD + token bucket)
+# ---------------------------------------------------------------------------
+
+LLM_GATE_ENV_VAR = "GUARDKIT_LLM_GATE"
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Ceilings for one LLM provider.
+
+    Attributes:
+        max_in_flight: Upper bound for concurrent calls (the AIMD ceiling),
+            or ``None`` for none: only AIMD decreases then limit concurrency.
+        rate_per_sec: Sustained call starts per second, or ``None`` for no
+            rate limit.
+        burst: Token bucket capacity (calls that may start back-to-back).
+    """
+
+    max_in_flight: Optional[int] = None
+    rate_per_sec: Optional[float] = None
+    burst: int = 1
+
+
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimits] = {
+    # max_in_flight counts agent sessions, so any default ceiling would also
+    # cap wave parallelism below --max-parallel: leave it to AIMD.
+    # Hosted APIs: rate limits are per-organisation, so pace call starts.
+    "anthropic": ProviderLimits(rate_per_sec=1.0, burst=4),
+    "openai": ProviderLimits(rate_per_sec=1.0, burst=4),
+    # Local vLLM: no request quota; throughput collapses once the KV cache is
+    # oversubscribed, which shows up as the p95 latency decrease. Set
+    # GUARDKIT_LLM_MAX_INFLIGHT_LOCAL_VLLM to cap it outright.
+    "local-vllm": ProviderLimits(rate_per_sec=None, burst=4),
+}
+
+
+def llm_gate_enabled() -> bool:
+    """Return False when ``GUARDKIT_LLM_GATE`` switches the gate off."""
+    raw = os.environ.get(LLM_GATE_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def provider_limits_from_env(provider: str) -> ProviderLimits:
+    """Resolve a provider's limits: defaults overlaid with env overrides.
+
+    Args:
+        provider: Provider name as returned by ``detect_provider``.
+
+    Returns:
+        The effective ``ProviderLimits``. Malformed overrides are ignored
+        with a warning.
+    """
+    base = DEFAULT_PROVIDER_LIMITS.get(provider, DEFAULT_PROVIDER_LIMITS["anthropic"])
+    suffix = provider.upper().replace("-", "_")
+    max_in_flight, rate = base.max_in_flight, base.rate_per_sec
+
+    raw = os.environ.get(f"GUARDKIT_LLM_MAX_INFLIGHT_{suffix}")
+    if raw:
+        try:
+            max_in_flight = max(1, int(raw))
+        except ValueError:
+            logger.warning("Ignoring GUARDKIT_LLM_MAX_INFLIGHT_%s=%r", suffix, raw)
+    raw = os.environ.get(f"GUARDKIT_LLM_RATE_{suffix}")
+    if raw:
+        try:
+            value = float(raw)
+            rate = value if value > 0 else None
+        except ValueError:
+            logger.warning("Ignoring GUARDKIT_LLM_RATE_%s=%r", suffix, raw)
+
+    burst = base.burst if max_in_flight is None else min(base.burst, max_in_flight)
+    return ProviderLimits(
+        max_in_flight=max_in_flight,
+        rate_per_sec=rate,
+        burst=max(1, burst),
+    )
+
+
+def llm_gate_ceiling(provider: str) -> Optional[int]:
+    """The hard in-flight ceiling the shared gate applies to ``provider``.
+
+    Returns:
+        The configured ``max_in_flight``, or ``None`` when the gate is
+        disabled or sets no ceiling for this provider.
+    """
+    if not llm_gate_enabled():
+        return None
+    return provider_limits_from_env(provider).max_in_flight
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from any event loop.
+
+    Args:
+        rate_per_sec: Refill rate in tokens per second.
+        burst: Bucket capacity; the bucket starts full.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            ``0.0`` when a token was taken, otherwise the seconds until the
+            next token is due.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated) * self.rate_per_sec,
+            )
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate_per_sec
+
+    async def acquire(self) -> None:
+        """Wait (without blocking the loop) until a token is taken."""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def drain(self) -> None:
+        """Empty the bucket so the next start waits a full refill interval."""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = self._clock()
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+
+
+@dataclass
+class LLMSlot:
+    """An acquired in-flight slot; release exactly once.
+
+    Attributes:
+        provider: Provider the slot was taken for.
+        epoch: The limiter's decrease epoch at grant time. Rate limits from
+            calls started before the latest decrease do not decrease again.
+    """
+
+    provider: str
+    epoch: int
+    _limiter: Optional["ProviderLimiter"] = field(default=None, repr=False)
+    _released: bool = field(default=False, repr=False)
+
+    def release(self, event: Optional[LLMCallEvent] = None) -> None:
+        """Free the slot, feeding the call's outcome to the controller.
+
+        Args:
+            event: The call's ``LLMCallEvent``, when one was built.
+        """
+        if self._released or self._limiter is None:
+            return
+        self._released = True
+        self._limiter.release(self, event)
+
+
+class ProviderLimiter:
+    """AIMD in-flight limit plus token bucket for one provider.
+
+    Thread-safe and loop-agnostic: tasks running on different event loops
+    (one per worker thread) share one limiter; waiters are woken with
+    ``call_soon_threadsafe`` on their own loop.
+
+    Args:
+        provider: Provider name.
+        limits: Ceilings for this provider.
+        p95_threshold_pct: Percentage above the baseline p95 latency that
+            triggers a decrease (same meaning as ``ConcurrencyController``).
+        latency_window: Successful calls per p95 sample; the first full
+            window sets the baseline.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        limits: ProviderLimits,
+        p95_threshold_pct: float = 100.0,
+        latency_window: int = 20,
+    ) -> None:
+        self.provider = provider
+        self.limits = limits
+        self._p95_threshold_pct = p95_threshold_pct
+        self._latency_window = latency_window
+        self._bucket = (
+            TokenBucket(limits.rate_per_sec, limits.burst)
+            if limits.rate_per_sec
+            else None
+        )
+        self._lock = threading.Lock()
+        self._ceiling = float(limits.max_in_flight or math.inf)
+        self._limit = self._ceiling
+        self._in_flight = 0
+        self._epoch = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._latencies: List[float] = []
+        self._baseline_p95: Optional[float] = None
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Current in-flight limit (AIMD state, floored at 1); None if unbounded."""
+        with self._lock:
+            return None if math.isinf(self._limit) else self._allowed_locked()
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        with self._lock:
+            return self._in_flight
+
+    async def acquire(self) -> LLMSlot:
+        """Wait for a token and an in-flight slot.
+
+        Returns:
+            The granted ``LLMSlot``.
+        """
+        if self._bucket is not None:
+            await self._bucket.acquire()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._in_flight < self._allowed_locked():
+                self._in_flight += 1
+                return LLMSlot(self.provider, self._epoch, self)
+            waiter = _Waiter(loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= 1
+                    self._wake_locked()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+        with self._lock:
+            return LLMSlot(self.provider, self._epoch, self)
+
+    def release(self, slot: LLMSlot, event: Optional[LLMCallEvent]) -> None:
+        """Return ``slot`` and apply AIMD to the call's outcome."""
+        with self._lock:
+            self._in_flight -= 1
+            if event is not None:
+                self._observe_locked(event, slot.epoch)
+            self._wake_locked()
+
+    def observe(self, event: LLMCallEvent) -> None:
+        """Apply AIMD to an outcome not tied to a slot."""
+        with self._lock:
+            self._observe_locked(event, self._epoch)
+            self._wake_locked()
+
+    # -- AIMD ---------------------------------------------------------------
+
+    def _observe_locked(self, event: LLMCallEvent, epoch: int) -> None:
+        if event.status == "error" and event.error_type == "rate_limited":
+            if epoch == self._epoch:
+                self._decrease_locked(f"rate limited ({event.model})")
+                if self._bucket is not None:
+                    self._bucket.drain()
+            return
+        if event.status != "ok":
+            return
+
+        self._latencies.append(event.latency_ms)
+        if len(self._latencies) >= self._latency_window:
+            p95 = _p95(self._latencies)
+            self._latencies = []
+            if self._baseline_p95 is None:
+                self._baseline_p95 = p95
+            else:
+                threshold = self._baseline_p95 * (1.0 + self._p95_threshold_pct / 100.0)
+                if p95 > threshold:
+                    self._decrease_locked(
+                        f"p95 latency {p95:.0f}ms exceeds threshold "
+                        f"{threshold:.0f}ms (baseline {self._baseline_p95:.0f}ms)"
+                    )
+                    return
+        # Additive increase: ~+1 per limit-worth of successful calls.
+        self._limit = min(self._ceiling, self._limit + 1.0 / max(1.0, self._limit))
+
+    def _allowed_locked(self) -> float:
+        return self._limit if math.isinf(self._limit) else max(1, int(self._limit))
+
+    def _decrease_locked(self, reason: str) -> None:
+        # Unbounded: halve the concurrency that was actually reached (the
+        # calls in flight plus the one reporting, already released).
+        old = self._in_flight + 1 if math.isinf(self._limit) else max(1, int(self._limit))
+        self._limit = max(1.0, math.floor(old / 2.0))
+        self._epoch += 1
+        self._latencies = []
+        logger.info(
+            "LLM gate %s: reducing in-flight limit from %d to %d -- %s",
+            self.provider,
+            old,
+            int(self._limit),
+            reason,
+        )
+
+    def _wake_locked(self) -> None:
+        while self._waiters and self._in_flight < self._allowed_locked():
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._in_flight += 1
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # Waiter's loop is closed; nobody will use the slot.
+                self._in_flight -= 1
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _p95(samples: List[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class LLMRequestGate:
+    """Process-wide gate for LLM calls, one ``ProviderLimiter`` per provider.
+
+    Args:
+        limits: Per-provider ceilings; providers not listed resolve via
+            ``provider_limits_from_env``.
+        p95_threshold_pct: Forwarded to each ``ProviderLimiter``.
+        latency_window: Forwarded to each ``ProviderLimiter``.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, ProviderLimits]] = None,
+        p95_threshold_pct: float = 100.0,
+        latency_window: int = 20,
+    ) -> None:
+        self._limits = dict(limits or {})
+        self._p95_threshold_pct = p95_threshold_pct
+        self._latency_window = latency_window
+        self._limiters: Dict[str, ProviderLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        """Return (creating on first use) the limiter for ``provider``."""
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limits = self._limits.get(provider) or provider_limits_from_env(provider)
+                limiter = ProviderLimiter(
+                    provider,
+                    limits,
+                    p95_threshold_pct=self._p95_threshold_pct,
+                    latency_window=self._latency_window,
+                )
+                self._limiters[provider] = limiter
+            return limiter
+
+    async def acquire(self, provider: str) -> LLMSlot:
+        """Wait for a slot for ``provider``; caller must ``release()`` it."""
+        return await self.limiter(provider).acquire()
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[LLMSlot]:
+        """Hold a slot for the duration of the block."""
+        held = await self.acquire(provider)
+        try:
+            yield held
+        finally:
+            held.release()
+
+    def on_llm_call(self, event: LLMCallEvent) -> None:
+        """Feed an ``LLMCallEvent`` observed outside a slot."""
+        self.limiter(event.provider).observe(event)
+
+
+_shared_gate: Optional[LLMRequestGate] = None
+_shared_gate_lock = threading.Lock()
+
+
+def get_llm_request_gate() -> Optional[LLMRequestGate]:
+    """Return the process-wide gate, or ``None`` when disabled by env."""
+    global _shared_gate
+    if not llm_gate_enabled():
+        return None
+    with _shared_gate_lock:
+        if _shared_gate is None:
+            _shared_gate = LLMRequestGate()
+        return _shared_gate
@@ -6,7 +6,10 @@ that replace the full always-on rules bundle with minimal, targeted system promp
 Architecture:
     DigestValidator  - Validates token count and file existence at startup
     DigestLoader     - Loads role-specific digest content for prompt injection
-    count_tokens     - Token counting with tiktoken or word-based fallback
+    TokenCounter     - Token counting service: cached encoder, batch counting,
+                       content-hash LRU for repeated prompt fragments
+    count_tokens     - Count one string via the process-wide TokenCounter
+    count_tokens_many - Count many strings in one batched encode
 
 Digest files live in `.guardkit/digests/` with one markdown file per role:
     player.md, coach.md, resolver.md, router.md
@@ -21,11 +24,14 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -57,16 +63,170 @@ class DigestLoadError(Exception):
 # ============================================================================
 
 
-def count_tokens(text: str) -> int:
-    """Count tokens in text using tiktoken or word-based fallback.
+TOKEN_ENCODING: str = "cl100k_base"
+"""tiktoken encoding used for counting (GPT-4 / Claude-compatible estimate)."""
+
+_TOKEN_CACHE_MAX_ENTRIES = 4096
+
+
+def _estimate_tokens(text: str, chars_per_token: float) -> int:
+    """Character-based token estimate used when tiktoken is unavailable.
+
+    Whitespace-only text counts as 0; anything else as at least 1 token.
+    """
+    if not text.strip():
+        return 0
+    return max(1, math.ceil(len(text) / chars_per_token))
+
+
+class TokenCounter:
+    """Token counting service shared by digest validation and budget code.
+
+    The tiktoken encoder is loaded once (tiktoken builds its BPE tables on
+    every ``get_encoding`` miss, which dominated per-call cost) and strings
+    are counted through an LRU keyed by a content hash, so the same prompt
+    section counted several times per turn is encoded once. Misses from
+    :meth:`count_many` go through a single ``encode_ordinary_batch`` call.
+
+    When tiktoken is not installed (or its encoding cannot be loaded) counts
+    fall back to a characters-per-token estimate; fallback counts are cheap
+    and are not cached.
+
+    Args:
+        max_entries: LRU capacity (distinct strings).
+
+    Example:
+        >>> counter = TokenCounter()
+        >>> counter.count_many(["hello world", ""])[1]
+        0
+    """
+
+    def __init__(self, max_entries: int = _TOKEN_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._encoder: Any = None
+        self._encoder_loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _get_encoder(self) -> Any:
+        """Return the cached tiktoken encoder, or None when unavailable."""
+        if not self._encoder_loaded:
+            with self._lock:
+                if not self._encoder_loaded:
+                    try:
+                        import tiktoken
+
+                        self._encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+                    except ImportError:
+                        self._encoder = None
+                    except Exception as exc:  # e.g. BPE download failed offline
+                        logger.warning(
+                            "tiktoken encoding %s unavailable (%s); "
+                            "using character-based token estimates",
+                            TOKEN_ENCODING,
+                            exc,
+                        )
+                        self._encoder = None
+                    self._encoder_loaded = True
+        return self._encoder
+
+    @property
+    def exact(self) -> bool:
+        """True when counts come from the tokenizer rather than an estimate."""
+        return self._get_encoder() is not None
+
+    def count(self, text: str, fallback_chars_per_token: float = 4.0) -> int:
+        """Count tokens in ``text``.
+
+        Args:
+            text: The text to count tokens for.
+            fallback_chars_per_token: Characters per token for the estimate
+                used when tiktoken is unavailable.
 
-    Attempts to use tiktoken with the cl100k_base encoding (used by GPT-4
-    and Claude models). Falls back to a word-based approximation if tiktoken
-    is not available.
+        Returns:
+            Token count (>= 0).
+        """
+        return self.count_many([text], fallback_chars_per_token)[0]
+
+    def count_many(
+        self,
+        texts: Sequence[str],
+        fallback_chars_per_token: float = 4.0,
+    ) -> List[int]:
+        """Count tokens for each string in ``texts``.
+
+        Cached strings are answered from the LRU; the rest are encoded in one
+        batch call and cached.
+
+        Args:
+            texts: Strings to count.
+            fallback_chars_per_token: Characters per token for the estimate
+                used when tiktoken is unavailable.
 
-    The word-based fallback uses the standard approximation of ~0.75 tokens
-    per word (based on the observation that average English words are ~4-5
-    characters and most tokenizers produce ~1 token per 4 characters).
+        Returns:
+            Token counts, aligned with ``texts``.
+        """
+        encoder = self._get_encoder()
+        if encoder is None:
+            return [_estimate_tokens(t, fallback_chars_per_token) for t in texts]
+
+        counts: List[Optional[int]] = [0 if not t else None for t in texts]
+        pending: "OrderedDict[bytes, List[int]]" = OrderedDict()
+        with self._lock:
+            for i, text in enumerate(texts):
+                if not text:
+                    continue
+                key = hashlib.blake2b(
+                    text.encode("utf-8", "surrogatepass"), digest_size=16
+                ).digest()
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    counts[i] = cached
+                    self.hits += 1
+                else:
+                    pending.setdefault(key, []).append(i)
+                    self.misses += 1
+        if pending:
+            batch = [texts[positions[0]] for positions in pending.values()]
+            encoded = encoder.encode_ordinary_batch(batch)
+            with self._lock:
+                for (key, positions), tokens in zip(pending.items(), encoded):
+                    for i in positions:
+                        counts[i] = len(tokens)
+                    self._cache[key] = len(tokens)
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
+        return [c or 0 for c in counts]
+
+    def clear(self) -> None:
+        """Drop cached counts and the loaded encoder (tests, reconfiguration)."""
+        with self._lock:
+            self._cache.clear()
+            self._encoder = None
+            self._encoder_loaded = False
+            self.hits = 0
+            self.misses = 0
+
+
+_token_counter = TokenCounter()
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the process-wide :class:`TokenCounter`."""
+    return _token_counter
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text using tiktoken or a character-based fallback.
+
+    Uses tiktoken with the cl100k_base encoding (used by GPT-4 and Claude
+    models) through the process-wide :class:`TokenCounter`, so the encoder is
+    loaded once and repeated strings are answered from its cache. Falls back
+    to ~1 token per 4 characters if tiktoken is not available.
 
     Args:
         text: The text to count tokens for.
@@ -74,26 +234,24 @@ def count_tokens(text: str) -> int:
     Returns:
         Estimated token count as an integer (>= 0).
     """
-    if not text:
-        return 0
+    return _token_counter.count(text)
+
+
+def count_tokens_many(
+    texts: Sequence[str],
+    fallback_chars_per_token: float = 4.0,
+) -> List[int]:
+    """Count tokens for many strings with one batched encode.
 
-    try:
-        import tiktoken
-
-        enc = tiktoken.get_encoding("cl100k_base")
-        return len(enc.encode(text))
-    except ImportError:
-        # Word-based fallback: split on whitespace, apply 0.75 multiplier
-        # This approximation is based on the observation that tokenizers
-        # typically produce ~1 token per 4 characters, and average English
-        # words are ~5.1 characters including the space separator.
-        words = text.split()
-        if not words:
-            return 0
-        # Use character-based estimate for more accuracy:
-        # ~1 token per 4 characters
-        char_count = len(text)
-        return max(1, math.ceil(char_count / 4.0))
+    Args:
+        texts: Strings to count.
+        fallback_chars_per_token: Characters per token for the estimate used
+            when tiktoken is unavailable.
+
+    Returns:
+        Token counts, aligned with ``texts``.
+    """
+    return _token_counter.count_many(texts, fallback_chars_per_token)
 
 
 # ============================================================================
@@ -263,7 +421,11 @@ class DigestLoader:
 # ============================================================================
 
 __all__ = [
+    "TOKEN_ENCODING",
+    "TokenCounter",
     "count_tokens",
+    "count_tokens_many",
+    "get_token_counter",
     "DigestLoadError",
     "DigestLoader",
     "DigestValidationResult",
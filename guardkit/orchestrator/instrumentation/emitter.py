@@ -14,8 +14,14 @@ Architecture:
 Design Decisions:
     - All emit() calls are async and non-blocking to avoid blocking the
       LLM call critical path.
-    - JSONLFileBackend uses a threading.Lock for thread-safe writes from
-      concurrent coroutines and worker threads.
+    - JSONLFileBackend buffers serialized events in a bounded in-memory
+      queue and group-commits them from a background writer thread (one
+      open/append per batch instead of per event). When the buffer is full
+      the emitting caller writes the backlog itself (backpressure) rather
+      than dropping events. flush()/close() drain the buffer to disk.
+    - Serialization uses orjson when it is importable (optional ``telemetry``
+      extra) and falls back to the stdlib json module with the same compact
+      separators.
     - NATSBackend degrades gracefully: connection failures are logged as
       warnings, never raised to callers.
     - CompositeBackend tolerates individual backend failures: if one backend
@@ -37,16 +43,49 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import atexit
 import json
 import logging
+import os
 import threading
+import weakref
+from collections import deque
 from pathlib import Path
-from typing import Any, List, Optional, Protocol, runtime_checkable
+from typing import Any, Deque, List, Optional, Protocol, runtime_checkable
+
+try:  # pragma: no cover - exercised when the telemetry extra is installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from guardkit.orchestrator.instrumentation.schemas import BaseEvent
 
 logger = logging.getLogger(__name__)
 
+# Opt-out for the buffered JSONL writer. ``0``/``false``/``no``/``off``
+# restores write-through (every emit appends synchronously).
+JSONL_BUFFER_ENV_VAR = "GUARDKIT_EVENTS_JSONL_BUFFER"
+
+
+def _jsonl_buffer_enabled() -> bool:
+    """Return False when the buffered JSONL writer is switched off."""
+    raw = os.environ.get(JSONL_BUFFER_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize ``payload`` to compact UTF-8 JSON bytes.
+
+    Uses orjson when available; falls back to the stdlib encoder (same
+    ``(",", ":")`` separators) when orjson is absent or rejects the payload.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
 # ============================================================================
 # EventEmitter Protocol
@@ -147,12 +186,42 @@ class JSONLFileBackend:
     Writes each event as a valid JSON object on its own line to
     ``{events_dir}/events.jsonl``. Creates parent directories if needed.
 
-    Thread-safety is ensured via a threading.Lock so concurrent coroutines
-    and worker threads can safely emit events without corrupting the file.
+    The first event is written through, so the events file exists (and an
+    unwritable directory surfaces to the caller) as soon as a run starts
+    emitting. After that ``emit()`` only serializes the event and appends it
+    to a bounded in-memory buffer. A background writer thread group-commits the buffer
+    with a single open/append once ``batch_size`` events are pending or
+    ``flush_interval`` seconds have passed since the first pending event.
+    The writer exits when the buffer is empty and is restarted lazily on the
+    next emit, so idle backends hold no thread.
+
+    When ``max_buffered`` events are already pending, the emitting caller
+    writes the backlog itself. Events are never dropped for lack of buffer
+    space; each such stall is counted in ``backpressure_count`` and the
+    first one per backend is logged as a warning.
+
+    Line order on disk matches emit order: every write drains the buffer
+    from the head while holding the file lock.
+
+    Durability: ``flush()`` returns once every event emitted before the
+    call is written and ``fsync``-ed; ``close()`` does the same and stops
+    the writer. Buffered events of backends never flushed are written at
+    interpreter exit.
+
+    Setting ``GUARDKIT_EVENTS_JSONL_BUFFER=0`` restores write-through
+    behaviour (each emit appends synchronously).
 
     Args:
         events_dir: Directory where ``events.jsonl`` will be written.
             Parent directories are created automatically on first write.
+        batch_size: Pending events that trigger an immediate group commit.
+        flush_interval: Maximum seconds an event waits in the buffer before
+            the writer commits it.
+        max_buffered: Buffer bound; reaching it makes the caller write.
+
+    Attributes:
+        backpressure_count: Number of emits that found the buffer full.
+        write_errors: Number of events lost to failed background writes.
 
     Example:
         >>> backend = JSONLFileBackend(events_dir=Path(".guardkit/autobuild/TASK-001"))
@@ -160,12 +229,29 @@ class JSONLFileBackend:
         >>> # await backend.flush()
     """
 
-    def __init__(self, events_dir: Path) -> None:
+    def __init__(
+        self,
+        events_dir: Path,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+        max_buffered: int = 8192,
+    ) -> None:
         self._events_dir = events_dir
         self._events_file = events_dir / "events.jsonl"
-        self._lock = threading.Lock()
-        self._buffer: List[str] = []
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0.0, flush_interval)
+        self._max_buffered = max(self._batch_size, max_buffered)
+        # _cond guards the buffer and writer state; _file_lock serializes
+        # drain+write so batches reach the file in emit order.
+        self._cond = threading.Condition()
+        self._file_lock = threading.Lock()
+        self._buffer: Deque[bytes] = deque()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
         self._dir_created = False
+        self.backpressure_count = 0
+        self.write_errors = 0
+        _live_jsonl_backends.add(self)
 
     def _ensure_dir(self) -> None:
         """Create parent directories if they don't exist yet."""
@@ -176,34 +262,135 @@ class JSONLFileBackend:
     async def emit(self, event: BaseEvent) -> None:
         """Serialize and buffer an event for writing.
 
-        The event is serialized to a JSON string and added to an internal
-        buffer. The buffer is flushed to disk on each emit to ensure
-        durability, while the lock ensures thread-safe writes.
+        Returns without touching the file unless this is the first event,
+        the buffer is full (the caller then commits the backlog), the
+        backend is closed, or buffering is switched off.
 
         Args:
             event: A BaseEvent subclass to persist.
         """
-        line = json.dumps(event.model_dump(), separators=(",", ":"))
-        with self._lock:
-            self._ensure_dir()
-            with self._events_file.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+        line = _dumps(event.model_dump()) + b"\n"
+        write_now = False
+        with self._cond:
+            self._buffer.append(line)
+            if (
+                self._closed
+                or not self._dir_created
+                or not _jsonl_buffer_enabled()
+            ):
+                write_now = True
+            elif len(self._buffer) > self._max_buffered:
+                self.backpressure_count += 1
+                write_now = True
+                if self.backpressure_count == 1:
+                    logger.warning(
+                        "Event buffer for %s is full (%d pending); emitting "
+                        "callers are writing synchronously until it drains.",
+                        self._events_file,
+                        len(self._buffer),
+                    )
+            elif len(self._buffer) >= self._batch_size:
+                self._cond.notify()
+            if not write_now and self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name=f"jsonl-events-{self._events_dir.name}",
+                    daemon=True,
+                )
+                self._writer.start()
+        if write_now:
+            self._commit()
+
+    def _writer_loop(self) -> None:
+        """Group-commit the buffer until it stays empty for one interval."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._buffer) >= self._batch_size,
+                    timeout=self._flush_interval,
+                )
+                if not self._buffer:
+                    self._writer = None
+                    return
+            try:
+                self._commit()
+            except OSError as exc:
+                logger.warning(
+                    "Failed to write instrumentation events to %s: %s",
+                    self._events_file,
+                    exc,
+                )
+
+    def _commit(self, sync: bool = False) -> None:
+        """Drain the buffer and append it to the events file in one write.
+
+        Args:
+            sync: ``fsync`` the file after writing.
+
+        Raises:
+            OSError: If the directory or file cannot be written. The drained
+                events are counted in ``write_errors``.
+        """
+        with self._file_lock:
+            with self._cond:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            if not batch and not sync:
+                return
+            try:
+                self._ensure_dir()
+                with self._events_file.open("ab") as f:
+                    if batch:
+                        f.write(b"".join(batch))
+                    if sync:
+                        f.flush()
+                        os.fsync(f.fileno())
+            except OSError:
+                self.write_errors += len(batch)
+                raise
+
+    def _flush_sync(self) -> None:
+        """Write and fsync everything emitted so far (blocking)."""
+        with self._cond:
+            pending = bool(self._buffer)
+        if pending or self._dir_created:
+            self._commit(sync=True)
 
     async def flush(self) -> None:
         """Ensure all buffered events are written to disk.
 
-        Since emit() writes directly under a lock, flush() is a
-        synchronization point that ensures any in-flight write has
-        completed.
+        Every event emitted before this call is appended and ``fsync``-ed
+        by the time it returns.
         """
-        with self._lock:
-            # All writes happen in emit() under the lock,
-            # so acquiring the lock here ensures completion.
-            pass
+        self._flush_sync()
 
     async def close(self) -> None:
-        """Flush remaining events and release resources."""
-        await self.flush()
+        """Flush remaining events and stop the background writer.
+
+        Events emitted after close() are written synchronously.
+        """
+        with self._cond:
+            self._closed = True
+            writer = self._writer
+            self._cond.notify_all()
+        if writer is not None:
+            writer.join()
+        self._flush_sync()
+        _live_jsonl_backends.discard(self)
+
+
+# Backends with possibly-unwritten events, drained at interpreter exit so a
+# run that never reaches flush()/close() still persists its telemetry.
+_live_jsonl_backends: "weakref.WeakSet[JSONLFileBackend]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_jsonl_backends_at_exit() -> None:
+    for backend in list(_live_jsonl_backends):
+        try:
+            backend._flush_sync()
+        except Exception:  # pragma: no cover - best effort at shutdown
+            pass
 
 
 # ============================================================================
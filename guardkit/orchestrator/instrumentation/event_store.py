@@ -0,0 +1,629 @@
+"""Columnar event store and streaming aggregation for AutoBuild telemetry.
+
+Every AutoBuild run appends its instrumentation events to a per-feature (or
+per-task) ``events.jsonl`` (see :mod:`.emitter`). That format is ideal for
+crash-safe appends and poor for analysis: answering "what did the last three
+months cost" means parsing every line of every run as JSON.
+
+This module adds two pieces:
+
+- **Compaction** — :func:`compact_events` converts a finished run's
+  ``events.jsonl`` into ``events.parquet`` next to it: one row per event, a
+  ``kind`` column naming the event model, the union of all event fields as
+  nullable columns, zstd-compressed, written one row group at a time so a
+  large log never has to fit in memory. The source size is recorded in the
+  file metadata; a log that grew after compaction makes the Parquet file
+  stale and readers fall back to the JSONL.
+- **Query** — :func:`aggregate_events` streams records from any mix of
+  Parquet and JSONL sources (Parquet reads only the projected columns, batch
+  by batch) and folds them into per-group token totals, latency p50/p95
+  (log-bucket histogram, ~1% relative error, bounded memory), cost, error
+  classes and per-role prefix cache efficiency. ``guardkit telemetry``
+  wraps both.
+
+pyarrow is an optional dependency (``telemetry`` extra). Without it JSONL
+sources are still queryable; only compaction and Parquet reads need it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import types
+import typing
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from guardkit.orchestrator.instrumentation.schemas import (
+    BaseEvent,
+    GraphitiQueryEvent,
+    LLMCallEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+    ToolExecEvent,
+    WaveCompletedEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+EVENTS_JSONL = "events.jsonl"
+EVENTS_PARQUET = "events.parquet"
+
+#: Parquet key-value metadata holding the byte size of the compacted JSONL.
+_SOURCE_BYTES_KEY = b"guardkit.source_bytes"
+
+#: Event kind (``kind`` column) → model. Ordered most-specific first so a
+#: record is classified by the first model whose own required fields it has.
+EVENT_KINDS: Dict[str, type] = {
+    "llm_call": LLMCallEvent,
+    "wave_completed": WaveCompletedEvent,
+    "tool_exec": ToolExecEvent,
+    "graphiti_query": GraphitiQueryEvent,
+    "task_completed": TaskCompletedEvent,
+    "task_failed": TaskFailedEvent,
+    "task_started": TaskStartedEvent,
+}
+
+#: Dimensions ``aggregate_events`` can group LLM calls by.
+GROUP_BY_FIELDS = (
+    "model", "provider", "feature_id", "task_id", "agent_role", "prompt_profile",
+)
+
+#: Columns the query path needs; Parquet reads project onto these.
+_QUERY_COLUMNS = (
+    "kind", "run_id", "timestamp", *GROUP_BY_FIELDS,
+    "input_tokens", "output_tokens", "latency_ms", "status", "error_type",
+    "tool_name", "exit_code", "failure_category",
+    "prefix_cache_hit", "prefix_reusable_tokens",
+)
+
+
+def _own_required_fields(model: type) -> frozenset:
+    return frozenset(
+        name
+        for name, info in model.model_fields.items()
+        if name not in BaseEvent.model_fields and info.is_required()
+    )
+
+
+_KIND_SIGNATURES: Tuple[Tuple[str, frozenset], ...] = tuple(
+    (kind, _own_required_fields(model)) for kind, model in EVENT_KINDS.items()
+)
+
+
+def event_kind(record: Dict[str, Any]) -> str:
+    """Classify a serialized event by the fields it carries.
+
+    Events are written without a type tag, so the kind is recovered from the
+    model-specific required fields (``provider`` → ``llm_call``,
+    ``wave_id`` → ``wave_completed``, ...). A record with only base fields is
+    a ``task_started``.
+
+    Args:
+        record: One decoded ``events.jsonl`` line.
+
+    Returns:
+        A key of :data:`EVENT_KINDS`.
+    """
+    if "kind" in record and record["kind"] in EVENT_KINDS:
+        return record["kind"]
+    keys = record.keys()
+    for kind, required in _KIND_SIGNATURES:
+        if required and required <= keys:
+            return kind
+    return "task_started"
+
+
+# ============================================================================
+# Compaction
+# ============================================================================
+
+
+def _require_pyarrow() -> Any:
+    """Import pyarrow, raising an ImportError that names the extra."""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for columnar telemetry "
+            "(install the 'telemetry' extra)",
+            name="pyarrow",
+        ) from exc
+    return pyarrow
+
+
+def _arrow_type(annotation: Any, pa: Any) -> Any:
+    """Map a pydantic field annotation onto an Arrow type."""
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    union = typing.get_origin(annotation) in (typing.Union, types.UnionType)
+    if union and len(args) == 1:
+        return _arrow_type(args[0], pa)
+    if typing.get_origin(annotation) is typing.Literal:
+        return pa.string()
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    return pa.string()
+
+
+def event_schema() -> Any:
+    """Arrow schema of the compacted store: ``kind`` + union of event fields."""
+    pa = _require_pyarrow()
+    fields = [pa.field("kind", pa.string(), nullable=False)]
+    seen = {"kind"}
+    for model in (BaseEvent, *EVENT_KINDS.values()):
+        for name, info in model.model_fields.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            fields.append(pa.field(name, _arrow_type(info.annotation, pa)))
+    return pa.schema(fields)
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield decoded records from ``path``, skipping undecodable lines.
+
+    A crashed run can leave a torn last line; it is logged and skipped rather
+    than failing the whole read.
+    """
+    with path.open("rb") as f:
+        for lineno, raw in enumerate(f, start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                logger.warning("Skipping malformed event at %s:%d", path, lineno)
+                continue
+            if isinstance(record, dict):
+                record["kind"] = event_kind(record)
+                yield record
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """Outcome of compacting one events directory.
+
+    Attributes:
+        source: The ``events.jsonl`` that was read.
+        output: The ``events.parquet`` that was written.
+        rows: Number of events written.
+        source_bytes: Size of the JSONL at compaction time.
+        output_bytes: Size of the Parquet file.
+    """
+
+    source: Path
+    output: Path
+    rows: int
+    source_bytes: int
+    output_bytes: int
+
+
+def compact_events(
+    events_dir: Path,
+    row_group_size: int = 50_000,
+    compression: str = "zstd",
+) -> CompactionResult:
+    """Compact ``events_dir/events.jsonl`` into ``events_dir/events.parquet``.
+
+    Rows are buffered one row group at a time, so memory is bounded by
+    ``row_group_size`` regardless of log size. The file is written to a
+    temporary name and renamed into place. The JSONL is left untouched (it
+    stays the append target and the archive format).
+
+    Args:
+        events_dir: Directory holding ``events.jsonl``.
+        row_group_size: Events per Parquet row group.
+        compression: Parquet codec.
+
+    Returns:
+        CompactionResult describing the written file.
+
+    Raises:
+        FileNotFoundError: If ``events.jsonl`` does not exist.
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    source = events_dir / EVENTS_JSONL
+    output = events_dir / EVENTS_PARQUET
+    source_bytes = source.stat().st_size
+    schema = event_schema().with_metadata(
+        {_SOURCE_BYTES_KEY: str(source_bytes).encode()}
+    )
+    names = schema.names
+    tmp = output.with_name(f".{EVENTS_PARQUET}.tmp")
+    rows = 0
+    pending: List[Dict[str, Any]] = []
+    with pq.ParquetWriter(tmp, schema, compression=compression) as writer:
+        for record in _iter_jsonl(source):
+            pending.append({name: record.get(name) for name in names})
+            if len(pending) >= row_group_size:
+                writer.write_table(pa.Table.from_pylist(pending, schema=schema))
+                rows += len(pending)
+                pending = []
+        if pending or rows == 0:
+            writer.write_table(pa.Table.from_pylist(pending, schema=schema))
+            rows += len(pending)
+    os.replace(tmp, output)
+    return CompactionResult(
+        source=source,
+        output=output,
+        rows=rows,
+        source_bytes=source_bytes,
+        output_bytes=output.stat().st_size,
+    )
+
+
+def parquet_is_fresh(events_dir: Path) -> bool:
+    """Return True if ``events.parquet`` covers the whole current JSONL.
+
+    A Parquet file without a sibling JSONL (e.g. an archive that kept only
+    the compacted form) is fresh by definition.
+    """
+    parquet = events_dir / EVENTS_PARQUET
+    jsonl = events_dir / EVENTS_JSONL
+    if not parquet.is_file():
+        return False
+    if not jsonl.is_file():
+        return True
+    try:
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_schema(parquet).metadata or {}
+    except Exception:  # pyarrow missing or unreadable file
+        return False
+    recorded = metadata.get(_SOURCE_BYTES_KEY)
+    return recorded is not None and int(recorded) == jsonl.stat().st_size
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+def discover_event_sources(paths: Iterable[Path]) -> List[Path]:
+    """Resolve files and directories into one event source per run directory.
+
+    Directories are searched recursively. Per directory the Parquet file is
+    used when it is fresh and pyarrow is importable; otherwise the JSONL.
+
+    Args:
+        paths: Event files or directories containing them.
+
+    Returns:
+        Sorted, de-duplicated list of ``events.parquet``/``events.jsonl``.
+    """
+    try:
+        _require_pyarrow()
+        columnar = True
+    except ImportError:
+        columnar = False
+
+    dirs: set = set()
+    files: set = set()
+    for path in paths:
+        if path.is_file():
+            files.add(path)
+        elif path.is_dir():
+            for name in (EVENTS_JSONL, EVENTS_PARQUET):
+                dirs.update(p.parent for p in path.rglob(name))
+    for d in dirs:
+        if columnar and parquet_is_fresh(d):
+            files.add(d / EVENTS_PARQUET)
+        elif (d / EVENTS_JSONL).is_file():
+            files.add(d / EVENTS_JSONL)
+    return sorted(files)
+
+
+def iter_event_records(
+    source: Path,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 65_536,
+) -> Iterator[Dict[str, Any]]:
+    """Stream event records (with ``kind``) from a Parquet or JSONL source.
+
+    Parquet sources are read batch by batch, projected onto ``columns``;
+    JSONL sources are decoded line by line.
+
+    Args:
+        source: An ``events.parquet`` or ``events.jsonl`` file.
+        columns: Columns to read (Parquet only; JSONL yields whole records).
+        batch_size: Rows per Parquet batch.
+
+    Yields:
+        One dict per event.
+    """
+    if source.suffix != ".parquet":
+        yield from _iter_jsonl(source)
+        return
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(source)
+    available = set(parquet.schema_arrow.names)
+    wanted = [c for c in columns if c in available] if columns else None
+    for batch in parquet.iter_batches(batch_size=batch_size, columns=wanted):
+        yield from batch.to_pylist()
+
+
+# ============================================================================
+# Aggregation
+# ============================================================================
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram for streaming percentiles.
+
+    Each positive value lands in bucket ``floor(log(v) / log(1 + precision))``
+    so a reported percentile is within ``precision`` (relative) of the exact
+    one, while memory grows with the value *range*, not the sample count.
+
+    Args:
+        precision: Relative bucket width.
+    """
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self._log_base = math.log1p(precision)
+        self._buckets: Counter = Counter()
+        self._zero = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        if value <= 0:
+            self._zero += 1
+        else:
+            self._buckets[math.floor(math.log(value) / self._log_base)] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the ``q``-quantile (0 < q <= 1), or None when empty."""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = self._zero
+        if seen >= rank:
+            return 0.0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return math.exp((bucket + 0.5) * self._log_base)
+        return None  # pragma: no cover - rank never exceeds count
+
+
+@dataclass
+class LLMUsage:
+    """LLM call totals for one group.
+
+    Attributes:
+        calls: Number of LLM calls.
+        errors: Calls with ``status == "error"``.
+        input_tokens: Summed prompt tokens.
+        output_tokens: Summed completion tokens.
+        cost_usd: Summed cost, or None when no price covers the group.
+        latency: Latency histogram (milliseconds).
+    """
+
+    calls: int = 0
+    errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: Optional[float] = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency_p50_ms": self.latency.percentile(0.50),
+            "latency_p95_ms": self.latency.percentile(0.95),
+            "cost_usd": self.cost_usd,
+        }
+
+
+@dataclass
+class PrefixCacheUsage:
+    """Prefix cache efficiency for one agent role.
+
+    Only calls that carry prefix data (``prefix_cache_hit`` set) count.
+
+    Attributes:
+        calls: Calls with prefix data.
+        hits: Calls whose prompt shared a stable prefix with an earlier one.
+        input_tokens: Prompt tokens of those calls.
+        reusable_tokens: Summed ``prefix_reusable_tokens``.
+    """
+
+    calls: int = 0
+    hits: int = 0
+    input_tokens: int = 0
+    reusable_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of calls with a prefix hit, or None without data."""
+        return self.hits / self.calls if self.calls else None
+
+    @property
+    def reuse_ratio(self) -> Optional[float]:
+        """Reusable share of prompt tokens, or None without token data."""
+        if not self.input_tokens:
+            return None
+        return min(1.0, self.reusable_tokens / self.input_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": self.hit_rate,
+            "input_tokens": self.input_tokens,
+            "reusable_tokens": self.reusable_tokens,
+            "reuse_ratio": self.reuse_ratio,
+        }
+
+
+@dataclass
+class TelemetryReport:
+    """Aggregated view over many runs.
+
+    Attributes:
+        group_by: Field the LLM usage is grouped by.
+        groups: Group value → LLM usage.
+        error_classes: ``llm:<error_type>``, ``task:<failure_category>`` and
+            ``tool:<tool_name>`` (non-zero exit) → occurrence count.
+        prefix_cache: Agent role → prefix cache efficiency (independent of
+            ``group_by``).
+        events: Events read (after the ``since`` filter).
+        runs: Distinct run ids.
+        sources: Files read.
+    """
+
+    group_by: str
+    groups: Dict[str, LLMUsage] = field(default_factory=dict)
+    error_classes: Counter = field(default_factory=Counter)
+    prefix_cache: Dict[str, PrefixCacheUsage] = field(default_factory=dict)
+    events: int = 0
+    runs: int = 0
+    sources: List[Path] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "group_by": self.group_by,
+            "events": self.events,
+            "runs": self.runs,
+            "sources": [str(s) for s in self.sources],
+            "groups": {k: v.to_dict() for k, v in sorted(self.groups.items())},
+            "error_classes": dict(self.error_classes.most_common()),
+            "prefix_cache": {
+                k: v.to_dict() for k, v in sorted(self.prefix_cache.items())
+            },
+        }
+
+
+def parse_price(spec: str) -> Tuple[str, float, float]:
+    """Parse ``MODEL=IN:OUT`` (USD per million input/output tokens).
+
+    Raises:
+        ValueError: If ``spec`` is not in that form.
+    """
+    model, sep, rates = spec.partition("=")
+    in_rate, sep2, out_rate = rates.partition(":")
+    if not (model and sep and sep2):
+        raise ValueError(f"expected MODEL=IN:OUT, got {spec!r}")
+    return model, float(in_rate), float(out_rate)
+
+
+def aggregate_events(
+    sources: Iterable[Path],
+    group_by: str = "model",
+    since: Optional[str] = None,
+    prices: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> TelemetryReport:
+    """Fold event records from ``sources`` into a :class:`TelemetryReport`.
+
+    Records are streamed one at a time; memory is bounded by the number of
+    groups, error classes and runs, not by the number of events.
+
+    Args:
+        sources: Files from :func:`discover_event_sources`.
+        group_by: One of :data:`GROUP_BY_FIELDS`.
+        since: Keep events whose ISO timestamp sorts at or after this value.
+        prices: Model → (USD per million input, per million output tokens).
+            Cost is reported only for models with a price.
+
+    Returns:
+        The aggregated report.
+
+    Raises:
+        ValueError: If ``group_by`` is not a supported field.
+    """
+    if group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f"unsupported group_by {group_by!r}")
+    prices = prices or {}
+    report = TelemetryReport(group_by=group_by)
+    run_ids: set = set()
+    for source in sources:
+        report.sources.append(source)
+        for record in iter_event_records(source, columns=_QUERY_COLUMNS):
+            if since and str(record.get("timestamp") or "") < since:
+                continue
+            report.events += 1
+            run_ids.add(record.get("run_id"))
+            kind = record.get("kind")
+            if kind == "llm_call":
+                _add_llm_call(report, record, group_by, prices)
+            elif kind == "tool_exec" and record.get("exit_code") not in (0, None):
+                report.error_classes[f"tool:{record.get('tool_name')}"] += 1
+            elif kind == "task_failed":
+                report.error_classes[f"task:{record.get('failure_category')}"] += 1
+    report.runs = len(run_ids)
+    return report
+
+
+def _add_llm_call(
+    report: TelemetryReport,
+    record: Dict[str, Any],
+    group_by: str,
+    prices: Dict[str, Tuple[float, float]],
+) -> None:
+    key = str(record.get(group_by) or "(none)")
+    usage = report.groups.get(key)
+    if usage is None:
+        usage = report.groups[key] = LLMUsage()
+    input_tokens = int(record.get("input_tokens") or 0)
+    output_tokens = int(record.get("output_tokens") or 0)
+    usage.calls += 1
+    usage.input_tokens += input_tokens
+    usage.output_tokens += output_tokens
+    if record.get("latency_ms") is not None:
+        usage.latency.add(float(record["latency_ms"]))
+    if record.get("status") == "error":
+        usage.errors += 1
+        report.error_classes[f"llm:{record.get('error_type') or 'other'}"] += 1
+    if record.get("prefix_cache_hit") is not None:
+        role = str(record.get("agent_role") or "(none)")
+        prefix = report.prefix_cache.get(role)
+        if prefix is None:
+            prefix = report.prefix_cache[role] = PrefixCacheUsage()
+        prefix.calls += 1
+        prefix.hits += bool(record["prefix_cache_hit"])
+        prefix.input_tokens += input_tokens
+        prefix.reusable_tokens += int(record.get("prefix_reusable_tokens") or 0)
+    price = prices.get(str(record.get("model")))
+    if price is not None:
+        cost = (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
+        usage.cost_usd = (usage.cost_usd or 0.0) + cost
+
+
+__all__ = [
+    "EVENTS_JSONL",
+    "EVENTS_PARQUET",
+    "EVENT_KINDS",
+    "GROUP_BY_FIELDS",
+    "CompactionResult",
+    "LLMUsage",
+    "LatencyHistogram",
+    "PrefixCacheUsage",
+    "TelemetryReport",
+    "aggregate_events",
+    "compact_events",
+    "discover_event_sources",
+    "event_kind",
+    "event_schema",
+    "iter_event_records",
+    "parquet_is_fresh",
+    "parse_price",
+]
@@ -0,0 +1,243 @@
+"""Prefix-cache-stable prompt layout and prefix reuse estimation.
+
+vLLM's automatic prefix caching (and hosted prompt caching) only reuses the
+KV cache for the longest *exact* token prefix a new prompt shares with an
+earlier one. A prompt that opens with ``Turn: 3`` or the Coach's feedback
+therefore recomputes every token after it, even when the bulk of the prompt
+(role instructions, report schema, requirements) is unchanged from the last
+turn. On a self-hosted model that prefill dominates per-turn latency.
+
+``PromptLayout`` builds a prompt from named sections tagged with how often
+they change:
+
+    - ``STATIC``: identical for every task of a role (instructions, schemas)
+    - ``TASK``:   stable across the turns of one task (requirements, criteria)
+    - ``TURN``:   changes every turn (turn number, feedback, job context)
+
+and renders them most-static first (ties keep insertion order). Layouts
+that must keep their authored order -- e.g. a prompt a model was fine-tuned
+on -- render with ``reorder=False``; their stable prefix then ends at the
+first ``TURN`` section.
+
+``PrefixCacheTracker`` fingerprints the stable prefix at each tier boundary
+per role and, for each new prompt, reports whether a previously sent prompt
+shared that prefix and how many tokens of it are reusable. The estimate is
+recorded on ``LLMCallEvent`` (``prefix_cache_hit`` with
+``prefix_cache_estimated=True``, ``prefix_reusable_tokens``) and summarised
+per role by ``guardkit telemetry query``.
+
+Example:
+    >>> layout = PromptLayout(role="player")
+    >>> layout.add("turn", "Turn: 2", SectionStability.TURN)
+    >>> layout.add("rules", "## Your Responsibilities ...", SectionStability.STATIC)
+    >>> prompt = layout.render()
+    >>> prompt.startswith("## Your Responsibilities")
+    True
+"""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from guardkit.orchestrator.instrumentation.digests import count_tokens
+
+
+class SectionStability(enum.IntEnum):
+    """How often a prompt section changes; lower values render first."""
+
+    STATIC = 0
+    TASK = 1
+    TURN = 2
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    """One named piece of a prompt.
+
+    Attributes:
+        name: Section identifier (for debugging and tests).
+        text: Rendered text, concatenated verbatim.
+        stability: How often the text changes.
+    """
+
+    name: str
+    text: str
+    stability: SectionStability
+
+
+class LayoutPrompt(str):
+    """A rendered prompt that remembers the layout it came from.
+
+    Behaves exactly like ``str``; ``AgentInvoker._invoke_with_role`` reads
+    ``layout`` to estimate prefix reuse. Any string operation on it returns
+    a plain ``str`` (and so drops the layout), which is the safe default for
+    a prompt edited after rendering.
+    """
+
+    layout: "PromptLayout"
+
+    def __new__(cls, text: str, layout: "PromptLayout") -> "LayoutPrompt":
+        obj = super().__new__(cls, text)
+        obj.layout = layout
+        return obj
+
+
+@dataclass
+class PromptLayout:
+    """Ordered prompt builder that keeps stable content in the prefix.
+
+    Args:
+        role: Agent role the prompt is for (fingerprints are per role).
+        reorder: Sort sections most-static first. ``False`` keeps the
+            authored order.
+    """
+
+    role: str
+    reorder: bool = True
+    sections: List[PromptSection] = field(default_factory=list)
+
+    def add(self, name: str, text: str, stability: SectionStability) -> None:
+        """Append a section; empty text is skipped."""
+        if text:
+            self.sections.append(PromptSection(name, text, stability))
+
+    def ordered(self) -> List[PromptSection]:
+        """Sections in render order."""
+        if not self.reorder:
+            return list(self.sections)
+        return sorted(self.sections, key=lambda s: s.stability)
+
+    def render(self) -> LayoutPrompt:
+        """Concatenate the sections in render order."""
+        return LayoutPrompt("".join(s.text for s in self.ordered()), self)
+
+    def prefixes(self) -> List[Tuple[SectionStability, str]]:
+        """Cumulative stable prefixes, one per tier boundary.
+
+        Returns:
+            ``(tier, prefix_text)`` for the prefix ending after the last
+            section of each tier below ``TURN``, stopping at the first
+            ``TURN`` section. Shortest first.
+        """
+        out: List[Tuple[SectionStability, str]] = []
+        parts: List[str] = []
+        ordered = self.ordered()
+        for i, section in enumerate(ordered):
+            if section.stability is SectionStability.TURN:
+                break
+            parts.append(section.text)
+            following = ordered[i + 1] if i + 1 < len(ordered) else None
+            if following is None or following.stability != section.stability:
+                out.append((section.stability, "".join(parts)))
+        return out
+
+    def fingerprint(self) -> Optional[str]:
+        """Hash of the full stable prefix, or None when it is empty."""
+        prefixes = self.prefixes()
+        return _fingerprint(self.role, prefixes[-1][1]) if prefixes else None
+
+
+def _fingerprint(role: str, text: str) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(role.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class PrefixCacheEstimate:
+    """Predicted prefix reuse for one prompt.
+
+    Attributes:
+        hit: Whether an earlier prompt of the same role shared a stable
+            prefix with this one.
+        reusable_tokens: Tokens of that shared prefix (0 on a miss).
+        fingerprint: Fingerprint of this prompt's full stable prefix.
+    """
+
+    hit: bool
+    reusable_tokens: int
+    fingerprint: Optional[str]
+
+
+class PrefixCacheTracker:
+    """Remembers stable-prefix fingerprints sent per role.
+
+    Thread-safe; bounded to ``max_entries`` fingerprints per role (LRU),
+    roughly mirroring a server-side cache that eventually evicts.
+
+    Args:
+        max_entries: Fingerprints kept per role.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._seen: Dict[str, "OrderedDict[str, int]"] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, layout: PromptLayout) -> PrefixCacheEstimate:
+        """Estimate reuse for ``layout`` and record its prefixes as sent.
+
+        Args:
+            layout: Layout of the prompt about to be sent.
+
+        Returns:
+            The estimate for this prompt.
+        """
+        keyed = [(_fingerprint(layout.role, text), text) for _, text in layout.prefixes()]
+        if not keyed:
+            return PrefixCacheEstimate(hit=False, reusable_tokens=0, fingerprint=None)
+
+        reusable = 0
+        with self._lock:
+            seen = self._seen.setdefault(layout.role, OrderedDict())
+            for fp, _ in reversed(keyed):
+                if fp in seen:
+                    seen.move_to_end(fp)
+                    reusable = seen[fp]
+                    break
+            missing = [(fp, text) for fp, text in keyed if fp not in seen]
+
+        # Count outside the lock (tokenizer work); only new prefixes need it.
+        counts = {fp: count_tokens(text) for fp, text in missing}
+        with self._lock:
+            seen = self._seen.setdefault(layout.role, OrderedDict())
+            for fp, tokens in counts.items():
+                seen[fp] = tokens
+                seen.move_to_end(fp)
+            while len(seen) > self._max_entries:
+                seen.popitem(last=False)
+
+        return PrefixCacheEstimate(
+            hit=reusable > 0, reusable_tokens=reusable, fingerprint=keyed[-1][0]
+        )
+
+    def clear(self) -> None:
+        """Forget every fingerprint (tests, server restarts)."""
+        with self._lock:
+            self._seen.clear()
+
+
+_tracker = PrefixCacheTracker()
+
+
+def get_prefix_cache_tracker() -> PrefixCacheTracker:
+    """Return the process-wide :class:`PrefixCacheTracker`."""
+    return _tracker
+
+
+__all__ = [
+    "LayoutPrompt",
+    "PrefixCacheEstimate",
+    "PrefixCacheTracker",
+    "PromptLayout",
+    "PromptSection",
+    "SectionStability",
+    "get_prefix_cache_tracker",
+]
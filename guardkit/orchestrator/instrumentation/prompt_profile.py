@@ -31,6 +31,10 @@ import logging
 from typing import Optional
 
 from guardkit.orchestrator.instrumentation.digests import DigestLoader
+from guardkit.orchestrator.instrumentation.prompt_layout import (
+    PromptLayout,
+    SectionStability,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -126,42 +130,46 @@ class PromptProfileAssembler:
                 Required when profile includes graphiti.
 
         Returns:
-            Assembled prompt string ready for system prompt injection.
+            Assembled prompt string ready for system prompt injection
+            (a ``LayoutPrompt``: digest, then rules bundle, then Graphiti
+            context).
         """
         active_profile = profile if profile is not None else self._default_profile
         self._last_profile = active_profile
 
-        # Always start with the role digest
-        digest_content = self._loader.load(role)
-        sections: list[str] = [digest_content]
+        # Sections are laid out most-static first so the digest and rules
+        # bundle form a prefix shared by every call for the role; retrieved
+        # Graphiti context changes per task/turn and goes last.
+        layout = PromptLayout(role=role)
+        layout.add("digest", self._loader.load(role), SectionStability.STATIC)
 
-        # Add Graphiti context if profile requires it
+        # Add rules bundle if profile requires it
         if active_profile in (
-            PromptProfile.DIGEST_GRAPHITI,
+            PromptProfile.DIGEST_RULES_BUNDLE,
             PromptProfile.DIGEST_GRAPHITI_RULES_BUNDLE,
         ):
-            if graphiti_context:
-                sections.append(graphiti_context)
+            if rules_bundle:
+                layout.add("rules_bundle", "\n\n" + rules_bundle, SectionStability.STATIC)
             else:
                 logger.debug(
-                    "Profile '%s' expects Graphiti context but none provided",
+                    "Profile '%s' expects rules bundle but none provided",
                     active_profile.value,
                 )
 
-        # Add rules bundle if profile requires it
+        # Add Graphiti context if profile requires it
         if active_profile in (
-            PromptProfile.DIGEST_RULES_BUNDLE,
+            PromptProfile.DIGEST_GRAPHITI,
             PromptProfile.DIGEST_GRAPHITI_RULES_BUNDLE,
         ):
-            if rules_bundle:
-                sections.append(rules_bundle)
+            if graphiti_context:
+                layout.add("graphiti", "\n\n" + graphiti_context, SectionStability.TURN)
             else:
                 logger.debug(
-                    "Profile '%s' expects rules bundle but none provided",
+                    "Profile '%s' expects Graphiti context but none provided",
                     active_profile.value,
                 )
 
-        assembled = "\n\n".join(sections)
+        assembled = layout.render()
         logger.debug(
             "Assembled prompt for role='%s', profile='%s' (%d chars)",
             role,
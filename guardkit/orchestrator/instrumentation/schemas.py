@@ -158,6 +158,9 @@ class LLMCallEvent(BaseEvent):
         ttft_ms: Optional time-to-first-token in milliseconds.
         prefix_cache_hit: Optional flag for prefix cache hit.
         prefix_cache_estimated: Whether cache hit was estimated (default False).
+        prefix_reusable_tokens: Optional estimated prompt tokens reusable from
+            the prefix cache (stable prefix shared with an earlier prompt).
+        prefix_fingerprint: Optional fingerprint of the prompt's stable prefix.
         context_bytes: Optional context size in bytes.
         prompt_profile: Prompt composition profile from controlled vocabulary.
         status: Call outcome (ok or error).
@@ -185,6 +188,14 @@ class LLMCallEvent(BaseEvent):
         default=False,
         description="Whether cache hit was estimated rather than confirmed",
     )
+    prefix_reusable_tokens: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Estimated prompt tokens reusable from the prefix cache",
+    )
+    prefix_fingerprint: Optional[str] = Field(
+        None, description="Fingerprint of the prompt's stable prefix"
+    )
     context_bytes: Optional[int] = Field(
         None, description="Context size in bytes"
     )
@@ -337,6 +348,11 @@ class GraphitiQueryEvent(BaseEvent):
         tokens_injected: Number of tokens injected into context.
         latency_ms: Query latency in milliseconds.
         status: Query outcome (ok or error).
+        cache_hits: Searches answered by the shared query cache (including
+            ones that joined an identical in-flight search). None when the
+            emitter does not go through the cache.
+        cache_misses: Searches that went to the memory backend. None when
+            the emitter does not go through the cache.
     """
 
     query_type: GraphitiQueryType = Field(
@@ -350,6 +366,12 @@ class GraphitiQueryEvent(BaseEvent):
     )
     latency_ms: float = Field(description="Query latency in milliseconds")
     status: GraphitiStatus = Field(description="Query outcome: ok or error")
+    cache_hits: Optional[int] = Field(
+        None, ge=0, description="Searches served by the shared query cache"
+    )
+    cache_misses: Optional[int] = Field(
+        None, ge=0, description="Searches that reached the memory backend"
+    )
 
 
 # ============================================================================
@@ -39,6 +39,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from guardkit.orchestrator.git_service import check_ignore_rules, tracked_paths
+
 logger = logging.getLogger(__name__)
 
 _FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
@@ -101,6 +103,10 @@ def run_preflight_ignore_gate(
             skip_reason="plan / frontmatter present but empty file list",
         )
 
+    # One batched round trip over the worktree's git service; the per-target
+    # probes below then read its cache instead of forking git per path.
+    check_ignore_rules(worktree_path, planned_targets)
+
     matches: List[IgnoreMatch] = []
     for target in planned_targets:
         rule = check_ignore_one(worktree_path, target)
@@ -274,20 +280,14 @@ def _find_task_file(task_id: str, worktree_path: Path) -> Optional[Path]:
     cross-module dependency from a gate that fires before AgentInvoker
     is fully active).
     """
-    task_dirs = (
-        worktree_path / "tasks" / "backlog",
-        worktree_path / "tasks" / "design_approved",
-        worktree_path / "tasks" / "in_progress",
-        worktree_path / "tasks" / "in_review",
-        worktree_path / "tasks" / "completed",
-        worktree_path / "tasks" / "blocked",
+    from guardkit.tasks.task_index import locate_task
+
+    location = locate_task(
+        task_id,
+        worktree_path,
+        ("backlog", "design_approved", "in_progress", "in_review", "completed", "blocked"),
     )
-    for task_dir in task_dirs:
-        if not task_dir.exists():
-            continue
-        for candidate in task_dir.rglob(f"{task_id}*.md"):
-            return candidate
-    return None
+    return location.path if location is not None else None
 
 
 def _coerce_string_list(value: Any) -> List[str]:
@@ -332,7 +332,19 @@ def check_ignore_one(worktree_path: Path, path: str) -> Optional[str]:
 
     The matching logic mirrors ``CoachVerifier._git_check_ignore_rule``
     but is intentionally duplicated to keep the gate self-contained.
+    The rule comes from the worktree's git service when it can answer
+    (:mod:`guardkit.orchestrator.git_service`); the one-shot subprocess
+    below is the fallback.
     """
+    answered = check_ignore_rules(worktree_path, [path])
+    if path in answered:
+        rule = answered[path]
+        if rule is None or _rule_is_negation(rule):
+            return None
+        if _path_is_tracked(worktree_path, path):
+            return None
+        return rule
+
     try:
         result = subprocess.run(
             ["git", "check-ignore", "-v", "--no-index", "--", path],
@@ -413,6 +425,9 @@ def _path_is_tracked(worktree_path: Path, path: str) -> bool:
     ignored path when git is unavailable (the Coach still verifies at turn
     end). Red-baseline retro, L12 item 6.
     """
+    answered = tracked_paths(worktree_path, [path])
+    if path in answered:
+        return answered[path]
     try:
         result = subprocess.run(
             ["git", "ls-files", "--error-unmatch", "--", path],
@@ -17,7 +17,7 @@ import importlib
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Sequence
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
 from guardkit.orchestrator.qa_stages.boundary import (
     ProbeTarget,
@@ -36,6 +36,9 @@ from guardkit.orchestrator.qa_stages.mutation import (
 )
 from guardkit.orchestrator.qa_stages.sandbox import MutationSandbox
 
+if TYPE_CHECKING:
+    from guardkit.orchestrator.quality_gates.test_impact import TestImpactIndex
+
 _OPERATORS = ("strip-auth-header", "revert-hunk")
 
 
@@ -69,6 +72,23 @@ def _changed_files(repo_root: Path, base: str) -> List[str]:
     return [ln.strip() for ln in proc.stdout.splitlines() if ln.strip()]
 
 
+def _impact_index(repo_root: Path) -> Optional["TestImpactIndex"]:
+    """The coverage gate's test-impact index, if it describes this exact tree.
+
+    The sandbox is materialized from the repo as it stands; an index measured
+    on any other tree would select tests for the wrong lines.
+    """
+    from guardkit.orchestrator.quality_gates.test_impact import (
+        load_index,
+        snapshot_tree,
+    )
+
+    index = load_index(repo_root)
+    if index is None or index.tree != snapshot_tree(repo_root):
+        return None
+    return index
+
+
 def build_mutants(
     repo_root: Path,
     source_files: Sequence[str],
@@ -104,11 +124,15 @@ def assemble_mutation_campaign(
     operators: Sequence[str] = ("strip-auth-header",),
     base: str | None = None,
     timeout: int = 600,
+    workers: int | None = None,
 ) -> MutationAssembly:
     """Assemble and run a mutation campaign for a task; derive its findings.
 
     ``source_files`` may be ``None`` when ``base`` is given (files are derived
     from the diff). Surviving mutants become non-blocking coverage-hole findings.
+    ``workers`` caps concurrent mutants (default: ``GUARDKIT_MUTATION_WORKERS``
+    or ``min(8, cpu_count)``). When the coverage gate left a test-impact index
+    for the current tree, each mutant runs only the tests covering its lines.
     """
     for op in operators:
         if op not in _OPERATORS:
@@ -126,7 +150,9 @@ def assemble_mutation_campaign(
     mutants = build_mutants(repo_root, source_files, operators, base=base)
     sandbox = MutationSandbox(repo_root)
     runner = make_pytest_runner(test_command, timeout=timeout)
-    result = run_mutation_campaign(sandbox, mutants, runner)
+    result = run_mutation_campaign(
+        sandbox, mutants, runner, workers=workers, impact=_impact_index(repo_root)
+    )
 
     findings: List[Finding] = []
     for survivor in result.survivors:
@@ -16,19 +16,39 @@ Granularity note: mutations are applied per-site so a whole-file test run can
 still attribute a surviving mutant to the exact line the mutation touched. Every
 mutant runs in its own THROWAWAY sandbox (never the task branch — see
 :mod:`~guardkit.orchestrator.qa_stages.sandbox`).
+
+Throughput: mutants run concurrently (``GUARDKIT_MUTATION_WORKERS``, default
+``min(8, cpu_count)``; ``1`` runs them one at a time), each in a hardlinked
+clone of a single base snapshot. The pytest runner stops at the first failure
+(a killed mutant needs one red test, not the whole suite), and when the
+campaign is given a test-impact index for the snapshot's tree, a mutant runs
+only the tests that executed the lines it touches. Whenever the index cannot
+vouch for a mutant's lines, that mutant runs the full command.
 """
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
 
 from guardkit.orchestrator.qa_stages.errors import MutationError
 from guardkit.orchestrator.qa_stages.sandbox import MutationSandbox
 
+if TYPE_CHECKING:
+    from guardkit.orchestrator.quality_gates.test_impact import TestImpactIndex
+
+#: Concurrent mutant override (``1`` runs the campaign serially).
+MUTATION_WORKERS_ENV_VAR = "GUARDKIT_MUTATION_WORKERS"
+
+# Above this many covering tests a targeted run saves little over the full
+# command and the argv grows unwieldy.
+_MAX_TARGETS = 400
+
 
 # --------------------------------------------------------------------------- #
 # Test outcome + runner
@@ -37,6 +57,8 @@ from guardkit.orchestrator.qa_stages.sandbox import MutationSandbox
 class TestOutcome:
     """Result of running the task's test command in a sandbox."""
 
+    __test__ = False
+
     green: bool
     returncode: int
     tail: str = ""
@@ -49,26 +71,96 @@ class TestOutcome:
 #: A test runner takes a sandbox root and returns the outcome of the suite there.
 TestRunner = Callable[[Path], TestOutcome]
 
+#: A runner that can also be narrowed to pytest node ids / test files.
+TargetedTestRunner = Callable[[Path, Optional[Sequence[str]]], TestOutcome]
+
+# pytest options whose value is the NEXT token — that token is never a test
+# path, even when it names one (``--ignore tests/slow``).
+_PYTEST_VALUE_OPTIONS = frozenset({
+    "-k", "-m", "-p", "-c", "-o", "-W", "-r",
+    "--ignore", "--ignore-glob", "--deselect", "--rootdir", "--confcutdir",
+    "--basetemp", "--junitxml", "--junit-xml", "--cov", "--cov-report",
+    "--cov-config", "--log-file", "--maxfail", "--tb", "--durations",
+})
+_FAIL_FAST_OPTIONS = ("-x", "--exitfirst", "--maxfail", "--sw", "--stepwise")
+
+
+def _pytest_position(argv: Sequence[str]) -> Optional[int]:
+    """Index of the ``pytest`` token (``pytest`` or ``-m pytest``), if any."""
+    for i, token in enumerate(argv):
+        if Path(token).name in ("pytest", "py.test"):
+            return i
+        if token == "pytest" and i and argv[i - 1] == "-m":
+            return i
+    return None
+
+
+def _with_fail_fast(argv: List[str]) -> List[str]:
+    at = _pytest_position(argv)
+    if at is None or any(
+        token.split("=", 1)[0] in _FAIL_FAST_OPTIONS for token in argv[at + 1:]
+    ):
+        return argv
+    return argv[: at + 1] + ["-x"] + argv[at + 1:]
+
+
+def _narrowed(
+    argv: Sequence[str], targets: Sequence[str], root: Path
+) -> Optional[List[str]]:
+    """``argv`` with its positional test selection replaced by ``targets``.
+
+    Returns ``None`` when ``argv`` is not a pytest invocation — the caller then
+    runs the command unchanged.
+    """
+    at = _pytest_position(argv)
+    if at is None:
+        return None
+    kept = list(argv[: at + 1])
+    value_next = False
+    for token in argv[at + 1:]:
+        if value_next:
+            kept.append(token)
+            value_next = False
+        elif token.startswith("-"):
+            kept.append(token)
+            value_next = token in _PYTEST_VALUE_OPTIONS
+        elif not (root / token.split("::", 1)[0]).exists():
+            kept.append(token)
+    return kept + list(targets)
+
 
 def make_pytest_runner(
     command: Sequence[str],
     *,
     timeout: int = 600,
-) -> TestRunner:
-    """Build a :data:`TestRunner` that shells ``command`` with ``cwd=sandbox``.
+    fail_fast: bool = True,
+) -> TargetedTestRunner:
+    """Build a test runner that shells ``command`` with ``cwd=sandbox``.
 
     ``command`` is the task's own test command (e.g.
     ``[sys.executable, "-m", "pytest", "-q", "tests/unit"]``). A non-zero exit —
     including a timeout (124-style) — is RED; a mutation that leaves the suite
     green survived. Absence-of-failure: a collection/spawn error is red (an
     un-runnable suite is never a silent pass).
+
+    With ``fail_fast`` a pytest command gets ``-x``: the first failing test
+    already decides the verdict. When the runner is called with ``targets``
+    (pytest node ids or test files), they replace the command's own test
+    paths; its other options are kept.
     """
     argv = list(command)
-
-    def _run(sandbox_root: Path) -> TestOutcome:
+    if fail_fast:
+        argv = _with_fail_fast(argv)
+
+    def _run(
+        sandbox_root: Path, targets: Optional[Sequence[str]] = None
+    ) -> TestOutcome:
+        run_argv = argv
+        if targets:
+            run_argv = _narrowed(argv, targets, sandbox_root) or argv
         try:
             proc = subprocess.run(
-                argv,
+                run_argv,
                 cwd=str(sandbox_root),
                 capture_output=True,
                 text=True,
@@ -95,11 +187,18 @@ class Mutant:
 
     ``apply`` mutates the materialized sandbox (never the source tree). ``site``
     labels the exact location so a surviving mutant is attributable.
+
+    ``path`` is the one file ``apply`` rewrites (relative to the sandbox root)
+    and ``lines`` the lines of it the mutation touches. An operator that
+    cannot say leaves them empty: the mutant then gets a full sandbox copy and
+    the full test command.
     """
 
     operator: str
     site: str
     apply: Callable[[Path], None]
+    path: Optional[str] = None
+    lines: Tuple[int, ...] = ()
 
 
 #: A mutation operator inspects a source file and yields zero or more Mutants.
@@ -144,6 +243,8 @@ def strip_auth_header_operator(rel_path: str, text: str) -> List[Mutant]:
                 operator="strip-auth-header",
                 site=f"{rel_path}:{line_no}",
                 apply=_apply,
+                path=rel_path,
+                lines=(line_no,),
             )
         )
     return mutants
@@ -163,12 +264,19 @@ def revert_hunks_operator(
     mutants: List[Mutant] = []
     for idx, hunk in enumerate(diff_hunks, start=1):
         def _apply(sandbox_root: Path, _hunk=hunk) -> None:
+            # A snapshot clone is not a repository: keep git from discovering
+            # an enclosing one, so ``apply`` patches the sandbox as plain files.
+            env = {
+                **os.environ,
+                "GIT_CEILING_DIRECTORIES": str(Path(sandbox_root).parent),
+            }
             proc = subprocess.run(
                 ["git", "-C", str(sandbox_root), "apply", "-R", "--recount", "-"],
                 input=_hunk,
                 capture_output=True,
                 text=True,
                 check=False,
+                env=env,
             )
             if proc.returncode != 0:
                 raise MutationError(
@@ -176,11 +284,34 @@ def revert_hunks_operator(
                 )
 
         mutants.append(
-            Mutant(operator="revert-hunk", site=f"{rel_path}#hunk{idx}", apply=_apply)
+            Mutant(
+                operator="revert-hunk",
+                site=f"{rel_path}#hunk{idx}",
+                apply=_apply,
+                path=rel_path,
+                lines=_hunk_new_lines(hunk),
+            )
         )
     return mutants
 
 
+_HUNK_HEADER = re.compile(r"(?m)^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _hunk_new_lines(hunk: str) -> Tuple[int, ...]:
+    """Post-image lines a hunk spans — the lines reverting it rewrites.
+
+    A pure deletion spans no post-image line; the line after it stands in, so
+    the tests around the deletion point still select.
+    """
+    m = _HUNK_HEADER.search(hunk)
+    if m is None:
+        return ()
+    start = int(m.group(1))
+    count = int(m.group(2)) if m.group(2) is not None else 1
+    return tuple(range(start, start + count)) if count else (start + 1,)
+
+
 def split_diff_by_file(diff: str) -> dict[str, List[str]]:
     """Split a unified ``git diff`` into per-file lists of single-hunk patches.
 
@@ -255,45 +386,112 @@ class MutationCampaignResult:
         return [r for r in self.results if r.error is not None]
 
 
+def _mutation_workers() -> int:
+    raw = os.environ.get(MUTATION_WORKERS_ENV_VAR, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return min(8, os.cpu_count() or 1)
+
+
+def _covering_tests(
+    mut: Mutant, impact: "TestImpactIndex"
+) -> Optional[List[str]]:
+    """Tests that executed ``mut``'s lines, or ``None`` to run everything.
+
+    ``None`` whenever the index cannot vouch for the mutant: no path or lines,
+    a file the index never measured, a test file, a line executed outside any
+    test (module import), or no covering test at all.
+    """
+    if mut.path is None or not mut.lines or mut.path not in impact.measured_files:
+        return None
+    name = Path(mut.path).name
+    if name == "conftest.py" or name.startswith("test_") or name.endswith("_test.py"):
+        return None
+    file_lines = impact.lines[mut.path]
+    found: set[str] = set()
+    for lineno in mut.lines:
+        node_ids = file_lines.get(lineno)
+        if node_ids is None:
+            continue
+        if not node_ids:
+            return None
+        found.update(node_ids)
+    if not found or len(found) > _MAX_TARGETS:
+        return None
+    return sorted(found)
+
+
+def _run_mutant(
+    sandbox: MutationSandbox,
+    base: Path,
+    mut: Mutant,
+    run_tests: Callable[..., TestOutcome],
+    impact: Optional["TestImpactIndex"],
+) -> MutantResult:
+    targets = _covering_tests(mut, impact) if impact is not None else None
+    writable = [mut.path] if mut.path is not None else None
+    with sandbox.clone(base, writable) as box:
+        try:
+            mut.apply(box.path)
+        except MutationError as exc:
+            return MutantResult(
+                mut.operator, mut.site, survived=False, returncode=-1, error=str(exc)
+            )
+        outcome = run_tests(box.path) if targets is None else run_tests(box.path, targets)
+    return MutantResult(
+        operator=mut.operator,
+        site=mut.site,
+        survived=outcome.green,
+        returncode=outcome.returncode,
+    )
+
+
 def run_mutation_campaign(
     sandbox: MutationSandbox,
     mutants: Sequence[Mutant],
-    run_tests: TestRunner,
+    run_tests: TestRunner | TargetedTestRunner,
+    *,
+    workers: Optional[int] = None,
+    impact: Optional["TestImpactIndex"] = None,
 ) -> MutationCampaignResult:
-    """Run a mutation campaign; each mutant gets a fresh throwaway sandbox.
+    """Run a mutation campaign; each mutant gets its own throwaway sandbox.
 
     1. Baseline: materialize a clean sandbox and run the suite — it MUST be
        green, else raise :class:`MutationError` (absence-of-failure: a red
-       baseline cannot certify "no coverage holes").
-    2. Per mutant: materialize a fresh sandbox, apply the mutant, run the suite.
+       baseline cannot certify "no coverage holes"). That sandbox stays up as
+       the campaign's base snapshot.
+    2. Per mutant: clone the snapshot, apply the mutant, run the suite.
        Green after mutation → SURVIVED (coverage hole). Red → killed.
+
+    Up to ``workers`` mutants (default :data:`MUTATION_WORKERS_ENV_VAR`) run at
+    once; results keep the order of ``mutants``. ``impact`` is a test-impact
+    index measured on the tree the sandbox materializes. With it, a mutant is
+    run as ``run_tests(root, targets)`` on the tests covering its lines, so
+    ``run_tests`` must then accept targets (:func:`make_pytest_runner`'s does).
     """
     with sandbox.materialize() as baseline_box:
         baseline = run_tests(baseline_box.path)
-    if baseline.red:
-        raise MutationError(
-            "mutation baseline is RED — cannot assess coverage holes against a "
-            f"failing suite (rc={baseline.returncode}).\n{baseline.tail}"
-        )
-
-    results: List[MutantResult] = []
-    for mut in mutants:
-        with sandbox.materialize() as box:
-            try:
-                mut.apply(box.path)
-            except MutationError as exc:
-                results.append(
-                    MutantResult(mut.operator, mut.site, survived=False,
-                                 returncode=-1, error=str(exc))
-                )
-                continue
-            outcome = run_tests(box.path)
-        results.append(
-            MutantResult(
-                operator=mut.operator,
-                site=mut.site,
-                survived=outcome.green,
-                returncode=outcome.returncode,
+        if baseline.red:
+            raise MutationError(
+                "mutation baseline is RED — cannot assess coverage holes against a "
+                f"failing suite (rc={baseline.returncode}).\n{baseline.tail}"
             )
-        )
+
+        pool_size = max(1, min(workers or _mutation_workers(), len(mutants) or 1))
+
+        def _one(mut: Mutant) -> MutantResult:
+            return _run_mutant(sandbox, baseline_box.path, mut, run_tests, impact)
+
+        if pool_size == 1:
+            results = [_one(mut) for mut in mutants]
+        else:
+            # Each mutant's cost is its pytest subprocess, so threads give
+            # real parallelism without pickling the mutants' closures.
+            with ThreadPoolExecutor(
+                max_workers=pool_size, thread_name_prefix="guardkit-mutant"
+            ) as pool:
+                results = list(pool.map(_one, mutants))
     return MutationCampaignResult(baseline_green=True, results=results)
@@ -6,16 +6,28 @@ tree under a temp dir; the original working tree is never written. When the
 source is a git repo we prefer ``git worktree add`` (cheap, honest isolation);
 otherwise we ``copytree`` the source (excluding ``.git`` and the usual build
 detritus). Either way the sandbox is removed on ``__exit__``.
+
+A campaign materializes the source ONCE as its base snapshot and gives every
+mutant a :meth:`MutationSandbox.clone` of it: a tree of hardlinks to the
+snapshot in which only the files the mutant rewrites are real copies, so a
+mutant costs a directory walk instead of a checkout. The snapshot is itself a
+throwaway copy, so a hardlink can never reach the task branch.
+``GUARDKIT_MUTATION_HARDLINK=0`` makes every clone a full copy (for suites that
+rewrite tracked files in place).
 """
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence
+
+#: Set to ``0`` to give every mutant a full copy of the base snapshot.
+MUTATION_HARDLINK_ENV_VAR = "GUARDKIT_MUTATION_HARDLINK"
 
 # Never copied into a sandbox — heavy, regenerable, or the VCS metadata itself.
 _COPY_EXCLUDES = (
@@ -34,6 +46,28 @@ def _ignore(_dir: str, names: List[str]) -> set[str]:
     return {n for n in names if n in _COPY_EXCLUDES or n.endswith(".pyc")}
 
 
+def hardlink_clones_enabled() -> bool:
+    """False when ``GUARDKIT_MUTATION_HARDLINK`` turns hardlinked clones off."""
+    flag = os.environ.get(MUTATION_HARDLINK_ENV_VAR, "").strip().lower()
+    return flag not in ("0", "false", "off", "no")
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:  # cross-device or a filesystem without hardlinks
+        shutil.copy2(src, dst)
+
+
+def _unshare(path: Path) -> None:
+    """Replace a hardlinked file with a private copy so writes stay local."""
+    if not path.is_file() or path.is_symlink():
+        return
+    private = path.with_name(f".{path.name}.cow")
+    shutil.copy2(path, private)
+    os.replace(private, path)
+
+
 @dataclass
 class MaterializedSandbox:
     """A single materialized copy of the source tree under a temp dir.
@@ -112,3 +146,30 @@ class MutationSandbox:
         dest = tmp / "copy"
         shutil.copytree(self.source_root, dest, ignore=_ignore, symlinks=True)
         return MaterializedSandbox(path=dest, is_git=False)
+
+    def clone(
+        self,
+        base: Path,
+        writable: Optional[Sequence[str]] = None,
+    ) -> MaterializedSandbox:
+        """Return a throwaway copy of a materialized ``base`` snapshot.
+
+        Files are hardlinked to ``base`` except ``writable`` (paths relative to
+        the root), which get private copies. ``writable=None`` means the
+        caller cannot say which files it will write, so everything is copied.
+        The clone never carries ``.git``; it is not a worktree.
+        """
+        tmp = Path(tempfile.mkdtemp(prefix="guardkit-qa-mutate-"))
+        dest = tmp / "copy"
+        link = writable is not None and hardlink_clones_enabled()
+        shutil.copytree(
+            base,
+            dest,
+            ignore=_ignore,
+            symlinks=True,
+            copy_function=_link_or_copy if link else shutil.copy2,
+        )
+        if link:
+            for rel in writable or ():
+                _unshare(dest / rel)
+        return MaterializedSandbox(path=dest, is_git=False)
@@ -47,6 +47,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from guardkit.lib.pytest_argv import isolated_basetemp
 from guardkit.lib.pytest_summary import parse_pytest_summary
+from guardkit.lib.pytest_worker import pytest_worker_enabled, run_pytest
 from guardkit.orchestrator.coach_verification import (
     CoachVerifier,
     HonestyVerification,
@@ -54,6 +55,11 @@ from guardkit.orchestrator.coach_verification import (
 )
 from guardkit.orchestrator import evidence_repos as evidence_repos_lib
 from guardkit.orchestrator.evidence_repos import EvidenceRepo, EvidenceTestResult
+from guardkit.orchestrator.quality_gates.test_impact import (
+    SELECTION_CHANGED_IMPACT,
+    select_impacted_tests,
+    test_impact_enabled,
+)
 from guardkit.orchestrator.quality_gates.stack_test_execution import (
     StackTestProfile,
     classify_absent_for_stack,
@@ -5074,6 +5080,39 @@ class CoachValidator:
 
         return build_venv_env(self.worktree_path) or dict(os.environ)
 
+    def _run_pytest_argv(
+        self, cmd: List[str], cwd: Path
+    ) -> subprocess.CompletedProcess:
+        """Run an interpreter-pinned ``[python, -m, pytest, …]`` command.
+
+        Shared by the isolated and standard subprocess paths. When
+        ``GUARDKIT_COACH_PYTEST_WORKER`` opts in, the run is served by the
+        warm per-worktree worker pool (:mod:`guardkit.lib.pytest_worker`),
+        whose servers fork from a parent that already imported pytest and its
+        plugins; otherwise — on any worker failure, or when every server is
+        busy with a parallel task's run — it is the cold ``subprocess.run`` it
+        always was. ``cmd`` (interpreter pin, per-test
+        ``--timeout``, ``--basetemp``), the environment and
+        ``self.test_timeout`` are identical on both paths.
+        """
+        if pytest_worker_enabled():
+            return run_pytest(
+                cmd[0],
+                cmd[3:],
+                cwd=cwd,
+                env=self._pytest_env(),
+                timeout=self.test_timeout,
+                worker_key=self.worktree_path,
+            )
+        return subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=self.test_timeout,
+            env=self._pytest_env(),
+        )
+
     # ------------------------------------------------------------------
     # TASK-ABFIX-011: gated per-test pytest-timeout injection
     # ------------------------------------------------------------------
@@ -5325,13 +5364,8 @@ class CoachValidator:
                             + self._pytest_timeout_argv()
                             + basetemp_argv
                         )
-                        result = subprocess.run(
-                            cmd,
-                            cwd=str(self._component_run_cwd(tmpdir_path)),
-                            capture_output=True,
-                            text=True,
-                            timeout=self.test_timeout,
-                            env=self._pytest_env(),
+                        result = self._run_pytest_argv(
+                            cmd, self._component_run_cwd(tmpdir_path)
                         )
                 else:
                     # Per-component seam: the isolated copy is a copy of the
@@ -5651,13 +5685,8 @@ class CoachValidator:
                             + self._pytest_timeout_argv()
                             + basetemp_argv
                         )
-                        result = subprocess.run(
-                            cmd,
-                            cwd=str(self._component_run_cwd(self.worktree_path)),
-                            capture_output=True,
-                            text=True,
-                            timeout=self.test_timeout,
-                            env=self._pytest_env(),
+                        result = self._run_pytest_argv(
+                            cmd, self._component_run_cwd(self.worktree_path)
                         )
                 else:
                     # TS-lane D.1b (design §B.5): the declared / non-pytest
@@ -7388,6 +7417,10 @@ class CoachValidator:
         4. Quaternary: Extract test files from completion_promises
         5. Quinary: Scan prior player_turn_N.json reports for accumulated test files
 
+        When ``GUARDKIT_COACH_TEST_IMPACT`` opts in and a fresh test-impact
+        index exists, a "changed-impact" selection (see
+        ``_detect_impacted_tests``) pre-empts the ladder above.
+
         If no task-specific tests are found and task_id was provided,
         returns None to signal that independent verification should be skipped.
         This is essential for shared worktrees where parallel tasks may have
@@ -7455,6 +7488,14 @@ class CoachValidator:
             )
             return declared
 
+        # Test impact analysis: when the coverage gate left a test-impact
+        # index, run only the tests the changes since then can affect. A
+        # missing or stale index returns None and the ladder below runs as
+        # before.
+        impact_cmd = self._detect_impacted_tests()
+        if impact_cmd:
+            return impact_cmd
+
         # Try task-specific filtering first (for shared worktrees)
         if task_id:
             # Primary: extract test files from task_work_results (already in memory)
@@ -7940,6 +7981,52 @@ class CoachValidator:
                         return patterns
         return []
 
+    def _detect_impacted_tests(self) -> Optional[str]:
+        """Changed-impact test selection from the worktree's impact index.
+
+        Opt-in via ``GUARDKIT_COACH_TEST_IMPACT``. Maps the worktree changes
+        since the coverage gate's last context-recording run to the test node
+        ids that execute the changed lines, plus every changed test file (see
+        :mod:`guardkit.orchestrator.quality_gates.test_impact`).
+
+        Single-task waves only: in a parallel wave the diff also carries
+        sibling tasks' edits, and selecting their impacted tests would
+        attribute sibling failures to this task — the same guard the
+        whole-suite fallback uses.
+
+        Returns
+        -------
+        Optional[str]
+            pytest command for the selection, or None to fall back to the
+            regular detection ladder (disabled, parallel wave, no index,
+            stale index, or nothing selectable).
+        """
+        if not test_impact_enabled() or self.is_parallel:
+            return None
+        try:
+            selection = select_impacted_tests(self.worktree_path)
+        except Exception as e:  # noqa: BLE001 — an accelerator must not break detection
+            logger.debug(f"Test impact selection failed: {e}")
+            return None
+        if selection is None:
+            return None
+
+        # Drop pytest-bdd glue files (TASK-FIX-CC-BDD), node ids included.
+        target_files = sorted({t.split("::", 1)[0] for t in selection.targets})
+        kept_files = set(self._filter_bdd_glue_files(target_files))
+        targets = [t for t in selection.targets if t.split("::", 1)[0] in kept_files]
+        if not targets:
+            return None
+
+        logger.info(
+            "Test selection %s for %s: %d target(s) from %d changed path(s)",
+            SELECTION_CHANGED_IMPACT,
+            self.task_id,
+            len(targets),
+            len(selection.changed_paths),
+        )
+        return f"pytest {' '.join(targets)} -v --tb=short"
+
     def _detect_tests_from_results(
         self, task_work_results: Dict[str, Any]
     ) -> Optional[str]:
@@ -0,0 +1,447 @@
+"""Per-worktree coverage database for the incremental coverage gate.
+
+The L3 coverage gate (:mod:`guardkit.orchestrator.quality_gates.coverage_gate`)
+re-ran the whole worktree suite under coverage on every turn, even when the
+Player's turn touched one function. With test impact analysis on
+(``GUARDKIT_COACH_TEST_IMPACT=1``) the gate already records per-test dynamic
+contexts; this module keeps that measurement as a database and carries it
+forward instead of re-measuring:
+
+    * **Database**: after a full context-recording run the coverage data file
+      is kept as ``.cov_output/coverage.db``, with a small metadata file
+      pinning it to the tree the test-impact index was recorded against.
+    * **Partial run**: on a later turn the gate re-runs only the tests
+      :func:`~guardkit.orchestrator.quality_gates.test_impact.select_impacted_tests`
+      selects, into a separate data file.
+    * **Merge**: :func:`merge_partial` drops every context the partial run
+      re-measured (re-run node ids, changed or deleted test files), carries
+      the remaining arcs of changed files across the diff to their new line
+      numbers (arcs inside a changed hunk are dropped — any test that ran
+      them was re-run), applies renames and deletions, then folds the
+      partial run's arcs in. The merged file is an ordinary coverage data
+      file, so ``coverage json`` reports it exactly like a full run.
+
+The merge works on coverage.py's SQLite data file (schema version 7) with
+branch data, which is what the gate records. Any other shape — an
+unexpected schema, line-only data, a changed module the partial run never
+measured — makes the merge decline and the gate runs the full suite. The
+database can only save time, never change what the gate reports.
+
+Kill switch: ``GUARDKIT_COVERAGE_INCREMENTAL=0`` (read at call time).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from guardkit.orchestrator.quality_gates.test_impact import (
+    COV_OUTPUT_DIR,
+    node_file,
+    relative_path,
+    strip_context,
+)
+from guardkit.qa.diff_ingest import DiffHunk, FileDiff
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "COVERAGE_INCREMENTAL_ENV_VAR",
+    "database_path",
+    "export_json_report",
+    "incremental_coverage_enabled",
+    "invalidate_database",
+    "load_database_meta",
+    "merge_partial",
+    "store_database",
+]
+
+COVERAGE_INCREMENTAL_ENV_VAR = "GUARDKIT_COVERAGE_INCREMENTAL"
+
+_DB_FILENAME = "coverage.db"
+_META_FILENAME = "coverage_db.json"
+
+# coverage.py data file schema this merge understands (coverage 5.0+).
+_SCHEMA_VERSION = 7
+
+_META_VERSION = 1
+
+
+def incremental_coverage_enabled() -> bool:
+    """False when ``GUARDKIT_COVERAGE_INCREMENTAL`` disables the database."""
+    flag = os.environ.get(COVERAGE_INCREMENTAL_ENV_VAR, "").strip().lower()
+    return flag not in ("0", "false", "off", "no")
+
+
+def database_path(worktree_path: Path) -> Path:
+    """Location of the worktree's coverage database."""
+    return Path(worktree_path) / COV_OUTPUT_DIR / _DB_FILENAME
+
+
+def _meta_path(worktree_path: Path) -> Path:
+    return Path(worktree_path) / COV_OUTPUT_DIR / _META_FILENAME
+
+
+def load_database_meta(worktree_path: Path) -> Optional[Dict[str, str]]:
+    """Metadata of the worktree's database, or ``None`` when it is unusable.
+
+    Returns
+    -------
+    Optional[Dict[str, str]]
+        ``{"tree": ..., "source": ...}`` — the measured tree and the
+        ``--cov`` source the runs were restricted to.
+    """
+    meta_path = _meta_path(worktree_path)
+    if not meta_path.exists() or not database_path(worktree_path).exists():
+        return None
+    try:
+        data = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.debug("Coverage database: unreadable metadata %s: %s", meta_path, exc)
+        return None
+    if not isinstance(data, dict) or data.get("version") != _META_VERSION:
+        return None
+    if not data.get("tree"):
+        return None
+    return {"tree": str(data["tree"]), "source": str(data.get("source", ""))}
+
+
+def _write_meta(worktree_path: Path, tree: str, source: str) -> None:
+    meta_path = _meta_path(worktree_path)
+    tmp = meta_path.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"version": _META_VERSION, "tree": tree, "source": source}),
+        encoding="utf-8",
+    )
+    os.replace(tmp, meta_path)
+
+
+def invalidate_database(worktree_path: Path) -> None:
+    """Forget the database's tree pin; the next gate run measures in full."""
+    try:
+        _meta_path(worktree_path).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.debug("Coverage database: could not invalidate: %s", exc)
+
+
+def store_database(
+    worktree_path: Path, data_file: Path, tree: str, source: str
+) -> bool:
+    """Adopt ``data_file`` as the database for ``tree``.
+
+    ``data_file`` is moved when it already lives in the coverage output
+    directory (a merged database) and copied otherwise (a full run's
+    ``.coverage``). Never raises.
+    """
+    target = database_path(worktree_path)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if Path(data_file).parent == target.parent:
+            os.replace(data_file, target)
+        else:
+            tmp = target.with_suffix(".copy")
+            shutil.copyfile(data_file, tmp)
+            os.replace(tmp, target)
+        _write_meta(worktree_path, tree, source)
+    except OSError as exc:
+        logger.debug("Coverage database: could not store %s: %s", data_file, exc)
+        invalidate_database(worktree_path)
+        return False
+    return True
+
+
+def export_json_report(
+    worktree_path: Path,
+    python: str,
+    data_file: Path,
+    json_report: Path,
+    timeout: int = 120,
+) -> bool:
+    """Write ``coverage json`` for ``data_file`` to ``json_report``."""
+    try:
+        proc = subprocess.run(
+            [python, "-m", "coverage", "json", "-o", str(json_report)],
+            cwd=str(worktree_path),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=dict(os.environ, COVERAGE_FILE=str(data_file)),
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Coverage database: coverage json failed: %s", exc)
+        return False
+    if proc.returncode != 0 or not json_report.exists():
+        logger.debug(
+            "Coverage database: coverage json exited %d: %s",
+            proc.returncode, proc.stderr.strip(),
+        )
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Merge
+# ---------------------------------------------------------------------------
+
+
+def _line_mapper(hunks: Iterable[DiffHunk]) -> Callable[[int], Optional[int]]:
+    """Map pre-image line numbers to post-image ones across zero-context hunks.
+
+    Lines a hunk removed or rewrote map to ``None``. A pure insertion
+    (``old_count == 0``) sits *after* its ``old_start`` line.
+    """
+    spans = sorted((h.old_start, h.old_count, h.new_count) for h in hunks)
+
+    def remap(lineno: int) -> Optional[int]:
+        shift = 0
+        for start, old_count, new_count in spans:
+            if old_count == 0:
+                if lineno <= start:
+                    break
+            else:
+                if lineno < start:
+                    break
+                if lineno < start + old_count:
+                    return None
+            shift += new_count - old_count
+        return lineno + shift
+
+    return remap
+
+
+def _remap_arc_end(lineno: int, remap: Callable[[int], Optional[int]]) -> Optional[int]:
+    # Negative arc ends are code-object entries / exits (minus the object's
+    # first line); 0 is a module with no statements.
+    if lineno == 0:
+        return 0
+    mapped = remap(abs(lineno))
+    if mapped is None:
+        return None
+    return mapped if lineno > 0 else -mapped
+
+
+def _check_data_file(con: sqlite3.Connection, schema: str) -> bool:
+    try:
+        (version,) = con.execute(
+            f"select version from {schema}.coverage_schema"
+        ).fetchone()
+        row = con.execute(
+            f"select value from {schema}.meta where key = 'has_arcs'"
+        ).fetchone()
+    except (sqlite3.Error, TypeError) as exc:
+        logger.debug("Coverage database: unreadable %s data: %s", schema, exc)
+        return False
+    if version != _SCHEMA_VERSION:
+        logger.debug("Coverage database: unsupported schema %s", version)
+        return False
+    if row is None or row[0] not in ("1", "True", "true"):
+        logger.debug("Coverage database: %s data has no branch arcs", schema)
+        return False
+    return True
+
+
+def _files_by_relpath(
+    con: sqlite3.Connection, schema: str, worktree_path: Path
+) -> Dict[str, Tuple[int, str]]:
+    files: Dict[str, Tuple[int, str]] = {}
+    for file_id, path in con.execute(f"select id, path from {schema}.file"):
+        rel = relative_path(path, worktree_path)
+        if rel is not None:
+            files[rel] = (file_id, path)
+    return files
+
+
+def _dropped_context_ids(
+    con: sqlite3.Connection, node_ids: Set[str], node_files: Set[str]
+) -> List[int]:
+    dropped: List[int] = []
+    for context_id, label in con.execute("select id, context from context"):
+        node_id = strip_context(label)
+        if node_id is None:
+            continue
+        if node_id in node_ids or node_file(node_id) in node_files:
+            dropped.append(context_id)
+    return dropped
+
+
+def _delete_file_rows(con: sqlite3.Connection, file_id: int) -> None:
+    for table in ("arc", "line_bits"):
+        con.execute(f"delete from {table} where file_id = ?", (file_id,))
+    con.execute("delete from tracer where file_id = ?", (file_id,))
+    con.execute("delete from file where id = ?", (file_id,))
+
+
+def _remap_file_arcs(
+    con: sqlite3.Connection, file_id: int, remap: Callable[[int], Optional[int]]
+) -> None:
+    rows = con.execute(
+        "select context_id, fromno, tono from arc where file_id = ?", (file_id,)
+    ).fetchall()
+    con.execute("delete from arc where file_id = ?", (file_id,))
+    mapped = []
+    for context_id, fromno, tono in rows:
+        new_from = _remap_arc_end(fromno, remap)
+        new_to = _remap_arc_end(tono, remap)
+        if new_from is None or new_to is None:
+            continue
+        mapped.append((file_id, context_id, new_from, new_to))
+    con.executemany(
+        "insert or ignore into arc (file_id, context_id, fromno, tono) "
+        "values (?, ?, ?, ?)",
+        mapped,
+    )
+
+
+def merge_partial(
+    base: Path,
+    partial: Path,
+    out: Path,
+    worktree_path: Path,
+    diffs: Iterable[FileDiff],
+    rerun_targets: Iterable[str],
+) -> bool:
+    """Merge a partial context-recording run into a copy of the database.
+
+    Parameters
+    ----------
+    base : Path
+        The database, measured at the tree ``diffs`` start from.
+    partial : Path
+        Coverage data of the re-run tests, measured at the tree ``diffs``
+        end at.
+    out : Path
+        Where the merged data file is written (replaced).
+    worktree_path : Path
+        Root the data files' absolute paths live under.
+    diffs : Iterable[FileDiff]
+        Zero-context diff from the base tree to the partial run's tree.
+    rerun_targets : Iterable[str]
+        pytest targets of the partial run — node ids or test files.
+
+    Returns
+    -------
+    bool
+        True when ``out`` holds the merged data; False when the merge
+        declined (see the module docstring) and a full run is needed.
+    """
+    worktree_path = Path(worktree_path)
+    diffs = tuple(diffs)
+    node_ids: Set[str] = set()
+    node_files: Set[str] = set()
+    for target in rerun_targets:
+        if "::" in target:
+            node_ids.add(target)
+        else:
+            node_files.add(target)
+    for file_diff in diffs:
+        # Contexts of a changed / deleted test file are stale wholesale; the
+        # surviving tests in it were re-run (changed test files always are).
+        node_files.add(file_diff.path)
+        if file_diff.old_path:
+            node_files.add(file_diff.old_path)
+
+    tmp_out = out.with_suffix(".merging")
+    try:
+        shutil.copyfile(base, tmp_out)
+        con = sqlite3.connect(str(tmp_out))
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Coverage database: cannot open merge target: %s", exc)
+        return False
+
+    try:
+        merged = _merge_into(con, partial, worktree_path, diffs, node_ids, node_files)
+    except sqlite3.Error as exc:
+        logger.debug("Coverage database: merge failed: %s", exc)
+        merged = False
+    finally:
+        con.close()
+
+    try:
+        if merged:
+            os.replace(tmp_out, out)
+    except OSError as exc:
+        logger.debug("Coverage database: cannot write %s: %s", out, exc)
+        merged = False
+    finally:
+        if tmp_out.exists():
+            tmp_out.unlink()
+    return merged
+
+
+def _merge_into(
+    con: sqlite3.Connection,
+    partial: Path,
+    worktree_path: Path,
+    diffs: Tuple[FileDiff, ...],
+    node_ids: Set[str],
+    node_files: Set[str],
+) -> bool:
+    con.execute("attach database ? as partial", (str(partial),))
+    if not (_check_data_file(con, "main") and _check_data_file(con, "partial")):
+        return False
+    dropped = _dropped_context_ids(con, node_ids, node_files)
+    con.executemany(
+        "delete from arc where context_id = ?", ((cid,) for cid in dropped)
+    )
+    con.executemany(
+        "delete from context where id = ?", ((cid,) for cid in dropped)
+    )
+
+    base_files = _files_by_relpath(con, "main", worktree_path)
+    partial_files = _files_by_relpath(con, "partial", worktree_path)
+    root = worktree_path.resolve()
+    for file_diff in diffs:
+        old_path = file_diff.old_path or file_diff.path
+        if old_path not in base_files:
+            continue
+        file_id, _ = base_files[old_path]
+        if file_diff.change_kind == "deleted":
+            _delete_file_rows(con, file_id)
+            continue
+        if file_diff.path.endswith(".py") and file_diff.path not in partial_files:
+            # Import-time arcs of the changed lines would be lost.
+            logger.info(
+                "Coverage database: changed %s was not re-measured; "
+                "running full coverage",
+                file_diff.path,
+            )
+            return False
+        if file_diff.hunks:
+            _remap_file_arcs(con, file_id, _line_mapper(file_diff.hunks))
+        if file_diff.path != old_path:
+            con.execute(
+                "update file set path = ? where id = ?",
+                (str(root / file_diff.path), file_id),
+            )
+
+    con.execute(
+        "insert or ignore into context (context) "
+        "select context from partial.context"
+    )
+    con.execute(
+        "insert or ignore into file (path) select path from partial.file"
+    )
+    con.execute(
+        "insert or ignore into arc (file_id, context_id, fromno, tono) "
+        "select f.id, c.id, a.fromno, a.tono from partial.arc a "
+        "join partial.file pf on pf.id = a.file_id "
+        "join file f on f.path = pf.path "
+        "join partial.context pc on pc.id = a.context_id "
+        "join context c on c.context = pc.context"
+    )
+    con.execute(
+        "insert or ignore into tracer (file_id, tracer) "
+        "select f.id, t.tracer from partial.tracer t "
+        "join partial.file pf on pf.id = t.file_id "
+        "join file f on f.path = pf.path"
+    )
+    con.commit()
+    return True
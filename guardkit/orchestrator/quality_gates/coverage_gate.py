@@ -10,6 +10,11 @@ Design:
       symbol extents.
     * Symbol extraction: Python AST (``ast`` module) for authored Python files;
       non-Python stacks degrade to absent-signal (``None``).
+    * Incremental runs: with test impact analysis on, the context-recording
+      run is kept as a per-worktree coverage database
+      (:mod:`~guardkit.orchestrator.quality_gates.coverage_db`); later turns
+      re-run only the tests the diff can affect and merge them in. Symbol
+      tables are cached by source content hash.
     * Zero-execution only: a symbol with any executed line is not flagged
       (v0 policy).
     * Advisory only: findings surface as ``should_fix`` feedback; they never
@@ -30,20 +35,46 @@ Acceptance criteria:
 from __future__ import annotations
 
 import ast
+import copy
+import hashlib
 import json
 import logging
 import os
 import subprocess
 import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from guardkit.orchestrator.quality_gates.coverage_db import (
+    database_path,
+    export_json_report,
+    incremental_coverage_enabled,
+    load_database_meta,
+    merge_partial,
+    store_database,
+)
+from guardkit.orchestrator.quality_gates.test_impact import (
+    load_index,
+    record_test_impact,
+    select_impacted_tests,
+    snapshot_tree,
+    test_impact_enabled,
+)
+
 logger = logging.getLogger(__name__)
 
 # Task-type gate: only these types run the coverage gate.
 _GATE_TASK_TYPES = frozenset({"FEATURE", "REFACTOR", "INTEGRATION"})
 
+# Symbol tables keyed by a hash of the source text: an authored file the
+# turn did not touch is not re-parsed. Bounded LRU, shared across worktrees.
+_SYMBOL_CACHE_MAX_ENTRIES = 1024
+_symbol_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+_symbol_cache_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -111,7 +142,8 @@ def _extract_public_symbols(file_path: Path) -> List[Dict[str, Any]]:
 
     A symbol is "public" if its name does not start with an underscore
     (following Python convention). Only top-level functions and classes
-    are extracted (nested functions/classes are ignored).
+    are extracted (nested functions/classes are ignored). Results are
+    cached by source content hash; callers get fresh dicts.
 
     Parameters
     ----------
@@ -130,6 +162,15 @@ def _extract_public_symbols(file_path: Path) -> List[Dict[str, Any]]:
         logger.warning("Cannot read %s for symbol extraction: %s", file_path, exc)
         return []
 
+    key = hashlib.blake2b(
+        source.encode("utf-8", "surrogatepass"), digest_size=16
+    ).hexdigest()
+    with _symbol_cache_lock:
+        cached = _symbol_cache.get(key)
+        if cached is not None:
+            _symbol_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
     try:
         tree = ast.parse(source, filename=str(file_path))
     except SyntaxError as exc:
@@ -155,6 +196,10 @@ def _extract_public_symbols(file_path: Path) -> List[Dict[str, Any]]:
                     "executed_lines": [],
                 })
 
+    with _symbol_cache_lock:
+        _symbol_cache[key] = copy.deepcopy(symbols)
+        while len(_symbol_cache) > _SYMBOL_CACHE_MAX_ENTRIES:
+            _symbol_cache.popitem(last=False)
     return symbols
 
 
@@ -437,10 +482,29 @@ def _run_coverage(
         d for d in worktree_path.rglob("*")
         if d.is_dir() and (d / "__init__.py").exists()
     ]
+    cov_source = ""
     if py_packages:
         # Use the first top-level package as coverage source.
-        src_pkg = py_packages[0].name
-        cmd.extend(["--cov", src_pkg])
+        cov_source = py_packages[0].name
+        cmd.extend(["--cov", cov_source])
+
+    # Test impact analysis: record per-test contexts so the Coach can map a
+    # later turn's changed lines to the tests that execute them. The tree is
+    # snapshotted first so the index is pinned to what was measured.
+    impact_tree: Optional[str] = None
+    if test_impact_enabled():
+        impact_tree = snapshot_tree(worktree_path)
+        if impact_tree is not None:
+            cmd.append("--cov-context=test")
+
+    if (
+        impact_tree is not None
+        and incremental_coverage_enabled()
+        and _run_incremental_coverage(
+            worktree_path, venv_python, cov_source, impact_tree, json_report, timeout
+        )
+    ):
+        return _parse_coverage_json(json_report, authored_files, worktree_path)
 
     logger.info(
         "Coverage gate: running pytest under coverage for %s (timeout=%ds)",
@@ -489,6 +553,12 @@ def _run_coverage(
             result.returncode, worktree_path,
         )
 
+    if impact_tree is not None:
+        index = record_test_impact(worktree_path, venv_python, impact_tree)
+        data_file = worktree_path / ".coverage"
+        if index is not None and incremental_coverage_enabled() and data_file.exists():
+            store_database(worktree_path, data_file, impact_tree, cov_source)
+
     # Parse the coverage JSON report.
     if not json_report.exists():
         logger.warning(
@@ -501,6 +571,117 @@ def _run_coverage(
     return _parse_coverage_json(json_report, authored_files, worktree_path)
 
 
+def _run_incremental_coverage(
+    worktree_path: Path,
+    python: str,
+    cov_source: str,
+    tree: str,
+    json_report: Path,
+    timeout: int,
+) -> bool:
+    """Bring the coverage database up to ``tree`` and report from it.
+
+    Re-runs only the tests the diff since the database's tree can affect,
+    under per-test contexts, and merges them into the database. Writes
+    ``json_report`` exactly as a full run would.
+
+    Parameters
+    ----------
+    worktree_path : Path
+        Root of the worktree.
+    python : str
+        Interpreter that runs pytest and coverage.
+    cov_source : str
+        ``--cov`` source of this run; the database must match it.
+    tree : str
+        Snapshot of the worktree taken before this gate run.
+    json_report : Path
+        Where the coverage JSON report is written.
+    timeout : int
+        Timeout in seconds for the partial run.
+
+    Returns
+    -------
+    bool
+        True when ``json_report`` is up to date; False when the caller must
+        run the full suite (no usable database, a selection the test-impact
+        index cannot vouch for, a failed or declined merge).
+    """
+    if not cov_source:
+        return False
+    meta = load_database_meta(worktree_path)
+    if meta is None or meta["source"] != cov_source:
+        return False
+    index = load_index(worktree_path)
+    if index is None or index.tree != meta["tree"]:
+        return False
+
+    database = database_path(worktree_path)
+    if tree == index.tree:
+        logger.info(
+            "Coverage gate: %s unchanged since the last measurement; "
+            "reporting from the coverage database",
+            worktree_path,
+        )
+        return export_json_report(worktree_path, python, database, json_report, timeout)
+
+    selection = select_impacted_tests(worktree_path, index)
+    if selection is None or selection.tree != tree:
+        return False
+
+    partial = database.with_name("coverage.partial")
+    merged = database.with_name("coverage.merged")
+    cmd = [
+        python, "-m", "pytest",
+        "-q",
+        "--tb=short",
+        "--cov-report=",
+        "--cov-branch",
+        "--cov-context=test",
+        "--cov", cov_source,
+        "-p", "no:cacheprovider",
+        *selection.targets,
+    ]
+    logger.info(
+        "Coverage gate: re-running %d impacted test target(s) under coverage "
+        "for %s (timeout=%ds)",
+        len(selection.targets), worktree_path, timeout,
+    )
+    try:
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=str(worktree_path),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=dict(os.environ, COVERAGE_FILE=str(partial)),
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.warning(
+                "Coverage gate: incremental run failed for %s: %s; "
+                "running full coverage.",
+                worktree_path, exc,
+            )
+            return False
+        if result.returncode == 5 or not partial.exists():
+            return False
+        if not merge_partial(
+            database, partial, merged, worktree_path,
+            selection.diffs, selection.targets,
+        ):
+            return False
+        if not export_json_report(worktree_path, python, merged, json_report, timeout):
+            return False
+        if record_test_impact(worktree_path, python, tree, data_file=merged) is None:
+            return False
+        return store_database(worktree_path, merged, tree, cov_source)
+    finally:
+        for leftover in (partial, merged):
+            if leftover.exists():
+                leftover.unlink()
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -10,6 +10,13 @@ Architecture:
     - Substring matching for simple patterns (10x faster than regex)
     - Regex only when pattern matching is required
     - Path-based filtering to limit checks to relevant file types
+    - One pass per file: a combined literal prefilter skips files and lines
+      no check can match, and remaining lines go only to the checks whose
+      literals they contain
+    - Excluded directories pruned during the walk; files scanned on a
+      thread pool; optional incremental mode that rescans only files changed
+      since the last checkpoint commit and carries the previous scan's
+      findings forward for the rest
 
 Security Checks Implemented:
     Python (6 checks):
@@ -43,9 +50,15 @@ Example:
     ...     print(f"[{finding.severity}] {finding.check_id}: {finding.description}")
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
-from dataclasses import dataclass
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Literal, Optional, Pattern, Set, Tuple, Union
 
@@ -59,6 +72,41 @@ logger = logging.getLogger(__name__)
 # Maximum length for matched text in findings (prevents excessive output)
 MAX_MATCHED_TEXT_LENGTH = 200
 
+# Subject prefix of WorktreeCheckpointManager commits (incremental mode base)
+CHECKPOINT_SUBJECT_PREFIX = "[guardkit-checkpoint]"
+
+# Per-file findings of the last incremental-mode scan, kept in the worktree's
+# git dir (``git rev-parse --git-path``) so checkpoint commits never stage it
+SCAN_CACHE_GIT_PATH = "guardkit-security-scan.json"
+_SCAN_CACHE_VERSION = 1
+
+# Opt-in: SecurityReviewer scans only files changed since the last checkpoint
+INCREMENTAL_SCAN_ENV_VAR = "GUARDKIT_SECURITY_SCAN_INCREMENTAL"
+
+# Worker thread override for the file scan
+SCAN_WORKERS_ENV_VAR = "GUARDKIT_SECURITY_SCAN_WORKERS"
+
+# Below this many files the thread pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+_GIT_TIMEOUT_SECONDS = 30
+
+
+def incremental_scan_enabled() -> bool:
+    """Return True when ``GUARDKIT_SECURITY_SCAN_INCREMENTAL`` opts in."""
+    raw = os.environ.get(INCREMENTAL_SCAN_ENV_VAR, "").strip().lower()
+    return raw in {"1", "true", "yes", "on"}
+
+
+def _default_workers() -> int:
+    raw = os.environ.get(SCAN_WORKERS_ENV_VAR, "").strip()
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {SCAN_WORKERS_ENV_VAR}={raw!r}")
+    return min(8, os.cpu_count() or 1)
+
 
 # ============================================================================
 # Data Models
@@ -116,6 +164,10 @@ class SecurityCheck:
     regex_pattern: Optional[Pattern] = None
     # Function to filter false positives
     false_positive_filter: Optional[Callable[[str, int, List[str]], bool]] = None
+    # Literals every match of ``regex_pattern`` must contain (prefilter).
+    # Substring checks use ``substrings``; a regex check without anchors is
+    # never prefiltered out.
+    anchors: Optional[List[str]] = None
 
 
 # ============================================================================
@@ -254,6 +306,7 @@ PYTHON_CHECKS: List[SecurityCheck] = [
         recommendation="Use environment variables or a secrets manager instead of hardcoding credentials",
         file_extensions={".py"},
         regex_pattern=re.compile(r'(API_KEY|PASSWORD|SECRET)\s*=\s*["\'][^"\']+["\']'),
+        anchors=["API_KEY", "PASSWORD", "SECRET"],
         false_positive_filter=_filter_hardcoded_secrets,
     ),
     SecurityCheck(
@@ -263,6 +316,7 @@ PYTHON_CHECKS: List[SecurityCheck] = [
         recommendation="Use parameterized queries (cursor.execute(query, params)) instead of string formatting",
         file_extensions={".py"},
         regex_pattern=re.compile(r'f["\']SELECT.*\{'),
+        anchors=["SELECT"],
         false_positive_filter=_filter_sql_injection,
     ),
     SecurityCheck(
@@ -298,6 +352,7 @@ PYTHON_CHECKS: List[SecurityCheck] = [
         recommendation="Ensure DEBUG is set to False in production. Use environment variables to control debug mode.",
         file_extensions={".py"},
         regex_pattern=re.compile(r'DEBUG\s*=\s*True'),
+        anchors=["DEBUG"],
     ),
 ]
 
@@ -355,6 +410,7 @@ UNIVERSAL_CHECKS: List[SecurityCheck] = [
         recommendation="Specify explicit origins instead of using wildcard (*) for CORS.",
         file_extensions={".py", ".js", ".ts", ".jsx", ".tsx"},
         regex_pattern=re.compile(r'(?:allow_origins|origin)\s*[=:]\s*\[?\s*["\']?\*["\']?'),
+        anchors=["origin"],
     ),
 ]
 
@@ -368,6 +424,7 @@ GHA_CHECKS: List[SecurityCheck] = [
         file_extensions={".yml", ".yaml"},
         # Match github.event context usage - the false_positive_filter determines if it's dangerous
         regex_pattern=re.compile(r'\$\{\{\s*github\.event'),
+        anchors=["github.event"],
         false_positive_filter=_filter_gha_injection,
     ),
 ]
@@ -408,7 +465,8 @@ class SecurityChecker:
     # All source extensions
     SOURCE_EXTENSIONS = PYTHON_EXTENSIONS | JS_EXTENSIONS | WORKFLOW_EXTENSIONS
 
-    # Directories to skip
+    # Directories to skip, matched only below the worktree root: AutoBuild
+    # worktrees live under .guardkit/worktrees/ and must still be scanned
     SKIP_DIRS = {
         ".git",
         "node_modules",
@@ -433,7 +491,7 @@ class SecurityChecker:
         "info": 4,
     }
 
-    def __init__(self, worktree_path: Union[str, Path]):
+    def __init__(self, worktree_path: Union[str, Path], max_workers: Optional[int] = None):
         """
         Initialize SecurityChecker.
 
@@ -441,49 +499,69 @@ class SecurityChecker:
         ----------
         worktree_path : Union[str, Path]
             Path to the worktree to check
+        max_workers : Optional[int]
+            Threads used to scan files. Defaults to
+            ``GUARDKIT_SECURITY_SCAN_WORKERS`` or ``min(8, cpu_count)``;
+            1 scans serially.
         """
         self.worktree_path = Path(worktree_path)
+        self.max_workers = max(1, max_workers if max_workers is not None else _default_workers())
+        self._scanners: Dict[Tuple[str, bool], "_CompiledScanner"] = {}
         logger.debug(f"SecurityChecker initialized for: {self.worktree_path}")
 
-    def run_quick_checks(self) -> List[SecurityFinding]:
+    def run_quick_checks(self, incremental: bool = False) -> List[SecurityFinding]:
         """
         Run all quick security checks and return findings.
 
+        Parameters
+        ----------
+        incremental : bool
+            Only rescan source files changed since the last checkpoint commit
+            (see :meth:`_incremental_plan`); every other file keeps the
+            findings the previous incremental scan recorded for the same
+            content, so the result matches a full scan. Falls back to a full
+            scan when there is no checkpoint, no previous scan (or one made
+            with a different check set), or git cannot answer.
+
         Returns
         -------
         List[SecurityFinding]
             List of findings sorted by severity (critical first)
         """
         logger.info(f"Starting security checks in {self.worktree_path}")
-        findings: List[SecurityFinding] = []
-
-        # Collect all checks
-        all_checks = PYTHON_CHECKS + JS_CHECKS + UNIVERSAL_CHECKS + GHA_CHECKS
-
-        # Scan files
-        for file_path in self._iter_source_files():
-            file_ext = file_path.suffix.lower()
-            rel_path = str(file_path.relative_to(self.worktree_path))
-
-            # Special handling for GHA files - must be in .github/workflows
-            is_workflow_file = ".github/workflows" in str(file_path) and file_ext in self.WORKFLOW_EXTENSIONS
-
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                lines = content.splitlines()
-
-                for check in all_checks:
-                    # Path-based filtering
-                    if not self._check_applies_to_file(check, file_ext, is_workflow_file):
-                        continue
 
-                    # Run the check
-                    check_findings = self._run_check(check, file_path, rel_path, file_ext, lines)
-                    findings.extend(check_findings)
-
-            except Exception as e:
-                logger.warning(f"Error reading {file_path}: {e}")
-                continue
+        files: Optional[List[Path]] = None
+        carried: Dict[str, Tuple[Optional[str], List[SecurityFinding]]] = {}
+        if incremental:
+            plan = self._incremental_plan()
+            if plan is not None:
+                files, carried = plan
+                logger.info(
+                    f"Incremental security scan: {len(files)} file(s) rescanned, "
+                    f"{len(carried)} carried forward"
+                )
+        if files is None:
+            files = list(self._iter_source_files())
+
+        # Findings are gathered per file in walk order, so the result does not
+        # depend on how the pool schedules files.
+        if self.max_workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="security-scan"
+            ) as pool:
+                scanned = list(pool.map(self._scan_entry, files))
+        else:
+            scanned = [self._scan_entry(file_path) for file_path in files]
+        per_file = list(zip(map(self._rel, files), scanned))
+
+        if incremental:
+            self._save_scan_cache({**carried, **dict(per_file)})
+        if carried:
+            # Carried-forward files interleave with the rescanned ones by path.
+            per_file = sorted({**carried, **dict(per_file)}.items())
+        findings: List[SecurityFinding] = [
+            finding for _, (_, file_findings) in per_file for finding in file_findings
+        ]
 
         # Sort by severity
         findings.sort(key=lambda f: self.SEVERITY_ORDER.get(f.severity, 5))
@@ -491,27 +569,192 @@ class SecurityChecker:
         logger.info(f"Security checks complete: {len(findings)} finding(s)")
         return findings
 
+    def _scan_file(self, file_path: Path) -> List[SecurityFinding]:
+        """
+        Run every applicable check over one file in a single pass.
+
+        Parameters
+        ----------
+        file_path : Path
+            Absolute path to the file
+
+        Returns
+        -------
+        List[SecurityFinding]
+            Findings grouped by check (registry order), then by line
+        """
+        return self._scan_entry(file_path)[1]
+
+    def _scan_entry(self, file_path: Path) -> Tuple[Optional[str], List[SecurityFinding]]:
+        """Scan one file; also return the git blob id of the content scanned."""
+        file_ext = file_path.suffix.lower()
+        rel_path = self._rel(file_path)
+
+        # Special handling for GHA files - must be in .github/workflows
+        is_workflow_file = ".github/workflows" in str(file_path) and file_ext in self.WORKFLOW_EXTENSIONS
+
+        try:
+            data = file_path.read_bytes()
+            content = data.decode("utf-8", errors="ignore")
+            findings = self._scanner_for(file_ext, is_workflow_file).scan(content, rel_path)
+        except Exception as e:
+            logger.warning(f"Error reading {file_path}: {e}")
+            return None, []
+        return _git_blob_id(data), findings
+
+    def _rel(self, file_path: Path) -> str:
+        return str(file_path.relative_to(self.worktree_path))
+
+    def _scanner_for(self, file_ext: str, is_workflow_file: bool) -> "_CompiledScanner":
+        """Return the compiled scanner for a file kind, building it once."""
+        key = (file_ext, is_workflow_file)
+        scanner = self._scanners.get(key)
+        if scanner is None:
+            checks = [
+                check
+                for check in PYTHON_CHECKS + JS_CHECKS + UNIVERSAL_CHECKS + GHA_CHECKS
+                if self._check_applies_to_file(check, file_ext, is_workflow_file)
+            ]
+            scanner = self._scanners.setdefault(key, _CompiledScanner(checks, file_ext))
+        return scanner
+
     def _iter_source_files(self):
         """
         Iterate over source files in the worktree.
 
+        Excluded directories are pruned during the walk, so trees such as
+        ``node_modules`` are never descended into. Directories and files are
+        visited in sorted order.
+
         Yields
         ------
         Path
             Path to each source file
         """
-        for path in self.worktree_path.rglob("*"):
-            # Skip directories
-            if path.is_dir():
-                continue
+        for dirpath, dirnames, filenames in os.walk(self.worktree_path):
+            dirnames[:] = sorted(d for d in dirnames if d not in self.SKIP_DIRS)
+            for name in sorted(filenames):
+                if os.path.splitext(name)[1].lower() in self.SOURCE_EXTENSIONS:
+                    yield Path(dirpath, name)
 
-            # Skip files in excluded directories
-            if any(skip_dir in path.parts for skip_dir in self.SKIP_DIRS):
-                continue
+    def _incremental_plan(
+        self,
+    ) -> Optional[Tuple[List[Path], Dict[str, Tuple[Optional[str], List[SecurityFinding]]]]]:
+        """
+        Split the worktree into files to rescan and findings to carry forward.
 
-            # Check if it's a source file
-            if path.suffix.lower() in self.SOURCE_EXTENSIONS:
-                yield path
+        Files changed, added or untracked since the most recent
+        ``[guardkit-checkpoint]`` commit reachable from HEAD are rescanned. A
+        file untouched since the checkpoint has the checkpoint's content, so
+        its findings carry forward when the previous scan saw that same blob.
+        Files the previous scan did not see (or saw at other content) are
+        rescanned with the changed ones.
+
+        Returns
+        -------
+        Optional[Tuple[List[Path], Dict[str, Tuple[Optional[str], List[SecurityFinding]]]]]
+            Sorted files to scan and the carried-forward entries keyed by
+            relative path, or None when a full scan is needed
+        """
+        cache = self._load_scan_cache()
+        if cache is None:
+            return None
+        try:
+            checkpoint = self._last_checkpoint()
+            if not checkpoint:
+                return None
+            touched = self._touched_since(checkpoint)
+            tree = self._git("ls-tree", "-r", "-z", checkpoint)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"Incremental security scan unavailable, scanning everything: {e}")
+            return None
+
+        files = set(self._existing_sources(touched))
+        carried: Dict[str, Tuple[Optional[str], List[SecurityFinding]]] = {}
+        for record in tree.split("\0"):
+            meta, _, rel = record.partition("\t")
+            if not rel or rel in touched or not self._is_source(rel):
+                continue
+            blob = meta.split()[2]
+            cached = cache.get(rel)
+            if cached is not None and cached[0] == blob:
+                carried[rel] = cached
+            elif (self.worktree_path / rel).is_file():
+                files.add(self.worktree_path / rel)
+        return sorted(files), carried
+
+    def _last_checkpoint(self) -> str:
+        return self._git(
+            "log", "-1", "--format=%H", f"--grep=^{re.escape(CHECKPOINT_SUBJECT_PREFIX)}", "HEAD"
+        ).strip()
+
+    def _touched_since(self, checkpoint: str) -> Set[str]:
+        """Relative paths changed, added, deleted or untracked since ``checkpoint``."""
+        changed = self._git("diff", "--name-only", "--relative", "--no-renames", "-z", checkpoint, "--")
+        untracked = self._git("ls-files", "--others", "--exclude-standard", "-z")
+        return {rel for rel in (changed + untracked).split("\0") if rel}
+
+    def _is_source(self, rel: str) -> bool:
+        parts = Path(rel).parts
+        if any(part in self.SKIP_DIRS for part in parts[:-1]):
+            return False
+        return os.path.splitext(rel)[1].lower() in self.SOURCE_EXTENSIONS
+
+    def _existing_sources(self, rels: Set[str]) -> Set[Path]:
+        return {
+            self.worktree_path / rel
+            for rel in rels
+            if self._is_source(rel) and (self.worktree_path / rel).is_file()
+        }
+
+    def _scan_cache_path(self) -> Path:
+        git_path = self._git("rev-parse", "--git-path", SCAN_CACHE_GIT_PATH).strip()
+        return self.worktree_path / git_path
+
+    def _load_scan_cache(self) -> Optional[Dict[str, Tuple[Optional[str], List[SecurityFinding]]]]:
+        """Entries of the previous incremental scan, or None if unusable."""
+        try:
+            raw = json.loads(self._scan_cache_path().read_text(encoding="utf-8"))
+            if raw.get("version") != _SCAN_CACHE_VERSION or raw.get("checks") != _checks_fingerprint():
+                return None
+            return {
+                rel: (entry["blob"], [SecurityFinding(**f) for f in entry["findings"]])
+                for rel, entry in raw["files"].items()
+            }
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError,
+                ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"No usable security scan cache: {e}")
+            return None
+
+    def _save_scan_cache(self, entries: Dict[str, Tuple[Optional[str], List[SecurityFinding]]]) -> None:
+        """Record per-file findings for the next incremental scan (best effort)."""
+        payload = {
+            "version": _SCAN_CACHE_VERSION,
+            "checks": _checks_fingerprint(),
+            "files": {
+                rel: {"blob": blob, "findings": [asdict(f) for f in findings]}
+                for rel, (blob, findings) in entries.items()
+                if blob is not None
+            },
+        }
+        try:
+            path = self._scan_cache_path()
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp, path)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"Could not write security scan cache: {e}")
+
+    def _git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        ).stdout
 
     def _check_applies_to_file(
         self, check: SecurityCheck, file_ext: str, is_workflow_file: bool
@@ -579,52 +822,178 @@ class SecurityChecker:
             if _is_comment_line(line, file_ext):
                 continue
 
-            # Check for match
-            matched = False
-            matched_text = ""
-
-            if check.substrings:
-                # Substring matching (fast)
-                for substring in check.substrings:
-                    if substring in line:
-                        matched = True
-                        matched_text = line.strip()
-                        break
-            elif check.regex_pattern:
-                # Regex matching
-                match = check.regex_pattern.search(line)
-                if match:
-                    matched = True
-                    matched_text = match.group(0)
-
-            if not matched:
-                continue
-
-            # Apply false positive filter
-            if check.false_positive_filter:
-                if check.false_positive_filter(line, line_num, lines):
-                    continue  # Skip this match (false positive)
-
-            # Create finding
-            finding = SecurityFinding(
-                check_id=check.check_id,
-                severity=check.severity,
-                description=check.description,
-                file_path=rel_path,
-                line_number=line_num,
-                matched_text=matched_text[:MAX_MATCHED_TEXT_LENGTH],
-                recommendation=check.recommendation,
-            )
-            findings.append(finding)
+            finding = _match_line(check, rel_path, line, line_num, lines)
+            if finding is not None:
+                findings.append(finding)
 
         return findings
 
 
+# ============================================================================
+# Compiled Scanner
+# ============================================================================
+
+
+def _git_blob_id(data: bytes) -> str:
+    """The id ``git hash-object`` gives ``data`` (as ``ls-tree`` reports it)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _checks_fingerprint() -> str:
+    """Hash of the check registry, so a changed check set voids the scan cache.
+
+    Covers what decides a finding: ids, severity, file types, substrings,
+    regex patterns and anchors, and the false-positive filters' code.
+    """
+    digest = hashlib.sha256()
+    for check in PYTHON_CHECKS + JS_CHECKS + UNIVERSAL_CHECKS + GHA_CHECKS:
+        regex = check.regex_pattern
+        fp_filter = check.false_positive_filter
+        code = getattr(fp_filter, "__code__", None)
+        digest.update(repr((
+            check.check_id,
+            check.severity,
+            check.description,
+            check.recommendation,
+            sorted(check.file_extensions),
+            check.substrings,
+            (regex.pattern, regex.flags) if regex is not None else None,
+            check.anchors,
+            (fp_filter.__qualname__, _code_key(code)) if code is not None else None,
+        )).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _code_key(code) -> tuple:
+    """Bytecode and constants, recursing into nested code (whose repr has an address)."""
+    return (
+        code.co_code,
+        tuple(_code_key(c) if hasattr(c, "co_code") else c for c in code.co_consts),
+    )
+
+
+def _match_line(
+    check: SecurityCheck,
+    rel_path: str,
+    line: str,
+    line_num: int,
+    lines: List[str],
+) -> Optional[SecurityFinding]:
+    """
+    Evaluate one check against one (non-comment) line.
+
+    Returns
+    -------
+    Optional[SecurityFinding]
+        The finding, or None when the check does not match or the match is a
+        false positive
+    """
+    matched = False
+    matched_text = ""
+
+    if check.substrings:
+        # Substring matching (fast)
+        for substring in check.substrings:
+            if substring in line:
+                matched = True
+                matched_text = line.strip()
+                break
+    elif check.regex_pattern:
+        # Regex matching
+        match = check.regex_pattern.search(line)
+        if match:
+            matched = True
+            matched_text = match.group(0)
+
+    if not matched:
+        return None
+
+    # Apply false positive filter
+    if check.false_positive_filter:
+        if check.false_positive_filter(line, line_num, lines):
+            return None  # Skip this match (false positive)
+
+    return SecurityFinding(
+        check_id=check.check_id,
+        severity=check.severity,
+        description=check.description,
+        file_path=rel_path,
+        line_number=line_num,
+        matched_text=matched_text[:MAX_MATCHED_TEXT_LENGTH],
+        recommendation=check.recommendation,
+    )
+
+
+class _CompiledScanner:
+    """
+    All checks that apply to one kind of file, evaluated in one pass.
+
+    A single alternation of every check's literals (``substrings`` or
+    ``anchors``) acts as the prefilter: a file with no literal anywhere is
+    skipped without splitting it into lines, and a line with none is skipped
+    without consulting any check. Lines that pass are dispatched only to the
+    checks whose literals they contain, which then apply their exact
+    substring/regex match and false positive filter as before.
+
+    Findings are returned grouped by check in registry order, then by line,
+    which is the order the per-check scan produced.
+    """
+
+    def __init__(self, checks: List[SecurityCheck], file_ext: str):
+        self.checks = checks
+        self.file_ext = file_ext
+        self._literals: List[Optional[Tuple[str, ...]]] = [
+            tuple(check.substrings or check.anchors or ()) or None for check in checks
+        ]
+        self._unanchored = any(group is None for group in self._literals)
+        # Longest first so the alternation never stops at a shorter prefix.
+        literals = sorted(
+            {lit for group in self._literals if group for lit in group},
+            key=len,
+            reverse=True,
+        )
+        self._prefilter: Optional[Pattern] = (
+            re.compile("|".join(map(re.escape, literals))) if literals else None
+        )
+
+    def _candidate(self, text: str) -> bool:
+        if self._unanchored:
+            return True
+        return self._prefilter is not None and self._prefilter.search(text) is not None
+
+    def scan(self, content: str, rel_path: str) -> List[SecurityFinding]:
+        """Scan file content; see the class docstring for ordering."""
+        if not self.checks or not self._candidate(content):
+            return []
+
+        lines = content.splitlines()
+        per_check: List[List[SecurityFinding]] = [[] for _ in self.checks]
+
+        for line_num, line in enumerate(lines, start=1):
+            if not self._candidate(line):
+                continue
+            # Skip comment lines (basic heuristic)
+            if _is_comment_line(line, self.file_ext):
+                continue
+            for index, check in enumerate(self.checks):
+                group = self._literals[index]
+                if group is not None and not any(lit in line for lit in group):
+                    continue
+                finding = _match_line(check, rel_path, line, line_num, lines)
+                if finding is not None:
+                    per_check[index].append(finding)
+
+        return [finding for findings in per_check for finding in findings]
+
+
 # ============================================================================
 # Public API
 # ============================================================================
 
 __all__ = [
+    "INCREMENTAL_SCAN_ENV_VAR",
+    "SCAN_CACHE_GIT_PATH",
     "SecurityChecker",
     "SecurityFinding",
+    "incremental_scan_enabled",
 ]
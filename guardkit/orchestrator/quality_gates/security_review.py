@@ -47,6 +47,7 @@ from typing import Any, Dict, List, Optional, Union
 from guardkit.orchestrator.quality_gates.security_checker import (
     SecurityChecker,
     SecurityFinding,
+    incremental_scan_enabled,
 )
 from guardkit.orchestrator.security_config import SecurityConfig, SecurityLevel
 
@@ -260,7 +261,9 @@ class SecurityReviewer:
         if self.worktree_path.exists():
             try:
                 checker = SecurityChecker(self.worktree_path)
-                findings = checker.run_quick_checks()
+                findings = checker.run_quick_checks(
+                    incremental=incremental_scan_enabled()
+                )
             except Exception as e:
                 logger.error(f"Security check failed: {e}")
                 # Return empty result on error
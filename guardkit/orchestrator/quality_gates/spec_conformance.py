@@ -34,12 +34,18 @@ Three moving parts:
 
 from __future__ import annotations
 
+import copy
 import difflib
+import hashlib
 import json
 import logging
+import os
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing_extensions import Annotated
@@ -53,6 +59,20 @@ _OUTPUT_TAIL_CHARS: int = 2000
 # Default per-command timeout for assert_command (seconds), overridable per rule.
 _DEFAULT_ASSERT_TIMEOUT: int = 120
 
+# Memo of byte_parity / token_coverage verdicts (default on; ``0`` disables).
+CONFORMANCE_CACHE_ENV_VAR = "GUARDKIT_CONFORMANCE_CACHE"
+
+# Worker thread override for the file-rule pool (``1`` evaluates serially).
+CONFORMANCE_WORKERS_ENV_VAR = "GUARDKIT_CONFORMANCE_WORKERS"
+
+# File-rule verdicts keyed by (rule, authority digest, subject content
+# digests): a Coach turn that left a rule's files alone gets the previous
+# verdict without re-diffing or re-scanning. Bounded LRU, shared across
+# worktrees — keys carry repo-relative paths only, as do the details.
+_RULE_CACHE_MAX_ENTRIES = 512
+_rule_cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+_rule_cache_lock = threading.Lock()
+
 
 # =========================================================================
 # 1. Rule schema (the ``conformance:`` block)
@@ -360,16 +380,42 @@ def _evaluate_byte_parity(
     }
 
 
+def _token_coverage_files(
+    rule: TokenCoverageRule,
+    subject_root: Path,
+) -> Dict[str, List[Path]]:
+    """Resolve each glob group a token_coverage rule actually reads."""
+    groups: Dict[str, List[Path]] = {}
+    if rule.require_tokens:
+        groups["paths"] = _resolve_paths(subject_root, rule.paths)
+    if rule.unique_token is not None:
+        groups["unique_token"] = _resolve_paths(
+            subject_root, rule.unique_token.paths
+        )
+    if rule.require_test_tokens is not None:
+        groups["require_test_tokens"] = _resolve_paths(
+            subject_root, rule.require_test_tokens.paths
+        )
+    return groups
+
+
 def _evaluate_token_coverage(
     rule: TokenCoverageRule,
     subject_root: Path,
+    resolved: Optional[Dict[str, List[Path]]] = None,
 ) -> Optional[Dict[str, Any]]:
-    """Evaluate one token_coverage rule. Returns a failure dict or ``None``."""
+    """Evaluate one token_coverage rule. Returns a failure dict or ``None``.
+
+    *resolved* is :func:`_token_coverage_files` output when the caller has
+    already globbed the rule's paths.
+    """
+    if resolved is None:
+        resolved = _token_coverage_files(rule, subject_root)
     problems: List[str] = []
 
     # --- require_tokens: each must appear in at least one matched path. ---
     if rule.require_tokens:
-        files = _resolve_paths(subject_root, rule.paths)
+        files = resolved["paths"]
         blobs = [t for t in (_read_text(f) for f in files) if t is not None]
         combined = "\n".join(blobs)
         missing = [tok for tok in rule.require_tokens if tok not in combined]
@@ -391,7 +437,7 @@ def _evaluate_token_coverage(
     # --- unique_token: bound how many times a token appears. ---
     if rule.unique_token is not None:
         ut = rule.unique_token
-        ut_files = _resolve_paths(subject_root, ut.paths)
+        ut_files = resolved["unique_token"]
         count = 0
         locations: List[str] = []
         for f in ut_files:
@@ -415,7 +461,7 @@ def _evaluate_token_coverage(
     # --- require_test_tokens: named tokens must exist under test paths. ---
     if rule.require_test_tokens is not None:
         rtt = rule.require_test_tokens
-        test_files = _resolve_paths(subject_root, rtt.paths)
+        test_files = resolved["require_test_tokens"]
         test_blobs = [
             t for t in (_read_text(f) for f in test_files) if t is not None
         ]
@@ -487,6 +533,136 @@ def _evaluate_assert_command(
     }
 
 
+# --- Memoized, pooled rule evaluation. ---
+#
+# byte_parity and token_coverage only read files, so they fan out across a
+# thread pool and their verdicts are memoized by content. assert_command
+# rules share the worktree (and may write to it), so they run one at a time
+# in declared order once the file rules are done, and are never memoized —
+# their verdict depends on the whole tree and environment.
+
+
+def conformance_cache_enabled() -> bool:
+    """False when ``GUARDKIT_CONFORMANCE_CACHE`` disables the verdict memo."""
+    flag = os.environ.get(CONFORMANCE_CACHE_ENV_VAR, "").strip().lower()
+    return flag not in ("0", "false", "off", "no")
+
+
+def _conformance_workers() -> int:
+    raw = os.environ.get(CONFORMANCE_WORKERS_ENV_VAR, "").strip()
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", CONFORMANCE_WORKERS_ENV_VAR, raw)
+    return min(8, os.cpu_count() or 1)
+
+
+def authority_digest(data: bytes) -> str:
+    """Content digest of captured authority bytes (the manifest's unit)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        return authority_digest(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _rule_cache_key(rule: ConformanceRule, inputs: Any) -> str:
+    payload = json.dumps(
+        [rule.model_dump(mode="json"), inputs], sort_keys=True
+    ).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _memoized(
+    key: str, compute: Callable[[], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """Return the cached verdict for *key*, computing and storing it on a miss."""
+    with _rule_cache_lock:
+        if key in _rule_cache:
+            _rule_cache.move_to_end(key)
+            return copy.deepcopy(_rule_cache[key])
+    result = compute()
+    with _rule_cache_lock:
+        _rule_cache[key] = copy.deepcopy(result)
+        while len(_rule_cache) > _RULE_CACHE_MAX_ENTRIES:
+            _rule_cache.popitem(last=False)
+    return result
+
+
+def _evaluate_file_rule(
+    rule: Union[ByteParityRule, TokenCoverageRule],
+    authority_bytes: Dict[str, bytes],
+    authority_digests: Dict[str, str],
+    subject_root: Path,
+    use_cache: bool,
+) -> Optional[Dict[str, Any]]:
+    """Evaluate one byte_parity / token_coverage rule through the memo."""
+    if isinstance(rule, ByteParityRule):
+        data = authority_bytes[rule.id]
+        if not use_cache:
+            return _evaluate_byte_parity(rule, data, subject_root)
+        digest = authority_digests.get(rule.id) or authority_digest(data)
+        key = _rule_cache_key(
+            rule, [digest, _file_digest(subject_root / rule.subject)]
+        )
+        return _memoized(
+            key, lambda: _evaluate_byte_parity(rule, data, subject_root)
+        )
+
+    resolved = _token_coverage_files(rule, subject_root)
+    if not use_cache:
+        return _evaluate_token_coverage(rule, subject_root, resolved)
+    inputs = {
+        group: [[_relative_to(f, subject_root), _file_digest(f)] for f in files]
+        for group, files in resolved.items()
+    }
+    return _memoized(
+        _rule_cache_key(rule, inputs),
+        lambda: _evaluate_token_coverage(rule, subject_root, resolved),
+    )
+
+
+def _evaluate_rules(
+    rules: List[ConformanceRule],
+    authority_bytes: Dict[str, bytes],
+    authority_digests: Dict[str, str],
+    subject_root: Path,
+) -> List[Optional[Dict[str, Any]]]:
+    """Evaluate *rules*, returning one verdict per rule in declared order."""
+    use_cache = conformance_cache_enabled()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(rules)
+    file_rules = [
+        (index, rule)
+        for index, rule in enumerate(rules)
+        if isinstance(rule, (ByteParityRule, TokenCoverageRule))
+    ]
+
+    def _run(item: Tuple[int, Any]) -> None:
+        index, rule = item
+        results[index] = _evaluate_file_rule(
+            rule, authority_bytes, authority_digests, subject_root, use_cache
+        )
+
+    workers = min(_conformance_workers(), len(file_rules))
+    if workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="spec-conformance"
+        ) as pool:
+            list(pool.map(_run, file_rules))  # re-raises ⇒ caller degrades
+    else:
+        for item in file_rules:
+            _run(item)
+
+    for index, rule in enumerate(rules):
+        if isinstance(rule, AssertCommandRule):
+            results[index] = _evaluate_assert_command(rule, subject_root)
+    return results
+
+
 # --- ac_paths: AC-cited path presence over the structured ACs. ---
 #
 # The extraction generalizes ``AgentInvoker._scan_ac_for_missing_paths`` and is
@@ -581,6 +757,7 @@ def evaluate(
     *,
     acceptance_criteria: Optional[List[Dict[str, str]]] = None,
     task_id: Optional[str] = None,
+    authority_digests: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """Evaluate a conformance block against a live subject tree (pure executor).
 
@@ -589,6 +766,10 @@ def evaluate(
     authority snapshot is missing from *authority_bytes*, or when evaluation
     crashes unexpectedly.
 
+    ``byte_parity`` and ``token_coverage`` rules are evaluated concurrently and
+    memoized by content (see :func:`_evaluate_rules`); ``assert_command`` rules
+    then run one at a time in declared order. Failures keep rule order.
+
     Parameters
     ----------
     block : ConformanceBlock or None
@@ -603,6 +784,9 @@ def evaluate(
         Structured ACs (``[{"id","text"}]``) for the ``ac_paths`` check.
     task_id : str or None
         For the WARNING log on absence.
+    authority_digests : dict[str, str] or None
+        :func:`authority_digest` of each captured authority, keyed by rule id
+        (the snapshot manifest). Missing entries are hashed on demand.
 
     Returns
     -------
@@ -619,31 +803,27 @@ def evaluate(
         )
 
     try:
-        failures: List[Dict[str, Any]] = []
-
         for rule in block.rules:
-            if isinstance(rule, ByteParityRule):
-                if rule.id not in authority_bytes:
-                    # Authority snapshot missing ⇒ we cannot verify this rule.
-                    # Never fabricate a verdict for the whole evaluation.
-                    return _make_absent(
-                        f"authority snapshot missing for byte_parity rule "
-                        f"{rule.id!r} (authority {rule.authority})",
-                        task_id=task_id,
-                    )
-                result = _evaluate_byte_parity(
-                    rule, authority_bytes[rule.id], subject_root
+            if isinstance(rule, ByteParityRule) and rule.id not in authority_bytes:
+                # Authority snapshot missing ⇒ we cannot verify this rule.
+                # Never fabricate a verdict for the whole evaluation — and
+                # decide before any rule (or command) runs.
+                return _make_absent(
+                    f"authority snapshot missing for byte_parity rule "
+                    f"{rule.id!r} (authority {rule.authority})",
+                    task_id=task_id,
                 )
-                if result is not None:
-                    failures.append(result)
-            elif isinstance(rule, TokenCoverageRule):
-                result = _evaluate_token_coverage(rule, subject_root)
-                if result is not None:
-                    failures.append(result)
-            elif isinstance(rule, AssertCommandRule):
-                result = _evaluate_assert_command(rule, subject_root)
-                if result is not None:
-                    failures.append(result)
+
+        failures: List[Dict[str, Any]] = [
+            result
+            for result in _evaluate_rules(
+                block.rules,
+                authority_bytes,
+                authority_digests or {},
+                subject_root,
+            )
+            if result is not None
+        ]
 
         if block.ac_paths:
             ac_result = _evaluate_ac_paths(acceptance_criteria, subject_root)
@@ -673,6 +853,7 @@ def evaluate(
 _SNAPSHOT_SUBDIR = "spec_conformance"
 _SNAPSHOT_BLOCK_FILE = "conformance.json"
 _SNAPSHOT_AUTHORITY_SUBDIR = "authority"
+_SNAPSHOT_MANIFEST_FILE = "manifest.json"
 
 
 def snapshot_paths(task_id: str, worktree_path: Path) -> Dict[str, Path]:
@@ -691,6 +872,7 @@ def snapshot_paths(task_id: str, worktree_path: Path) -> Dict[str, Path]:
         "dir": base,
         "block": base / _SNAPSHOT_BLOCK_FILE,
         "authority_dir": base / _SNAPSHOT_AUTHORITY_SUBDIR,
+        "manifest": base / _SNAPSHOT_MANIFEST_FILE,
     }
 
 
@@ -708,6 +890,10 @@ def snapshot_task_conformance(
     * ``<private>/spec_conformance/authority/<rule_id>`` — the bytes of each
       ``byte_parity`` rule's authority file (read from *repo_root*, the
       canonical source, at snapshot time).
+    * ``<private>/spec_conformance/manifest.json`` — the
+      :func:`authority_digest` of each captured authority, so every later
+      evaluation keys its verdict memo without re-hashing. A re-snapshot
+      leaves an authority whose digest is unchanged untouched.
 
     Absence-of-failure / no-regression discipline:
 
@@ -796,8 +982,11 @@ def snapshot_task_conformance(
             encoding="utf-8",
         )
 
-        # (b) the bytes of every byte_parity rule's authority file.
+        # (b) the bytes of every byte_parity rule's authority file, plus
+        # (c) their digests.
         authority_dir: Path = paths["authority_dir"]
+        previous = load_manifest(snapshot_dir)
+        digests: Dict[str, str] = {}
         for rule in block.rules:
             if not isinstance(rule, ByteParityRule):
                 continue
@@ -814,8 +1003,17 @@ def snapshot_task_conformance(
                     exc,
                 )
                 continue
+            digest = authority_digest(data)
+            digests[rule.id] = digest
+            captured = authority_dir / rule.id
+            if previous.get(rule.id) == digest and captured.is_file():
+                continue
             authority_dir.mkdir(parents=True, exist_ok=True)
-            (authority_dir / rule.id).write_bytes(data)
+            captured.write_bytes(data)
+        paths["manifest"].write_text(
+            json.dumps({"authority": digests}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
 
         logger.info(
             "FEAT-SCG snapshot: captured conformance block for %s "
@@ -868,6 +1066,25 @@ def load_snapshot(
     return block, authority_bytes
 
 
+def load_manifest(snapshot_dir: Path) -> Dict[str, str]:
+    """Return the snapshot's authority digests by rule id (``{}`` when absent).
+
+    The manifest is written with the authority bytes it describes and, like
+    them, lives outside the worktree. A missing or unreadable manifest only
+    costs a re-hash of the captured bytes.
+    """
+    try:
+        raw = json.loads(
+            (snapshot_dir / _SNAPSHOT_MANIFEST_FILE).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+    authority = raw.get("authority") if isinstance(raw, dict) else None
+    if not isinstance(authority, dict):
+        return {}
+    return {str(k): str(v) for k, v in authority.items()}
+
+
 def evaluate_from_snapshot(
     snapshot_dir: Path,
     subject_root: Path,
@@ -898,4 +1115,5 @@ def evaluate_from_snapshot(
         subject_root,
         acceptance_criteria=acceptance_criteria,
         task_id=task_id,
+        authority_digests=load_manifest(snapshot_dir),
     )
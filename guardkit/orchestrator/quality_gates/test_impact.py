@@ -0,0 +1,560 @@
+"""Test impact analysis — select only the tests a change can affect.
+
+The Coach's independent verification re-runs whole test files (or the whole
+suite) every turn, even when the Player's turn touched two modules. On large
+suites that is the dominant cost of a Coach turn.
+
+This module keeps a *test-impact index* per worktree:
+
+    * **Source of truth**: the coverage gate's own pytest-under-coverage run
+      (:mod:`guardkit.orchestrator.quality_gates.coverage_gate`), recorded with
+      per-test dynamic contexts (``--cov-context=test``). ``coverage json
+      --show-contexts`` turns that into ``file → line → [test node ids]``.
+    * **Tree identity**: the index is pinned to a git tree id of the worktree
+      exactly as it was measured (tracked + untracked files, written through
+      a throw-away index so the real index is never touched).
+    * **Change set**: ``git diff <indexed tree> <current tree>`` read through
+      :func:`guardkit.qa.diff_ingest.ingest_range` — the same file list
+      ``AgentInvoker._detect_git_changes`` reports, plus the pre-image line
+      numbers of every hunk, which are exactly the line numbers the index was
+      recorded against.
+
+:func:`select_impacted_tests` maps that change set to pytest node ids (plus
+every changed test file). Anything the index cannot vouch for — a changed
+``conftest.py``, a changed non-Python input, a modified module the run never
+measured, a tree snapshot that fails — returns ``None`` and the caller runs
+its full selection. A stale or missing index can only cost speed, never hide
+a failing test.
+
+Opt-in via ``GUARDKIT_COACH_TEST_IMPACT=1`` (read at call time). When off,
+the coverage gate records no contexts and the Coach's test detection ladder
+is unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from guardkit.qa.diff_ingest import DiffIngestError, FileDiff, ingest_range
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "COV_OUTPUT_DIR",
+    "SELECTION_CHANGED_IMPACT",
+    "TEST_IMPACT_ENV_VAR",
+    "ImpactSelection",
+    "TestImpactIndex",
+    "build_index",
+    "load_index",
+    "node_file",
+    "record_test_impact",
+    "relative_path",
+    "save_index",
+    "select_impacted_tests",
+    "snapshot_tree",
+    "strip_context",
+    "test_impact_enabled",
+]
+
+#: Label the Coach logs when it runs an impact-narrowed selection.
+SELECTION_CHANGED_IMPACT = "changed-impact"
+
+TEST_IMPACT_ENV_VAR = "GUARDKIT_COACH_TEST_IMPACT"
+
+#: The coverage gate's report directory; the index (and the coverage
+#: database, :mod:`.coverage_db`) live next to its reports.
+COV_OUTPUT_DIR = ".cov_output"
+_INDEX_FILENAME = "test_impact.json"
+_CONTEXTS_FILENAME = "coverage_contexts.json"
+
+_INDEX_VERSION = 1
+
+# Git timeout (seconds) for the snapshot / diff plumbing.
+_GIT_TIMEOUT = 30
+
+# Run by-products kept out of the tree snapshot; without this every
+# coverage / pytest run would invalidate the index it just wrote.
+_SNAPSHOT_EXCLUDES = (
+    f":(exclude){COV_OUTPUT_DIR}",
+    ":(exclude).coverage",
+    ":(exclude).pytest_cache",
+    ":(exclude,glob)**/__pycache__/**",
+)
+
+# Orchestration artefacts and docs that never change test outcomes.
+_IGNORED_PREFIXES = (
+    f"{COV_OUTPUT_DIR}/",
+    ".guardkit/",
+    ".claude/",
+    "docs/",
+    "tasks/",
+)
+# No ``.txt``: requirements.txt / constraints.txt and text fixtures do.
+_IGNORED_SUFFIXES = (".md", ".rst", ".pyc")
+
+# Above this many node ids the selection collapses to test files, keeping
+# the whitespace-split command line a sane length.
+_MAX_NODE_IDS = 400
+
+# pytest-cov appends the phase to each dynamic context.
+_CONTEXT_PHASES = ("|setup", "|run", "|teardown")
+
+
+def test_impact_enabled() -> bool:
+    """True when ``GUARDKIT_COACH_TEST_IMPACT`` opts in."""
+    flag = os.environ.get(TEST_IMPACT_ENV_VAR, "").strip().lower()
+    return flag in ("1", "true", "on", "yes")
+
+
+# Not a pytest test despite the name.
+test_impact_enabled.__test__ = False  # type: ignore[attr-defined]
+
+
+def _is_test_file(path: str) -> bool:
+    name = Path(path).name
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def _is_ignored(path: str) -> bool:
+    return path.startswith(_IGNORED_PREFIXES) or path.endswith(_IGNORED_SUFFIXES)
+
+
+def node_file(node_id: str) -> str:
+    """The test file part of a pytest node id."""
+    return node_id.split("::", 1)[0]
+
+
+# ---------------------------------------------------------------------------
+# Index model
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TestImpactIndex:
+    """``file → line → test node ids`` for one measured worktree tree.
+
+    Attributes
+    ----------
+    tree : str
+        Git tree id of the worktree the coverage run measured.
+    lines : Dict[str, Dict[int, Tuple[str, ...]]]
+        Worktree-relative source path → executed line → node ids of the
+        tests that executed it. Lines only executed outside a test (module
+        import during collection) are recorded with no node ids.
+    """
+
+    __test__ = False
+
+    tree: str
+    lines: Dict[str, Dict[int, Tuple[str, ...]]] = field(default_factory=dict)
+
+    @property
+    def measured_files(self) -> FrozenSet[str]:
+        """Every source file the coverage run measured."""
+        return frozenset(self.lines)
+
+    def tests_for_file(self, path: str) -> Set[str]:
+        """Every test that executed any line of ``path``."""
+        found: Set[str] = set()
+        for node_ids in self.lines.get(path, {}).values():
+            found.update(node_ids)
+        return found
+
+    def tests_for_lines(self, path: str, line_numbers: Iterable[int]) -> Set[str]:
+        """Tests that executed any of ``line_numbers`` in ``path``."""
+        file_lines = self.lines.get(path, {})
+        found: Set[str] = set()
+        for lineno in line_numbers:
+            found.update(file_lines.get(lineno, ()))
+        return found
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "tree": self.tree,
+            "lines": {
+                path: {str(lineno): list(ids) for lineno, ids in sorted(file_lines.items())}
+                for path, file_lines in sorted(self.lines.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TestImpactIndex":
+        if data.get("version") != _INDEX_VERSION or not data.get("tree"):
+            raise ValueError("unsupported test-impact index")
+        return cls(
+            tree=str(data["tree"]),
+            lines={
+                path: {int(lineno): tuple(ids) for lineno, ids in file_lines.items()}
+                for path, file_lines in data.get("lines", {}).items()
+            },
+        )
+
+
+@dataclass(frozen=True)
+class ImpactSelection:
+    """The tests a change can affect.
+
+    Attributes
+    ----------
+    targets : Tuple[str, ...]
+        Sorted pytest positional arguments — node ids and/or test files.
+    changed_paths : Tuple[str, ...]
+        Paths that changed since the indexed tree.
+    tree : Optional[str]
+        Git tree id of the worktree the selection was computed against.
+    diffs : Tuple[FileDiff, ...]
+        The per-file diff from the indexed tree to ``tree`` (zero context
+        lines), for callers that carry line-keyed data across the change.
+    """
+
+    targets: Tuple[str, ...]
+    changed_paths: Tuple[str, ...]
+    tree: Optional[str] = None
+    diffs: Tuple[FileDiff, ...] = ()
+
+
+def strip_context(context: str) -> Optional[str]:
+    """The pytest node id of a coverage dynamic context (phase suffix dropped)."""
+    for phase in _CONTEXT_PHASES:
+        if context.endswith(phase):
+            context = context[: -len(phase)]
+            break
+    return context or None
+
+
+def relative_path(path: str, worktree_path: Path) -> Optional[str]:
+    """``path`` as a POSIX path relative to the worktree; None if outside it."""
+    candidate = Path(path)
+    if candidate.is_absolute():
+        try:
+            candidate = candidate.resolve().relative_to(worktree_path.resolve())
+        except ValueError:
+            return None
+    return candidate.as_posix()
+
+
+def build_index(
+    contexts_report: Mapping[str, Any], tree: str, worktree_path: Path
+) -> TestImpactIndex:
+    """Build an index from a ``coverage json --show-contexts`` report.
+
+    Parameters
+    ----------
+    contexts_report : Mapping[str, Any]
+        Parsed JSON report; each ``files[path]`` carries a ``contexts``
+        mapping of line number → context labels.
+    tree : str
+        Git tree id of the measured worktree.
+    worktree_path : Path
+        Root the report's (possibly absolute) paths are relative to.
+    """
+    lines: Dict[str, Dict[int, Tuple[str, ...]]] = {}
+    for path, file_info in contexts_report.get("files", {}).items():
+        rel = relative_path(path, worktree_path)
+        if rel is None:
+            continue
+        file_lines: Dict[int, Tuple[str, ...]] = {}
+        for lineno in file_info.get("executed_lines", []):
+            file_lines[int(lineno)] = ()
+        for lineno, labels in (file_info.get("contexts") or {}).items():
+            node_ids = {
+                node_id
+                for node_id in (strip_context(label) for label in labels)
+                if node_id
+            }
+            file_lines[int(lineno)] = tuple(sorted(node_ids))
+        lines[rel] = file_lines
+    return TestImpactIndex(tree=tree, lines=lines)
+
+
+def _index_path(worktree_path: Path) -> Path:
+    return worktree_path / COV_OUTPUT_DIR / _INDEX_FILENAME
+
+
+def save_index(worktree_path: Path, index: TestImpactIndex) -> Path:
+    """Write ``index`` to the worktree's coverage output directory."""
+    path = _index_path(worktree_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load_index(worktree_path: Path) -> Optional[TestImpactIndex]:
+    """Load the worktree's index, or ``None`` when absent or unreadable."""
+    path = _index_path(worktree_path)
+    if not path.exists():
+        return None
+    try:
+        return TestImpactIndex.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        logger.debug("Test impact: ignoring unreadable index %s: %s", path, exc)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Tree identity
+# ---------------------------------------------------------------------------
+
+
+def _git(
+    worktree_path: Path, args: List[str], env: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=str(worktree_path),
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+            env=env,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Test impact: git %s failed: %s", args[0], exc)
+        return None
+    if proc.returncode != 0:
+        logger.debug(
+            "Test impact: git %s exited %d: %s",
+            args[0], proc.returncode, proc.stderr.strip(),
+        )
+        return None
+    return proc.stdout.strip()
+
+
+def snapshot_tree(worktree_path: Path) -> Optional[str]:
+    """Git tree id of the worktree's current contents (tracked + untracked).
+
+    Stages everything into a *copy* of the worktree's index and writes it as
+    a tree, so the real index and ``HEAD`` are untouched. Ignored files are
+    excluded, as are coverage / pytest run by-products. Returns ``None``
+    when the worktree is not a git repository or git fails.
+    """
+    git_path = _git(worktree_path, ["rev-parse", "--git-path", "index"])
+    if git_path is None:
+        return None
+    index_file = worktree_path / git_path
+    with tempfile.TemporaryDirectory(prefix="guardkit-impact-") as tmpdir:
+        tmp_index = Path(tmpdir) / "index"
+        if index_file.exists():
+            shutil.copyfile(index_file, tmp_index)
+        env = dict(os.environ, GIT_INDEX_FILE=str(tmp_index))
+        if _git(
+            worktree_path,
+            ["add", "-A", "--", ".", *_SNAPSHOT_EXCLUDES],
+            env=env,
+        ) is None:
+            return None
+        return _git(worktree_path, ["write-tree"], env=env) or None
+
+
+# ---------------------------------------------------------------------------
+# Recording (coverage gate side)
+# ---------------------------------------------------------------------------
+
+
+def record_test_impact(
+    worktree_path: Path,
+    python: str,
+    tree_before: Optional[str],
+    timeout: int = 120,
+    data_file: Optional[Path] = None,
+) -> Optional[TestImpactIndex]:
+    """Persist an index from the coverage gate's context-recording run.
+
+    Called after ``pytest --cov-context=test`` finished. Exports the
+    ``.coverage`` data with ``coverage json --show-contexts`` and pins it to
+    ``tree_before`` — the tree snapshot taken before the run. If the tree
+    moved during the run (a parallel task wrote to the shared worktree), the
+    measurement matches neither tree and nothing is saved. ``data_file``
+    exports a coverage data file other than the run's default ``.coverage``
+    (the incremental coverage database).
+
+    Never raises; returns the saved index or ``None``.
+    """
+    if tree_before is None:
+        return None
+    tree_after = snapshot_tree(worktree_path)
+    if tree_after != tree_before:
+        logger.info(
+            "Test impact: worktree changed during the coverage run; "
+            "not recording an index for %s",
+            worktree_path,
+        )
+        return None
+
+    report_path = worktree_path / COV_OUTPUT_DIR / _CONTEXTS_FILENAME
+    env = None
+    if data_file is not None:
+        env = dict(os.environ, COVERAGE_FILE=str(data_file))
+    try:
+        proc = subprocess.run(
+            [
+                python, "-m", "coverage", "json", "--show-contexts",
+                "-o", str(report_path),
+            ],
+            cwd=str(worktree_path),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=env,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Test impact: coverage json failed: %s", exc)
+        return None
+    if proc.returncode != 0 or not report_path.exists():
+        logger.debug(
+            "Test impact: coverage json exited %d: %s",
+            proc.returncode, proc.stderr.strip(),
+        )
+        return None
+
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        index = build_index(report, tree_before, worktree_path)
+        save_index(worktree_path, index)
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        logger.debug("Test impact: could not record index: %s", exc)
+        return None
+    logger.info(
+        "Test impact: recorded index for %s (%d measured files, tree=%s)",
+        worktree_path, len(index.lines), tree_before[:12],
+    )
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Selection (Coach side)
+# ---------------------------------------------------------------------------
+
+
+def _hunk_pre_image_lines(file_diff: FileDiff) -> Optional[List[Set[int]]]:
+    """Pre-image lines each hunk touches; ``None`` when the diff has no hunks.
+
+    A pure insertion touches no pre-image line, so it is attributed to the
+    lines either side of the insertion point.
+    """
+    if not file_diff.hunks:
+        return None
+    touched: List[Set[int]] = []
+    for hunk in file_diff.hunks:
+        removed = {
+            line.old_lineno
+            for line in hunk.removed_lines
+            if line.old_lineno is not None
+        }
+        if not removed:
+            removed = {hunk.old_start, hunk.old_start + 1}
+        touched.append(removed)
+    return touched
+
+
+def select_impacted_tests(
+    worktree_path: Path,
+    index: Optional[TestImpactIndex] = None,
+) -> Optional[ImpactSelection]:
+    """Select the tests the worktree's changes since the index can affect.
+
+    Returns ``None`` whenever the full selection must run instead: no index,
+    a failed snapshot or diff, nothing testable changed, or a change the
+    index cannot vouch for (see the module docstring).
+    """
+    worktree_path = Path(worktree_path)
+    if index is None:
+        index = load_index(worktree_path)
+    if index is None:
+        logger.debug("Test impact: no index for %s", worktree_path)
+        return None
+    current = snapshot_tree(worktree_path)
+    if current is None:
+        return None
+    if current == index.tree:
+        logger.debug("Test impact: tree unchanged since index; no selection")
+        return None
+
+    try:
+        payload = ingest_range(worktree_path, index.tree, current, context_lines=0)
+    except DiffIngestError as exc:
+        logger.info("Test impact: diff against indexed tree failed: %s", exc)
+        return None
+
+    measured = index.measured_files
+    node_ids: Set[str] = set()
+    test_files: Set[str] = set()
+    changed: List[str] = []
+    for file_diff in payload.files:
+        path = file_diff.path
+        old_path = file_diff.old_path or path
+        changed.append(path)
+        if _is_ignored(path) and _is_ignored(old_path):
+            continue
+        if Path(path).name == "conftest.py" or Path(old_path).name == "conftest.py":
+            logger.info("Test impact: %s changed; running full selection", path)
+            return None
+        if _is_test_file(path) or _is_test_file(old_path):
+            if file_diff.change_kind != "deleted" and _is_test_file(path):
+                test_files.add(path)
+            continue
+        if not path.endswith(".py") and not old_path.endswith(".py"):
+            logger.info(
+                "Test impact: non-Python input %s changed; running full selection",
+                path,
+            )
+            return None
+        if old_path not in measured:
+            if file_diff.change_kind in ("added", "copied"):
+                # A brand-new module is only reachable through another change
+                # (an import edit or a new test), which is selected itself.
+                continue
+            logger.info(
+                "Test impact: %s is not in the index; running full selection",
+                old_path,
+            )
+            return None
+
+        hunks = _hunk_pre_image_lines(file_diff)
+        if hunks is None or file_diff.change_kind in ("deleted", "renamed"):
+            node_ids.update(index.tests_for_file(old_path))
+            continue
+        for hunk_lines in hunks:
+            hit = index.tests_for_lines(old_path, hunk_lines)
+            # A hunk no test executed directly (module-level code, a line only
+            # run at import) may still change behaviour: widen to every test
+            # of the file.
+            node_ids.update(hit or index.tests_for_file(old_path))
+
+    targets: Set[str] = set(test_files)
+    for node_id in node_ids:
+        test_file = node_file(node_id)
+        if test_file in test_files:
+            continue
+        if not (worktree_path / test_file).exists():
+            continue
+        # The Coach splits its command on whitespace.
+        if any(ch.isspace() for ch in node_id):
+            targets.add(test_file)
+        else:
+            targets.add(node_id)
+    if len(targets) > _MAX_NODE_IDS:
+        targets = {node_file(target) for target in targets}
+    if not targets:
+        logger.debug("Test impact: no tests affected by %d change(s)", len(changed))
+        return None
+    return ImpactSelection(
+        targets=tuple(sorted(targets)),
+        changed_paths=tuple(sorted(changed)),
+        tree=current,
+        diffs=payload.files,
+    )
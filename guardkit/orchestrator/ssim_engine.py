@@ -0,0 +1,563 @@
+"""Tiled SSIM engine behind SSIMComparator.
+
+Computes the same mean SSIM as scikit-image's ``structural_similarity``
+defaults (7x7 uniform window, K1=0.01, K2=0.03, sample covariance, border
+windows excluded from the mean), but:
+
+- Window statistics come from running sums over the five stacked moments
+  (x, y, x², y², xy): a seven-term add down the rows and a cumulative sum
+  along each row, in exact integer arithmetic for 8-bit images. They are
+  computed in bands of rows so intermediates stay bounded at any resolution,
+  and the SSIM formula is then evaluated in place on the band.
+- A caller that only needs to know whether the score clears a threshold
+  (``fail_below``) gets an early exit: SSIM is at most 1 per window, so once
+  the windows seen so far have lost more than ``1 - fail_below`` of the total,
+  no remaining band can lift the mean back over the line.
+- Decoded images (and their grayscale / pyramid reductions) are cached by
+  content hash, so a reference screenshot compared against dozens of
+  viewports is decoded once.
+- Batches of pairs can be scored in a process pool.
+
+numpy and Pillow are optional dependencies of the design-mode pipeline; this
+module imports numpy at load time, so callers import it lazily.
+
+Example:
+    >>> from guardkit.orchestrator import ssim_engine
+    >>> ssim_engine.score_pair(reference_png, rendered_png).value
+    0.9731...
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SSIM_WORKERS_ENV_VAR = "GUARDKIT_SSIM_WORKERS"
+
+WIN_SIZE = 7
+K1 = 0.01
+K2 = 0.03
+
+# Output rows per band. Each band holds five int32 and five float64 planes of
+# about TILE_ROWS x width x channels: ~70 MB for a 4K RGB frame.
+TILE_ROWS = 128
+
+# Decoded-image cache budget (bytes of decoded pixels). Pool workers split it,
+# so a batch holds about this much however many processes it runs on.
+DECODE_CACHE_BYTES = 256 * 1024 * 1024
+
+# 8-bit moments are taken about mid-grey so x² fits 15 bits and a row's
+# running sum of window sums fits int32 for any width below ~18k pixels.
+_OFFSET = 128
+
+
+# ============================================================================
+# Results
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SSIMScore:
+    """Mean SSIM of an image pair.
+
+    Attributes:
+        value: Mean SSIM. When ``exact`` is False the computation stopped early
+            and this is an upper bound that is already below the caller's
+            ``fail_below`` threshold.
+        exact: True when every window was evaluated.
+    """
+
+    value: float
+    exact: bool = True
+
+
+# ============================================================================
+# Decoded-image cache
+# ============================================================================
+
+
+class DecodedImageCache:
+    """Thread-safe LRU of decoded images keyed by (content hash, variant).
+
+    Bounded by the decoded pixel bytes it holds rather than by entry count,
+    since one 4K RGBA frame outweighs a hundred thumbnails. Cached arrays are
+    read-only.
+    """
+
+    def __init__(self, max_bytes: int = DECODE_CACHE_BYTES):
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self, key: Tuple[str, str], build: Callable[[], "np.ndarray"]
+    ) -> "np.ndarray":
+        """Return the cached array for ``key``, building it on a miss."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        array = build()
+        array.setflags(write=False)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = array
+                self._bytes += array.nbytes
+                while self._bytes > self._max_bytes and len(self._entries) > 1:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.nbytes
+        return array
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+
+_CACHE = DecodedImageCache()
+
+
+def get_decode_cache() -> DecodedImageCache:
+    """The process-wide decoded-image cache."""
+    return _CACHE
+
+
+def decode(image_bytes: bytes) -> "np.ndarray":
+    """Decode PNG (or any Pillow-readable) bytes to a uint8 array.
+
+    RGBA and other modes become RGB; grayscale ("L") stays 2-D.
+
+    Raises:
+        ValueError: If image bytes are empty
+        RuntimeError: If image cannot be decoded
+    """
+    if not image_bytes:
+        raise ValueError("Empty image bytes")
+
+    try:
+        from PIL import Image
+
+        img = Image.open(io.BytesIO(image_bytes))
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        return np.array(img)
+    except Exception as e:
+        raise RuntimeError(f"Failed to decode image: {e}")
+
+
+def load(image_bytes: bytes, *, gray: bool = False, level: int = 0) -> "np.ndarray":
+    """Decoded image, optionally grayscale and/or ``level`` pyramid steps down.
+
+    Every variant is cached under the content hash of ``image_bytes``. Pyramid
+    levels halve each side with a 2x2 box filter and stop once a side would
+    drop below two SSIM windows.
+
+    Args:
+        image_bytes: Encoded image.
+        gray: Reduce colour images to the channel mean (as uint8).
+        level: Pyramid level (0 = full resolution).
+
+    Returns:
+        Read-only uint8 array.
+    """
+    if not image_bytes:
+        raise ValueError("Empty image bytes")
+    digest = hashlib.sha256(image_bytes).hexdigest()
+    return _load(digest, image_bytes, gray, max(0, level))
+
+
+def _load(digest: str, image_bytes: bytes, gray: bool, level: int) -> "np.ndarray":
+    def build() -> "np.ndarray":
+        if level > 0:
+            parent = _load(digest, image_bytes, gray, level - 1)
+            if min(parent.shape[:2]) < 4 * WIN_SIZE:
+                return parent
+            return _reduce(parent)
+        if gray:
+            img = _load(digest, image_bytes, False, 0)
+            if img.ndim == 2:
+                return img
+            return np.mean(img, axis=2).astype(np.uint8)
+        return decode(image_bytes)
+
+    variant = f"{'gray' if gray else 'native'}@{level}"
+    return _CACHE.get_or_build((digest, variant), build)
+
+
+def _reduce(img: "np.ndarray") -> "np.ndarray":
+    """One pyramid step: 2x2 box mean, odd trailing row/column dropped."""
+    h2, w2 = img.shape[0] // 2, img.shape[1] // 2
+    blocks = img[: 2 * h2, : 2 * w2].reshape(h2, 2, w2, 2, *img.shape[2:])
+    return np.rint(blocks.mean(axis=(1, 3))).astype(np.uint8)
+
+
+# ============================================================================
+# SSIM
+# ============================================================================
+
+
+def _moments(xb: "np.ndarray", yb: "np.ndarray") -> "np.ndarray":
+    """Stack x, y, x², y², xy for a band, exact for 8-bit input."""
+    if xb.dtype == np.uint8 and yb.dtype == np.uint8:
+        width = xb.shape[1]
+        exact = WIN_SIZE * WIN_SIZE * width * _OFFSET * _OFFSET < 2**31
+        dtype = np.int32 if exact else np.int64
+        offset = _OFFSET
+    else:
+        dtype, offset = np.float64, 0
+    stack = np.empty((5,) + xb.shape, dtype=dtype)
+    x, y = stack[0], stack[1]
+    x[...] = xb
+    y[...] = yb
+    if offset:
+        x -= offset
+        y -= offset
+    np.multiply(x, x, out=stack[2])
+    np.multiply(y, y, out=stack[3])
+    np.multiply(x, y, out=stack[4])
+    return stack
+
+
+def _window_sums(stack: "np.ndarray") -> "np.ndarray":
+    """Sums over every WIN_SIZE x WIN_SIZE window, for all five planes at once."""
+    w = WIN_SIZE
+    rows = stack.shape[1] - w + 1
+    by_rows = stack[:, 0:rows].copy()
+    for k in range(1, w):
+        by_rows += stack[:, k : k + rows]
+    running = np.cumsum(by_rows, axis=2, dtype=by_rows.dtype)
+    cols = running.shape[2] - w + 1
+    sums = np.empty(running.shape[:2] + (cols,) + running.shape[3:], dtype=running.dtype)
+    sums[:, :, 0] = running[:, :, w - 1]
+    np.subtract(running[:, :, w:], running[:, :, :-w], out=sums[:, :, 1:])
+    return sums
+
+
+def _ssim_band(sums: "np.ndarray", offset: float, c1: float, c2: float) -> "np.ndarray":
+    """Per-window SSIM from the five window sums, evaluated in place."""
+    n = WIN_SIZE * WIN_SIZE
+    cov_norm = n / (n - 1)
+    m = sums.astype(np.float64)
+    m *= 1.0 / n
+    ux, uy, vx, vy, vxy = m  # moments -> (co)variances, in place below
+    tmp = ux * ux
+    vx -= tmp
+    np.multiply(uy, uy, out=tmp)
+    vy -= tmp
+    np.multiply(ux, uy, out=tmp)
+    vxy -= tmp
+    if offset:
+        ux += offset
+        uy += offset
+    # B2 = vx + vy + C2 (scaled to sample covariance), into vx
+    vx += vy
+    vx *= cov_norm
+    vx += c2
+    # A2 = 2 vxy + C2, into vxy
+    vxy *= 2 * cov_norm
+    vxy += c2
+    # A1 * A2, into tmp
+    np.multiply(ux, uy, out=tmp)
+    tmp *= 2
+    tmp += c1
+    tmp *= vxy
+    # B1 * B2, into vy
+    np.multiply(ux, ux, out=vy)
+    uy *= uy
+    vy += uy
+    vy += c1
+    vy *= vx
+    tmp /= vy
+    return tmp
+
+
+def ssim(
+    x: "np.ndarray",
+    y: "np.ndarray",
+    *,
+    data_range: float,
+    fail_below: Optional[float] = None,
+    full: bool = False,
+    tile_rows: int = TILE_ROWS,
+) -> Tuple[SSIMScore, Optional["np.ndarray"]]:
+    """Mean SSIM of two same-shape images (2-D, or H x W x C averaged over C).
+
+    Args:
+        x: Reference image.
+        y: Comparison image.
+        data_range: Dynamic range used for the stabilising constants.
+        fail_below: Stop as soon as the mean provably cannot reach this value.
+            Ignored when ``full`` is set.
+        full: Also return the per-pixel SSIM map (H x W, channel mean), with
+            the border windows cannot cover filled from the nearest window.
+        tile_rows: Output rows evaluated per band.
+
+    Returns:
+        Tuple of (SSIMScore, map or None).
+
+    Raises:
+        ValueError: If shapes differ or the image is smaller than one window.
+    """
+    if x.shape != y.shape:
+        raise ValueError(
+            f"Image dimensions must match. Reference: {x.shape}, Rendered: {y.shape}"
+        )
+    h, w = x.shape[:2]
+    if h < WIN_SIZE or w < WIN_SIZE:
+        raise ValueError(
+            f"Images must be at least {WIN_SIZE}x{WIN_SIZE} pixels, got {w}x{h}"
+        )
+    x3 = x.reshape(h, w, -1)
+    y3 = y.reshape(h, w, -1)
+    channels = x3.shape[2]
+    offset = _OFFSET if (x.dtype == np.uint8 and y.dtype == np.uint8) else 0
+
+    c1 = (K1 * data_range) ** 2
+    c2 = (K2 * data_range) ** 2
+    out_h, out_w = h - WIN_SIZE + 1, w - WIN_SIZE + 1
+    total = out_h * out_w * channels
+    budget = None if (fail_below is None or full) else (1.0 - fail_below) * total
+
+    accumulated = 0.0
+    deficit = 0.0
+    seen = 0
+    map_bands: List["np.ndarray"] = []
+
+    for r0 in range(0, out_h, tile_rows):
+        r1 = min(out_h, r0 + tile_rows)
+        stack = _moments(x3[r0 : r1 + WIN_SIZE - 1], y3[r0 : r1 + WIN_SIZE - 1])
+        band = _ssim_band(_window_sums(stack), offset, c1, c2)
+
+        band_sum = float(band.sum())
+        accumulated += band_sum
+        deficit += band.size - band_sum
+        seen += band.size
+        if full:
+            map_bands.append(band.mean(axis=2))
+        if budget is not None and deficit > budget:
+            upper = (accumulated + (total - seen)) / total
+            return SSIMScore(upper, exact=False), None
+
+    score = SSIMScore(accumulated / total)
+    if not full:
+        return score, None
+    pad = (WIN_SIZE - 1) // 2
+    return score, np.pad(np.concatenate(map_bands, axis=0), pad, mode="edge")
+
+
+def _finite(score: SSIMScore, x: "np.ndarray", y: "np.ndarray") -> SSIMScore:
+    """Identical images score 1.0 and anything else 0.0 if the mean is NaN."""
+    if np.isnan(score.value):
+        return SSIMScore(1.0 if np.array_equal(x, y) else 0.0)
+    return score
+
+
+def _data_range(img: "np.ndarray") -> float:
+    data_range = float(img.max()) - float(img.min())
+    # Solid colour images (min == max): use the 8-bit range.
+    return data_range if data_range else 255.0
+
+
+def score_pair(
+    reference: bytes,
+    rendered: bytes,
+    *,
+    pyramid_level: int = 0,
+    fail_below: Optional[float] = None,
+) -> SSIMScore:
+    """Mean SSIM over all channels of two encoded images.
+
+    ``data_range`` is the reference's own value range (255 for a solid image).
+
+    Args:
+        reference: Reference image as PNG bytes.
+        rendered: Rendered image as PNG bytes.
+        pyramid_level: Compare this many 2x downsamples in (0 = full resolution).
+        fail_below: Allow an early exit once the score cannot reach this value.
+
+    Returns:
+        SSIMScore (an upper bound when ``exact`` is False).
+    """
+    ref_img = load(reference, level=pyramid_level)
+    rend_img = load(rendered, level=pyramid_level)
+    if ref_img.shape != rend_img.shape:
+        # Compare the full-resolution shapes in the message, not the pyramid's.
+        raise ValueError(
+            f"Image dimensions must match. "
+            f"Reference: {load(reference).shape}, Rendered: {load(rendered).shape}"
+        )
+    score, _ = ssim(
+        ref_img, rend_img, data_range=_data_range(ref_img), fail_below=fail_below
+    )
+    return _finite(score, ref_img, rend_img)
+
+
+def score_pair_with_map(
+    reference: bytes,
+    rendered: bytes,
+    *,
+    pyramid_level: int = 0,
+) -> Tuple[float, "np.ndarray"]:
+    """Grayscale SSIM of two encoded images plus its per-pixel map.
+
+    The map has the shape of the (possibly downsampled) grayscale images.
+
+    Args:
+        reference: Reference image as PNG bytes.
+        rendered: Rendered image as PNG bytes.
+        pyramid_level: Compare this many 2x downsamples in (0 = full resolution).
+
+    Returns:
+        Tuple of (SSIM score, float SSIM map).
+    """
+    ref_gray = load(reference, gray=True, level=pyramid_level)
+    rend_gray = load(rendered, gray=True, level=pyramid_level)
+    if ref_gray.shape != rend_gray.shape:
+        raise ValueError(
+            f"Image dimensions must match. "
+            f"Reference: {load(reference).shape}, Rendered: {load(rendered).shape}"
+        )
+    score, ssim_map = ssim(
+        ref_gray, rend_gray, data_range=_data_range(ref_gray), full=True
+    )
+    return _finite(score, ref_gray, rend_gray).value, ssim_map
+
+
+# ============================================================================
+# Batches
+# ============================================================================
+
+
+def ssim_workers() -> int:
+    """Process-pool size for batch scoring (``GUARDKIT_SSIM_WORKERS``, 1 = inline)."""
+    raw = os.environ.get(SSIM_WORKERS_ENV_VAR, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return min(8, os.cpu_count() or 1)
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _init_worker(cache_bytes: int) -> None:
+    global _CACHE
+    _CACHE = DecodedImageCache(cache_bytes)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool, grown to at least ``workers`` processes.
+
+    The pool never shrinks, so a smaller batch reuses it. When a larger batch
+    needs a bigger one, the old pool is retired without cancelling anything:
+    maps other threads already submitted to it run to completion.
+    """
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS < workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            # spawn, not fork: callers run inside asyncio loops with live threads.
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(DECODE_CACHE_BYTES // workers,),
+            )
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the batch-scoring process pool, if one was started."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+atexit.register(shutdown_pool)
+
+
+def _score_pair_task(
+    task: Tuple[bytes, bytes, int, Optional[float]]
+) -> SSIMScore:
+    reference, rendered, pyramid_level, fail_below = task
+    return score_pair(
+        reference, rendered, pyramid_level=pyramid_level, fail_below=fail_below
+    )
+
+
+def score_pairs(
+    pairs: Sequence[Tuple[bytes, bytes]],
+    *,
+    pyramid_level: int = 0,
+    fail_below: Optional[float] = None,
+    workers: Optional[int] = None,
+) -> List[SSIMScore]:
+    """Score many (reference, rendered) pairs, in a process pool when it pays.
+
+    Results keep the order of ``pairs``. Each worker process keeps its own
+    decoded-image cache, an equal share of ``DECODE_CACHE_BYTES``, so a
+    reference shared by many pairs is decoded at most once per worker. The
+    first exception raised by any pair propagates.
+
+    Args:
+        pairs: (reference, rendered) PNG byte pairs.
+        pyramid_level: As for ``score_pair``.
+        fail_below: As for ``score_pair``.
+        workers: Pool size (default ``ssim_workers()``); 1 scores inline.
+
+    Returns:
+        One SSIMScore per pair.
+    """
+    workers = min(workers or ssim_workers(), len(pairs))
+    tasks = [(ref, rend, pyramid_level, fail_below) for ref, rend in pairs]
+    if workers <= 1:
+        return [_score_pair_task(task) for task in tasks]
+    pool = _get_pool(workers)
+    chunksize = max(1, len(tasks) // (workers * 4))
+    return list(pool.map(_score_pair_task, tasks, chunksize=chunksize))
+
+
+__all__ = [
+    "DecodedImageCache",
+    "SSIMScore",
+    "SSIM_WORKERS_ENV_VAR",
+    "decode",
+    "get_decode_cache",
+    "load",
+    "score_pair",
+    "score_pair_with_map",
+    "score_pairs",
+    "shutdown_pool",
+    "ssim",
+    "ssim_workers",
+]
@@ -0,0 +1,471 @@
+"""
+Content-addressed cache of bootstrapped worktree venvs.
+
+Every fresh AutoBuild worktree pays a cold dependency install into its own
+``.venv`` even when an identical manifest set was installed minutes ago for
+the previous feature. ``VenvTemplateCache`` keeps a copy of each successfully
+bootstrapped venv, keyed by the manifest contents, install commands and the
+venv's interpreter, so the next worktree with the same key gets a clone
+instead of a resolve/download/build cycle.
+
+Cloning:
+    ``cp -a --reflink=auto`` on Linux (copy-on-write on btrfs/xfs, a plain
+    copy elsewhere), ``cp -cR`` (clonefile) on macOS, ``shutil.copytree`` as
+    the fallback. Hardlinks are deliberately not used: a worktree that
+    rewrites a file inside its venv in place would corrupt the template.
+
+Relocation:
+    A venv embeds absolute paths of the worktree it was built in: script
+    shebangs and activate scripts under ``bin/``, editable-install ``.pth``
+    files, editable finder modules and ``direct_url.json``. Those (small,
+    text) files are rewritten from the template's source root to the new
+    worktree root, and the restored interpreter is smoke-run before use. Any
+    failure discards the clone and the bootstrap installs cold.
+
+Eviction:
+    Entries unused for ``max_age_days`` are dropped, then least-recently used
+    entries until the cache fits in ``max_bytes``.
+
+Environment:
+    ``GUARDKIT_VENV_CACHE=0`` disables the cache; ``GUARDKIT_VENV_CACHE_DIR``
+    (default ``~/.guardkit/venv-cache``), ``GUARDKIT_VENV_CACHE_MAX_BYTES``
+    and ``GUARDKIT_VENV_CACHE_MAX_AGE_DAYS`` tune it.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VENV_CACHE_ENV_VAR = "GUARDKIT_VENV_CACHE"
+VENV_CACHE_DIR_ENV_VAR = "GUARDKIT_VENV_CACHE_DIR"
+VENV_CACHE_MAX_BYTES_ENV_VAR = "GUARDKIT_VENV_CACHE_MAX_BYTES"
+VENV_CACHE_MAX_AGE_ENV_VAR = "GUARDKIT_VENV_CACHE_MAX_AGE_DAYS"
+
+DEFAULT_MAX_BYTES = 10 * 1024**3
+DEFAULT_MAX_AGE_DAYS = 14.0
+
+#: Bumped whenever the on-disk layout or the relocation rules change.
+CACHE_FORMAT_VERSION = 1
+
+_METADATA_FILE = "template.json"
+_LOCK_FILE = ".lock"
+_TMP_PREFIX = "tmp-"
+# Text files larger than this under bin/ are binaries or not worth scanning.
+_MAX_RELOCATE_BYTES = 2 * 1024 * 1024
+
+
+def venv_cache_enabled() -> bool:
+    """Return False when ``GUARDKIT_VENV_CACHE`` switches the cache off."""
+    raw = os.environ.get(VENV_CACHE_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def read_pyvenv_cfg(venv_dir: Path) -> Dict[str, str]:
+    """
+    Parse ``<venv>/pyvenv.cfg`` into a dict (empty when missing/unreadable).
+
+    Parameters
+    ----------
+    venv_dir : Path
+        Venv root directory.
+
+    Returns
+    -------
+    Dict[str, str]
+        Lower-cased keys mapped to their stripped values.
+    """
+    try:
+        text = (venv_dir / "pyvenv.cfg").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip().lower()] = value.strip()
+    return values
+
+
+@dataclass
+class VenvTemplate:
+    """
+    Metadata of one cached venv.
+
+    Attributes
+    ----------
+    key : str
+        Cache key (see ``EnvironmentBootstrapper._venv_cache_key``).
+    source_root : str
+        Worktree root the venv was built in; relocated on restore.
+    python_version : str
+        Interpreter version recorded in the venv's ``pyvenv.cfg``.
+    size_bytes : int
+        Apparent size of the cached venv.
+    created_at : float
+        Unix time the template was stored.
+    last_used : float
+        Unix time the template was last stored or restored.
+    format_version : int
+        ``CACHE_FORMAT_VERSION`` at store time.
+    """
+
+    key: str
+    source_root: str
+    python_version: str
+    size_bytes: int
+    created_at: float
+    last_used: float
+    format_version: int = CACHE_FORMAT_VERSION
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _clone_tree(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` (which must not exist), CoW where possible."""
+    if sys.platform.startswith("linux"):
+        cmd: Optional[List[str]] = ["cp", "-a", "--reflink=auto", str(src), str(dst)]
+    elif sys.platform == "darwin":
+        cmd = ["cp", "-cRp", str(src), str(dst)]
+    else:
+        cmd = None
+    if cmd is not None and shutil.which("cp"):
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode == 0:
+            return
+        logger.debug("venv cache: %s failed (%s); copying", cmd[0], proc.stderr.strip())
+        shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst, symlinks=True)
+
+
+def _relocation_candidates(venv_dir: Path) -> Iterator[Path]:
+    """Yield the venv files that may embed the build-time worktree path."""
+    yield venv_dir / "pyvenv.cfg"
+    bin_dir = venv_dir / "bin"
+    if bin_dir.is_dir():
+        yield from (p for p in bin_dir.iterdir() if not p.is_symlink())
+    for site in venv_dir.glob("lib/python*/site-packages"):
+        yield from site.glob("*.pth")
+        yield from site.glob("*.egg-link")
+        yield from site.glob("__editable__*")
+        yield from site.glob("*.dist-info/direct_url.json")
+
+
+def relocate_venv(venv_dir: Path, old_root: str, new_root: str) -> int:
+    """
+    Rewrite ``old_root`` to ``new_root`` in a cloned venv's path-bearing files.
+
+    Only whole path components are replaced (``/wt/a`` never matches inside
+    ``/wt/ab``). Files are rewritten via a temp file + rename so the clone
+    never writes through to a shared inode.
+
+    Parameters
+    ----------
+    venv_dir : Path
+        The cloned venv.
+    old_root : str
+        Worktree root the template was built in.
+    new_root : str
+        Worktree root the clone now lives in.
+
+    Returns
+    -------
+    int
+        Number of files rewritten.
+    """
+    if old_root == new_root:
+        return 0
+    pattern = re.compile(re.escape(old_root.encode()) + rb"(?=[/\\\"'\s]|$)", re.M)
+    replacement = new_root.encode().replace(b"\\", b"\\\\")
+    rewritten = 0
+    for path in _relocation_candidates(venv_dir):
+        try:
+            if not path.is_file() or path.stat().st_size > _MAX_RELOCATE_BYTES:
+                continue
+            data = path.read_bytes()
+        except OSError:
+            continue
+        if b"\0" in data[:8192]:
+            continue  # binary (e.g. a compiled launcher)
+        updated = pattern.sub(replacement, data)
+        if updated == data:
+            continue
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        tmp.write_bytes(updated)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        rewritten += 1
+    return rewritten
+
+
+class VenvTemplateCache:
+    """
+    Directory of cached venvs, one ``<key>/`` per template.
+
+    Layout: ``<root>/<key>/venv/`` + ``<root>/<key>/template.json``. Stores
+    land atomically (copy to ``tmp-*`` then rename); an ``fcntl`` lock on
+    ``<root>/.lock`` is held shared while cloning out and exclusive while
+    publishing or evicting, so an entry is never deleted mid-restore.
+
+    Parameters
+    ----------
+    root : Path
+        Cache directory.
+    max_bytes : int
+        Size budget across all entries.
+    max_age_days : float
+        Entries unused for longer are evicted.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400
+
+    @classmethod
+    def from_env(cls) -> Optional["VenvTemplateCache"]:
+        """
+        Build the cache from ``GUARDKIT_VENV_CACHE*`` settings.
+
+        Returns
+        -------
+        Optional[VenvTemplateCache]
+            None when the cache is disabled.
+        """
+        if not venv_cache_enabled():
+            return None
+        root = os.environ.get(VENV_CACHE_DIR_ENV_VAR) or str(
+            Path.home() / ".guardkit" / "venv-cache"
+        )
+        try:
+            max_bytes = int(os.environ.get(VENV_CACHE_MAX_BYTES_ENV_VAR, DEFAULT_MAX_BYTES))
+            max_age = float(os.environ.get(VENV_CACHE_MAX_AGE_ENV_VAR, DEFAULT_MAX_AGE_DAYS))
+        except ValueError:
+            logger.warning("venv cache: ignoring malformed size/age settings")
+            max_bytes, max_age = DEFAULT_MAX_BYTES, DEFAULT_MAX_AGE_DAYS
+        return cls(Path(root).expanduser(), max_bytes=max_bytes, max_age_days=max_age)
+
+    # ----------------------------------------------------------------- locks
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / _LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # -------------------------------------------------------------- metadata
+
+    def _read_meta(self, entry: Path) -> Optional[VenvTemplate]:
+        try:
+            data = json.loads((entry / _METADATA_FILE).read_text(encoding="utf-8"))
+            template = VenvTemplate(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        if template.format_version != CACHE_FORMAT_VERSION:
+            return None
+        return template
+
+    def _write_meta(self, entry: Path, template: VenvTemplate) -> None:
+        tmp = entry / f".{_METADATA_FILE}.{uuid.uuid4().hex}"
+        tmp.write_text(json.dumps(asdict(template), indent=2), encoding="utf-8")
+        os.replace(tmp, entry / _METADATA_FILE)
+
+    def entries(self) -> List[VenvTemplate]:
+        """Return the metadata of every valid cached template."""
+        if not self.root.is_dir():
+            return []
+        found = []
+        for entry in self.root.iterdir():
+            if entry.is_dir() and not entry.name.startswith(_TMP_PREFIX):
+                template = self._read_meta(entry)
+                if template is not None:
+                    found.append(template)
+        return found
+
+    # ------------------------------------------------------------------- api
+
+    def restore(self, key: str, worktree_root: Path) -> Optional[Path]:
+        """
+        Clone the template for ``key`` into ``<worktree_root>/.venv``.
+
+        ``<worktree_root>/.venv`` must not exist. On any failure the partial
+        clone is removed and None is returned.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        worktree_root : Path
+            Worktree receiving the venv.
+
+        Returns
+        -------
+        Optional[Path]
+            ``<worktree_root>/.venv/bin/python`` on a hit, else None.
+        """
+        entry = self.root / key
+        target = worktree_root / ".venv"
+        if not (entry / "venv").is_dir():
+            return None
+        try:
+            with self._locked(exclusive=False):
+                template = self._read_meta(entry)
+                if template is None or not (entry / "venv").is_dir():
+                    return None
+                _clone_tree(entry / "venv", target)
+            relocate_venv(target, template.source_root, str(worktree_root))
+            python = target / "bin" / "python"
+            subprocess.run(
+                [str(python), "-c", "import sys"],
+                check=True,
+                capture_output=True,
+                timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.warning(
+                "venv cache: restore of %s into %s failed (%s); installing cold",
+                key[:12],
+                worktree_root,
+                exc,
+            )
+            shutil.rmtree(target, ignore_errors=True)
+            return None
+
+        template.last_used = time.time()
+        try:
+            self._write_meta(entry, template)
+        except OSError:
+            pass
+        return python
+
+    def store(self, key: str, worktree_root: Path) -> bool:
+        """
+        Publish ``<worktree_root>/.venv`` as the template for ``key``.
+
+        A no-op when the key is already cached. Evicts afterwards.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        worktree_root : Path
+            Worktree whose freshly bootstrapped venv is cached.
+
+        Returns
+        -------
+        bool
+            True when a new template was published.
+        """
+        source = worktree_root / ".venv"
+        entry = self.root / key
+        if entry.is_dir() or not (source / "pyvenv.cfg").is_file():
+            return False
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f"{_TMP_PREFIX}{uuid.uuid4().hex}"
+        try:
+            staging.mkdir()
+            _clone_tree(source, staging / "venv")
+            cfg = read_pyvenv_cfg(source)
+            now = time.time()
+            self._write_meta(
+                staging,
+                VenvTemplate(
+                    key=key,
+                    source_root=str(worktree_root),
+                    python_version=cfg.get("version_info") or cfg.get("version", ""),
+                    size_bytes=_tree_size(staging / "venv"),
+                    created_at=now,
+                    last_used=now,
+                ),
+            )
+            with self._locked(exclusive=True):
+                if entry.exists():
+                    return False
+                os.rename(staging, entry)
+        except OSError as exc:
+            logger.warning("venv cache: could not store %s: %s", key[:12], exc)
+            return False
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        logger.info("venv cache: stored template %s from %s", key[:12], worktree_root)
+        self.evict()
+        return True
+
+    def evict(self) -> List[str]:
+        """
+        Drop expired entries, then LRU entries until within ``max_bytes``.
+
+        Also removes staging directories abandoned by crashed stores.
+
+        Returns
+        -------
+        List[str]
+            Keys evicted.
+        """
+        evicted: List[str] = []
+        now = time.time()
+        with self._locked(exclusive=True):
+            for stale in self.root.glob(f"{_TMP_PREFIX}*"):
+                try:
+                    if now - stale.stat().st_mtime > 86400:
+                        shutil.rmtree(stale, ignore_errors=True)
+                except OSError:
+                    pass
+            templates = sorted(self.entries(), key=lambda t: t.last_used)
+            total = sum(t.size_bytes for t in templates)
+            for template in templates:
+                expired = now - template.last_used > self.max_age_seconds
+                if not expired and total <= self.max_bytes:
+                    continue
+                shutil.rmtree(self.root / template.key, ignore_errors=True)
+                total -= template.size_bytes
+                evicted.append(template.key)
+        if evicted:
+            logger.info("venv cache: evicted %d template(s)", len(evicted))
+        return evicted
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "VENV_CACHE_DIR_ENV_VAR",
+    "VENV_CACHE_ENV_VAR",
+    "VENV_CACHE_MAX_AGE_ENV_VAR",
+    "VENV_CACHE_MAX_BYTES_ENV_VAR",
+    "VenvTemplate",
+    "VenvTemplateCache",
+    "read_pyvenv_cfg",
+    "relocate_venv",
+    "venv_cache_enabled",
+]
@@ -31,11 +31,12 @@ Example:
     ...     print(f"Mismatch: {result.feedback}")
 """
 
+import asyncio
 import io
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,8 @@ class ComparisonResult:
         tier: Comparison tier (1 or 2)
         feedback: Optional explanation (present if failed or escalated)
         spatial_map: Optional SSIM spatial difference map (PNG bytes)
+        ssim_exact: False when SSIM stopped early on a Tier 1 FAIL; ssim_score
+            is then only an upper bound, below the FAIL threshold
     """
 
     passed: bool
@@ -93,6 +96,7 @@ class ComparisonResult:
     tier: ComparisonTier
     feedback: Optional[str] = None
     spatial_map: Optional[bytes] = None
+    ssim_exact: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization.
@@ -107,6 +111,7 @@ class ComparisonResult:
             "tier": self.tier.value,
             "feedback": self.feedback,
             "spatial_map": self.spatial_map.hex() if self.spatial_map else None,
+            "ssim_exact": self.ssim_exact,
         }
 
     @classmethod
@@ -130,6 +135,7 @@ class ComparisonResult:
             tier=ComparisonTier(data.get("tier", 1)),
             feedback=data.get("feedback"),
             spatial_map=spatial_map,
+            ssim_exact=data.get("ssim_exact", True),
         )
 
 
@@ -143,15 +149,25 @@ class SSIMComparator:
 
     This class handles the deterministic SSIM computation with zero token cost.
     Uses the bezkrovny variant as recommended by jest-image-snapshot for
-    fast computation with negligible accuracy loss.
+    fast computation with negligible accuracy loss. The arithmetic lives in
+    ``ssim_engine``: decoded images are cached by content hash, so a reference
+    compared against many renders is decoded once.
 
     Attributes:
         variant: SSIM variant used (always "bezkrovny")
+        pyramid_level: Number of 2x downsamples applied before comparing
+            (0 = full resolution)
     """
 
-    def __init__(self):
-        """Initialize SSIMComparator with bezkrovny variant."""
+    def __init__(self, pyramid_level: int = 0):
+        """Initialize SSIMComparator with bezkrovny variant.
+
+        Args:
+            pyramid_level: Compare images this many 2x downsamples in. Each
+                level quarters the work; 0 keeps full resolution.
+        """
         self.variant = "bezkrovny"
+        self.pyramid_level = max(0, pyramid_level)
         self._ssim_available = self._check_ssim_availability()
 
     def _check_ssim_availability(self) -> bool:
@@ -161,17 +177,24 @@ class SSIMComparator:
             True if dependencies available, False otherwise
         """
         try:
-            from skimage.metrics import structural_similarity
+            import numpy
             from PIL import Image
 
             return True
         except ImportError:
             logger.warning(
                 "SSIM dependencies not available. "
-                "Install with: pip install scikit-image pillow"
+                "Install with: pip install numpy pillow"
             )
             return False
 
+    def _require_ssim(self) -> None:
+        if not self._ssim_available:
+            raise RuntimeError(
+                "SSIM dependencies not available. "
+                "Install with: pip install numpy pillow"
+            )
+
     def _load_image(self, image_bytes: bytes) -> "np.ndarray":
         """Load image bytes into numpy array.
 
@@ -179,33 +202,16 @@ class SSIMComparator:
             image_bytes: PNG image as bytes
 
         Returns:
-            Numpy array representing the image
+            Read-only numpy array representing the image (RGBA and other
+            modes converted to RGB, grayscale kept as-is)
 
         Raises:
             ValueError: If image bytes are empty or invalid
             RuntimeError: If image cannot be decoded
         """
-        if not image_bytes:
-            raise ValueError("Empty image bytes")
+        from guardkit.orchestrator import ssim_engine
 
-        try:
-            from PIL import Image
-            import numpy as np
-
-            img = Image.open(io.BytesIO(image_bytes))
-            # Convert to RGB if necessary (handles RGBA, L, etc.)
-            if img.mode == "RGBA":
-                # Remove alpha channel for SSIM comparison
-                img = img.convert("RGB")
-            elif img.mode == "L":
-                # Keep grayscale as-is
-                pass
-            elif img.mode != "RGB":
-                img = img.convert("RGB")
-
-            return np.array(img)
-        except Exception as e:
-            raise RuntimeError(f"Failed to decode image: {e}")
+        return ssim_engine.load(image_bytes)
 
     def compute_ssim(self, reference: bytes, rendered: bytes) -> float:
         """Compute SSIM score between two images.
@@ -224,74 +230,116 @@ class SSIMComparator:
             ValueError: If images have different dimensions
             RuntimeError: If SSIM computation fails
         """
-        if not self._ssim_available:
-            raise RuntimeError(
-                "SSIM dependencies not available. "
-                "Install with: pip install scikit-image pillow"
-            )
+        return float(self.compute_ssim_score(reference, rendered).value)
 
-        try:
-            from skimage.metrics import structural_similarity
-            import numpy as np
+    def compute_ssim_score(
+        self, reference: bytes, rendered: bytes, fail_below: Optional[float] = None
+    ) -> "SSIMScore":
+        """Compute SSIM, optionally stopping once it cannot reach a threshold.
 
-            # Load images
-            ref_img = self._load_image(reference)
-            rend_img = self._load_image(rendered)
+        Args:
+            reference: Reference image as PNG bytes
+            rendered: Rendered image as PNG bytes
+            fail_below: Optional threshold. Once the score provably cannot
+                reach it, computation stops and the result carries an upper
+                bound (still below the threshold) with ``exact=False``.
 
-            # Validate dimensions match
-            if ref_img.shape != rend_img.shape:
-                raise ValueError(
-                    f"Image dimensions must match. "
-                    f"Reference: {ref_img.shape}, Rendered: {rend_img.shape}"
-                )
+        Returns:
+            ``ssim_engine.SSIMScore`` (value and whether it is exact)
 
-            # Determine if grayscale or color
-            is_grayscale = len(ref_img.shape) == 2
-
-            # Calculate data range, handle solid color images (min == max)
-            data_range = ref_img.max() - ref_img.min()
-            if data_range == 0:
-                # For solid color images, use default 8-bit range
-                data_range = 255
-
-            # Compute SSIM with data_range for proper normalization
-            if is_grayscale:
-                score = structural_similarity(
-                    ref_img,
-                    rend_img,
-                    data_range=data_range,
-                )
-            else:
-                # For color images, compute SSIM per channel and average
-                score = structural_similarity(
-                    ref_img,
-                    rend_img,
-                    data_range=data_range,
-                    channel_axis=2,  # RGB channels on axis 2
-                )
+        Raises:
+            RuntimeError: If SSIM computation fails
+        """
+        self._require_ssim()
 
-            # Handle NaN (can occur with identical solid-color images)
-            if np.isnan(score):
-                # If images are identical, return 1.0
-                if np.array_equal(ref_img, rend_img):
-                    score = 1.0
-                else:
-                    score = 0.0
+        try:
+            from guardkit.orchestrator import ssim_engine
 
-            return float(score)
+            score = ssim_engine.score_pair(
+                reference,
+                rendered,
+                pyramid_level=self.pyramid_level,
+                fail_below=fail_below,
+            )
+            return score
 
         except ImportError as e:
             raise RuntimeError(f"SSIM dependency missing: {e}")
         except Exception as e:
             raise RuntimeError(f"SSIM computation failed: {e}")
 
+    def compute_ssim_batch(
+        self,
+        pairs: Sequence[Tuple[bytes, bytes]],
+        workers: Optional[int] = None,
+    ) -> List[float]:
+        """Compute SSIM scores for many (reference, rendered) pairs.
+
+        Pairs are scored in a process pool (GUARDKIT_SSIM_WORKERS, default
+        min(8, cpu_count)); results keep the order of ``pairs``.
+
+        Args:
+            pairs: (reference, rendered) PNG byte pairs
+            workers: Pool size override; 1 scores inline
+
+        Returns:
+            One SSIM score per pair
+
+        Raises:
+            RuntimeError: If any pair fails to compute
+        """
+        return [
+            float(score.value)
+            for score in self.compute_ssim_scores(pairs, workers=workers)
+        ]
+
+    def compute_ssim_scores(
+        self,
+        pairs: Sequence[Tuple[bytes, bytes]],
+        fail_below: Optional[float] = None,
+        workers: Optional[int] = None,
+    ) -> List["SSIMScore"]:
+        """Batch form of ``compute_ssim_score``; results keep pair order.
+
+        Args:
+            pairs: (reference, rendered) PNG byte pairs
+            fail_below: As for ``compute_ssim_score``
+            workers: Pool size override; 1 scores inline
+
+        Returns:
+            One ``ssim_engine.SSIMScore`` per pair
+
+        Raises:
+            RuntimeError: If any pair fails to compute
+        """
+        self._require_ssim()
+        if not pairs:
+            return []
+
+        try:
+            from guardkit.orchestrator import ssim_engine
+
+            scores = ssim_engine.score_pairs(
+                pairs,
+                pyramid_level=self.pyramid_level,
+                fail_below=fail_below,
+                workers=workers,
+            )
+            return scores
+
+        except ImportError as e:
+            raise RuntimeError(f"SSIM dependency missing: {e}")
+        except Exception as e:
+            raise RuntimeError(f"SSIM batch computation failed: {e}")
+
     def compute_ssim_with_map(
         self, reference: bytes, rendered: bytes
     ) -> Tuple[float, bytes]:
         """Compute SSIM score and generate spatial quality map.
 
         The spatial map shows WHERE differences occur, which is passed
-        to Tier 2 AI vision for targeted reasoning.
+        to Tier 2 AI vision for targeted reasoning. Color images are
+        compared in grayscale for the map.
 
         Args:
             reference: Reference image as PNG bytes
@@ -304,64 +352,17 @@ class SSIMComparator:
             ValueError: If images have different dimensions
             RuntimeError: If computation fails
         """
-        if not self._ssim_available:
-            raise RuntimeError(
-                "SSIM dependencies not available. "
-                "Install with: pip install scikit-image pillow"
-            )
+        self._require_ssim()
 
         try:
-            from skimage.metrics import structural_similarity
             from PIL import Image
             import numpy as np
 
-            # Load images
-            ref_img = self._load_image(reference)
-            rend_img = self._load_image(rendered)
+            from guardkit.orchestrator import ssim_engine
 
-            # Validate dimensions match
-            if ref_img.shape != rend_img.shape:
-                raise ValueError(
-                    f"Image dimensions must match. "
-                    f"Reference: {ref_img.shape}, Rendered: {rend_img.shape}"
-                )
-
-            # Determine if grayscale or color
-            is_grayscale = len(ref_img.shape) == 2
-
-            # Calculate data range, handle solid color images
-            if is_grayscale:
-                data_range = ref_img.max() - ref_img.min()
-            else:
-                ref_gray = np.mean(ref_img, axis=2).astype(np.uint8)
-                rend_gray = np.mean(rend_img, axis=2).astype(np.uint8)
-                data_range = ref_gray.max() - ref_gray.min()
-
-            if data_range == 0:
-                data_range = 255
-
-            # Compute SSIM with full image output for spatial map
-            if is_grayscale:
-                score, diff_map = structural_similarity(
-                    ref_img,
-                    rend_img,
-                    data_range=data_range,
-                    full=True,
-                )
-            else:
-                score, diff_map = structural_similarity(
-                    ref_gray,
-                    rend_gray,
-                    data_range=data_range,
-                    full=True,
-                )
-
-            # Handle NaN
-            if np.isnan(score):
-                if is_grayscale:
-                    score = 1.0 if np.array_equal(ref_img, rend_img) else 0.0
-                else:
-                    score = 1.0 if np.array_equal(ref_gray, rend_gray) else 0.0
+            score, diff_map = ssim_engine.score_pair_with_map(
+                reference, rendered, pyramid_level=self.pyramid_level
+            )
 
             # Convert diff map to visual representation
             # Invert and scale to show differences as bright areas
@@ -369,6 +370,10 @@ class SSIMComparator:
 
             # Create PNG bytes from diff map
             diff_img = Image.fromarray(diff_visual, mode="L")
+            if self.pyramid_level:
+                # Report the map at the input's size, not the pyramid level's
+                height, width = self._load_image(reference).shape[:2]
+                diff_img = diff_img.resize((width, height), Image.NEAREST)
             buffer = io.BytesIO()
             diff_img.save(buffer, format="PNG")
             spatial_map_bytes = buffer.getvalue()
@@ -413,6 +418,8 @@ class VisualComparator:
         ai_vision_callback: Optional[
             Callable[[bytes, bytes, bytes, float], Tuple[bool, str]]
         ] = None,
+        pyramid_level: int = 0,
+        early_exit: bool = False,
     ):
         """Initialize VisualComparator.
 
@@ -420,9 +427,15 @@ class VisualComparator:
             ai_vision_callback: Optional callback for Tier 2 AI vision review.
                 Signature: (reference, rendered, spatial_map, ssim_score) -> (passed, feedback)
                 If not provided, a default async callback will be used.
+            pyramid_level: Compare screenshots this many 2x downsamples in
+                (0 = full resolution).
+            early_exit: Stop SSIM once a pair provably fails Tier 1. A clear
+                FAIL then reports ``SSIM < 0.85`` with ``ssim_exact=False``
+                instead of its exact score.
         """
-        self._ssim_comparator = SSIMComparator()
+        self._ssim_comparator = SSIMComparator(pyramid_level=pyramid_level)
         self._ai_vision_callback = ai_vision_callback
+        self._early_exit = early_exit
 
     async def compare(self, reference: bytes, rendered: bytes) -> ComparisonResult:
         """Compare reference and rendered images using tiered pipeline.
@@ -434,6 +447,9 @@ class VisualComparator:
            - < 0.85: Tier 1 FAIL
            - 0.85-0.94: Tier 2 escalation
 
+        With ``early_exit``, SSIM stops once the score cannot reach the FAIL
+        threshold; such a FAIL carries an upper bound and ``ssim_exact=False``.
+
         Args:
             reference: Reference/design image as PNG bytes
             rendered: Rendered implementation image as PNG bytes
@@ -452,13 +468,76 @@ class VisualComparator:
         # Step 1: Compute SSIM (Tier 1 - deterministic, zero token cost)
         try:
             # First try simple SSIM for quick routing decision
-            ssim_score = self._ssim_comparator.compute_ssim(reference, rendered)
+            if self._early_exit:
+                score = self._ssim_comparator.compute_ssim_score(
+                    reference, rendered, fail_below=self.TIER1_FAIL_THRESHOLD
+                )
+                ssim_score, exact = float(score.value), score.exact
+            else:
+                ssim_score = self._ssim_comparator.compute_ssim(reference, rendered)
+                exact = True
         except Exception as e:
             raise RuntimeError(f"SSIM computation failed: {e}")
 
+        # Step 2: Route based on SSIM score
+        return await self._route(reference, rendered, ssim_score, exact)
+
+    async def compare_batch(
+        self, pairs: Sequence[Tuple[bytes, bytes]]
+    ) -> List[ComparisonResult]:
+        """Compare many (reference, rendered) pairs, e.g. one per viewport.
+
+        Tier 1 scores are computed together in a process pool off the event
+        loop; borderline pairs then escalate to Tier 2 concurrently.
+
+        Args:
+            pairs: (reference, rendered) PNG byte pairs
+
+        Returns:
+            One ComparisonResult per pair, in order
+
+        Raises:
+            ValueError: If any image is empty
+            RuntimeError: If SSIM computation fails for any pair
+        """
+        if any(not reference or not rendered for reference, rendered in pairs):
+            raise ValueError("Reference and rendered images cannot be empty")
+
+        try:
+            scores = await asyncio.to_thread(
+                self._ssim_comparator.compute_ssim_scores,
+                pairs,
+                self.TIER1_FAIL_THRESHOLD if self._early_exit else None,
+            )
+        except Exception as e:
+            raise RuntimeError(f"SSIM computation failed: {e}")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._route(reference, rendered, float(score.value), score.exact)
+                    for (reference, rendered), score in zip(pairs, scores)
+                )
+            )
+        )
+
+    async def _route(
+        self, reference: bytes, rendered: bytes, ssim_score: float, exact: bool = True
+    ) -> ComparisonResult:
+        """Route a Tier 1 SSIM score to PASS, FAIL or Tier 2 escalation.
+
+        Args:
+            reference: Reference image bytes
+            rendered: Rendered image bytes
+            ssim_score: Tier 1 SSIM score
+            exact: False when ``ssim_score`` is an early-exit upper bound
+                (always below the FAIL threshold)
+
+        Returns:
+            ComparisonResult for the routed tier
+        """
         logger.debug(f"SSIM score: {ssim_score:.4f}")
 
-        # Step 2: Route based on SSIM score
         if ssim_score >= self.TIER1_PASS_THRESHOLD:
             # Tier 1 PASS - High fidelity match
             logger.info(f"Tier 1 PASS: SSIM={ssim_score:.4f} >= {self.TIER1_PASS_THRESHOLD}")
@@ -472,16 +551,23 @@ class VisualComparator:
 
         elif ssim_score < self.TIER1_FAIL_THRESHOLD:
             # Tier 1 FAIL - Clear visual mismatch
-            logger.info(f"Tier 1 FAIL: SSIM={ssim_score:.4f} < {self.TIER1_FAIL_THRESHOLD}")
+            # An early-exit bound is not a score: report only the threshold
+            if exact:
+                logger.info(f"Tier 1 FAIL: SSIM={ssim_score:.4f} < {self.TIER1_FAIL_THRESHOLD}")
+                shown = f"={ssim_score:.3f}"
+            else:
+                logger.info(f"Tier 1 FAIL: SSIM < {self.TIER1_FAIL_THRESHOLD} (stopped early)")
+                shown = f" < {self.TIER1_FAIL_THRESHOLD}"
             return ComparisonResult(
                 passed=False,
                 ssim_score=ssim_score,
                 method=ComparisonMethod.SSIM,
                 tier=ComparisonTier.TIER_1,
                 feedback=(
-                    f"Visual mismatch detected (SSIM={ssim_score:.3f}). "
+                    f"Visual mismatch detected (SSIM{shown}). "
                     f"Significant differences between design and implementation."
                 ),
+                ssim_exact=exact,
             )
 
         else:
@@ -51,11 +51,18 @@ import shutil
 import subprocess
 import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import ClassVar, Dict, List, Optional, Protocol, Tuple
 
+from guardkit.orchestrator.checkpoint_plumbing import (
+    PlumbingCheckpointEngine,
+    PlumbingUnavailable,
+    Snapshot,
+    plumbing_enabled,
+)
 from guardkit.orchestrator.evidence_repos import EvidenceRepo
 
 logger = logging.getLogger(__name__)
@@ -477,6 +484,9 @@ class WorktreeCheckpointManager:
         # Git lock file path for serializing git operations across tasks
         self._git_lock_path = self.worktree_path / ".guardkit-git.lock"
 
+        # Plumbing checkpoint engines keyed by repo root (lazily created)
+        self._plumbing_engines: Dict[Path, PlumbingCheckpointEngine] = {}
+
         # Load existing checkpoints if available
         self._load_checkpoints()
 
@@ -491,9 +501,11 @@ class WorktreeCheckpointManager:
         This method stages all changes and creates a git commit with a
         standardized checkpoint message. The commit serves as a rollback point.
 
-        Git operations (add, commit, rev-parse) are serialized using a
-        file-based lock to prevent index.lock conflicts when multiple tasks
-        share the same worktree in feature mode.
+        Git operations are serialized using a file-based lock to prevent
+        index.lock conflicts when multiple tasks share the same worktree in
+        feature mode. With the production executor the working tree is staged
+        into a private index *before* the lock is taken, so the lock only
+        covers ``commit-tree``/``update-ref`` (see checkpoint_plumbing).
 
         Args:
             turn: Turn number (1-indexed)
@@ -556,6 +568,12 @@ class WorktreeCheckpointManager:
         1. threading.Lock - coordinates threads in the same process
         2. fcntl.flock - coordinates across processes (if needed)
 
+        TASK-AB-XREPOEV01 (AC-004): each declared sibling repo is committed
+        too, so approved sibling-repo work is versioned. On the plumbing path
+        the sibling repos are staged concurrently with the worktree, but they
+        are only committed once the worktree checkpoint has landed: a failed
+        worktree commit leaves them untouched (their snapshots are discarded).
+
         Args:
             turn: Turn number (1-indexed)
             tests_passed: Tri-state test signal (True/False/None=unknown)
@@ -567,28 +585,105 @@ class WorktreeCheckpointManager:
         Raises:
             subprocess.CalledProcessError: If git commands fail
         """
-        thread_lock = self._get_thread_lock()
+        pool: Optional[ThreadPoolExecutor] = None
+        staging = None
+        evidence_snapshots: Optional[Dict[str, Optional[Snapshot]]] = None
+        if self.evidence_repos and self._use_plumbing():
+            pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="checkpoint-evidence"
+            )
+            staging = pool.submit(self._stage_evidence_repos)
+        committed = False
+        try:
+            # Stage outside the lock (plumbing path only; None -> porcelain).
+            snapshot = self._plumbing_snapshot(self.worktree_path)
+            thread_lock = self._get_thread_lock()
 
-        with thread_lock:
-            # Ensure lock file parent directory exists
-            self._git_lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with thread_lock:
+                # Ensure lock file parent directory exists
+                self._git_lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self._git_lock_path, "w") as lock_file:
-                fcntl.flock(lock_file, fcntl.LOCK_EX)
-                try:
-                    return self._execute_git_checkpoint(
-                        turn, tests_passed, test_count
-                    )
-                finally:
-                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                with open(self._git_lock_path, "w") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        checkpoint = self._execute_git_checkpoint(
+                            turn, tests_passed, test_count, snapshot=snapshot
+                        )
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+            committed = True
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+                evidence_snapshots = staging.result()
+                if not committed:
+                    for snapshot in evidence_snapshots.values():
+                        if snapshot is not None:
+                            PlumbingCheckpointEngine.discard(snapshot)
+
+        # Best-effort and per-repo isolated: a failure in one repo never
+        # aborts the worktree checkpoint that already landed.
+        checkpoint.evidence_commits = self._checkpoint_evidence_repos(
+            turn, tests_passed, snapshots=evidence_snapshots
+        )
+        return checkpoint
+
+    def _use_plumbing(self) -> bool:
+        """Plumbing commits need the real subprocess executor (and no opt-out).
+
+        An injected executor (tests, dry runs) sees the classic porcelain
+        command sequence.
+        """
+        return type(self.git_executor) is SubprocessGitExecutor and plumbing_enabled()
+
+    def _plumbing_engine(
+        self, repo_root: Path, timeout: Optional[int] = None
+    ) -> PlumbingCheckpointEngine:
+        engine = self._plumbing_engines.get(repo_root)
+        if engine is None:
+            engine = PlumbingCheckpointEngine(repo_root, timeout=timeout)
+            self._plumbing_engines[repo_root] = engine
+        return engine
+
+    def _plumbing_snapshot(
+        self, repo_root: Path, timeout: Optional[int] = None
+    ) -> Optional[Snapshot]:
+        """Stage ``repo_root`` into a private index, or None for porcelain."""
+        if not self._use_plumbing():
+            return None
+        try:
+            return self._plumbing_engine(repo_root, timeout).snapshot(
+                _CHECKPOINT_ADD_ARGV
+            )
+        except PlumbingUnavailable as exc:
+            logger.debug("Porcelain checkpoint for %s: %s", repo_root, exc)
+            return None
+
+    def _plumbing_commit(
+        self,
+        repo_root: Path,
+        snapshot: Optional[Snapshot],
+        message: str,
+    ) -> Optional[str]:
+        """Commit a snapshot under the held lock; None means use porcelain."""
+        if snapshot is None:
+            return None
+        try:
+            return self._plumbing_engines[repo_root].commit(
+                snapshot, message, _CHECKPOINT_ADD_ARGV
+            )
+        except PlumbingUnavailable as exc:
+            logger.debug("Porcelain checkpoint for %s: %s", repo_root, exc)
+            return None
 
     def _execute_git_checkpoint(
         self,
         turn: int,
         tests_passed: Optional[bool],
         test_count: int,
+        snapshot: Optional[Snapshot] = None,
     ) -> Checkpoint:
-        """Execute the git add/commit/rev-parse sequence.
+        """Commit the worktree: plumbing when snapshotted, else add/commit/rev-parse.
 
         This method contains the actual git operations, extracted for clarity.
         It must only be called while holding the worktree git lock.
@@ -597,10 +692,31 @@ class WorktreeCheckpointManager:
             turn: Turn number (1-indexed)
             tests_passed: Tri-state test signal (True/False/None=unknown)
             test_count: Number of tests run
+            snapshot: Private-index snapshot taken before the lock. None (or
+                a plumbing failure) runs the porcelain sequence.
 
         Returns:
-            Checkpoint record with commit hash
+            Checkpoint record with commit hash (evidence commits are filled
+            in by the caller)
         """
+        status = format_test_status(tests_passed)
+        message = f"[guardkit-checkpoint] Turn {turn} complete (tests: {status})"
+
+        commit_hash = self._plumbing_commit(self.worktree_path, snapshot, message)
+        if commit_hash is None:
+            commit_hash = self._porcelain_commit(message)
+
+        return Checkpoint(
+            turn=turn,
+            commit_hash=commit_hash,
+            timestamp=datetime.now().isoformat(),
+            tests_passed=tests_passed,
+            test_count=test_count,
+            message=message,
+        )
+
+    def _porcelain_commit(self, message: str) -> str:
+        """``git add -A`` + ``git commit`` + ``git rev-parse HEAD`` the worktree."""
         # Stage all changes (including untracked files) EXCEPT build junk
         # (register 2a5, 2026-07-30; extended to the JS/TS classes by TS-lane
         # D.1c): checkpoint commits were baking pip http caches and
@@ -615,10 +731,6 @@ class WorktreeCheckpointManager:
             cwd=self.worktree_path,
         )
 
-        # Create checkpoint commit message
-        status = format_test_status(tests_passed)
-        message = f"[guardkit-checkpoint] Turn {turn} complete (tests: {status})"
-
         # Create commit (allow empty for turns with no changes)
         self.git_executor.execute(
             ["git", "commit", "-m", message, "--allow-empty"],
@@ -630,27 +742,38 @@ class WorktreeCheckpointManager:
             ["git", "rev-parse", "HEAD"],
             cwd=self.worktree_path,
         )
-        commit_hash = result.stdout.strip()
+        return result.stdout.strip()
 
-        # TASK-AB-XREPOEV01 (AC-004): also commit each declared sibling repo so
-        # approved sibling-repo work is versioned, not left as uncommitted
-        # working-tree edits. Best-effort and per-repo isolated: a failure in
-        # one repo must never abort the worktree checkpoint that already
-        # landed.
-        evidence_commits = self._checkpoint_evidence_repos(turn, tests_passed)
+    def _stage_evidence_repos(self) -> Dict[str, Optional[Snapshot]]:
+        """Snapshot every sibling repo (concurrently), without committing.
 
-        return Checkpoint(
-            turn=turn,
-            commit_hash=commit_hash,
-            timestamp=datetime.now().isoformat(),
-            tests_passed=tests_passed,
-            test_count=test_count,
-            message=message,
-            evidence_commits=evidence_commits,
-        )
+        A repo that cannot be staged maps to None and is committed through
+        porcelain later. Never raises.
+        """
+
+        def _stage(repo: EvidenceRepo) -> Optional[Snapshot]:
+            if not repo.root.exists():
+                return None
+            try:
+                return self._plumbing_snapshot(
+                    repo.root, timeout=_EVIDENCE_GIT_TIMEOUT_S
+                )
+            except Exception as exc:  # noqa: BLE001 -- porcelain fallback
+                logger.debug("Porcelain checkpoint for %s: %s", repo.root, exc)
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.evidence_repos),
+            thread_name_prefix="checkpoint-evidence-stage",
+        ) as pool:
+            snapshots = list(pool.map(_stage, self.evidence_repos))
+        return {repo.name: snap for repo, snap in zip(self.evidence_repos, snapshots)}
 
     def _checkpoint_evidence_repos(
-        self, turn: int, tests_passed: Optional[bool]
+        self,
+        turn: int,
+        tests_passed: Optional[bool],
+        snapshots: Optional[Dict[str, Optional[Snapshot]]] = None,
     ) -> Dict[str, str]:
         """Commit each declared sibling repo's working tree at this turn.
 
@@ -660,6 +783,11 @@ class WorktreeCheckpointManager:
         sibling repo cannot collide on ``index.lock``. Best-effort: any
         per-repo failure is logged and skipped, never raised -- AC-004's
         explicit-disclaim fallback is honoured by logging the gap.
+
+        On the plumbing path the repos are committed concurrently (they share
+        no lock); an injected executor commits them one by one in order.
+        ``snapshots`` holds stagings taken by :meth:`_stage_evidence_repos`;
+        without it each repo is staged here.
         """
         evidence_commits: Dict[str, str] = {}
         if not self.evidence_repos:
@@ -670,9 +798,32 @@ class WorktreeCheckpointManager:
             f"[guardkit-checkpoint] {self.task_id} turn {turn} "
             f"(sibling evidence, tests: {status})"
         )
-        for repo in self.evidence_repos:
+
+        def _commit(repo: EvidenceRepo) -> Tuple[Optional[str], Optional[Exception]]:
             try:
-                commit = self._commit_one_evidence_repo(repo, message)
+                if snapshots is not None:
+                    snapshot = snapshots.get(repo.name)
+                elif repo.root.exists():
+                    snapshot = self._plumbing_snapshot(
+                        repo.root, timeout=_EVIDENCE_GIT_TIMEOUT_S
+                    )
+                else:
+                    snapshot = None
+                return self._commit_one_evidence_repo(repo, message, snapshot), None
+            except Exception as exc:  # noqa: BLE001 -- never abort the checkpoint
+                return None, exc
+
+        if len(self.evidence_repos) > 1 and self._use_plumbing():
+            with ThreadPoolExecutor(
+                max_workers=len(self.evidence_repos),
+                thread_name_prefix="checkpoint-evidence",
+            ) as pool:
+                outcomes = list(pool.map(_commit, self.evidence_repos))
+        else:
+            outcomes = [_commit(repo) for repo in self.evidence_repos]
+
+        for repo, (commit, exc) in zip(self.evidence_repos, outcomes):
+            if exc is None:
                 if commit is not None:
                     evidence_commits[repo.name] = commit
                     logger.info(
@@ -689,7 +840,7 @@ class WorktreeCheckpointManager:
                         repo.name,
                         turn,
                     )
-            except Exception as exc:  # noqa: BLE001 -- never abort the checkpoint
+            else:
                 logger.warning(
                     "Sibling repo %s checkpoint failed at turn %d: %s "
                     "(state UNVERSIONED for this turn).",
@@ -700,7 +851,7 @@ class WorktreeCheckpointManager:
         return evidence_commits
 
     def _commit_one_evidence_repo(
-        self, repo: EvidenceRepo, message: str
+        self, repo: EvidenceRepo, message: str, snapshot: Optional[Snapshot]
     ) -> Optional[str]:
         """``git add -A && git commit`` one sibling repo under its own lock.
 
@@ -708,9 +859,13 @@ class WorktreeCheckpointManager:
         repository. The commit lands on the repo's CURRENT branch (no branch
         switch -- switching the operator's shared sibling repo is the riskier
         option the task flagged; an additive commit is recoverable, a branch
-        switch is disruptive).
+        switch is disruptive). On the plumbing path ``snapshot`` was staged
+        before the lock is taken and only commit-tree/update-ref run under it;
+        None runs the porcelain sequence.
         """
         if not repo.root.exists():
+            if snapshot is not None:
+                PlumbingCheckpointEngine.discard(snapshot)
             return None
 
         repo_lock_path = repo.root / ".guardkit-git.lock"
@@ -722,6 +877,9 @@ class WorktreeCheckpointManager:
         with open(repo_lock_path, "w") as lock_file:
             fcntl.flock(lock_file, fcntl.LOCK_EX)
             try:
+                commit = self._plumbing_commit(repo.root, snapshot, message)
+                if commit is not None:
+                    return commit
                 # Bounded so a hung git cannot hold the cross-process lock
                 # indefinitely and stall every task sharing this repo.
                 self.git_executor.execute(
@@ -22,15 +22,32 @@ invocation that *fails* (not a repo, bad ref) raises :class:`DiffIngestError`
 loudly — it is never silently read as "no changes". An invocation that
 *succeeds with empty output* is a legitimate empty payload (nothing changed),
 distinct from a failure.
+
+Big merges stream: ``git`` stdout is parsed line by line as it arrives
+(:func:`iter_unified_diff`), and the ``ingest_*`` constructors take a
+``path_filter`` plus per-file / per-payload character caps that are applied
+before hunks are built, so a vendored or generated change costs a bounded
+amount of memory. A capped file is kept, marked ``truncated``.
 """
 
 from __future__ import annotations
 
 import re
 import subprocess
+import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Literal, Optional, Sequence, Tuple
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 __all__ = [
     "DiffIngestError",
@@ -41,7 +58,9 @@ __all__ = [
     "DiffHunk",
     "FileDiff",
     "ReviewPayload",
+    "PathFilter",
     "parse_unified_diff",
+    "iter_unified_diff",
     "ingest_working_tree",
     "ingest_commit",
     "ingest_merge",
@@ -64,6 +83,11 @@ LineKind = Literal["context", "added", "removed"]
 #: Default surrounding-context lines requested from git (git's own default).
 DEFAULT_CONTEXT_LINES = 3
 
+#: Keep-predicate over a file's repo path (True = ingest its hunks).
+PathFilter = Callable[[str], bool]
+
+_GIT_TIMEOUT_SECONDS = 60
+
 
 class DiffIngestError(Exception):
     """A diff could not be produced or parsed — raised loudly, never swallowed.
@@ -75,11 +99,12 @@ class DiffIngestError(Exception):
 
 # ---------------------------------------------------------------------------
 # Structured payload (frozen dataclasses — a deterministic reader, not a
-# persisted QA format; F14 is the persisted schema this feeds).
+# persisted QA format; F14 is the persisted schema this feeds). Slotted: a
+# large diff holds one DiffLine per body line.
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffLine:
     """One body line of a hunk.
 
@@ -94,7 +119,7 @@ class DiffLine:
     new_lineno: Optional[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffHunk:
     """One ``@@`` hunk: its ranges, the section heading, and its body lines."""
 
@@ -115,7 +140,7 @@ class DiffHunk:
         return tuple(l for l in self.lines if l.kind == "removed")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileDiff:
     """A single file's diff: change classification, metadata, and its hunks."""
 
@@ -127,6 +152,8 @@ class FileDiff:
     new_mode: Optional[str]
     similarity: Optional[int]
     hunks: Tuple[DiffHunk, ...]
+    #: The hunks were dropped by an ingest size cap (metadata is still exact).
+    truncated: bool = False
 
     @property
     def additions(self) -> int:
@@ -169,6 +196,11 @@ class ReviewPayload:
     def is_empty(self) -> bool:
         return not self.files
 
+    @property
+    def truncated_paths(self) -> Tuple[str, ...]:
+        """Paths whose hunks an ingest size cap dropped (metadata kept)."""
+        return tuple(f.path for f in self.files if f.truncated)
+
     @property
     def total_additions(self) -> int:
         return sum(f.additions for f in self.files)
@@ -278,6 +310,21 @@ class _FileBuilder:
         self.is_deleted: bool = False
         self.is_binary: bool = False
         self.hunks: List[DiffHunk] = []
+        # Streaming caps (``iter_unified_diff``): body characters kept so far,
+        # and whether the hunks were dropped for a cap or a path filter.
+        self.chars: int = 0
+        self.truncated: bool = False
+        self.filtered: bool = False
+
+    @property
+    def keeps_hunks(self) -> bool:
+        return not (self.truncated or self.filtered)
+
+    def truncate(self) -> None:
+        """Drop the hunks read so far; later body lines are discarded too."""
+        self.truncated = True
+        self.hunks = []
+        self.chars = 0
 
     def _change_kind(self) -> ChangeKind:
         if self.is_new:
@@ -298,7 +345,7 @@ class _FileBuilder:
             return "type_changed"
         return "modified"
 
-    def seal(self) -> Optional[FileDiff]:
+    def _paths(self) -> Tuple[Optional[str], Optional[str]]:
         if self.saw_old_marker:
             old = self.old_path
         else:
@@ -307,9 +354,17 @@ class _FileBuilder:
             new = self.new_path
         else:
             new = self.rename_to or self.copy_to or self.header_new
-        # Primary path: the post-image path (new), falling back to old for a
-        # delete. If neither surfaced, this builder held no real file.
-        path = new if new is not None else old
+        return old, new
+
+    def resolved_path(self) -> Optional[str]:
+        """Primary path: the post-image path, falling back to old for a delete."""
+        old, new = self._paths()
+        return new if new is not None else old
+
+    def seal(self) -> Optional[FileDiff]:
+        old, _new = self._paths()
+        # If neither path surfaced, this builder held no real file.
+        path = self.resolved_path()
         if path is None:
             return None
         return FileDiff(
@@ -321,6 +376,7 @@ class _FileBuilder:
             new_mode=self.new_mode,
             similarity=self.similarity,
             hunks=tuple(self.hunks),
+            truncated=self.truncated,
         )
 
 
@@ -335,9 +391,31 @@ def parse_unified_diff(text: str) -> Tuple[FileDiff, ...]:
     Empty / whitespace-only input → an empty tuple (a legitimate no-change
     diff, not an error).
     """
-    lines = (text or "").splitlines()
-    files: List[FileDiff] = []
+    return tuple(iter_unified_diff((text or "").splitlines()))
+
+
+def iter_unified_diff(
+    lines: Iterable[str],
+    *,
+    path_filter: Optional[PathFilter] = None,
+    max_file_chars: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
+) -> Iterator[FileDiff]:
+    """Stream :class:`FileDiff` records out of ``git diff`` lines as each file ends.
+
+    The incremental form of :func:`parse_unified_diff`: *lines* (newline
+    stripped) may be a live pipe, and only the file currently being read is
+    held in memory. Two knobs bound what gets materialised:
+
+    - ``path_filter`` — a file whose path it rejects is dropped; its body
+      lines are discarded as they stream, never built into hunks.
+    - ``max_file_chars`` / ``max_total_chars`` — a file whose hunk bodies
+      exceed its own cap, or the payload's remaining budget, keeps its
+      metadata but loses its hunks and is marked ``truncated`` (honesty-to-
+      state: a clipped file says so, it never reads as a hunk-less change).
+    """
     builder: Optional[_FileBuilder] = None
+    budget_used = 0
 
     # Open hunk state.
     h_header: Optional[str] = None
@@ -347,7 +425,7 @@ def parse_unified_diff(text: str) -> Tuple[FileDiff, ...]:
 
     def _close_hunk() -> None:
         nonlocal h_header, h_body
-        if builder is not None and h_header is not None:
+        if builder is not None and h_header is not None and builder.keeps_hunks:
             builder.hunks.append(
                 _finalise_hunk(
                     h_header,
@@ -362,18 +440,43 @@ def parse_unified_diff(text: str) -> Tuple[FileDiff, ...]:
         h_header = None
         h_body = []
 
-    def _close_file() -> None:
+    def _close_file() -> Optional[FileDiff]:
         nonlocal builder
         _close_hunk()
-        if builder is not None:
-            sealed = builder.seal()
-            if sealed is not None:
-                files.append(sealed)
+        sealed = builder.seal() if builder is not None else None
         builder = None
+        if sealed is not None and path_filter is not None and not path_filter(
+            sealed.path
+        ):
+            return None
+        return sealed
+
+    def _keep_body_line(line: str) -> bool:
+        """Account one body line against the caps; False once it is dropped."""
+        nonlocal budget_used
+        assert builder is not None
+        if not builder.keeps_hunks:
+            return False
+        size = len(line) + 1
+        over_file = (
+            max_file_chars is not None and builder.chars + size > max_file_chars
+        )
+        over_total = (
+            max_total_chars is not None and budget_used + size > max_total_chars
+        )
+        if over_file or over_total:
+            budget_used -= builder.chars
+            builder.truncate()
+            return False
+        builder.chars += size
+        budget_used += size
+        return True
 
     for line in lines:
         if line.startswith("diff --git "):
-            _close_file()
+            sealed = _close_file()
+            if sealed is not None:
+                yield sealed
             builder = _FileBuilder()
             # Recover best-effort paths from "a/<old> b/<new>" (the sole path
             # source for a mode-only change). Unambiguous unless a path itself
@@ -397,13 +500,26 @@ def parse_unified_diff(text: str) -> Tuple[FileDiff, ...]:
                 # (e.g. the next file's metadata with no blank separator) closes
                 # the hunk and is reprocessed as metadata below.
                 if line[:1] in (" ", "+", "-", "\\") or line == "":
-                    h_body.append(line)
+                    if _keep_body_line(line):
+                        h_body.append(line)
+                    else:
+                        h_body = []
                     continue
                 _close_hunk()
 
         m = _HUNK_RE.match(line)
         if m is not None:
             _close_hunk()
+            if (
+                path_filter is not None
+                and builder.keeps_hunks
+                and not builder.hunks
+            ):
+                # The ---/+++ markers precede the first hunk, so the path is
+                # settled here: a rejected file never materialises a hunk.
+                path = builder.resolved_path()
+                if path is not None and not path_filter(path):
+                    builder.filtered = True
             h_header = line
             h_old_start = int(m.group("old_start"))
             h_old_count = int(m.group("old_count") or 1)
@@ -473,8 +589,9 @@ def parse_unified_diff(text: str) -> Tuple[FileDiff, ...]:
                         builder.saw_new_marker = True
         # Any other line (e.g. "\ No newline") outside a hunk is ignored.
 
-    _close_file()
-    return tuple(files)
+    sealed = _close_file()
+    if sealed is not None:
+        yield sealed
 
 
 # ---------------------------------------------------------------------------
@@ -490,12 +607,19 @@ def _default_git(
             ["git", "-C", str(repo_root), *args],
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=_GIT_TIMEOUT_SECONDS,
         )
 
     return _run
 
 
+def _diff_argv(diff_args: Sequence[str], context_lines: int) -> List[str]:
+    if context_lines < 0:
+        raise DiffIngestError(f"context_lines must be >= 0, got {context_lines}")
+    # Inject flags right after the subcommand so they bind to diff/show.
+    return [diff_args[0], "--no-color", f"--unified={context_lines}", *diff_args[1:]]
+
+
 def _run_diff(
     repo_root: Path,
     diff_args: Sequence[str],
@@ -511,11 +635,8 @@ def _run_diff(
     non-zero return code raises :class:`DiffIngestError` with argv + stderr —
     an unreadable subject is a named failure, never a faked empty review.
     """
-    if context_lines < 0:
-        raise DiffIngestError(f"context_lines must be >= 0, got {context_lines}")
+    args = _diff_argv(diff_args, context_lines)
     run = git_run or _default_git(repo_root)
-    # Inject flags right after the subcommand so they bind to diff/show.
-    args = [diff_args[0], "--no-color", f"--unified={context_lines}", *diff_args[1:]]
     try:
         proc = run(args)
     except (OSError, subprocess.SubprocessError) as exc:
@@ -531,6 +652,97 @@ def _run_diff(
     return proc.stdout or ""
 
 
+def _stream_diff(
+    repo_root: Path,
+    diff_args: Sequence[str],
+    *,
+    context_lines: int,
+) -> Iterator[str]:
+    """Yield a ``git diff``-family command's stdout line by line as git writes it.
+
+    The streaming sibling of :func:`_run_diff` (same argv, same loud failure
+    contract): the output is never held whole, so a parser downstream can drop
+    what it does not need while git is still producing the rest. A non-zero
+    exit raises :class:`DiffIngestError` once the stream is drained; stderr
+    goes to a temp file so a chatty git can never stall the pipe.
+    """
+    args = _diff_argv(diff_args, context_lines)
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        try:
+            proc = subprocess.Popen(
+                ["git", "-C", str(repo_root), *args],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+            )
+        except OSError as exc:
+            raise DiffIngestError(
+                f"git {' '.join(args)} could not be run ({exc}) — is git "
+                f"installed and {repo_root} a repository?"
+            ) from exc
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(_GIT_TIMEOUT_SECONDS, _kill)
+        timer.start()
+        try:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                yield line[:-1] if line.endswith("\n") else line
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:  # the consumer stopped early
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        if timed_out.is_set():
+            raise DiffIngestError(
+                f"git {' '.join(args)} could not be run (timed out after "
+                f"{_GIT_TIMEOUT_SECONDS}s)"
+            )
+        if returncode != 0:
+            stderr.seek(0)
+            raise DiffIngestError(
+                f"git {' '.join(args)} failed (exit {returncode}): "
+                f"{stderr.read().strip() or '<no stderr>'}"
+            )
+
+
+def _ingest_files(
+    repo_root: Path,
+    diff_args: Sequence[str],
+    *,
+    context_lines: int,
+    git_run: Optional[Callable[[Sequence[str]], subprocess.CompletedProcess]],
+    path_filter: Optional[PathFilter],
+    max_file_chars: Optional[int],
+    max_total_chars: Optional[int],
+) -> Tuple[FileDiff, ...]:
+    """Run the diff and parse it under the caller's filter and size caps.
+
+    Streams straight from git; an injected ``git_run`` (tests, callers with
+    their own runner) returns buffered output, which is parsed the same way.
+    """
+    if git_run is not None:
+        lines: Iterable[str] = _run_diff(
+            repo_root, diff_args, context_lines=context_lines, git_run=git_run
+        ).splitlines()
+    else:
+        lines = _stream_diff(repo_root, diff_args, context_lines=context_lines)
+    return tuple(
+        iter_unified_diff(
+            lines,
+            path_filter=path_filter,
+            max_file_chars=max_file_chars,
+            max_total_chars=max_total_chars,
+        )
+    )
+
+
 # ---------------------------------------------------------------------------
 # The public ingestion surface — one constructor per F14 SubjectKind + range.
 # ---------------------------------------------------------------------------
@@ -545,6 +757,9 @@ def ingest_working_tree(
     scope: TreeScope = "all",
     context_lines: int = DEFAULT_CONTEXT_LINES,
     git_run: Optional[Callable[[Sequence[str]], subprocess.CompletedProcess]] = None,
+    path_filter: Optional[PathFilter] = None,
+    max_file_chars: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
 ) -> ReviewPayload:
     """Ingest the working tree as a reviewable subject (F14 ``tree``, LPA-18).
 
@@ -567,14 +782,20 @@ def ingest_working_tree(
         ref = "working-tree (unstaged vs index)"
     else:  # pragma: no cover - Literal guards this at type-check time
         raise DiffIngestError(f"unknown working-tree scope {scope!r}")
-    text = _run_diff(
-        repo_root, diff_args, context_lines=context_lines, git_run=git_run
+    files = _ingest_files(
+        repo_root,
+        diff_args,
+        context_lines=context_lines,
+        git_run=git_run,
+        path_filter=path_filter,
+        max_file_chars=max_file_chars,
+        max_total_chars=max_total_chars,
     )
     return ReviewPayload(
         subject_kind="tree",
         ref=ref,
         context_lines=context_lines,
-        files=parse_unified_diff(text),
+        files=files,
     )
 
 
@@ -584,6 +805,9 @@ def ingest_commit(
     *,
     context_lines: int = DEFAULT_CONTEXT_LINES,
     git_run: Optional[Callable[[Sequence[str]], subprocess.CompletedProcess]] = None,
+    path_filter: Optional[PathFilter] = None,
+    max_file_chars: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
 ) -> ReviewPayload:
     """Ingest a single commit's diff (F14 ``commit``).
 
@@ -593,17 +817,20 @@ def ingest_commit(
     """
     if not commit or not commit.strip():
         raise DiffIngestError("commit ref must be a non-empty string")
-    text = _run_diff(
+    files = _ingest_files(
         repo_root,
         ["show", "--format=", commit],
         context_lines=context_lines,
         git_run=git_run,
+        path_filter=path_filter,
+        max_file_chars=max_file_chars,
+        max_total_chars=max_total_chars,
     )
     return ReviewPayload(
         subject_kind="commit",
         ref=commit,
         context_lines=context_lines,
-        files=parse_unified_diff(text),
+        files=files,
     )
 
 
@@ -613,6 +840,9 @@ def ingest_merge(
     *,
     context_lines: int = DEFAULT_CONTEXT_LINES,
     git_run: Optional[Callable[[Sequence[str]], subprocess.CompletedProcess]] = None,
+    path_filter: Optional[PathFilter] = None,
+    max_file_chars: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
 ) -> ReviewPayload:
     """Ingest a merge commit as what it brought in vs its first parent (F14 ``merge``).
 
@@ -623,17 +853,20 @@ def ingest_merge(
     """
     if not merge or not merge.strip():
         raise DiffIngestError("merge ref must be a non-empty string")
-    text = _run_diff(
+    files = _ingest_files(
         repo_root,
         ["diff", f"{merge}^1", merge],
         context_lines=context_lines,
         git_run=git_run,
+        path_filter=path_filter,
+        max_file_chars=max_file_chars,
+        max_total_chars=max_total_chars,
     )
     return ReviewPayload(
         subject_kind="merge",
         ref=merge,
         context_lines=context_lines,
-        files=parse_unified_diff(text),
+        files=files,
     )
 
 
@@ -644,6 +877,9 @@ def ingest_range(
     *,
     context_lines: int = DEFAULT_CONTEXT_LINES,
     git_run: Optional[Callable[[Sequence[str]], subprocess.CompletedProcess]] = None,
+    path_filter: Optional[PathFilter] = None,
+    max_file_chars: Optional[int] = None,
+    max_total_chars: Optional[int] = None,
 ) -> ReviewPayload:
     """Ingest an arbitrary git range (F14 ``commit`` — reviews committed history).
 
@@ -663,12 +899,18 @@ def ingest_range(
     else:
         diff_args = ["diff", base]
         ref = base
-    text = _run_diff(
-        repo_root, diff_args, context_lines=context_lines, git_run=git_run
+    files = _ingest_files(
+        repo_root,
+        diff_args,
+        context_lines=context_lines,
+        git_run=git_run,
+        path_filter=path_filter,
+        max_file_chars=max_file_chars,
+        max_total_chars=max_total_chars,
     )
     return ReviewPayload(
         subject_kind="commit",
         ref=ref,
         context_lines=context_lines,
-        files=parse_unified_diff(text),
+        files=files,
     )
@@ -86,6 +86,13 @@ REVIEW_SEAT_MAX_CHARS: int = int(
     os.environ.get(REVIEW_SEAT_MAX_CHARS_ENV, "300000")
 )
 
+# Ingest caps for the review subject: the seat never sees more than
+# REVIEW_SEAT_MAX_CHARS, so a single file past that window (vendored /
+# generated) is kept as metadata only, and the payload as a whole is held to a
+# few windows' worth however large the merge is.
+REVIEW_INGEST_MAX_FILE_CHARS: int = REVIEW_SEAT_MAX_CHARS
+REVIEW_INGEST_MAX_TOTAL_CHARS: int = 4 * REVIEW_SEAT_MAX_CHARS
+
 # Protected section markers that must NEVER be trimmed.
 _REVIEW_INSTRUCTION_HEADER = "## Review subject"
 _REVIEW_FINDING_SCHEMA = "## Diff under review"
@@ -94,6 +101,8 @@ __all__ = [
     "REVIEW_SEAT_ENV",
     "REVIEW_SEAT_MAX_CHARS_ENV",
     "REVIEW_SEAT_MAX_CHARS",
+    "REVIEW_INGEST_MAX_FILE_CHARS",
+    "REVIEW_INGEST_MAX_TOTAL_CHARS",
     "is_review_seat_enabled",
     "ALLOWED_SEATS",
     "DEFAULT_SEAT",
@@ -301,6 +310,9 @@ def render_payload_for_seat(payload: ReviewPayload, *, max_chars: int = 60000) -
         if fd.is_binary:
             lines.append("(binary file — not shown)")
             continue
+        if fd.truncated:
+            lines.append("(diff exceeds the ingest size cap — hunks not shown)")
+            continue
         for hunk in fd.hunks:
             lines.append(hunk.header if hunk.header else _synth_hunk_header(hunk))
             for dl in hunk.lines:
@@ -1019,10 +1031,14 @@ def default_merge_candidate_payload(
     single-commit diff (:func:`ingest_commit`). Either way the subject is "what
     this change delivered".
     """
+    caps = {
+        "max_file_chars": REVIEW_INGEST_MAX_FILE_CHARS,
+        "max_total_chars": REVIEW_INGEST_MAX_TOTAL_CHARS,
+    }
     try:
-        return ingest_merge(repo_root, ref, git_run=git_run)
+        return ingest_merge(repo_root, ref, git_run=git_run, **caps)
     except DiffIngestError:
-        return ingest_commit(repo_root, ref, git_run=git_run)
+        return ingest_commit(repo_root, ref, git_run=git_run, **caps)
 
 
 def run_review_gate_step(
@@ -36,6 +36,7 @@ from guardkit.orchestrator.exceptions import (
     TaskStateError,
 )
 from guardkit.orchestrator.paths import TaskArtifactPaths
+from guardkit.tasks.task_index import locate_task, record_task_move
 from guardkit.tasks.task_loader import TaskLoader, TaskNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -489,14 +490,10 @@ class TaskStateBridge:
         """
         tasks_dir = self.repo_root / "tasks"
 
-        for state in STATE_DIRECTORIES:
-            state_dir = tasks_dir / state
-            if not state_dir.exists():
-                continue
-
-            # Search for task file in this state directory (including subdirs)
-            for task_path in state_dir.rglob(f"{self.task_id}*.md"):
-                return state, task_path
+        # Search each state directory (including subdirs) via the task index
+        location = locate_task(self.task_id, self.repo_root, STATE_DIRECTORIES)
+        if location is not None:
+            return location.state, location.path
 
         # Task not found
         raise TaskNotFoundError(
@@ -705,6 +702,7 @@ The detailed specifications are in the task markdown file.
         try:
             # Move file (shutil.move handles cross-filesystem moves)
             shutil.move(str(current_path), str(new_path))
+            record_task_move(self.repo_root, current_path, new_path)
             self.logger.info(
                 f"Moved task file: {current_path} -> {new_path}"
             )
@@ -0,0 +1,493 @@
+"""
+Persistent task-file index.
+
+Resolving a task id used to mean ``rglob(f"{task_id}*.md")`` over every
+``tasks/<state>`` directory -- a full walk of ``tasks/completed`` on repos
+with thousands of finished tasks, repeated many times per turn by
+TaskLoader, TaskStateBridge, AgentInvoker and the preflight gates.
+
+``TaskIndex`` keeps the listing of every directory under ``tasks/<state>``
+together with the directory's mtime. A lookup stats the known directories
+and re-lists only those whose mtime moved: adding, removing or renaming a
+file changes its directory's mtime, and a new subdirectory shows up in its
+parent's listing. An unchanged tree therefore costs one ``stat`` per
+directory. A directory modified shortly before it was listed is treated as
+unstable and re-listed on every lookup, because a change within the same
+mtime tick would otherwise go unnoticed (git's "racily clean" rule).
+
+Listings are persisted to ``~/.guardkit/task-index/<root-hash>.json`` so a
+new process starts warm. The file is only a hint: every entry is
+revalidated against the filesystem before it is used.
+``TaskStateBridge._move_task_to_state`` updates the index as part of a move.
+
+Parsed frontmatter is cached in memory, keyed by the file's mtime and size
+(see :func:`load_task_post`).
+
+Environment:
+    ``GUARDKIT_TASK_INDEX=0`` restores the per-lookup ``rglob`` walk;
+    ``GUARDKIT_TASK_INDEX_DIR`` (default ``~/.guardkit/task-index``) moves
+    the on-disk cache.
+
+Example:
+    >>> from guardkit.tasks.task_index import locate_task
+    >>>
+    >>> location = locate_task("TASK-AB-001", Path("/repo"), ["backlog", "in_progress"])
+    >>> location.state, location.path
+    ('backlog', PosixPath('/repo/tasks/backlog/TASK-AB-001-oauth.md'))
+"""
+
+import bisect
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import frontmatter
+
+logger = logging.getLogger(__name__)
+
+TASK_INDEX_ENV_VAR = "GUARDKIT_TASK_INDEX"
+TASK_INDEX_DIR_ENV_VAR = "GUARDKIT_TASK_INDEX_DIR"
+
+#: Bumped whenever the on-disk layout changes.
+INDEX_FORMAT_VERSION = 1
+
+# A directory (or file) modified less than this long before it was read may
+# still change within the same mtime tick; never trust it. Covers coarse
+# (1-2 s) filesystem timestamps as well as kernel clock granularity.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_MAX_INDEXES = 64
+_MAX_CACHED_POSTS = 512
+
+
+def task_index_enabled() -> bool:
+    """Return False when ``GUARDKIT_TASK_INDEX`` switches the index off."""
+    raw = os.environ.get(TASK_INDEX_ENV_VAR, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+class TaskLocation(NamedTuple):
+    """Where a task file lives: its state directory and path."""
+
+    state: str
+    path: Path
+
+
+@dataclass
+class _DirListing:
+    """Markdown files and subdirectories of one directory, both sorted."""
+
+    mtime_ns: int
+    listed_at_ns: int
+    files: List[str] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+
+    def stable(self, mtime_ns: int) -> bool:
+        return (
+            mtime_ns == self.mtime_ns
+            and self.listed_at_ns - self.mtime_ns > _RACY_WINDOW_NS
+        )
+
+
+class TaskIndex:
+    """
+    Task id to file index for one repository's ``tasks/`` tree.
+
+    Thread-safe. Obtain instances through :func:`get_task_index` so every
+    caller in the process shares one index per repository.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Repository (or worktree) root containing ``tasks/``
+    cache_dir : Optional[Path]
+        Directory for the persisted listing; None keeps it in memory only
+    """
+
+    def __init__(self, repo_root: Path, cache_dir: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        self.tasks_dir = self.repo_root / "tasks"
+        self._cache_file: Optional[Path] = None
+        if cache_dir is not None:
+            digest = hashlib.sha256(str(self.repo_root).encode("utf-8")).hexdigest()[:16]
+            self._cache_file = Path(cache_dir) / f"{digest}.json"
+        self._dirs: Dict[str, _DirListing] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    # ------------------------------------------------------------- lookups
+
+    def locate(self, task_id: str, states: Sequence[str]) -> Optional[TaskLocation]:
+        """
+        Find the first ``{task_id}*.md`` file under ``tasks/<state>``.
+
+        States are searched in the given order. Within a state the search is
+        depth-first, checking a directory's own files before its
+        subdirectories, with names in sorted order.
+
+        Parameters
+        ----------
+        task_id : str
+            Task identifier (e.g., "TASK-AB-001")
+        states : Sequence[str]
+            State directory names in search order
+
+        Returns
+        -------
+        Optional[TaskLocation]
+            The match, or None when no state directory holds one
+
+        Raises
+        ------
+        OSError
+            If a task directory exists but cannot be read
+        """
+        with self._lock:
+            try:
+                for state in states:
+                    rel = self._find_in(state, task_id)
+                    if rel is not None:
+                        return TaskLocation(state, self.tasks_dir / rel)
+                return None
+            finally:
+                self._save()
+
+    def record_move(self, old_path: Path, new_path: Path) -> None:
+        """
+        Refresh the index for a task file that was just moved.
+
+        Re-lists the source and destination directories immediately, so the
+        next lookup (from any thread) sees the new location without
+        depending on mtime resolution.
+
+        Parameters
+        ----------
+        old_path : Path
+            Former task file path
+        new_path : Path
+            Current task file path
+        """
+        with self._lock:
+            for directory in {Path(old_path).parent, Path(new_path).parent}:
+                rel = self._rel(directory)
+                if rel is None:
+                    continue
+                try:
+                    self._relist(rel, os.stat(directory).st_mtime_ns)
+                except FileNotFoundError:
+                    self._forget(rel)
+                except OSError as e:
+                    logger.debug(f"Task index could not refresh {directory}: {e}")
+                    self._forget(rel)
+            self._save()
+
+    def clear(self) -> None:
+        """Forget every listing (the on-disk cache is rewritten on next use)."""
+        with self._lock:
+            self._dirs.clear()
+            self._dirty = True
+
+    # ------------------------------------------------------------ internals
+
+    def _rel(self, directory: Path) -> Optional[str]:
+        try:
+            rel = Path(directory).relative_to(self.tasks_dir)
+        except ValueError:
+            return None
+        return rel.as_posix() if rel.parts else None
+
+    def _find_in(self, rel: str, task_id: str) -> Optional[str]:
+        """Depth-first search of one directory subtree; caller holds the lock."""
+        listing = self._fresh(rel)
+        if listing is None:
+            return None
+        files = listing.files
+        i = bisect.bisect_left(files, task_id)
+        if i < len(files) and files[i].startswith(task_id):
+            return f"{rel}/{files[i]}"
+        for sub in listing.subdirs:
+            found = self._find_in(f"{rel}/{sub}", task_id)
+            if found is not None:
+                return found
+        return None
+
+    def _fresh(self, rel: str) -> Optional[_DirListing]:
+        """Return a validated listing for ``tasks/<rel>``, or None if absent."""
+        try:
+            mtime_ns = os.stat(self.tasks_dir / rel).st_mtime_ns
+        except FileNotFoundError:
+            self._forget(rel)
+            return None
+        listing = self._dirs.get(rel)
+        if listing is not None and listing.stable(mtime_ns):
+            return listing
+        return self._relist(rel, mtime_ns)
+
+    def _relist(self, rel: str, mtime_ns: int) -> _DirListing:
+        listed_at_ns = time.time_ns()
+        files: List[str] = []
+        subdirs: List[str] = []
+        with os.scandir(self.tasks_dir / rel) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like rglob: symlinked directories are not descended.
+                    if not entry.is_symlink():
+                        subdirs.append(entry.name)
+                elif entry.name.endswith(".md"):
+                    files.append(entry.name)
+        files.sort()
+        subdirs.sort()
+
+        previous = self._dirs.get(rel)
+        if previous is not None:
+            for gone in set(previous.subdirs) - set(subdirs):
+                self._forget(f"{rel}/{gone}")
+        if (
+            previous is None
+            or previous.files != files
+            or previous.subdirs != subdirs
+            or previous.mtime_ns != mtime_ns
+            or previous.stable(mtime_ns) != (listed_at_ns - mtime_ns > _RACY_WINDOW_NS)
+        ):
+            self._dirty = True
+        listing = _DirListing(mtime_ns, listed_at_ns, files, subdirs)
+        self._dirs[rel] = listing
+        return listing
+
+    def _forget(self, rel: str) -> None:
+        prefix = f"{rel}/"
+        stale = [key for key in self._dirs if key == rel or key.startswith(prefix)]
+        for key in stale:
+            del self._dirs[key]
+        if stale:
+            self._dirty = True
+
+    # ---------------------------------------------------------- persistence
+
+    def _load(self) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_FORMAT_VERSION
+            or data.get("root") != str(self.repo_root)
+        ):
+            return
+        try:
+            for rel, raw in data.get("dirs", {}).items():
+                self._dirs[rel] = _DirListing(
+                    mtime_ns=int(raw["mtime_ns"]),
+                    listed_at_ns=int(raw["listed_at_ns"]),
+                    files=list(raw["files"]),
+                    subdirs=list(raw["subdirs"]),
+                )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self._dirs.clear()
+
+    def _save(self) -> None:
+        """Persist the listings if they changed; caller holds the lock."""
+        if self._cache_file is None or not self._dirty:
+            return
+        payload = {
+            "version": INDEX_FORMAT_VERSION,
+            "root": str(self.repo_root),
+            "dirs": {
+                rel: {
+                    "mtime_ns": listing.mtime_ns,
+                    "listed_at_ns": listing.listed_at_ns,
+                    "files": listing.files,
+                    "subdirs": listing.subdirs,
+                }
+                for rel, listing in self._dirs.items()
+            },
+        }
+        tmp = self._cache_file.with_name(
+            f".{self._cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self._cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not persist task index {self._cache_file}: {e}")
+            tmp.unlink(missing_ok=True)
+
+
+# ============================================================================
+# Process-wide access
+# ============================================================================
+
+_indexes: "OrderedDict[str, TaskIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _cache_dir() -> Path:
+    raw = os.environ.get(TASK_INDEX_DIR_ENV_VAR, "").strip()
+    return Path(raw).expanduser() if raw else Path.home() / ".guardkit" / "task-index"
+
+
+def get_task_index(repo_root: Path) -> Optional[TaskIndex]:
+    """
+    Return the shared :class:`TaskIndex` for ``repo_root``.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Repository (or worktree) root
+
+    Returns
+    -------
+    Optional[TaskIndex]
+        The index, or None when ``GUARDKIT_TASK_INDEX`` disables it
+    """
+    if not task_index_enabled():
+        return None
+    root = Path(repo_root).resolve()
+    key = str(root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = TaskIndex(root, cache_dir=_cache_dir())
+            _indexes[key] = index
+            while len(_indexes) > _MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
+
+
+def locate_task(
+    task_id: str, repo_root: Path, states: Sequence[str]
+) -> Optional[TaskLocation]:
+    """
+    Find a task file under ``repo_root/tasks/<state>`` for the given states.
+
+    Uses the shared index; with the index disabled (or unreadable) it walks
+    each state directory with ``rglob`` as before.
+
+    Parameters
+    ----------
+    task_id : str
+        Task identifier (e.g., "TASK-AB-001")
+    repo_root : Path
+        Repository (or worktree) root
+    states : Sequence[str]
+        State directory names in search order
+
+    Returns
+    -------
+    Optional[TaskLocation]
+        The first match, or None
+    """
+    index = get_task_index(repo_root)
+    if index is not None:
+        try:
+            location = index.locate(task_id, states)
+        except OSError as e:
+            logger.debug(f"Task index lookup failed, walking instead: {e}")
+        else:
+            if location is None:
+                return None
+            # Report paths under the caller's root spelling, as rglob did.
+            return TaskLocation(
+                location.state,
+                Path(repo_root) / location.path.relative_to(index.repo_root),
+            )
+
+    tasks_dir = Path(repo_root) / "tasks"
+    for state in states:
+        state_dir = tasks_dir / state
+        if not state_dir.exists():
+            continue
+        for task_path in state_dir.rglob(f"{task_id}*.md"):
+            return TaskLocation(state, task_path)
+    return None
+
+
+def record_task_move(repo_root: Path, old_path: Path, new_path: Path) -> None:
+    """Tell the shared index (if enabled) that a task file moved."""
+    index = get_task_index(repo_root)
+    if index is not None:
+        index.record_move(Path(old_path).resolve(), Path(new_path).resolve())
+
+
+# ============================================================================
+# Parsed frontmatter cache
+# ============================================================================
+
+_posts: "OrderedDict[str, Tuple[int, int, Dict[str, Any], str]]" = OrderedDict()
+_posts_lock = threading.Lock()
+
+
+def load_task_post(path: Path) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse a task file's frontmatter and body, reusing an earlier parse.
+
+    The cached parse is reused while the file's mtime and size are
+    unchanged (and the file was not modified within the racy window).
+    Callers get their own deep copy of the metadata.
+
+    Parameters
+    ----------
+    path : Path
+        Task markdown file
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], str]
+        Frontmatter metadata and markdown content
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read
+    Exception
+        Whatever the frontmatter parser raises for malformed files
+    """
+    key = str(path)
+    st = os.stat(path)
+    if task_index_enabled():
+        with _posts_lock:
+            cached = _posts.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                _posts.move_to_end(key)
+                return copy.deepcopy(cached[2]), cached[3]
+
+    with open(path, "r", encoding="utf-8") as f:
+        post = frontmatter.load(f)
+    metadata = dict(post.metadata)
+
+    if task_index_enabled() and time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        with _posts_lock:
+            _posts[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(metadata), post.content)
+            _posts.move_to_end(key)
+            while len(_posts) > _MAX_CACHED_POSTS:
+                _posts.popitem(last=False)
+    return metadata, post.content
+
+
+__all__ = [
+    "TASK_INDEX_DIR_ENV_VAR",
+    "TASK_INDEX_ENV_VAR",
+    "TaskIndex",
+    "TaskLocation",
+    "get_task_index",
+    "load_task_post",
+    "locate_task",
+    "record_task_move",
+    "task_index_enabled",
+]
@@ -16,7 +16,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
-import frontmatter
+from guardkit.tasks.task_index import load_task_post, locate_task
 
 logger = logging.getLogger(__name__)
 
@@ -132,11 +132,12 @@ class TaskLoader:
     @staticmethod
     def _find_task_file(task_id: str, repo_root: Path) -> Path:
         """
-        Find task file in search paths using recursive glob.
+        Find task file in search paths via the shared task index.
 
         Searches for files matching {task_id}*.md pattern, allowing for
         both exact matches (TASK-XXX.md) and extended filenames
-        (TASK-XXX-descriptive-name.md) in nested directories.
+        (TASK-XXX-descriptive-name.md) in nested directories. See
+        ``guardkit.tasks.task_index`` for how lookups avoid a tree walk.
 
         Parameters
         ----------
@@ -150,17 +151,11 @@ class TaskLoader:
         Path
             Path to task file, or None if not found
         """
-        for dir_name in TaskLoader.SEARCH_PATHS:
-            search_dir = repo_root / "tasks" / dir_name
-            if not search_dir.exists():
-                continue
-
-            # Use rglob for recursive search with pattern matching
-            for task_path in search_dir.rglob(f"{task_id}*.md"):
-                logger.debug(f"Found task {task_id} at {task_path}")
-                return task_path
-
-        return None
+        location = locate_task(task_id, repo_root, TaskLoader.SEARCH_PATHS)
+        if location is None:
+            return None
+        logger.debug(f"Found task {task_id} at {location.path}")
+        return location.path
 
     @staticmethod
     def _parse_task_file(path: Path, task_id: str) -> Dict[str, Any]:
@@ -188,19 +183,15 @@ class TaskLoader:
             If file cannot be parsed
         """
         try:
-            # Parse frontmatter and content
-            with open(path, "r", encoding="utf-8") as f:
-                post = frontmatter.load(f)
-
-            # Extract frontmatter metadata
-            metadata = dict(post.metadata)
+            # Parse frontmatter and content (cached while the file is unchanged)
+            metadata, content = load_task_post(path)
 
             # Extract requirements (from frontmatter or content)
-            requirements = TaskLoader._extract_requirements(metadata, post.content)
+            requirements = TaskLoader._extract_requirements(metadata, content)
 
             # Extract acceptance criteria
             acceptance_criteria = TaskLoader._extract_acceptance_criteria(
-                metadata, post.content
+                metadata, content
             )
 
             return {
@@ -208,7 +199,7 @@ class TaskLoader:
                 "requirements": requirements,
                 "acceptance_criteria": acceptance_criteria,
                 "frontmatter": metadata,
-                "content": post.content,
+                "content": content,
                 "file_path": path,
             }
 
@@ -46,7 +46,9 @@ from typing import Dict, List, Optional, Sequence
 # Tunables (DATA)
 # ---------------------------------------------------------------------------
 
-# chars-per-token heuristic. The review measured the protocol slice at
+# chars-per-token heuristic, used when tiktoken is not installed (section
+# counts otherwise come from the shared token counter in
+# instrumentation.digests). The review measured the protocol slice at
 # 47,223 chars ≈ 11-12k tokens (~4 chars/token); we use 4.
 _CHARS_PER_TOKEN = 4
 
@@ -246,24 +248,32 @@ def _check_section_token_budgets(
     fences: Sequence[bool],
     serving_window_tokens: Optional[int],
 ) -> List[StructureFinding]:
+    # Lazy: keeps the lint importable without pulling in guardkit.orchestrator.
+    from guardkit.orchestrator.instrumentation.digests import count_tokens_many
+
     # Split into level-2 (##) normative sections.
-    sections = []  # (header_text, start_line, char_count)
+    sections = []  # (header_text, start_line, section_text)
     cur_header: Optional[str] = None
     cur_start = 0
-    cur_chars = 0
+    cur_lines: List[str] = []
     for i, raw in enumerate(lines):
         m = _HEADER_RE.match(raw)
         is_l2 = (not fences[i]) and m is not None and len(m.group(1)) == 2
         if is_l2 and m is not None:
             if cur_header is not None:
-                sections.append((cur_header, cur_start, cur_chars))
+                sections.append((cur_header, cur_start, "\n".join(cur_lines) + "\n"))
             cur_header = m.group(2)
             cur_start = i + 1
-            cur_chars = len(raw) + 1
-        else:
-            cur_chars += len(raw) + 1
+            cur_lines = [raw]
+        elif cur_header is not None:
+            cur_lines.append(raw)
     if cur_header is not None:
-        sections.append((cur_header, cur_start, cur_chars))
+        sections.append((cur_header, cur_start, "\n".join(cur_lines) + "\n"))
+    # One batched count through the shared token counter (tokenizer when
+    # installed, _CHARS_PER_TOKEN estimate otherwise).
+    section_tokens = count_tokens_many(
+        [text for _, _, text in sections], fallback_chars_per_token=_CHARS_PER_TOKEN
+    )
 
     # Severity depends on whether a serving-window figure is provided. When
     # provided (as of WS4 Amendment M3), findings are WARNING; without it,
@@ -277,8 +287,7 @@ def _check_section_token_budgets(
     )
 
     findings: List[StructureFinding] = []
-    for header, start, chars in sections:
-        tokens = chars // _CHARS_PER_TOKEN
+    for (header, start, _), tokens in zip(sections, section_tokens):
         if tokens < reference:
             continue
         findings.append(
@@ -12,6 +12,7 @@ Coverage Target: >=85%
 Test Count: 10+ tests
 """
 
+import json
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -397,3 +398,139 @@ class TestMemoryHarvestCommand:
             # Should exit non-zero
             assert result.exit_code == 1
             assert "Walker error" in result.output or "error" in result.output.lower()
+
+
+class TestMemoryHarvestIncremental:
+    """Test guardkit memory harvest --incremental."""
+
+    @staticmethod
+    def _episode(source_ref: str, body: str) -> MagicMock:
+        return MagicMock(
+            episode_id=f"ep-{source_ref}",
+            episode_type="adr",
+            source_ref=source_ref,
+            body=body,
+        )
+
+    def test_manifest_advances_after_publish(self, tmp_path, monkeypatch):
+        """Published episodes and tombstones land in the manifest."""
+        monkeypatch.setenv("GUARDKIT_NATS_PASSWORD", "test-password")
+        (tmp_path / ".git").mkdir()
+        manifest_path = tmp_path / "manifest.json"
+        mock_harvest = HarvestResult(
+            episodes=[self._episode("docs/adr/new.md", "# New")],
+            skipped_oversized=[],
+            skipped_empty=0,
+            counts_per_type={"adr": 1},
+            unchanged=4,
+            tombstones=["guardkit:docs/adr/gone.md:adr"],
+        )
+
+        with patch(
+            "guardkit.cli.memory.walk_harvest_dirs", return_value=mock_harvest
+        ) as mock_walker, patch(
+            "guardkit.cli.memory.publish_episodes", new_callable=AsyncMock
+        ) as mock_publisher:
+            mock_publisher.return_value = PublishSummary(
+                published=1, skipped_oversized=0, counts_per_type={"adr": 1}
+            )
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "memory", "harvest", "--incremental",
+                    "--docs-root", str(tmp_path), "--manifest", str(manifest_path),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert mock_walker.call_args.kwargs["manifest"] is not None
+        assert "Unchanged since last publish: 4" in result.output
+        assert "local manifest only" in result.output
+        entries = json.loads(manifest_path.read_text())["entries"]
+        assert entries["guardkit:docs/adr/new.md:adr"]["episode_id"] == "ep-docs/adr/new.md"
+
+    def test_partial_publish_leaves_manifest_alone(self, tmp_path, monkeypatch):
+        """A run that did not publish everything is retried next time."""
+        monkeypatch.setenv("GUARDKIT_NATS_PASSWORD", "test-password")
+        (tmp_path / ".git").mkdir()
+        manifest_path = tmp_path / "manifest.json"
+        mock_harvest = HarvestResult(
+            episodes=[self._episode("docs/adr/a.md", "# A")],
+            skipped_oversized=[],
+            skipped_empty=0,
+            counts_per_type={"adr": 1},
+        )
+
+        with patch(
+            "guardkit.cli.memory.walk_harvest_dirs", return_value=mock_harvest
+        ), patch(
+            "guardkit.cli.memory.publish_episodes", new_callable=AsyncMock
+        ) as mock_publisher:
+            mock_publisher.return_value = PublishSummary(
+                published=0, skipped_oversized=1, counts_per_type={}
+            )
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "memory", "harvest", "--incremental",
+                    "--docs-root", str(tmp_path), "--manifest", str(manifest_path),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert not manifest_path.exists()
+
+    def test_nothing_changed_skips_nats(self, tmp_path, monkeypatch):
+        """No new or changed docs means no publisher run at all."""
+        monkeypatch.delenv("GUARDKIT_NATS_PASSWORD", raising=False)
+        (tmp_path / ".git").mkdir()
+        mock_harvest = HarvestResult(
+            episodes=[], skipped_oversized=[], skipped_empty=0, counts_per_type={},
+            unchanged=10,
+        )
+
+        with patch(
+            "guardkit.cli.memory.walk_harvest_dirs", return_value=mock_harvest
+        ), patch(
+            "guardkit.cli.memory.publish_episodes", new_callable=AsyncMock
+        ) as mock_publisher:
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "memory", "harvest", "--incremental",
+                    "--docs-root", str(tmp_path),
+                    "--manifest", str(tmp_path / "manifest.json"),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_publisher.assert_not_called()
+        assert "nothing changed" in result.output
+
+
+class TestMemoryMigrateGraph:
+    """Test guardkit memory migrate-graph."""
+
+    def test_nothing_to_publish_needs_no_nats(self, tmp_path, monkeypatch):
+        """A non-dry run with zero episodes exits 0 without credentials or NATS."""
+        import sys
+
+        monkeypatch.delenv("GUARDKIT_NATS_PASSWORD", raising=False)
+        falkordb = MagicMock()
+        falkordb.FalkorDB.return_value.list_graphs.return_value = []
+
+        with patch.dict(sys.modules, {"falkordb": falkordb}), patch(
+            "guardkit.memory.harvest_publisher.build_nats_client"
+        ) as build:
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "memory", "migrate-graph",
+                    "--checkpoint", str(tmp_path / "checkpoint.json"),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        build.assert_not_called()
+        assert "No episodes to publish" in result.output
+        assert "Graph migration complete" in result.output
@@ -155,6 +155,62 @@ def guard_live_memory_writes(monkeypatch, request):
     )
 
 
+# ---------------------------------------------------------------------------
+# The venv template cache fence
+# ---------------------------------------------------------------------------
+# ``EnvironmentBootstrapper`` clones fresh worktree venvs from a cache under
+# ``~/.guardkit/venv-cache`` by default. A test must neither read a template a
+# developer's real builds left there (its outcome would depend on the machine)
+# nor publish a fixture venv into it. The cache is off for every test; the
+# suites whose subject IS the cache switch it back on against a tmp dir.
+
+
+@pytest.fixture(autouse=True)
+def guard_venv_template_cache(monkeypatch):
+    """Keep bootstrap tests away from the user's venv template cache."""
+    monkeypatch.setenv("GUARDKIT_VENV_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def guard_llm_request_gate(monkeypatch):
+    """Keep mocked invocations off the process-wide LLM rate limiter."""
+    monkeypatch.setenv("GUARDKIT_LLM_GATE", "0")
+
+
+@pytest.fixture(autouse=True)
+def guard_context_query_cache(monkeypatch):
+    """Keep context-retrieval searches off the process-wide query cache.
+
+    A cached result from one test would otherwise answer the next test's
+    mocked backend; the cache's own tests switch it back on.
+    """
+    monkeypatch.setenv("GUARDKIT_CONTEXT_QUERY_CACHE", "0")
+
+
+@pytest.fixture(scope="session")
+def _task_index_cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("task-index")
+
+
+@pytest.fixture(autouse=True)
+def guard_task_index_cache(monkeypatch, _task_index_cache_dir):
+    """Keep the persisted task index out of the user's home directory."""
+    monkeypatch.setenv("GUARDKIT_TASK_INDEX_DIR", str(_task_index_cache_dir))
+
+
+@pytest.fixture(autouse=True)
+def guard_memory_write_behind(monkeypatch, tmp_path_factory):
+    """Keep episode writes synchronous and the spool out of the home directory.
+
+    Suites that assert on a publish expect it to have happened by the time
+    the call returns; the write-behind queue's own tests switch it back on.
+    """
+    monkeypatch.setenv("GUARDKIT_MEMORY_WRITE_BEHIND", "0")
+    monkeypatch.setenv(
+        "GUARDKIT_MEMORY_SPOOL_DIR", str(tmp_path_factory.mktemp("memory-spool"))
+    )
+
+
 # ---------------------------------------------------------------------------
 # The M0 effective-seat fence (leg-invocation stage-2 design §3)
 # ---------------------------------------------------------------------------
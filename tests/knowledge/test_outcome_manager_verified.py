@@ -212,3 +212,22 @@ class TestTheOriginalCallIsUnchanged:
             )
 
         assert outcome_id.startswith("OUT-")
+
+    @pytest.mark.asyncio
+    async def test_only_the_unverified_call_asks_for_write_behind(self):
+        # The verified variant must report a real publish, so it never queues.
+        client = _client(None)
+
+        with patch(f"{MANAGER}.get_memory_client", return_value=client):
+            await capture_task_outcome(
+                outcome_type=OutcomeType.TASK_COMPLETED,
+                task_id="TASK-VER-004",
+                task_title="Queued",
+                task_requirements="unchanged",
+                success=True,
+                summary="ok",
+            )
+            await _capture()
+
+        flags = [c.kwargs["write_behind"] for c in client.add_episode.await_args_list]
+        assert flags == [True, False]
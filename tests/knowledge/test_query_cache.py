@@ -0,0 +1,239 @@
+"""Tests for the process-wide memory search cache (shared across tasks).
+
+Covers:
+- LRU eviction by entry count and by byte size
+- TTL expiry and the ttl <= 0 bypass
+- Single-flight coalescing within one loop and across threads/loops
+- Failures propagate to every waiter and are never cached
+- JobContextRetriever sharing searches across tasks and retrievers
+- GraphitiQueryEvent carrying hit/miss counts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from guardkit.knowledge.job_context_retriever import JobContextRetriever
+from guardkit.knowledge.query_cache import (
+    QueryCacheStats,
+    SharedQueryCache,
+    get_shared_query_cache,
+)
+from guardkit.knowledge.task_analyzer import TaskPhase
+from guardkit.orchestrator.instrumentation.schemas import GraphitiQueryEvent
+
+
+class _Backend:
+    """Counting fake memory client."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: List[tuple] = []
+        self.delay = delay
+
+    @property
+    def category_calls(self) -> List[tuple]:
+        """Category searches (the task analyzer's history search is ungrouped)."""
+        return [c for c in self.calls if c[1]]
+
+    async def search(self, query, group_ids=None, num_results=10):
+        self.calls.append((query, tuple(group_ids or ()), num_results))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return [{"body": f"{query}:{group_ids}", "score": 0.9}]
+
+
+@dataclass(frozen=True)
+class _Config:
+    host: str = "localhost"
+    port: int = 6379
+
+
+class _ConfiguredBackend(_Backend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.config = _Config()
+
+
+def _fetcher(backend: _Backend, query: str = "q"):
+    return lambda: backend.search(query, group_ids=["g"])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_cache(monkeypatch):
+    # conftest's guard_context_query_cache switches the cache off everywhere else.
+    monkeypatch.setenv("GUARDKIT_CONTEXT_QUERY_CACHE", "1")
+    get_shared_query_cache().clear()
+    yield
+    get_shared_query_cache().clear()
+
+
+class TestSharedQueryCache:
+    @pytest.mark.asyncio
+    async def test_hit_returns_private_copy(self):
+        cache, backend = SharedQueryCache(), _Backend()
+
+        first = await cache.get_or_fetch(backend, "k", _fetcher(backend), ttl=60)
+        first[0]["body"] = "mutated"
+        second = await cache.get_or_fetch(backend, "k", _fetcher(backend), ttl=60)
+
+        assert len(backend.calls) == 1
+        assert second[0]["body"] != "mutated"
+        assert cache.stats == QueryCacheStats(hits=1, misses=1)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_count_and_bytes(self):
+        cache, backend = SharedQueryCache(max_entries=2), _Backend()
+        for key in ("a", "b"):
+            await cache.get_or_fetch(backend, key, _fetcher(backend, key), ttl=60)
+        await cache.get_or_fetch(backend, "a", _fetcher(backend, "a"), ttl=60)
+        await cache.get_or_fetch(backend, "c", _fetcher(backend, "c"), ttl=60)
+
+        assert len(cache) == 2
+        await cache.get_or_fetch(backend, "a", _fetcher(backend, "a"), ttl=60)
+        assert [c[0] for c in backend.calls] == ["a", "b", "c"]
+
+        one = len('[{"body": "x:[\'g\']", "score": 0.9}]')
+        small = SharedQueryCache(max_bytes=one + 1)
+        await small.get_or_fetch(backend, "x", _fetcher(backend, "x"), ttl=60)
+        await small.get_or_fetch(backend, "y", _fetcher(backend, "y"), ttl=60)
+        assert len(small) == 1
+        assert small.bytes_used <= small.max_bytes
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_bypass(self):
+        cache, backend = SharedQueryCache(), _Backend()
+        with patch("guardkit.knowledge.query_cache.time.monotonic", return_value=100.0):
+            await cache.get_or_fetch(backend, "k", _fetcher(backend), ttl=10)
+        with patch("guardkit.knowledge.query_cache.time.monotonic", return_value=111.0):
+            await cache.get_or_fetch(backend, "k", _fetcher(backend), ttl=10)
+        await cache.get_or_fetch(backend, "z", _fetcher(backend), ttl=0)
+
+        assert len(backend.calls) == 3
+        assert "z" not in {k[1] for k in cache._entries}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_search(self):
+        cache, backend = SharedQueryCache(), _Backend(delay=0.05)
+        stats = QueryCacheStats()
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch(backend, "k", _fetcher(backend), 60, stats) for _ in range(5))
+        )
+
+        assert len(backend.calls) == 1
+        assert all(r == results[0] for r in results)
+        assert stats == QueryCacheStats(misses=1, coalesced=4)
+
+    def test_single_flight_across_threads(self):
+        cache, backend = SharedQueryCache(), _ConfiguredBackend()
+        backend.delay = 0.1
+        results: List[Any] = []
+
+        def worker():
+            client = _ConfiguredBackend()
+            client.calls = backend.calls
+            client.delay = backend.delay
+            results.append(asyncio.run(cache.get_or_fetch(client, "k", _fetcher(client), 60)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(backend.calls) == 1
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_waiters_and_is_not_cached(self):
+        cache, backend = SharedQueryCache(), _Backend()
+
+        async def boom():
+            await asyncio.sleep(0.02)
+            raise ConnectionError("down")
+
+        outcomes = await asyncio.gather(
+            *(cache.get_or_fetch(backend, "k", boom, 60) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(o, ConnectionError) for o in outcomes)
+
+        await cache.get_or_fetch(backend, "k", _fetcher(backend), 60)
+        assert len(backend.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_clients_do_not_share(self):
+        cache = SharedQueryCache()
+        a, b = _Backend(), _Backend()
+
+        await cache.get_or_fetch(a, "k", _fetcher(a), 60)
+        await cache.get_or_fetch(b, "k", _fetcher(b), 60)
+
+        assert len(a.calls) == len(b.calls) == 1
+
+
+class TestRetrieverSharing:
+    @pytest.mark.asyncio
+    async def test_tasks_share_category_searches(self):
+        backend = _ConfiguredBackend()
+        task_a = {"id": "TASK-A", "description": "Add auth", "tech_stack": "python"}
+        task_b = {"id": "TASK-B", "description": "Add auth", "tech_stack": "python"}
+
+        await JobContextRetriever(backend).retrieve(task_a, TaskPhase.IMPLEMENT)
+        first = len(backend.category_calls)
+        other = _ConfiguredBackend()
+        other.calls = backend.calls
+        await JobContextRetriever(other).retrieve(task_b, TaskPhase.IMPLEMENT)
+
+        assert first > 0
+        assert len(backend.category_calls) == first
+
+    @pytest.mark.asyncio
+    async def test_kill_switch_and_zero_ttl_reach_backend(self, monkeypatch):
+        backend = _ConfiguredBackend()
+        task = {"id": "TASK-A", "description": "Add auth", "tech_stack": "python"}
+
+        await JobContextRetriever(backend, cache_ttl=0).retrieve(task, TaskPhase.IMPLEMENT)
+        per_run = len(backend.calls)
+        await JobContextRetriever(backend, cache_ttl=0).retrieve(task, TaskPhase.IMPLEMENT)
+        assert len(backend.calls) == 2 * per_run
+
+        monkeypatch.setenv("GUARDKIT_CONTEXT_QUERY_CACHE", "0")
+        await JobContextRetriever(backend).retrieve(task, TaskPhase.IMPLEMENT)
+        assert len(backend.calls) == 3 * per_run
+
+    @pytest.mark.asyncio
+    async def test_emits_event_with_cache_counts(self):
+        class _Emitter:
+            def __init__(self) -> None:
+                self.events: List[Any] = []
+
+            async def emit(self, event) -> None:
+                self.events.append(event)
+
+        backend, emitter = _ConfiguredBackend(), _Emitter()
+        task = {
+            "id": "TASK-A", "description": "Add auth", "tech_stack": "python",
+            "feature_id": "FEAT-1", "turn_number": 2, "current_actor": "coach",
+        }
+
+        await JobContextRetriever(backend, emitter=emitter, run_id="run-1").retrieve(
+            task, TaskPhase.IMPLEMENT
+        )
+        await JobContextRetriever(backend, emitter=emitter, run_id="run-1").retrieve_parallel(
+            {**task, "id": "TASK-B"}, TaskPhase.IMPLEMENT
+        )
+
+        first, second = emitter.events
+        assert isinstance(first, GraphitiQueryEvent)
+        assert first.query_type == "context_loader"
+        assert (first.agent_role, first.attempt, first.run_id) == ("coach", 2, "run-1")
+        searches = len(backend.category_calls)
+        assert first.cache_hits == 0 and first.cache_misses == searches
+        assert second.cache_misses == 0 and second.cache_hits == searches
@@ -0,0 +1,222 @@
+"""Tests for the streaming FalkorDB export (paged reads, concurrency, resume).
+
+Graphs are in-memory ``PageReader`` fakes, so neither FalkorDB nor NATS is
+needed; the subject is that the stream builds exactly what the one-shot
+builder does, page by page, a bounded distance ahead of its consumer, and
+that a checkpoint lets an interrupted export pick up where it stopped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# graph_export imports nats_core at module load; see test_graph_export.py.
+pytest.importorskip("nats_core.events")
+
+from guardkit.memory.graph_export import (
+    ExportCheckpoint,
+    GraphExportResult,
+    build_export_episodes,
+    export_episode_batches,
+    stream_export_batches,
+)
+
+
+def _node(uuid: str, content: str = "some prose") -> dict:
+    return {"content": content, "name": uuid, "uuid": uuid}
+
+
+GRAPHS = {
+    "guardkit__project_decisions": [
+        (i, _node(f"d{i}", "" if i == 3 else "prose")) for i in range(0, 23)
+    ],
+    "guardkit__guardkit_templates": [(i, _node(f"t{i}")) for i in range(5)],
+    "jarvis__project_overview": [(i * 10, _node(f"o{i}")) for i in range(7)],
+    "product_knowledge": [(0, _node("p0"))],
+}
+
+
+class _Reader:
+    """PageReader over ``GRAPHS`` that records every call."""
+
+    def __init__(self, graphs=GRAPHS, fail=()):
+        self.graphs = graphs
+        self.fail = set(fail)
+        self.calls: list[tuple[str, int, int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, graph_name: str, after_id: int, page_size: int):
+        with self._lock:
+            self.calls.append((graph_name, after_id, page_size))
+        if graph_name in self.fail:
+            raise ConnectionError("graph unavailable")
+        rows = [row for row in self.graphs[graph_name] if row[0] > after_id]
+        return rows[:page_size]
+
+
+def _drain(batches, checkpoint=None) -> tuple[GraphExportResult, list[str]]:
+    result = GraphExportResult()
+    ids = [
+        episode.episode_id
+        for batch in export_episode_batches(batches, result, checkpoint)
+        for episode in batch
+    ]
+    return result, ids
+
+
+class TestStreamMatchesOneShotBuild:
+    def test_same_episodes_and_counts(self) -> None:
+        expected = build_export_episodes(
+            (name, [node for _id, node in rows]) for name, rows in GRAPHS.items()
+        )
+
+        result, ids = _drain(
+            stream_export_batches(GRAPHS, _Reader(), page_size=4, workers=3)
+        )
+
+        assert sorted(ids) == sorted(e.episode_id for e in expected.episodes)
+        assert result.episodes == []
+        for attr in (
+            "graphs_scanned", "skipped_retired", "skipped_empty",
+            "skipped_no_group", "counts_per_project",
+        ):
+            assert getattr(result, attr) == getattr(expected, attr), attr
+
+    def test_pages_follow_the_id_cursor(self) -> None:
+        reader = _Reader()
+
+        list(stream_export_batches(["jarvis__project_overview"], reader, page_size=3))
+
+        assert reader.calls == [
+            ("jarvis__project_overview", -1, 3),
+            ("jarvis__project_overview", 20, 3),
+            ("jarvis__project_overview", 50, 3),
+        ]
+
+    def test_limit_caps_nodes_read_per_graph(self) -> None:
+        batches = list(
+            stream_export_batches(
+                ["guardkit__project_decisions"], _Reader(),
+                page_size=4, limit_per_graph=6,
+            )
+        )
+
+        # Six nodes read: five episodes plus the empty node at id 3.
+        assert sum(len(b.episodes) + b.skipped_empty for b in batches) == 6
+        assert batches[-1].cursor == 5
+        assert batches[-1].final and not batches[-1].complete
+
+
+class TestConcurrencyAndBackpressure:
+    def test_graphs_are_read_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        reader = _Reader()
+
+        def _meeting_reader(graph_name, after_id, page_size):
+            if after_id == -1:
+                barrier.wait()  # both first pages in flight at once
+            return reader(graph_name, after_id, page_size)
+
+        names = ["guardkit__project_decisions", "jarvis__project_overview"]
+        result, _ids = _drain(
+            stream_export_batches(names, _meeting_reader, page_size=5, workers=2)
+        )
+
+        assert result.graphs_scanned == 2
+
+    def test_readers_stay_a_bounded_distance_ahead(self) -> None:
+        big = {"guardkit__project_decisions": [(i, _node(f"n{i}")) for i in range(1000)]}
+        reader = _Reader(big)
+        stream = stream_export_batches(big, reader, page_size=1, workers=1)
+
+        next(stream)
+        time.sleep(0.3)  # a stalled consumer
+        pages_read = len(reader.calls)
+        stream.close()
+
+        # One page handed out, two queued, one built and waiting to be queued.
+        assert pages_read <= 4
+
+    def test_closing_the_stream_stops_the_readers(self) -> None:
+        big = {"guardkit__project_decisions": [(i, _node(f"n{i}")) for i in range(1000)]}
+        stream = stream_export_batches(big, _Reader(big), page_size=1, workers=1)
+        next(stream)
+
+        stream.close()
+
+        assert not [t for t in threading.enumerate() if t.name.startswith("graph-export-")]
+
+
+class TestCheckpointedResume:
+    def test_interrupted_export_resumes_where_it_stopped(self, tmp_path: Path) -> None:
+        path = tmp_path / "checkpoint.json"
+        names = ["guardkit__project_decisions", "jarvis__project_overview"]
+        published: list[str] = []
+
+        checkpoint = ExportCheckpoint.load(path)
+        stream = export_episode_batches(
+            stream_export_batches(
+                names, _Reader(), page_size=4, workers=1, checkpoint=checkpoint
+            ),
+            GraphExportResult(),
+            checkpoint,
+        )
+        for n, batch in enumerate(stream):
+            if n == 3:
+                break  # crash while publishing the fourth batch
+            published.extend(e.episode_id for e in batch)
+        stream.close()
+
+        resumed = ExportCheckpoint.load(path)
+        assert resumed.cursor("guardkit__project_decisions") == 11
+        reader = _Reader()
+        result, ids = _drain(
+            stream_export_batches(names, reader, page_size=4, workers=1,
+                                  checkpoint=resumed),
+            resumed,
+        )
+
+        assert reader.calls[0] == ("guardkit__project_decisions", 11, 4)
+        everything = build_export_episodes(
+            (name, [node for _id, node in GRAPHS[name]]) for name in names
+        )
+        assert sorted(published + ids) == sorted(e.episode_id for e in everything.episodes)
+        assert all(resumed.is_done(name) for name in names)
+        assert list(stream_export_batches(names, _Reader(), checkpoint=resumed)) == []
+
+    def test_failed_graph_stays_open(self, tmp_path: Path) -> None:
+        checkpoint = ExportCheckpoint(tmp_path / "checkpoint.json")
+        names = ["guardkit__project_decisions", "jarvis__project_overview"]
+
+        result, _ids = _drain(
+            stream_export_batches(
+                names, _Reader(fail={"jarvis__project_overview"}),
+                checkpoint=checkpoint,
+            ),
+            checkpoint,
+        )
+
+        assert result.graphs_failed == 1
+        assert checkpoint.is_done("guardkit__project_decisions")
+        assert not checkpoint.is_done("jarvis__project_overview")
+        assert checkpoint.cursor("jarvis__project_overview") == -1
+
+    def test_checkpoint_round_trip_and_clear(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph-export" / "host_6379.json"
+        checkpoint = ExportCheckpoint(path)
+        checkpoint.advance("guardkit__project_decisions", 42)
+        checkpoint.advance("jarvis__project_overview", 7, done=True)
+        checkpoint.save()
+
+        loaded = ExportCheckpoint.load(path)
+        assert loaded.cursor("guardkit__project_decisions") == 42
+        assert loaded.is_done("jarvis__project_overview")
+        assert loaded.cursor("unknown__graph") == -1
+
+        loaded.clear()
+        assert not path.exists()
+        assert ExportCheckpoint.load(path).graphs == {}
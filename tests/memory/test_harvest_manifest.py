@@ -0,0 +1,98 @@
+"""Tests for the incremental-harvest publish manifest.
+
+Stdlib only, so unlike the walker/publisher tests these run without the
+`memory` extra (nats-core) installed.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from guardkit.memory.harvest_manifest import (
+    MANIFEST_ENV_VAR,
+    HarvestManifest,
+    content_hash,
+    default_manifest_path,
+)
+
+_KEY = "guardkit:docs/adr/001.md:adr"
+
+
+def _episode(body: str = "# ADR 001") -> SimpleNamespace:
+    return SimpleNamespace(
+        episode_id="ep-0123456789abcdef",
+        episode_type="adr",
+        source_ref="docs/adr/001.md",
+        body=body,
+    )
+
+
+class TestHarvestManifest:
+    def test_record_then_is_current_only_for_the_same_body(self) -> None:
+        manifest = HarvestManifest()
+        manifest.record(_KEY, _episode())
+
+        assert manifest.is_current(_KEY, content_hash("# ADR 001"))
+        assert not manifest.is_current(_KEY, content_hash("# ADR 001 (edited)"))
+        assert not manifest.is_current("guardkit:other.md:adr", content_hash("# ADR 001"))
+
+    def test_tombstone_keeps_the_entry_but_not_the_hash(self) -> None:
+        manifest = HarvestManifest()
+        manifest.record(_KEY, _episode())
+
+        manifest.tombstone([_KEY, "guardkit:never-published.md:adr"])
+
+        entry = manifest.entries[_KEY]
+        assert entry.is_tombstone and entry.content_hash is None
+        assert entry.episode_id == "ep-0123456789abcdef"
+        assert manifest.live_keys() == set()
+        assert not manifest.is_current(_KEY, content_hash("# ADR 001"))
+        assert "guardkit:never-published.md:adr" not in manifest.entries
+
+    def test_republish_clears_the_tombstone(self) -> None:
+        manifest = HarvestManifest()
+        manifest.record(_KEY, _episode())
+        manifest.tombstone([_KEY])
+
+        manifest.record(_KEY, _episode())
+
+        assert manifest.live_keys() == {_KEY}
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / ".guardkit" / "harvest-manifest.json"
+        manifest = HarvestManifest(path=path)
+        manifest.record(_KEY, _episode())
+        manifest.save()
+
+        loaded = HarvestManifest.load(path)
+
+        assert loaded.entries == manifest.entries
+        assert loaded.path == path
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", json.dumps({"schema_version": 99, "entries": {}})],
+    )
+    def test_unreadable_manifest_starts_empty(self, tmp_path: Path, content: str) -> None:
+        path = tmp_path / "harvest-manifest.json"
+        path.write_text(content)
+
+        assert HarvestManifest.load(path).entries == {}
+
+    def test_missing_manifest_starts_empty(self, tmp_path: Path) -> None:
+        assert HarvestManifest.load(tmp_path / "absent.json").entries == {}
+
+
+def test_default_manifest_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(MANIFEST_ENV_VAR, raising=False)
+    assert default_manifest_path(tmp_path) == (
+        tmp_path / ".guardkit" / "harvest-manifest.json"
+    )
+
+    monkeypatch.setenv(MANIFEST_ENV_VAR, str(tmp_path / "elsewhere.json"))
+    assert default_manifest_path(tmp_path) == tmp_path / "elsewhere.json"
@@ -24,6 +24,7 @@ from pydantic import SecretStr
 from guardkit.memory import harvest_publisher
 from guardkit.memory.harvest_publisher import (
     build_nats_client,
+    publish_episode_batches,
     publish_episodes,
     read_nats_password,
 )
@@ -290,6 +291,82 @@ class TestHangingUpIsBounded:
             await publish_episodes(episodes, client)
 
 
+class TestPublishEpisodeBatches:
+    """Test the streaming, batch-at-a-time publisher."""
+
+    @staticmethod
+    def _episode(n: int) -> MemoryEpisodeV1:
+        return MemoryEpisodeV1(
+            episode_id=f"ep-{n:03d}",
+            project_id="guardkit",
+            episode_type="document",
+            content_format="json",
+            body="{}",
+        )
+
+    async def test_one_connection_and_pull_after_publish(self) -> None:
+        """The next batch is pulled only once the previous one is published."""
+        client = MagicMock()
+        client.connect = AsyncMock()
+        client.disconnect = AsyncMock()
+        events: list[str] = []
+
+        async def _publish(episode: MemoryEpisodeV1) -> None:
+            events.append(f"published {episode.episode_id}")
+
+        client.publish_episode = AsyncMock(side_effect=_publish)
+
+        def _batches():
+            for start in (0, 2):
+                events.append(f"pulled {start}")
+                yield [self._episode(start), self._episode(start + 1)]
+            events.append("exhausted")
+
+        summary = await publish_episode_batches(_batches(), client)
+
+        client.connect.assert_awaited_once()
+        client.disconnect.assert_awaited_once()
+        assert summary.published == 4
+        assert summary.counts_per_type == {"document": 4}
+        assert events == [
+            "pulled 0", "published ep-000", "published ep-001",
+            "pulled 2", "published ep-002", "published ep-003",
+            "exhausted",
+        ]
+
+    async def test_nothing_to_send_never_connects(self, monkeypatch) -> None:
+        """An empty stream needs neither a password nor a connection."""
+        monkeypatch.delenv("GUARDKIT_NATS_PASSWORD", raising=False)
+        build = MagicMock()
+        monkeypatch.setattr(harvest_publisher, "build_nats_client", build)
+
+        summary = await publish_episode_batches(iter([[], []]))
+
+        build.assert_not_called()
+        assert summary.published == 0
+
+    async def test_failure_closes_the_producer(self) -> None:
+        """An error mid-stream disconnects and closes the batch generator."""
+        client = MagicMock()
+        client.connect = AsyncMock()
+        client.disconnect = AsyncMock()
+        client.publish_episode = AsyncMock(side_effect=RuntimeError("broker gone"))
+        closed: list[bool] = []
+
+        def _batches():
+            try:
+                yield [self._episode(0)]
+                yield [self._episode(1)]
+            finally:
+                closed.append(True)
+
+        with pytest.raises(RuntimeError, match="broker gone"):
+            await publish_episode_batches(_batches(), client)
+
+        client.disconnect.assert_awaited_once()
+        assert closed == [True]
+
+
 class TestIdempotency:
     """Test idempotency and resumability."""
 
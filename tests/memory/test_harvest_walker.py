@@ -6,6 +6,7 @@ Tests cover:
 - Oversized body skipping
 - MemoryEpisodeV1 construction with correct provenance
 - HarvestResult counts and statistics
+- Incremental walks against a HarvestManifest
 - No NATS dependencies
 """
 
@@ -25,6 +26,8 @@ pytest.importorskip("nats_core.events")
 
 from nats_core.events import MAX_EPISODE_BODY_BYTES, MemoryEpisodeV1
 
+from guardkit.memory.harvest_manifest import HarvestManifest
+from guardkit.memory.harvest_taxonomy import natural_key_for
 from guardkit.memory.harvest_walker import HarvestResult, walk_harvest_dirs
 
 
@@ -300,3 +303,105 @@ class TestHarvestWalker:
         # Should be relative
         assert path.startswith("docs/")
         assert not path.startswith("/")
+
+
+def _git(cwd: Path, *args: str) -> None:
+    import subprocess
+
+    subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        env={
+            "GIT_AUTHOR_NAME": "t",
+            "GIT_AUTHOR_EMAIL": "t@example.com",
+            "GIT_COMMITTER_NAME": "t",
+            "GIT_COMMITTER_EMAIL": "t@example.com",
+            "GIT_AUTHOR_DATE": "2024-01-02T03:04:05+00:00",
+            "PATH": "/usr/bin:/bin:/usr/local/bin",
+        },
+    )
+
+
+class TestIncrementalHarvest:
+    """Manifest-driven incremental walks and batched commit times."""
+
+    def _publish_all(self, manifest: HarvestManifest, result: HarvestResult) -> None:
+        for episode in result.episodes:
+            manifest.record(
+                natural_key_for(episode.source_ref, episode.episode_type), episode
+            )
+        manifest.tombstone(result.tombstones)
+
+    def test_unchanged_docs_are_not_rebuilt(self, tmp_path: Path) -> None:
+        """Only new or edited docs come back once the manifest has the rest."""
+        (tmp_path / "docs/adr").mkdir(parents=True)
+        (tmp_path / "docs/adr/001.md").write_text("# One")
+        (tmp_path / "docs/adr/002.md").write_text("# Two")
+        manifest = HarvestManifest()
+
+        first = walk_harvest_dirs(tmp_path, manifest=manifest)
+        assert len(first.episodes) == 2 and first.unchanged == 0
+        self._publish_all(manifest, first)
+
+        (tmp_path / "docs/adr/002.md").write_text("# Two, edited")
+        (tmp_path / "docs/adr/003.md").write_text("# Three")
+        second = walk_harvest_dirs(tmp_path, manifest=manifest)
+
+        assert sorted(e.source_ref for e in second.episodes) == [
+            "docs/adr/002.md",
+            "docs/adr/003.md",
+        ]
+        assert second.unchanged == 1
+        assert second.tombstones == []
+
+    def test_deleted_and_emptied_docs_are_tombstoned(self, tmp_path: Path) -> None:
+        """Published keys with no document left are reported once."""
+        (tmp_path / "docs/adr").mkdir(parents=True)
+        for name in ("keep", "gone", "blank"):
+            (tmp_path / f"docs/adr/{name}.md").write_text(f"# {name}")
+        manifest = HarvestManifest()
+        self._publish_all(manifest, walk_harvest_dirs(tmp_path, manifest=manifest))
+
+        (tmp_path / "docs/adr/gone.md").unlink()
+        (tmp_path / "docs/adr/blank.md").write_text("   \n")
+        result = walk_harvest_dirs(tmp_path, manifest=manifest)
+
+        assert result.tombstones == [
+            natural_key_for("docs/adr/blank.md", "adr"),
+            natural_key_for("docs/adr/gone.md", "adr"),
+        ]
+        self._publish_all(manifest, result)
+        assert walk_harvest_dirs(tmp_path, manifest=manifest).tombstones == []
+
+    def test_full_walk_reports_no_tombstones(self, tmp_path: Path) -> None:
+        """Without a manifest every doc is built, as before."""
+        (tmp_path / "docs/adr").mkdir(parents=True)
+        (tmp_path / "docs/adr/001.md").write_text("# One")
+
+        result = walk_harvest_dirs(tmp_path)
+
+        assert len(result.episodes) == 1
+        assert result.unchanged == 0 and result.tombstones == []
+
+    def test_commit_times_come_from_one_git_pass(self, tmp_path: Path) -> None:
+        """Tracked docs get their commit time; untracked ones the fs mtime."""
+        (tmp_path / "docs/adr").mkdir(parents=True)
+        (tmp_path / "docs/adr/tracked.md").write_text("# Tracked")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "docs")
+        (tmp_path / "docs/adr/untracked.md").write_text("# Untracked")
+
+        with patch(
+            "guardkit.memory.harvest_walker._get_file_mtime",
+            side_effect=AssertionError("per-file git lookup"),
+        ):
+            result = walk_harvest_dirs(tmp_path)
+
+        by_ref = {e.source_ref: e.occurred_at for e in result.episodes}
+        assert by_ref["docs/adr/tracked.md"] == datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+        )
+        assert by_ref["docs/adr/untracked.md"].year >= 2025
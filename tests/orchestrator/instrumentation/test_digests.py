@@ -123,6 +123,73 @@ class TestTokenCounting:
         assert 50 <= result <= 200
 
 
+class _CharEncoder:
+    """tiktoken-shaped encoder: one token per character, records batches."""
+
+    def __init__(self) -> None:
+        self.batches: list = []
+
+    def encode_ordinary_batch(self, texts: list) -> list:
+        self.batches.append(list(texts))
+        return [list(t) for t in texts]
+
+
+def _counter_with(encoder: object, max_entries: int = 4096):
+    from guardkit.orchestrator.instrumentation.digests import TokenCounter
+
+    counter = TokenCounter(max_entries=max_entries)
+    counter._encoder = encoder
+    counter._encoder_loaded = True
+    return counter
+
+
+class TestTokenCounter:
+    """Tests for the cached, batched token counting service."""
+
+    def test_count_many_batches_misses_and_caches(self) -> None:
+        """Unique misses are encoded in one batch; repeats hit the cache."""
+        encoder = _CharEncoder()
+        counter = _counter_with(encoder)
+
+        assert counter.count_many(["abc", "", "abcd", "abc"]) == [3, 0, 4, 3]
+        assert encoder.batches == [["abc", "abcd"]]
+
+        assert counter.count_many(["abcd", "xy"]) == [4, 2]
+        assert encoder.batches[-1] == ["xy"]
+        assert counter.hits == 1
+
+    def test_lru_evicts_least_recent(self) -> None:
+        """Entries beyond max_entries are evicted oldest-first."""
+        encoder = _CharEncoder()
+        counter = _counter_with(encoder, max_entries=2)
+        counter.count_many(["a", "bb", "ccc"])
+
+        counter.count("a")
+
+        assert encoder.batches[-1] == ["a"]
+
+    def test_fallback_uses_chars_per_token(self) -> None:
+        """Without an encoder the estimate honours fallback_chars_per_token."""
+        counter = _counter_with(None)
+
+        assert counter.count_many(["x" * 100, "   "], fallback_chars_per_token=2) == [
+            50, 0,
+        ]
+        assert counter.exact is False
+
+    def test_encoder_loaded_once(self) -> None:
+        """The tiktoken import/get_encoding happens once per counter."""
+        from guardkit.orchestrator.instrumentation.digests import TokenCounter
+
+        counter = TokenCounter()
+        with patch.dict("sys.modules", {"tiktoken": None}):
+            counter.count("hello")
+        # Cached absence: no re-import attempt even once tiktoken "appears".
+        with patch.dict("sys.modules", {"tiktoken": object()}):
+            assert counter.count("hello") == 2
+        assert counter.exact is False
+
+
 # ============================================================================
 # DigestValidator Tests (AC-002, AC-003, AC-004, AC-009)
 # ============================================================================
@@ -342,6 +342,174 @@ class TestJSONLFileBackend:
             assert "run_id" in parsed
 
 
+class TestBufferedJSONLFileBackend:
+    """Group commit, backpressure and durability of the buffered JSONL writer."""
+
+    @pytest.fixture(autouse=True)
+    def _buffer_on(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("GUARDKIT_EVENTS_JSONL_BUFFER", raising=False)
+
+    def _events(self, base_event_fields: dict, n: int) -> List[TaskStartedEvent]:
+        return [
+            TaskStartedEvent(**{**base_event_fields, "run_id": f"run-{i}"})
+            for i in range(n)
+        ]
+
+    def _run_ids(self, events_dir: Path) -> List[str]:
+        lines = (events_dir / "events.jsonl").read_text().strip().split("\n")
+        return [json.loads(line)["run_id"] for line in lines]
+
+    async def test_emit_buffers_after_first_event(
+        self, tmp_events_dir: Path, base_event_fields: dict
+    ) -> None:
+        """The first event is written through; later ones wait for a commit."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(events_dir=tmp_events_dir, flush_interval=60)
+        first, second = self._events(base_event_fields, 2)
+        await backend.emit(first)
+        await backend.emit(second)
+        assert self._run_ids(tmp_events_dir) == ["run-0"]
+
+        await backend.flush()
+        assert self._run_ids(tmp_events_dir) == ["run-0", "run-1"]
+        await backend.close()
+
+    async def test_batches_written_with_one_open_each(
+        self, tmp_events_dir: Path, base_event_fields: dict
+    ) -> None:
+        """Events are group-committed rather than opened per event."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(
+            events_dir=tmp_events_dir, batch_size=50, flush_interval=60
+        )
+        real_open = Path.open
+        opens = []
+
+        def _counting_open(self, *args, **kwargs):
+            opens.append(self)
+            return real_open(self, *args, **kwargs)
+
+        with patch.object(Path, "open", _counting_open):
+            for event in self._events(base_event_fields, 100):
+                await backend.emit(event)
+            await backend.close()
+
+        assert len(opens) <= 10
+        assert self._run_ids(tmp_events_dir) == [f"run-{i}" for i in range(100)]
+
+    async def test_writer_commits_after_interval(
+        self, tmp_events_dir: Path, sample_llm_event: LLMCallEvent
+    ) -> None:
+        """A buffered event reaches disk within flush_interval without flush()."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(events_dir=tmp_events_dir, flush_interval=0.01)
+        await backend.emit(sample_llm_event)
+        await backend.emit(sample_llm_event)
+        for _ in range(200):
+            if len(self._run_ids(tmp_events_dir)) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(self._run_ids(tmp_events_dir)) == 2
+        await backend.close()
+
+    async def test_full_buffer_applies_backpressure_without_loss(
+        self,
+        tmp_events_dir: Path,
+        base_event_fields: dict,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A full buffer makes the caller write; nothing is dropped."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(
+            events_dir=tmp_events_dir,
+            batch_size=1000,
+            flush_interval=60,
+            max_buffered=1000,
+        )
+        with caplog.at_level(logging.WARNING):
+            for event in self._events(base_event_fields, 1002):
+                await backend.emit(event)
+
+        assert backend.backpressure_count == 1
+        assert any("buffer" in r.message for r in caplog.records)
+        assert len(self._run_ids(tmp_events_dir)) == 1002
+        await backend.close()
+
+    async def test_concurrent_threads_keep_every_line(
+        self, tmp_events_dir: Path, base_event_fields: dict
+    ) -> None:
+        """Worker threads emitting concurrently never interleave lines."""
+        import threading
+
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(events_dir=tmp_events_dir, batch_size=7)
+        events = self._events(base_event_fields, 400)
+
+        def _worker(chunk: List[TaskStartedEvent]) -> None:
+            for event in chunk:
+                asyncio.run(backend.emit(event))
+
+        threads = [
+            threading.Thread(target=_worker, args=(events[i::4],)) for i in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        await backend.close()
+
+        assert sorted(self._run_ids(tmp_events_dir)) == sorted(
+            e.run_id for e in events
+        )
+
+    async def test_emit_after_close_writes_through(
+        self, tmp_events_dir: Path, sample_llm_event: LLMCallEvent
+    ) -> None:
+        """A closed backend still persists late events synchronously."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        backend = JSONLFileBackend(events_dir=tmp_events_dir, flush_interval=60)
+        await backend.close()
+        await backend.emit(sample_llm_event)
+
+        assert len(self._run_ids(tmp_events_dir)) == 1
+
+    async def test_kill_switch_writes_through(
+        self,
+        tmp_events_dir: Path,
+        sample_llm_event: LLMCallEvent,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """GUARDKIT_EVENTS_JSONL_BUFFER=0 appends on every emit."""
+        from guardkit.orchestrator.instrumentation.emitter import JSONLFileBackend
+
+        monkeypatch.setenv("GUARDKIT_EVENTS_JSONL_BUFFER", "0")
+        backend = JSONLFileBackend(events_dir=tmp_events_dir, flush_interval=60)
+        await backend.emit(sample_llm_event)
+
+        assert len(self._run_ids(tmp_events_dir)) == 1
+
+    async def test_stdlib_fallback_matches_compact_json(
+        self, tmp_events_dir: Path, sample_llm_event: LLMCallEvent
+    ) -> None:
+        """Without orjson the stdlib encoder produces the same records."""
+        from guardkit.orchestrator.instrumentation import emitter as emitter_mod
+
+        with patch.object(emitter_mod, "orjson", None):
+            backend = emitter_mod.JSONLFileBackend(events_dir=tmp_events_dir)
+            await backend.emit(sample_llm_event)
+            await backend.close()
+
+        line = (tmp_events_dir / "events.jsonl").read_text().strip()
+        assert line == json.dumps(sample_llm_event.model_dump(), separators=(",", ":"))
+
+
 # ============================================================================
 # NATSBackend Tests
 # ============================================================================
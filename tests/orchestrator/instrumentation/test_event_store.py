@@ -0,0 +1,289 @@
+"""Tests for the columnar event store and ``guardkit telemetry`` CLI.
+
+Covers:
+- Event kind recovery from untagged JSONL records
+- Streaming aggregation (tokens, latency percentiles, cost, error classes)
+- JSONL-only querying on a base install
+- Parquet compaction, staleness and projected reads (pyarrow only)
+- CLI wiring for ``telemetry query`` / ``telemetry compact``
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from click.testing import CliRunner
+
+from guardkit.cli.telemetry import telemetry
+from guardkit.orchestrator.instrumentation.event_store import (
+    LatencyHistogram,
+    aggregate_events,
+    discover_event_sources,
+    event_kind,
+    parse_price,
+)
+from guardkit.orchestrator.instrumentation.schemas import (
+    BaseEvent,
+    LLMCallEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+    ToolExecEvent,
+    WaveCompletedEvent,
+)
+
+_BASE = {
+    "task_id": "TASK-001",
+    "agent_role": "player",
+    "attempt": 1,
+}
+
+
+def _llm(run_id: str, model: str, latency: float, **extra) -> LLMCallEvent:
+    fields = {
+        "provider": "anthropic",
+        "model": model,
+        "input_tokens": 1000,
+        "output_tokens": 100,
+        "latency_ms": latency,
+        "prompt_profile": "digest_only",
+        "status": "ok",
+        **extra,
+    }
+    return LLMCallEvent(
+        run_id=run_id, timestamp="2026-07-02T10:00:00Z", **_BASE, **fields
+    )
+
+
+def _write(events_dir: Path, events: List[BaseEvent]) -> Path:
+    events_dir.mkdir(parents=True, exist_ok=True)
+    path = events_dir / "events.jsonl"
+    with path.open("a") as f:
+        for event in events:
+            f.write(json.dumps(event.model_dump()) + "\n")
+    return path
+
+
+@pytest.fixture
+def runs(tmp_path: Path) -> Path:
+    """Two runs: one feature with LLM + tool + failure events, one task."""
+    root = tmp_path / "autobuild"
+    _write(
+        root / "FEAT-A",
+        [
+            TaskStartedEvent(run_id="run-1", timestamp="2026-07-02T09:00:00Z", **_BASE),
+            *(_llm("run-1", "model-a", float(ms)) for ms in range(1, 101)),
+            _llm("run-1", "model-a", 50.0, status="error", error_type="rate_limited"),
+            ToolExecEvent(
+                run_id="run-1", timestamp="2026-07-02T10:01:00Z", **_BASE,
+                tool_name="bash", cmd="pytest", exit_code=1, latency_ms=5.0,
+                stdout_tail="", stderr_tail="",
+            ),
+            TaskFailedEvent(
+                run_id="run-1", timestamp="2026-07-02T10:02:00Z", **_BASE,
+                failure_category="timeout",
+            ),
+        ],
+    )
+    _write(
+        root / "TASK-B",
+        [_llm("run-2", "model-b", 2000.0)]
+        + [
+            LLMCallEvent(
+                **{**_llm("run-2", "model-b", 10.0).model_dump(),
+                   "timestamp": "2026-06-01T00:00:00Z"}
+            )
+        ],
+    )
+    with (root / "TASK-B" / "events.jsonl").open("a") as f:
+        f.write('{"torn": \n')
+    return root
+
+
+class TestEventKind:
+    @pytest.mark.parametrize(
+        "event, kind",
+        [
+            (_llm("r", "m", 1.0), "llm_call"),
+            (
+                ToolExecEvent(
+                    run_id="r", timestamp="t", **_BASE, tool_name="bash", cmd="x",
+                    exit_code=0, latency_ms=1.0, stdout_tail="", stderr_tail="",
+                ),
+                "tool_exec",
+            ),
+            (
+                WaveCompletedEvent(
+                    run_id="r", timestamp="t", **_BASE, wave_id="w1",
+                    worker_count=2, queue_depth_start=3, queue_depth_end=0,
+                    tasks_completed=3, task_failures=0, rate_limit_count=0,
+                ),
+                "wave_completed",
+            ),
+            (TaskStartedEvent(run_id="r", timestamp="t", **_BASE), "task_started"),
+        ],
+    )
+    def test_kind_recovered_from_fields(self, event: BaseEvent, kind: str) -> None:
+        assert event_kind(event.model_dump()) == kind
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_precision(self) -> None:
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.add(float(ms))
+
+        assert hist.percentile(0.50) == pytest.approx(500, rel=0.01)
+        assert hist.percentile(0.95) == pytest.approx(950, rel=0.01)
+
+    def test_empty_histogram(self) -> None:
+        assert LatencyHistogram().percentile(0.5) is None
+
+
+class TestAggregateEvents:
+    def test_aggregates_jsonl_runs(self, runs: Path) -> None:
+        report = aggregate_events(
+            discover_event_sources([runs]), prices={"model-a": (3.0, 15.0)}
+        )
+
+        assert report.runs == 2
+        a = report.groups["model-a"]
+        assert a.calls == 101
+        assert a.errors == 1
+        assert a.input_tokens == 101_000
+        assert a.latency.percentile(0.50) == pytest.approx(50, rel=0.01)
+        assert a.latency.percentile(0.95) == pytest.approx(95, rel=0.01)
+        assert a.cost_usd == pytest.approx(101 * (1000 * 3 + 100 * 15) / 1e6)
+        assert report.groups["model-b"].cost_usd is None
+        assert report.error_classes == {
+            "llm:rate_limited": 1, "tool:bash": 1, "task:timeout": 1,
+        }
+
+    def test_since_filters_by_timestamp(self, runs: Path) -> None:
+        report = aggregate_events(
+            discover_event_sources([runs]), since="2026-07-01"
+        )
+
+        assert report.groups["model-b"].calls == 1
+
+    def test_group_by_task(self, runs: Path) -> None:
+        report = aggregate_events(discover_event_sources([runs]), group_by="task_id")
+
+        assert set(report.groups) == {"TASK-001"}
+
+    def test_rejects_unknown_group(self, runs: Path) -> None:
+        with pytest.raises(ValueError):
+            aggregate_events([], group_by="cmd")
+
+    def test_prefix_cache_per_role(self, tmp_path: Path) -> None:
+        coach = {**_BASE, "agent_role": "coach"}
+        _write(
+            tmp_path / "FEAT-P",
+            [
+                _llm("run-1", "m", 1.0, prefix_cache_hit=False,
+                     prefix_cache_estimated=True, prefix_reusable_tokens=0),
+                _llm("run-1", "m", 1.0, prefix_cache_hit=True,
+                     prefix_cache_estimated=True, prefix_reusable_tokens=600),
+                LLMCallEvent(**{**_llm("run-1", "m", 1.0).model_dump(), **coach,
+                                "prefix_cache_hit": True,
+                                "prefix_reusable_tokens": 50}),
+                _llm("run-1", "m", 1.0),  # no layout data: not counted
+            ],
+        )
+
+        report = aggregate_events(discover_event_sources([tmp_path]))
+
+        player = report.prefix_cache["player"]
+        assert (player.calls, player.hits, player.reusable_tokens) == (2, 1, 600)
+        assert player.hit_rate == 0.5
+        assert player.reuse_ratio == pytest.approx(0.3)
+        assert report.to_dict()["prefix_cache"]["coach"]["hit_rate"] == 1.0
+
+
+def test_parse_price() -> None:
+    assert parse_price("m=3:15") == ("m", 3.0, 15.0)
+    with pytest.raises(ValueError):
+        parse_price("m=3")
+
+
+class TestParquetStore:
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self) -> None:
+        pytest.importorskip("pyarrow")
+
+    def test_compaction_round_trip_and_staleness(self, runs: Path) -> None:
+        from guardkit.orchestrator.instrumentation.event_store import (
+            compact_events,
+            iter_event_records,
+            parquet_is_fresh,
+        )
+
+        result = compact_events(runs / "FEAT-A", row_group_size=16)
+
+        assert result.rows == 104
+        assert parquet_is_fresh(runs / "FEAT-A")
+        records = list(iter_event_records(result.output, columns=["kind", "model"]))
+        assert set(records[1]) == {"kind", "model"}
+        assert sum(r["kind"] == "llm_call" for r in records) == 101
+        assert runs / "FEAT-A" / "events.parquet" in discover_event_sources([runs])
+
+        _write(runs / "FEAT-A", [_llm("run-3", "model-a", 1.0)])
+        assert not parquet_is_fresh(runs / "FEAT-A")
+        assert runs / "FEAT-A" / "events.jsonl" in discover_event_sources([runs])
+
+    def test_parquet_and_jsonl_aggregate_identically(self, runs: Path) -> None:
+        from guardkit.orchestrator.instrumentation.event_store import compact_events
+
+        before = aggregate_events(discover_event_sources([runs])).to_dict()
+        compact_events(runs / "FEAT-A")
+        compact_events(runs / "TASK-B")
+        after = aggregate_events(discover_event_sources([runs])).to_dict()
+
+        assert all(s.endswith(".parquet") for s in after.pop("sources"))
+        before.pop("sources")
+        assert after == before
+
+
+class TestTelemetryCLI:
+    def test_query_json(self, runs: Path) -> None:
+        result = CliRunner().invoke(
+            telemetry, ["query", str(runs), "--json", "--price", "model-a=3:15"]
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["groups"]["model-a"]["calls"] == 101
+        assert data["groups"]["model-a"]["cost_usd"] > 0
+        assert data["error_classes"]["tool:bash"] == 1
+
+    def test_query_table(self, runs: Path) -> None:
+        result = CliRunner().invoke(telemetry, ["query", str(runs), "--by", "provider"])
+
+        assert result.exit_code == 0, result.output
+        assert "anthropic" in result.output
+        assert "llm:rate_limited" in result.output
+
+    def test_bad_price_is_usage_error(self, runs: Path) -> None:
+        result = CliRunner().invoke(telemetry, ["query", str(runs), "--price", "x"])
+
+        assert result.exit_code == 2
+
+    def test_compact_without_pyarrow_names_extra(
+        self, runs: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import builtins
+
+        real_import = builtins.__import__
+
+        def _no_pyarrow(name, *args, **kwargs):
+            if name.startswith("pyarrow"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_pyarrow)
+        result = CliRunner().invoke(telemetry, ["compact", str(runs)])
+
+        assert result.exit_code == 1
+        assert "telemetry" in result.output
@@ -594,3 +594,125 @@ class TestPromptProfile:
 
         assert len(emitter.events) == 1
         assert emitter.events[0].prompt_profile == "digest+rules_bundle"
+
+
+# ============================================================================
+# Test: LLM request gate feedback
+# ============================================================================
+
+
+class TestLLMRequestGate:
+    """_invoke_with_role holds a gate slot and feeds the call outcome back."""
+
+    @pytest.mark.asyncio
+    async def test_slot_released_and_rate_limit_halves_limit(
+        self, tmp_path: Path, mock_sdk: ModuleType, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from guardkit.orchestrator.exceptions import AgentInvocationError
+        from guardkit.orchestrator.instrumentation.concurrency import (
+            LLMRequestGate,
+            ProviderLimits,
+        )
+
+        monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+        gate = LLMRequestGate(limits={"anthropic": ProviderLimits(max_in_flight=4)})
+        emitter = NullEmitter(capture=True)
+        invoker = _make_invoker(tmp_path, emitter=emitter, llm_gate=gate)
+        result_msg = _make_result_msg(mock_sdk)
+
+        async def fake_query(**kw: Any):
+            assert gate.limiter("anthropic").in_flight == 1
+            yield result_msg
+
+        mock_sdk.query = fake_query  # type: ignore[attr-defined]
+        await invoker._invoke_with_role(
+            prompt="TASK-TEST-001 implement feature",
+            agent_type="player",
+            allowed_tools=["Read"],
+            permission_mode="acceptEdits",
+        )
+        assert gate.limiter("anthropic").in_flight == 0
+
+        async def rate_limited_query(**kw: Any):
+            raise RuntimeError("429 Too Many Requests")
+            yield  # pragma: no cover
+
+        mock_sdk.query = rate_limited_query  # type: ignore[attr-defined]
+        with pytest.raises(AgentInvocationError):
+            await invoker._invoke_with_role(
+                prompt="TASK-TEST-001 implement feature",
+                agent_type="player",
+                allowed_tools=["Read"],
+                permission_mode="acceptEdits",
+            )
+        await asyncio.sleep(0.05)
+
+        assert gate.limiter("anthropic").in_flight == 0
+        assert gate.limiter("anthropic").limit == 2
+        assert emitter.events[-1].error_type == "rate_limited"
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_setup_before_the_call_raises(
+        self, tmp_path: Path, mock_sdk: ModuleType, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from guardkit.orchestrator.exceptions import AgentInvocationError
+        from guardkit.orchestrator.instrumentation.concurrency import (
+            LLMRequestGate,
+            ProviderLimits,
+        )
+
+        class _LayoutPrompt(str):
+            layout = object()
+
+        monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+        gate = LLMRequestGate(limits={"anthropic": ProviderLimits(max_in_flight=1)})
+        invoker = _make_invoker(tmp_path, llm_gate=gate)
+        tracker = MagicMock()
+        tracker.observe.side_effect = RuntimeError("tracker broke")
+
+        with patch(
+            "guardkit.orchestrator.agent_invoker.get_prefix_cache_tracker",
+            return_value=tracker,
+        ), pytest.raises(AgentInvocationError):
+            await invoker._invoke_with_role(
+                prompt=_LayoutPrompt("TASK-TEST-001 implement feature"),
+                agent_type="player",
+                allowed_tools=["Read"],
+                permission_mode="acceptEdits",
+            )
+
+        assert gate.limiter("anthropic").in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancellation_while_queued_abandons_the_wait(
+        self, tmp_path: Path, mock_sdk: ModuleType, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import threading
+
+        from guardkit.orchestrator.instrumentation.concurrency import (
+            LLMRequestGate,
+            ProviderLimits,
+        )
+
+        monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+        gate = LLMRequestGate(limits={"anthropic": ProviderLimits(max_in_flight=1)})
+        cancelled = threading.Event()
+        invoker = _make_invoker(tmp_path, llm_gate=gate, cancellation_event=cancelled)
+        held = await gate.acquire("anthropic")
+
+        async def never_called(**kw: Any):
+            pytest.fail("a cancelled invocation must not reach the model")
+            yield  # pragma: no cover
+
+        mock_sdk.query = never_called  # type: ignore[attr-defined]
+        cancelled.set()
+        with pytest.raises(asyncio.CancelledError):
+            await invoker._invoke_with_role(
+                prompt="TASK-TEST-001 implement feature",
+                agent_type="player",
+                allowed_tools=["Read"],
+                permission_mode="acceptEdits",
+            )
+
+        held.release()
+        assert gate.limiter("anthropic").in_flight == 0
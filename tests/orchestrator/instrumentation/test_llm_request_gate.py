@@ -0,0 +1,260 @@
+"""Tests for the live LLM request gate (token bucket + intra-wave AIMD).
+
+Covers:
+- Token bucket pacing and drain
+- Multiplicative decrease on 429s, once per decrease epoch
+- Additive increase back to the provider ceiling
+- p95 latency decrease against the first-window baseline
+- In-flight limit enforced across threads / event loops
+- Cancelled waiters never leak a slot
+- No default ceiling: only AIMD decreases cap concurrency
+- Per-provider env overrides and the kill switch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from guardkit.orchestrator.instrumentation.concurrency import (
+    LLMRequestGate,
+    ProviderLimits,
+    TokenBucket,
+    get_llm_request_gate,
+    llm_gate_ceiling,
+    provider_limits_from_env,
+)
+from guardkit.orchestrator.instrumentation.schemas import LLMCallEvent
+
+
+def _event(
+    status: str = "ok",
+    error_type: Optional[str] = None,
+    latency_ms: float = 100.0,
+    provider: str = "anthropic",
+) -> LLMCallEvent:
+    return LLMCallEvent(
+        run_id="run-1",
+        task_id="TASK-1",
+        agent_role="player",
+        attempt=1,
+        timestamp="2026-10-18T12:00:00Z",
+        provider=provider,
+        model="m",
+        input_tokens=0,
+        output_tokens=0,
+        latency_ms=latency_ms,
+        prompt_profile="digest+rules_bundle",
+        status=status,
+        error_type=error_type,
+    )
+
+
+def _gate(max_in_flight: int = 8, window: int = 20) -> LLMRequestGate:
+    return LLMRequestGate(
+        limits={"anthropic": ProviderLimits(max_in_flight=max_in_flight)},
+        latency_window=window,
+    )
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(rate_per_sec=2.0, burst=2, clock=lambda: now[0])
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        now[0] = 0.5
+        assert bucket.try_acquire() == 0.0
+
+        bucket.drain()
+        assert bucket.try_acquire() == pytest.approx(0.5)
+
+
+class TestAIMD:
+    @pytest.mark.asyncio
+    async def test_concurrent_rate_limits_halve_once(self):
+        gate = _gate(max_in_flight=8)
+        slots = [await gate.acquire("anthropic") for _ in range(4)]
+
+        for slot in slots:
+            slot.release(_event("error", "rate_limited"))
+
+        assert gate.limiter("anthropic").limit == 4
+
+        # A 429 from a call started after the decrease halves again.
+        slot = await gate.acquire("anthropic")
+        slot.release(_event("error", "rate_limited"))
+        assert gate.limiter("anthropic").limit == 2
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_capped_at_ceiling(self):
+        gate = _gate(max_in_flight=4)
+        gate.on_llm_call(_event("error", "rate_limited"))
+        assert gate.limiter("anthropic").limit == 2
+
+        for _ in range(3):  # 2 -> 2.5 -> 2.9 -> 3.24
+            gate.on_llm_call(_event())
+        assert gate.limiter("anthropic").limit == 3
+        for _ in range(20):
+            gate.on_llm_call(_event())
+        assert gate.limiter("anthropic").limit == 4
+
+    @pytest.mark.asyncio
+    async def test_unbounded_limit_halves_the_concurrency_reached(self):
+        gate = LLMRequestGate(limits={"anthropic": ProviderLimits()})
+        slots = [await gate.acquire("anthropic") for _ in range(12)]
+        assert gate.limiter("anthropic").limit is None
+
+        for slot in slots:
+            slot.release(_event("error", "rate_limited"))
+
+        assert gate.limiter("anthropic").limit == 6
+        for _ in range(40):
+            gate.on_llm_call(_event())
+        assert gate.limiter("anthropic").limit > 6
+
+    def test_other_errors_do_not_adapt(self):
+        gate = _gate(max_in_flight=4)
+        gate.on_llm_call(_event("error", "timeout"))
+        assert gate.limiter("anthropic").limit == 4
+
+    def test_p95_above_baseline_decreases(self):
+        gate = _gate(max_in_flight=8, window=5)
+        for _ in range(5):
+            gate.on_llm_call(_event(latency_ms=100.0))
+        for _ in range(4):
+            gate.on_llm_call(_event(latency_ms=190.0))
+        assert gate.limiter("anthropic").limit == 8
+
+        gate.on_llm_call(_event(latency_ms=250.0))
+        assert gate.limiter("anthropic").limit == 4
+
+
+class TestInFlightLimit:
+    def test_limit_holds_across_threads_and_loops(self):
+        gate = _gate(max_in_flight=2)
+        lock = threading.Lock()
+        active: List[int] = [0]
+        peak: List[int] = [0]
+
+        async def call():
+            async with gate.slot("anthropic"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        async def two_calls():
+            await asyncio.wait_for(asyncio.gather(call(), call()), 5)
+
+        def worker():
+            asyncio.run(two_calls())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 2
+        assert gate.limiter("anthropic").in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_decrease_queues_new_calls(self):
+        gate = _gate(max_in_flight=2)
+        first = await gate.acquire("anthropic")
+        gate.on_llm_call(_event("error", "rate_limited"))
+
+        waiter = asyncio.create_task(gate.acquire("anthropic"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        first.release(_event())
+        slot = await asyncio.wait_for(waiter, 1)
+        slot.release()
+        assert gate.limiter("anthropic").in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        gate = _gate(max_in_flight=1)
+        held = await gate.acquire("anthropic")
+        waiter = asyncio.create_task(gate.acquire("anthropic"))
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        held.release()
+        held.release()  # idempotent
+
+        assert gate.limiter("anthropic").in_flight == 0
+        slot = await asyncio.wait_for(gate.acquire("anthropic"), 1)
+        slot.release()
+
+
+class TestConfiguration:
+    def test_providers_get_independent_ceilings(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_LLM_MAX_INFLIGHT_LOCAL_VLLM", "2")
+        monkeypatch.setenv("GUARDKIT_LLM_RATE_ANTHROPIC", "0")
+
+        local = provider_limits_from_env("local-vllm")
+        hosted = provider_limits_from_env("anthropic")
+
+        assert (local.max_in_flight, local.rate_per_sec) == (2, None)
+        assert hosted.max_in_flight is None and hosted.rate_per_sec is None
+
+    def test_no_default_ceiling_caps_max_parallel(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_LLM_GATE", "1")
+        for provider in ("anthropic", "openai", "local-vllm"):
+            monkeypatch.delenv(
+                f"GUARDKIT_LLM_MAX_INFLIGHT_{provider.upper().replace('-', '_')}",
+                raising=False,
+            )
+            assert llm_gate_ceiling(provider) is None
+
+        monkeypatch.setenv("GUARDKIT_LLM_MAX_INFLIGHT_ANTHROPIC", "4")
+        assert llm_gate_ceiling("anthropic") == 4
+        monkeypatch.setenv("GUARDKIT_LLM_GATE", "0")
+        assert llm_gate_ceiling("anthropic") is None
+
+    def test_wave_start_warns_when_the_ceiling_caps_the_wave(self, monkeypatch, caplog):
+        from unittest.mock import MagicMock
+
+        from guardkit.orchestrator.feature_orchestrator import FeatureOrchestrator
+
+        monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+        monkeypatch.setenv("GUARDKIT_LLM_GATE", "1")
+        monkeypatch.setenv("GUARDKIT_LLM_MAX_INFLIGHT_ANTHROPIC", "4")
+        warn = FeatureOrchestrator._warn_if_llm_gate_caps_wave
+
+        with caplog.at_level("WARNING"):
+            warn(MagicMock(), 1, 4)
+            assert not caplog.records
+            warn(MagicMock(), 2, 10)
+
+        assert "Wave 2 runs 10 tasks" in caplog.text
+        assert "GUARDKIT_LLM_MAX_INFLIGHT_ANTHROPIC" in caplog.text
+
+    def test_kill_switch(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_LLM_GATE", "0")
+        assert get_llm_request_gate() is None
+        monkeypatch.setenv("GUARDKIT_LLM_GATE", "1")
+        assert get_llm_request_gate() is get_llm_request_gate()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_provider_paces_starts(self):
+        gate = LLMRequestGate(
+            limits={"openai": ProviderLimits(max_in_flight=8, rate_per_sec=20.0, burst=1)}
+        )
+        start = time.monotonic()
+        for _ in range(3):
+            (await gate.acquire("openai")).release()
+        assert time.monotonic() - start >= 0.09
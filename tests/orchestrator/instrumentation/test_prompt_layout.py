@@ -0,0 +1,163 @@
+"""Tests for prefix-cache-stable prompt layout and prefix reuse estimation.
+
+Covers:
+- Most-static-first ordering and tier-boundary prefixes
+- reorder=False keeps authored order and stops the prefix at the first TURN
+- PrefixCacheTracker hit/miss and reusable-token estimates per role
+- Player prompts across turns share everything up to the turn block
+- Prefix estimates recorded on the llm.call event
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from guardkit.orchestrator.instrumentation.digests import count_tokens
+from guardkit.orchestrator.instrumentation.prompt_layout import (
+    LayoutPrompt,
+    PrefixCacheTracker,
+    PromptLayout,
+    SectionStability,
+)
+
+S, T, V = SectionStability.STATIC, SectionStability.TASK, SectionStability.TURN
+
+
+def _layout(role: str = "player", task: str = "task A", turn: str = "turn 1", **kw):
+    layout = PromptLayout(role=role, **kw)
+    layout.add("turn", turn, V)
+    layout.add("task", task, T)
+    layout.add("rules", "rules", S)
+    layout.add("schema", "schema", S)
+    return layout
+
+
+class TestPromptLayout:
+    def test_renders_most_static_first(self):
+        prompt = _layout().render()
+
+        assert prompt == "rulesschematask Aturn 1"
+        assert isinstance(prompt, LayoutPrompt)
+        assert not isinstance(prompt + "x", LayoutPrompt)
+
+    def test_prefixes_end_at_tier_boundaries(self):
+        assert _layout().prefixes() == [(S, "rulesschema"), (T, "rulesschematask A")]
+
+    def test_authored_order_prefix_stops_at_turn(self):
+        layout = _layout(reorder=False)
+
+        assert layout.render() == "turn 1task Arulesschema"
+        assert layout.prefixes() == []
+        assert layout.fingerprint() is None
+
+    def test_fingerprint_ignores_turn_content(self):
+        assert _layout(turn="turn 1").fingerprint() == _layout(turn="turn 2").fingerprint()
+        assert _layout(task="A").fingerprint() != _layout(task="B").fingerprint()
+        assert _layout(role="coach").fingerprint() != _layout().fingerprint()
+
+
+class TestPrefixCacheTracker:
+    def test_hit_miss_and_reusable_tokens(self):
+        tracker = PrefixCacheTracker()
+
+        first = tracker.observe(_layout(turn="turn 1"))
+        next_turn = tracker.observe(_layout(turn="turn 2"))
+        other_task = tracker.observe(_layout(task="task B"))
+        other_role = tracker.observe(_layout(role="coach"))
+
+        assert (first.hit, first.reusable_tokens) == (False, 0)
+        assert next_turn.hit
+        assert next_turn.reusable_tokens == count_tokens("rulesschematask A")
+        assert other_task.reusable_tokens == count_tokens("rulesschema")
+        assert not other_role.hit
+
+    def test_bounded_per_role(self):
+        tracker = PrefixCacheTracker(max_entries=2)
+        for task in ("a", "b", "c"):
+            tracker.observe(_layout(task=task))
+
+        # Static prefix stays warm (re-touched by every observe), "a" evicted.
+        assert tracker.observe(_layout(task="a")).reusable_tokens == count_tokens(
+            "rulesschema"
+        )
+
+
+class TestPlayerPromptLayout:
+    @pytest.fixture
+    def invoker(self, tmp_path: Path):
+        from guardkit.orchestrator.agent_invoker import AgentInvoker
+
+        return AgentInvoker(worktree_path=tmp_path)
+
+    def test_turns_share_prefix_up_to_turn_block(self, invoker):
+        criteria = [{"id": "AC-001", "text": "Does the thing"}]
+        turn1 = invoker._build_player_prompt(
+            "TASK-1", 1, "Build it", None, acceptance_criteria=criteria
+        )
+        turn2 = invoker._build_player_prompt(
+            "TASK-1", 2, "Build it", "Fix the tests", acceptance_criteria=criteria,
+            context="turn state",
+        )
+
+        assert turn1.startswith("You are the Player agent.")
+        assert turn1.layout.fingerprint() == turn2.layout.fingerprint()
+        shared = turn1.layout.prefixes()[-1][1]
+        assert turn2.startswith(shared)
+        assert "## Your Responsibilities" in shared and "Build it" in shared
+        assert "Turn: " not in shared and "Fix the tests" not in shared
+        assert turn2.index("## Requirements") < turn2.index("## Coach Feedback")
+
+    def test_coach_prompt_keeps_authored_order(self, invoker):
+        prompt = invoker._build_coach_prompt(
+            "TASK-1", 1, "Build it", {"task_id": "TASK-1"}
+        )
+
+        assert prompt.startswith(
+            "You are the Coach agent. Validate the Player's implementation.\n\n"
+            "Task ID: TASK-1\nTurn: 1\n"
+        )
+        assert prompt.layout.prefixes()[-1][0] is T
+
+
+@pytest.mark.asyncio
+async def test_llm_call_event_records_prefix_estimate(tmp_path, monkeypatch):
+    from guardkit.orchestrator.agent_invoker import AgentInvoker
+    from guardkit.orchestrator.instrumentation.emitter import NullEmitter
+    from guardkit.orchestrator.instrumentation.prompt_layout import (
+        get_prefix_cache_tracker,
+    )
+
+    get_prefix_cache_tracker().clear()
+    emitter = NullEmitter(capture=True)
+    invoker = AgentInvoker(worktree_path=tmp_path, emitter=emitter)
+
+    class _Harness:
+        supports_resume = True
+
+        async def invoke(self, **kw: Any):
+            if False:  # pragma: no cover - async generator with no events
+                yield None
+
+    with patch(
+        "guardkit.orchestrator.agent_invoker.select_harness",
+        return_value=_Harness(),
+    ):
+        for turn in (1, 2):
+            prompt = invoker._build_player_prompt("TASK-1", turn, "Build it", None)
+            await invoker._invoke_with_role(
+                prompt=prompt, agent_type="player", allowed_tools=[],
+                permission_mode="acceptEdits", model="m",
+            )
+    await asyncio.sleep(0.05)
+
+    first, second = emitter.events
+    assert (first.prefix_cache_hit, first.prefix_reusable_tokens) == (False, 0)
+    assert second.prefix_cache_hit and second.prefix_cache_estimated
+    assert second.prefix_reusable_tokens > 0
+    assert second.prefix_fingerprint == first.prefix_fingerprint
+    get_prefix_cache_tracker().clear()
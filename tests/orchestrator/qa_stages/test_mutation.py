@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import List, Optional, Sequence
 
 import pytest
 
@@ -17,7 +19,14 @@ from guardkit.orchestrator.qa_stages import (
     split_diff_by_file,
     strip_auth_header_operator,
 )
-from guardkit.orchestrator.qa_stages.mutation import _MUTATED_AUTH_KEY
+from guardkit.orchestrator.qa_stages.mutation import (
+    _MUTATED_AUTH_KEY,
+    Mutant,
+    TestOutcome,
+    _narrowed,
+    _with_fail_fast,
+)
+from guardkit.orchestrator.quality_gates.test_impact import TestImpactIndex
 
 FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "qa_stages" / "auth_client"
 
@@ -140,3 +149,132 @@ def test_split_diff_by_file_and_revert_hunk(tmp_path):
         mutants[0].apply(box.path)
         reverted = (box.path / "m.py").read_text()
     assert "+ 0" not in reverted
+
+
+def test_revert_hunk_applies_in_a_snapshot_clone(tmp_path):
+    # Parallel campaigns clone the base snapshot without .git; the git-backed
+    # operator must still patch the clone as plain files.
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "t@t")
+    _git(root, "config", "user.name", "t")
+    (root / "m.py").write_text("def add(a, b):\n    return a + b\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "base")
+    base = _git(root, "rev-parse", "HEAD").strip()
+    (root / "m.py").write_text("def add(a, b):\n    return a + b + 0\n")
+    _git(root, "commit", "-qam", "change")
+    hunks = split_diff_by_file(_git(root, "diff", base, "--", "m.py"))["m.py"]
+    (mutant,) = revert_hunks_operator("m.py", hunks)
+    assert mutant.path == "m.py" and mutant.lines == (1, 2)
+
+    sandbox = MutationSandbox(root)
+    with sandbox.materialize() as snapshot, sandbox.clone(
+        snapshot.path, [mutant.path]
+    ) as box:
+        assert not (box.path / ".git").exists()
+        mutant.apply(box.path)
+        assert "+ 0" not in (box.path / "m.py").read_text()
+        assert "+ 0" in (snapshot.path / "m.py").read_text()
+
+
+# --------------------------------------------------------------------------- #
+# Parallel campaign: snapshot clones, fail-fast, impact-targeted runs
+# --------------------------------------------------------------------------- #
+def test_clone_hardlinks_all_but_the_writable_files(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("A = 1\n")
+    (tmp_path / "pkg" / "b.py").write_text("B = 1\n")
+    sandbox = MutationSandbox(tmp_path, prefer_git=False)
+
+    with sandbox.materialize() as snapshot, sandbox.clone(
+        snapshot.path, ["pkg/a.py"]
+    ) as box:
+        assert os.path.samefile(box.path / "pkg" / "b.py", snapshot.path / "pkg" / "b.py")
+        assert not os.path.samefile(
+            box.path / "pkg" / "a.py", snapshot.path / "pkg" / "a.py"
+        )
+        (box.path / "pkg" / "a.py").write_text("A = 2\n")
+        assert (snapshot.path / "pkg" / "a.py").read_text() == "A = 1\n"
+
+
+def test_clone_copies_everything_when_hardlinks_are_off(tmp_path, monkeypatch):
+    monkeypatch.setenv("GUARDKIT_MUTATION_HARDLINK", "0")
+    (tmp_path / "b.py").write_text("B = 1\n")
+    sandbox = MutationSandbox(tmp_path, prefer_git=False)
+
+    with sandbox.materialize() as snapshot, sandbox.clone(snapshot.path, []) as box:
+        assert not os.path.samefile(box.path / "b.py", snapshot.path / "b.py")
+
+
+def test_parallel_campaign_matches_serial():
+    text = (FIXTURE / "authclient.py").read_text()
+    mutants = strip_auth_header_operator("authclient.py", text)
+    sandbox = MutationSandbox(FIXTURE, prefer_git=False)
+
+    serial = run_mutation_campaign(sandbox, mutants, _pytest_runner(), workers=1)
+    parallel = run_mutation_campaign(sandbox, mutants, _pytest_runner(), workers=4)
+
+    assert [(r.site, r.survived) for r in parallel.results] == [
+        (r.site, r.survived) for r in serial.results
+    ]
+
+
+def test_pytest_runner_fails_fast_and_narrows_to_targets(tmp_path):
+    (tmp_path / "tests").mkdir()
+    assert _with_fail_fast(["python", "-m", "pytest", "-q", "tests"]) == [
+        "python", "-m", "pytest", "-x", "-q", "tests",
+    ]
+    assert _with_fail_fast(["pytest", "--maxfail=3"]) == ["pytest", "--maxfail=3"]
+    assert _with_fail_fast(["make", "test"]) == ["make", "test"]
+
+    narrowed = _narrowed(
+        ["pytest", "-x", "-k", "tests", "--ignore", "tests/slow", "tests", "-q"],
+        ["tests/test_a.py::test_one"],
+        tmp_path,
+    )
+    assert narrowed == [
+        "pytest", "-x", "-k", "tests", "--ignore", "tests/slow", "-q",
+        "tests/test_a.py::test_one",
+    ]
+    assert _narrowed(["make", "test"], ["t.py"], tmp_path) is None
+
+
+class _RecordingRunner:
+    def __init__(self) -> None:
+        self.calls: List[Optional[Sequence[str]]] = []
+
+    def __call__(self, root: Path, targets: Optional[Sequence[str]] = None) -> TestOutcome:
+        self.calls.append(targets)
+        return TestOutcome(green=True, returncode=0)
+
+
+def test_impact_index_narrows_each_mutant_to_its_covering_tests(tmp_path):
+    (tmp_path / "svc.py").write_text("x = 1\n")
+    sandbox = MutationSandbox(tmp_path, prefer_git=False)
+    impact = TestImpactIndex(
+        tree="t",
+        lines={"svc.py": {1: (), 5: ("test_svc.py::test_a",), 6: ("test_svc.py::test_b",)}},
+    )
+    noop = lambda _root: None  # noqa: E731
+    mutants = [
+        Mutant("op", "svc.py:5", noop, path="svc.py", lines=(5, 6)),
+        Mutant("op", "svc.py:1", noop, path="svc.py", lines=(1,)),  # import-time line
+        Mutant("op", "svc.py:9", noop, path="svc.py", lines=(9,)),  # never executed
+        Mutant("op", "other.py:1", noop, path="other.py", lines=(1,)),  # unmeasured
+        Mutant("op", "unknown", noop),
+    ]
+    runner = _RecordingRunner()
+
+    run_mutation_campaign(sandbox, mutants, runner, workers=1, impact=impact)
+
+    # Baseline first, then one call per mutant in order.
+    assert runner.calls == [
+        None,
+        ["test_svc.py::test_a", "test_svc.py::test_b"],
+        None,
+        None,
+        None,
+        None,
+    ]
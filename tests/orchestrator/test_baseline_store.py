@@ -0,0 +1,306 @@
+"""Content-addressed baseline store + partial re-probe (wave-0 baseline probe).
+
+A restart on an unchanged tree must reuse the stored baseline without a suite
+run; a moved tree re-probes only previously failing tests and the test
+subtrees of changed packages; anything the partial probe cannot vouch for runs in full.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from guardkit.orchestrator import feature_orchestrator as fo
+from guardkit.orchestrator.baseline import (
+    BaselineResult,
+    BaselineStore,
+    load_known_failure_ids,
+    narrow_pytest_command,
+    partial_probe_targets,
+    worktree_tree_hash,
+)
+from guardkit.orchestrator.feature_loader import (
+    Feature,
+    FeatureExecution,
+    FeatureOrchestration,
+    FeatureTask,
+    SmokeGates,
+)
+from guardkit.orchestrator.feature_orchestrator import FeatureOrchestrator
+from guardkit.worktrees import Worktree
+
+
+def _result(passed=True, failing=()):
+    return BaselineResult(
+        command="pytest -q tests",
+        expected_exit=0,
+        passed=passed,
+        exit_code=0 if passed else 1,
+        failing_node_ids=list(failing),
+        failing_count=len(failing),
+        timestamp="2026-10-01T00:00:00",
+    )
+
+
+class TestBaselineStore:
+    def test_round_trip_and_lineage_lookup(self, tmp_path):
+        store = BaselineStore(tmp_path)
+        lineage = store.lineage("lock", "pytest -q", 0)
+        key = store.key("tree1", "lock", "pytest -q", 0)
+        store.put(key, lineage, "tree1", _result(passed=False, failing=["t.py::x"]))
+
+        assert store.get(key).failing_node_ids == ["t.py::x"]
+        assert store.get(store.key("tree2", "lock", "pytest -q", 0)) is None
+        tree, latest = store.latest_for(lineage)
+        assert tree == "tree1" and latest.failing_node_ids == ["t.py::x"]
+        assert store.latest_for(store.lineage("other-lock", "pytest -q", 0)) is None
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        store = BaselineStore(tmp_path, max_entries=2)
+        lineage = store.lineage("lock", "cmd", 0)
+        for n in range(3):
+            store.put(store.key(f"t{n}", "lock", "cmd", 0), lineage, f"t{n}", _result())
+
+        assert len(list(store.root.glob("*.json"))) == 2
+
+
+class TestNarrowPytestCommand:
+    def test_replaces_roots_and_keeps_flags(self):
+        cmd = narrow_pytest_command(
+            "python -m pytest -q -k 'not slow' tests/unit",
+            ["tests/unit/test_a.py", "other/test_b.py"],
+        )
+        assert cmd == "python -m pytest -q -k 'not slow' tests/unit/test_a.py"
+
+    def test_no_roots_keeps_every_target(self):
+        assert narrow_pytest_command("pytest -x", ["a/test_a.py::test_x"]) == (
+            "pytest -x a/test_a.py::test_x"
+        )
+
+    @pytest.mark.parametrize(
+        "command", ["pytest tests && ruff check .", "make test", "npm test"]
+    )
+    def test_not_narrowable(self, command):
+        assert narrow_pytest_command(command, ["tests/test_a.py"]) is None
+
+
+_TEST_FILES = [
+    "tests/core/test_calc.py",
+    "tests/core/parsing/test_lexer.py",
+    "tests/unit/core/test_units.py",
+    "tests/api/test_routes.py",
+    "tests/test_new.py",
+    "tests/test_old.py",
+]
+
+
+class TestPartialProbeTargets:
+    @pytest.fixture(autouse=True)
+    def _files(self, tmp_path):
+        for rel in _TEST_FILES:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("")
+
+    def test_failing_ids_changed_tests_and_package_subtrees(self, tmp_path):
+        previous = _result(passed=False, failing=["tests/test_old.py::test_x"])
+
+        targets = partial_probe_targets(
+            previous,
+            ["src/app/core/calc.py", "tests/test_new.py"],
+            _TEST_FILES,
+            tmp_path,
+        )
+
+        assert targets == [
+            "tests/core/parsing/test_lexer.py",
+            "tests/core/test_calc.py",
+            "tests/test_new.py",
+            "tests/test_old.py::test_x",
+            "tests/unit/core/test_units.py",
+        ]
+
+    def test_package_without_subtree_walks_up(self, tmp_path):
+        targets = partial_probe_targets(
+            _result(), ["app/api/v2/handlers.py"], _TEST_FILES, tmp_path
+        )
+
+        assert targets == ["tests/api/test_routes.py"]
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ["app/core/calc.py", "README.md"],
+            ["app/core/calc.py", "requirements.txt"],
+            ["app/core/data/fixture.json"],
+            ["app/calc.py"],
+            ["app/billing/invoice.py"],
+            ["tests/conftest.py"],
+        ],
+        ids=["docs", "manifest", "data", "top-level", "no-subtree", "conftest"],
+    )
+    def test_change_it_cannot_vouch_for_needs_full_probe(self, tmp_path, changed):
+        assert partial_probe_targets(_result(), changed, _TEST_FILES, tmp_path) is None
+
+    def test_nothing_to_run_needs_full_probe(self, tmp_path):
+        assert partial_probe_targets(
+            _result(), ["tests/test_deleted.py"], _TEST_FILES, tmp_path
+        ) is None
+
+    def test_red_without_ids_needs_full_probe(self, tmp_path):
+        previous = _result(passed=False)
+        assert partial_probe_targets(previous, ["src/a.py"], [], tmp_path) is None
+
+
+def test_ledger_parse_is_memoized_until_file_changes(tmp_path):
+    pytest.importorskip("yaml")
+    ledger = tmp_path / "qa" / "known-failures.yaml"
+    ledger.parent.mkdir()
+    ledger.write_text("known_failures:\n  - test_id: t.py::a\n")
+
+    assert load_known_failure_ids(tmp_path) == {"t.py::a"}
+    with patch("yaml.safe_load") as safe_load:
+        assert load_known_failure_ids(tmp_path) == {"t.py::a"}
+    safe_load.assert_not_called()
+
+    ledger.write_text("known_failures:\n  - test_id: t.py::a\n  - test_id: t.py::b\n")
+    assert load_known_failure_ids(tmp_path) == {"t.py::a", "t.py::b"}
+
+
+# ---------------------------------------------------------------------------
+# FeatureOrchestrator wave-0 probe through the store
+# ---------------------------------------------------------------------------
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture()
+def worktree(tmp_path) -> Worktree:
+    wt = tmp_path / "wt"
+    (wt / "tests" / "core").mkdir(parents=True)
+    (wt / "app" / "core").mkdir(parents=True)
+    (wt / "app" / "core" / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+    (wt / "tests" / "core" / "test_calc.py").write_text(
+        "from app.core.calc import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+    )
+    (wt / "tests" / "test_other.py").write_text(
+        "def test_red():\n    assert False\n\ndef test_green():\n    assert True\n"
+    )
+    _git(wt, "init", "-q")
+    _git(wt, "add", "-A")
+    _git(wt, "commit", "-qm", "base")
+    return Worktree(
+        task_id="FEAT-X", branch_name="autobuild/FEAT-X", path=wt, base_branch="main"
+    )
+
+
+def _feature() -> Feature:
+    return Feature(
+        id="FEAT-X",
+        name="F",
+        tasks=[FeatureTask(id="TASK-A-001", name="a", file_path=Path("a.md"))],
+        orchestration=FeatureOrchestration(parallel_groups=[["TASK-A-001"]]),
+        execution=FeatureExecution(),
+        smoke_gates=SmokeGates(
+            after_wave="all",
+            command="python -m pytest -q -p no:cacheprovider -o addopts= tests",
+        ),
+    )
+
+
+def _orchestrator(repo_root: Path) -> FeatureOrchestrator:
+    orch = FeatureOrchestrator(repo_root=repo_root, worktree_manager=MagicMock())
+    orch._bootstrap_lock_hash = "lock-hash"
+    return orch
+
+
+class TestCachedBaselineProbe:
+    def test_restart_on_same_tree_reuses_store(self, tmp_path, worktree, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_AUTOBUILD_BASELINE_CACHE", raising=False)
+        first = _orchestrator(tmp_path)
+        first._run_baseline_probe(_feature(), worktree)
+        assert first._measured_baseline.failing_node_ids == [
+            "tests/test_other.py::test_red"
+        ]
+
+        second = _orchestrator(tmp_path)
+        with patch.object(fo, "run_smoke_gate") as run:
+            second._run_baseline_probe(_feature(), worktree)
+
+        run.assert_not_called()
+        assert second._measured_baseline.probe_scope == "cached"
+        assert second._measured_baseline.failing_node_ids == [
+            "tests/test_other.py::test_red"
+        ]
+
+    def test_moved_tree_runs_partial_reprobe(self, tmp_path, worktree, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_AUTOBUILD_BASELINE_CACHE", raising=False)
+        _orchestrator(tmp_path)._run_baseline_probe(_feature(), worktree)
+
+        (worktree.path / "app" / "core" / "calc.py").write_text(
+            "def add(a, b):\n    return a - b\n"
+        )
+        _git(worktree.path, "commit", "-qam", "break add")
+
+        orch = _orchestrator(tmp_path)
+        commands = []
+        real_run = fo.run_smoke_gate
+
+        def _spy(config, **kwargs):
+            commands.append(config.command)
+            return real_run(config, **kwargs)
+
+        with patch.object(fo, "run_smoke_gate", side_effect=_spy):
+            orch._run_baseline_probe(_feature(), worktree)
+
+        assert len(commands) == 1
+        assert "tests/core/test_calc.py" in commands[0]
+        assert "tests/test_other.py::test_red" in commands[0]
+        baseline = orch._measured_baseline
+        assert baseline.probe_scope == "partial"
+        assert baseline.command == _feature().smoke_gates.command
+        assert sorted(baseline.failing_node_ids) == [
+            "tests/core/test_calc.py::test_add", "tests/test_other.py::test_red",
+        ]
+
+    def test_non_python_change_runs_full_probe(self, tmp_path, worktree, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_AUTOBUILD_BASELINE_CACHE", raising=False)
+        _orchestrator(tmp_path)._run_baseline_probe(_feature(), worktree)
+
+        (worktree.path / "requirements.txt").write_text("requests==2.0\n")
+        _git(worktree.path, "add", "requirements.txt")
+        _git(worktree.path, "commit", "-qm", "pin deps")
+
+        orch = _orchestrator(tmp_path)
+        orch._run_baseline_probe(_feature(), worktree)
+
+        assert orch._measured_baseline.probe_scope == "full"
+
+    def test_dirty_worktree_runs_full_probe(self, tmp_path, worktree, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_AUTOBUILD_BASELINE_CACHE", raising=False)
+        (worktree.path / "app" / "core" / "calc.py").write_text(
+            "def add(a, b):\n    return 0\n"
+        )
+        assert worktree_tree_hash(worktree.path) is None
+
+        orch = _orchestrator(tmp_path)
+        orch._run_baseline_probe(_feature(), worktree)
+
+        assert orch._measured_baseline.probe_scope == "full"
+        assert not (tmp_path / ".guardkit" / "baseline-cache").exists()
+
+    def test_kill_switch_always_probes(self, tmp_path, worktree, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_AUTOBUILD_BASELINE_CACHE", "0")
+        _orchestrator(tmp_path)._run_baseline_probe(_feature(), worktree)
+
+        orch = _orchestrator(tmp_path)
+        orch._run_baseline_probe(_feature(), worktree)
+
+        assert orch._measured_baseline.probe_scope == "full"
@@ -0,0 +1,161 @@
+"""Tests for the per-worktree git query service.
+
+Real git repos in ``tmp_path``: every answer is compared with the one-shot
+probe it replaces, so the service can only change how fast an answer comes.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from guardkit.orchestrator import git_service as git_service_module
+from guardkit.orchestrator.git_service import (
+    WorktreeGitService,
+    check_ignore_rules,
+    tracked_paths,
+)
+from guardkit.orchestrator.preflight_ignore_gate import check_ignore_one
+
+
+def _git(*args: str, cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), check=False, capture_output=True, text=True
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git("init", "-q", cwd=tmp_path)
+    (tmp_path / ".gitignore").write_text("*.log\n!keep.log\nbuild/\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / ".gitignore").write_text("gen/\n")
+    (tmp_path / "src" / "app.py").write_text("x = 1\n")
+    (tmp_path / "src" / "debug.log").write_text("")
+    _git("add", ".gitignore", "src/.gitignore", "src/app.py", cwd=tmp_path)
+    _git("add", "-f", "src/debug.log", cwd=tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def service(repo: Path):
+    svc = WorktreeGitService(repo)
+    yield svc
+    svc.close()
+
+
+_PATHS = [
+    "src/app.py",
+    "src/debug.log",
+    "keep.log",
+    "build/out.txt",
+    "src/gen/x.py",
+    "src/new.py",
+    "src/dir with space/a.py",
+]
+
+
+def _one_shot_rule(repo: Path, path: str):
+    result = _git("check-ignore", "-v", "--no-index", "--", path, cwd=repo)
+    if result.returncode != 0:
+        return None
+    return result.stdout.splitlines()[0].split("\t", 1)[0]
+
+
+def _one_shot_tracked(repo: Path, path: str) -> bool:
+    return _git("ls-files", "--error-unmatch", "--", path, cwd=repo).returncode == 0
+
+
+class TestAnswersMatchOneShotProbes:
+    def test_check_ignore(self, repo: Path, service: WorktreeGitService) -> None:
+        answers = service.check_ignore(_PATHS)
+
+        assert answers == {p: _one_shot_rule(repo, p) for p in _PATHS}
+        assert answers["keep.log"] == ".gitignore:2:!keep.log"
+
+    def test_tracked(self, repo: Path, service: WorktreeGitService) -> None:
+        answers = service.tracked(_PATHS)
+
+        assert answers == {p: _one_shot_tracked(repo, p) for p in _PATHS}
+        assert answers["src/debug.log"] is True
+
+    def test_absolute_path_inside_the_worktree(
+        self, repo: Path, service: WorktreeGitService
+    ) -> None:
+        path = str(repo / "src" / "debug.log")
+
+        assert service.tracked([path]) == {path: True}
+        assert service.check_ignore([path]) == {path: ".gitignore:1:*.log"}
+
+
+class TestUnansweredPaths:
+    def test_directories_globs_and_outside_paths_are_left_to_the_caller(
+        self, tmp_path: Path, repo: Path, service: WorktreeGitService
+    ) -> None:
+        outside = str(tmp_path.parent / "elsewhere.py")
+
+        assert service.tracked(["src", "src/*.py", outside, "../x.py"]) == {}
+        assert outside not in service.check_ignore([outside])
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        svc = WorktreeGitService(tmp_path)
+
+        assert svc.check_ignore(["a.log"]) == {}
+        assert svc.tracked(["a.py"]) == {}
+
+    def test_kill_switch(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GUARDKIT_GIT_SERVICE", "0")
+
+        assert check_ignore_rules(repo, ["x.log"]) == {}
+        assert tracked_paths(repo, ["src/app.py"]) == {}
+        assert check_ignore_one(repo, "x.log") == ".gitignore:1:*.log"
+
+
+class TestCaching:
+    def test_repeat_queries_do_not_restart_git(
+        self, repo: Path, service: WorktreeGitService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        service.check_ignore(_PATHS)
+        service.tracked(_PATHS)
+        spawned: List[object] = []
+        real_popen = subprocess.Popen
+
+        def _counting_popen(*args, **kwargs):
+            spawned.append(args[0])
+            return real_popen(*args, **kwargs)
+
+        monkeypatch.setattr(git_service_module.subprocess, "Popen", _counting_popen)
+
+        service.check_ignore(_PATHS)
+        service.tracked(_PATHS)
+        service.check_ignore(["src/another.log"])
+
+        assert spawned == []
+
+    def test_nested_gitignore_edit_is_seen(
+        self, repo: Path, service: WorktreeGitService
+    ) -> None:
+        assert service.check_ignore(["src/gen/x.py"])["src/gen/x.py"] == "src/.gitignore:1:gen/"
+
+        (repo / "src" / ".gitignore").write_text("other/\n")
+
+        assert service.check_ignore(["src/gen/x.py"]) == {"src/gen/x.py": None}
+
+    def test_index_change_is_seen(self, repo: Path, service: WorktreeGitService) -> None:
+        (repo / "src" / "new.py").write_text("")
+        assert service.tracked(["src/new.py"]) == {"src/new.py": False}
+
+        _git("add", "src/new.py", cwd=repo)
+
+        assert service.tracked(["src/new.py"]) == {"src/new.py": True}
+
+
+def test_preflight_probe_uses_the_service(repo: Path) -> None:
+    # A tracked, force-added file under an ignore rule is not a block; an
+    # untracked one is.
+    assert check_ignore_one(repo, "src/debug.log") is None
+    assert check_ignore_one(repo, "src/other.log") == ".gitignore:1:*.log"
+    assert "src/other.log" in check_ignore_rules(repo, ["src/other.log"])
@@ -0,0 +1,229 @@
+"""Tests for the tiled SSIM engine behind SSIMComparator.
+
+numpy and Pillow are optional (design-mode) dependencies, so the module is
+skipped without them. Scores are checked against scikit-image's
+``structural_similarity`` when that is installed too: the engine must only
+change how fast an answer comes, not the answer.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from guardkit.orchestrator import ssim_engine  # noqa: E402
+from guardkit.orchestrator.visual_comparator import (  # noqa: E402
+    SSIMComparator,
+    VisualComparator,
+)
+
+
+def _png(array) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _pair(shape, noise: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    reference = rng.integers(0, 256, shape, dtype=np.uint8)
+    rendered = np.clip(
+        reference.astype(int) + rng.integers(-noise, noise + 1, shape), 0, 255
+    ).astype(np.uint8)
+    return reference, rendered
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ssim_engine.get_decode_cache().clear()
+    yield
+    ssim_engine.get_decode_cache().clear()
+
+
+class TestMatchesScikitImage:
+    @pytest.mark.parametrize(
+        "shape", [(64, 64), (57, 93, 3), (300, 211, 3)], ids=["gray", "odd", "rgb"]
+    )
+    def test_mean_ssim(self, shape) -> None:
+        metrics = pytest.importorskip("skimage.metrics")
+        x, y = _pair(shape, noise=30)
+        channel_axis = 2 if len(shape) == 3 else None
+
+        expected = metrics.structural_similarity(
+            x, y, data_range=255, channel_axis=channel_axis
+        )
+        score, _ = ssim_engine.ssim(x, y, data_range=255, tile_rows=16)
+
+        assert score.exact
+        assert score.value == pytest.approx(expected, abs=1e-12)
+
+    def test_map_interior(self) -> None:
+        metrics = pytest.importorskip("skimage.metrics")
+        x, y = _pair((80, 90), noise=60)
+
+        _, expected = metrics.structural_similarity(x, y, data_range=255, full=True)
+        _, ssim_map = ssim_engine.ssim(x, y, data_range=255, full=True, tile_rows=16)
+
+        assert ssim_map.shape == expected.shape
+        np.testing.assert_allclose(ssim_map[3:-3, 3:-3], expected[3:-3, 3:-3], atol=1e-12)
+
+    def test_float_input_matches_uint8(self) -> None:
+        x, y = _pair((40, 50, 3), noise=20)
+
+        exact, _ = ssim_engine.ssim(x, y, data_range=255)
+        floating, _ = ssim_engine.ssim(x.astype(float), y.astype(float), data_range=255)
+
+        assert floating.value == pytest.approx(exact.value, abs=1e-12)
+
+
+class TestEarlyExit:
+    def test_failing_pair_stops_with_an_upper_bound(self) -> None:
+        x, _ = _pair((200, 120, 3), noise=0)
+        y = 255 - x
+
+        exact, _ = ssim_engine.ssim(x, y, data_range=255)
+        bounded, _ = ssim_engine.ssim(x, y, data_range=255, fail_below=0.85, tile_rows=8)
+
+        assert not bounded.exact
+        assert exact.value <= bounded.value < 0.85
+
+    def test_passing_pair_is_computed_exactly(self) -> None:
+        x, y = _pair((200, 120, 3), noise=2)
+
+        exact, _ = ssim_engine.ssim(x, y, data_range=255, tile_rows=8)
+        bounded, _ = ssim_engine.ssim(x, y, data_range=255, fail_below=0.85, tile_rows=8)
+
+        assert bounded == exact
+
+
+class TestComparatorReportsBounds:
+    @pytest.mark.asyncio
+    async def test_early_exit_fail_reports_the_threshold_not_a_score(self) -> None:
+        x, _ = _pair((200, 120, 3), noise=0)
+        reference, rendered = _png(x), _png(255 - x)
+
+        exact = await VisualComparator().compare(reference, rendered)
+        bounded = await VisualComparator(early_exit=True).compare(reference, rendered)
+
+        assert exact.ssim_exact
+        assert f"SSIM={exact.ssim_score:.3f}" in exact.feedback
+        assert not bounded.passed and not bounded.ssim_exact
+        assert "SSIM < 0.85" in bounded.feedback
+        assert "SSIM=" not in bounded.feedback
+        assert bounded.to_dict()["ssim_exact"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_is_exact_unless_early_exit(self) -> None:
+        x, _ = _pair((200, 120, 3), noise=0)
+        pairs = [(_png(x), _png(255 - x))]
+
+        [exact] = await VisualComparator().compare_batch(pairs)
+        [bounded] = await VisualComparator(early_exit=True).compare_batch(pairs)
+
+        assert exact.ssim_exact
+        assert exact.ssim_score == SSIMComparator().compute_ssim(*pairs[0])
+        assert not bounded.ssim_exact
+        assert exact.ssim_score <= bounded.ssim_score < 0.85
+
+
+class TestDecodeCacheAndPyramid:
+    def test_reference_is_decoded_once(self) -> None:
+        x, y = _pair((64, 64, 3), noise=10)
+        reference = _png(x)
+        cache = ssim_engine.get_decode_cache()
+
+        for seed in range(3):
+            ssim_engine.score_pair(reference, _png(_pair((64, 64, 3), 10, seed)[1]))
+
+        assert cache.misses == 4  # one reference + three renders
+        assert cache.hits == 2
+        assert not ssim_engine.load(reference).flags.writeable
+
+    def test_pyramid_level_halves_each_side(self) -> None:
+        x, _ = _pair((121, 200, 3), noise=0)
+
+        level1 = ssim_engine.load(_png(x), level=1)
+
+        assert level1.shape == (60, 100, 3)
+        assert level1.dtype == np.uint8
+
+    def test_pyramid_stops_at_two_windows(self) -> None:
+        x, _ = _pair((60, 60), noise=0)
+
+        # 60 -> 30 -> 15; halving again would leave less than two windows.
+        assert ssim_engine.load(_png(x), level=3).shape == (15, 15)
+
+    def test_spatial_map_keeps_input_size_at_a_pyramid_level(self) -> None:
+        x, y = _pair((64, 96, 3), noise=40)
+
+        _, spatial_map = SSIMComparator(pyramid_level=1).compute_ssim_with_map(
+            _png(x), _png(y)
+        )
+
+        assert Image.open(io.BytesIO(spatial_map)).size == (96, 64)
+
+
+class TestBatches:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_scores_keep_pair_order(self, workers: int) -> None:
+        pairs = [tuple(map(_png, _pair((40, 40, 3), noise))) for noise in (0, 20, 90)]
+
+        scores = ssim_engine.score_pairs(pairs, workers=workers)
+
+        assert [s.value for s in scores] == [
+            ssim_engine.score_pair(ref, rend).value for ref, rend in pairs
+        ]
+        assert scores[0].value == 1.0
+
+    def test_workers_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ssim_engine.SSIM_WORKERS_ENV_VAR, "3")
+        assert ssim_engine.ssim_workers() == 3
+
+        monkeypatch.setenv(ssim_engine.SSIM_WORKERS_ENV_VAR, "0")
+        assert ssim_engine.ssim_workers() == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_batch_routes_each_pair(self) -> None:
+        identical = _png(_pair((48, 48, 3), noise=0)[0])
+        x, _ = _pair((48, 48, 3), noise=0, seed=1)
+        comparator = VisualComparator()
+
+        results = await comparator.compare_batch(
+            [(identical, identical), (_png(x), _png(255 - x))]
+        )
+
+        assert [r.passed for r in results] == [True, False]
+        assert results[1].ssim_score < VisualComparator.TIER1_FAIL_THRESHOLD
+
+    def test_pool_only_grows_and_never_cancels_inflight_work(self) -> None:
+        pairs = [tuple(map(_png, _pair((40, 40, 3), noise))) for noise in (0, 20)]
+        ssim_engine.shutdown_pool()
+        try:
+            pool = ssim_engine._get_pool(2)
+            inflight = pool.submit(ssim_engine._score_pair_task, (*pairs[1], 0, None))
+
+            assert ssim_engine._get_pool(1) is pool
+            bigger = ssim_engine._get_pool(3)
+
+            assert bigger is not pool
+            assert inflight.result(timeout=60) == ssim_engine.score_pair(*pairs[1])
+        finally:
+            ssim_engine.shutdown_pool()
+
+    def test_workers_split_the_decode_cache_budget(self) -> None:
+        ssim_engine.shutdown_pool()
+        try:
+            pool = ssim_engine._get_pool(4)
+            budget = pool.submit(_worker_cache_budget).result(timeout=60)
+        finally:
+            ssim_engine.shutdown_pool()
+
+        assert budget == ssim_engine.DECODE_CACHE_BYTES // 4
+
+
+def _worker_cache_budget() -> int:
+    return ssim_engine.get_decode_cache()._max_bytes
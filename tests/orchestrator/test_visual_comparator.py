@@ -871,6 +871,21 @@ class TestComparisonResultSerialization:
         result = ComparisonResult.from_dict(data)
         assert result.spatial_map == spatial_data
 
+    def test_ssim_exact_round_trips(self):
+        """An early-exit bound stays marked as such through serialization."""
+        result = ComparisonResult(
+            passed=False,
+            ssim_score=0.78,
+            method=ComparisonMethod.SSIM,
+            tier=ComparisonTier.TIER_1,
+            ssim_exact=False,
+        )
+        d = result.to_dict()
+        assert d["ssim_exact"] is False
+        assert ComparisonResult.from_dict(d).ssim_exact is False
+        d.pop("ssim_exact")
+        assert ComparisonResult.from_dict(d).ssim_exact is True
+
 
 class TestAIVisionCallback:
     """Tests for AI vision callback functionality."""
@@ -11,6 +11,9 @@ R-b build-lane stage S-1. Two layers are exercised:
    built in ``tmp_path`` (the B2 test's fixture-repo pattern), covering every
    F14 ``SubjectKind`` (tree / commit / merge) plus an arbitrary range, and the
    loud-failure + empty-payload honesty rules.
+
+3. Streaming ingestion — :func:`iter_unified_diff` matches the buffered parser
+   and applies the path filter / size caps before hunks are built.
 """
 
 from __future__ import annotations
@@ -28,6 +31,7 @@ from guardkit.qa.diff_ingest import (
     ingest_merge,
     ingest_range,
     ingest_working_tree,
+    iter_unified_diff,
     parse_unified_diff,
 )
 
@@ -475,3 +479,108 @@ class TestHonestyRules:
 
         with pytest.raises(DiffIngestError, match="bad object"):
             ingest_commit(repo, "whatever", git_run=fake_git)
+
+
+# ===========================================================================
+# Layer 3 — streaming ingestion, path filters, and size caps
+# ===========================================================================
+
+_THREE_FILES = (
+    "diff --git a/a.py b/a.py\n"
+    "--- a/a.py\n"
+    "+++ b/a.py\n"
+    "@@ -1,2 +1,2 @@\n"
+    " keep\n"
+    "-old\n"
+    "+new\n"
+    "diff --git a/vendor/big.js b/vendor/big.js\n"
+    "new file mode 100644\n"
+    "--- /dev/null\n"
+    "+++ b/vendor/big.js\n"
+    "@@ -0,0 +1,4 @@\n"
+    "+one\n"
+    "+two\n"
+    "+three\n"
+    "+four\n"
+    "diff --git a/c.py b/c.py\n"
+    "--- a/c.py\n"
+    "+++ b/c.py\n"
+    "@@ -3 +3 @@\n"
+    "-x\n"
+    "+y\n"
+)
+
+
+class TestStreamingIngest:
+    def test_streamed_lines_match_buffered_parse(self):
+        streamed = tuple(iter_unified_diff(iter(_THREE_FILES.splitlines())))
+        assert streamed == parse_unified_diff(_THREE_FILES)
+        assert not hasattr(streamed[0].hunks[0].lines[0], "__dict__")
+
+    def test_files_are_yielded_as_they_close(self):
+        seen = []
+
+        def lines():
+            for line in _THREE_FILES.splitlines():
+                seen.append(line)
+                yield line
+
+        first = next(iter_unified_diff(lines()))
+        assert first.path == "a.py"
+        assert seen[-1] == "diff --git a/vendor/big.js b/vendor/big.js"
+
+    def test_path_filter_drops_file(self, monkeypatch: pytest.MonkeyPatch):
+        import guardkit.qa.diff_ingest as di
+
+        built = []
+        real = di._finalise_hunk
+        monkeypatch.setattr(
+            di, "_finalise_hunk", lambda *a: built.append(a[0]) or real(*a)
+        )
+        files = tuple(
+            iter_unified_diff(
+                _THREE_FILES.splitlines(),
+                path_filter=lambda p: not p.startswith("vendor/"),
+            )
+        )
+        assert [f.path for f in files] == ["a.py", "c.py"]
+        assert built == ["@@ -1,2 +1,2 @@", "@@ -3 +3 @@"]
+
+    def test_file_cap_keeps_metadata_and_marks_truncated(self):
+        a, big, c = iter_unified_diff(
+            _THREE_FILES.splitlines(), max_file_chars=16
+        )
+        assert big.truncated and big.hunks == ()
+        assert big.change_kind == "added" and big.path == "vendor/big.js"
+        assert a == parse_unified_diff(_THREE_FILES)[0]
+        assert not a.truncated and not c.truncated
+
+    def test_total_budget_truncates_once_spent(self):
+        files = tuple(
+            iter_unified_diff(_THREE_FILES.splitlines(), max_total_chars=25)
+        )
+        assert [f.truncated for f in files] == [False, True, False]
+        payload = ReviewPayload("commit", "x", 3, files)
+        assert payload.truncated_paths == ("vendor/big.js",)
+
+    def test_git_stream_applies_filter_and_cap(self, repo: Path):
+        base = _head(repo)
+        (repo / "vendor").mkdir()
+        (repo / "vendor" / "lib.js").write_text("v\n" * 5000)
+        (repo / "gen.py").write_text("g\n" * 5000)
+        (repo / "seed.py").write_text("a\nB\nc\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-qm", "big")
+
+        payload = ingest_range(
+            repo,
+            base,
+            "HEAD",
+            path_filter=lambda p: not p.startswith("vendor/"),
+            max_file_chars=1000,
+        )
+
+        assert payload.changed_paths == ("gen.py", "seed.py")
+        gen, seed = payload.files
+        assert gen.truncated and gen.hunks == ()
+        assert seed.additions == 1 and not seed.truncated
@@ -533,6 +533,22 @@ class TestPrompt:
         assert "+    total = 0" in text
         assert "-    return sum(xs) / len(xs)" in text
 
+    def test_render_names_a_size_capped_file(self):
+        from guardkit.qa.diff_ingest import iter_unified_diff
+
+        capped = ReviewPayload(
+            subject_kind="commit",
+            ref="abc1234",
+            context_lines=3,
+            files=tuple(
+                iter_unified_diff(SAMPLE_DIFF.splitlines(), max_file_chars=10)
+            ),
+        )
+        text = render_payload_for_seat(capped)
+        assert "pkg/calc.py" in text
+        assert "exceeds the ingest size cap" in text
+        assert "total = 0" not in text
+
     def test_messages_carry_subject_and_diff(self, payload):
         system, user = build_seat_messages(payload)
         assert "INSPECTOR" in system
@@ -1330,3 +1330,211 @@ API_KEY = "secret"  # critical
 
             # Should be sorted (critical before high)
             assert severities == sorted(severities), "Findings should be sorted by severity"
+
+
+# ============================================================================
+# 13. Single-Pass Engine, Walk Pruning and Incremental Mode
+# ============================================================================
+
+
+def _legacy_scan(checker, file_path):
+    """Per-check scan the compiled engine must reproduce exactly."""
+    from guardkit.orchestrator.quality_gates.security_checker import (
+        GHA_CHECKS,
+        JS_CHECKS,
+        PYTHON_CHECKS,
+        UNIVERSAL_CHECKS,
+    )
+
+    file_ext = file_path.suffix.lower()
+    rel_path = str(file_path.relative_to(checker.worktree_path))
+    is_workflow = ".github/workflows" in str(file_path) and file_ext in checker.WORKFLOW_EXTENSIONS
+    lines = file_path.read_text().splitlines()
+    findings = []
+    for check in PYTHON_CHECKS + JS_CHECKS + UNIVERSAL_CHECKS + GHA_CHECKS:
+        if checker._check_applies_to_file(check, file_ext, is_workflow):
+            findings.extend(checker._run_check(check, file_path, rel_path, file_ext, lines))
+    return findings
+
+
+class TestCompiledEngine:
+    """Single-pass scanner parity, pruning, pooling and incremental scans."""
+
+    def test_matches_per_check_scan(self, security_checker, create_python_file, create_js_file, create_workflow_file):
+        """One pass per file yields the same findings, in the same order."""
+        files = [
+            create_python_file("app.py", '''
+import os, pickle
+API_KEY = "abc"
+PASSWORD = os.getenv("P")
+# eval(comment)
+query = f"SELECT * FROM t WHERE id = {uid}"
+subprocess.run(f"ls {p}"); eval(x); data = pickle.loads(blob)
+DEBUG = True
+app.add_middleware(CORSMiddleware, allow_origins=["*"])
+value = ast.literal_eval(raw)
+'''),
+            create_js_file("ui.tsx", '''
+el.innerHTML = html; eval(code);
+const f = new Function("a", body);
+document.write(x)
+<div dangerouslySetInnerHTML={{__html: h}} />
+const cors = { origin: "*" };
+'''),
+            create_workflow_file("ci.yml", '''
+run: echo "${{ github.event.issue.title }}"
+run: echo "${{ github.event.number }}"
+'''),
+        ]
+
+        for file_path in files:
+            assert security_checker._scan_file(file_path) == _legacy_scan(security_checker, file_path)
+
+    def test_pool_result_matches_serial(self, temp_worktree):
+        """Thread-pooled scans return exactly the serial result."""
+        from guardkit.orchestrator.quality_gates.security_checker import SecurityChecker
+
+        for i in range(40):
+            (temp_worktree / "src" / f"m{i:02d}.py").write_text(
+                f'SECRET = "s{i}"\nDEBUG = True\nclean = {i}\n'
+            )
+
+        serial = SecurityChecker(temp_worktree, max_workers=1).run_quick_checks()
+        pooled = SecurityChecker(temp_worktree, max_workers=4).run_quick_checks()
+
+        assert len(serial) == 80
+        assert pooled == serial
+
+    def test_skip_dirs_are_pruned_not_filtered(self, security_checker, temp_worktree):
+        """Excluded directories are never entered."""
+        import os
+
+        (temp_worktree / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_worktree / "node_modules" / "pkg" / "x.js").write_text("eval(a)")
+        (temp_worktree / "src" / "ok.py").write_text("x = 1\n")
+        visited = []
+        real_walk = os.walk
+
+        def spy_walk(top, *args, **kwargs):
+            for entry in real_walk(top, *args, **kwargs):
+                visited.append(entry[0])
+                yield entry
+
+        with patch("guardkit.orchestrator.quality_gates.security_checker.os.walk", spy_walk):
+            files = list(security_checker._iter_source_files())
+
+        assert files == [temp_worktree / "src" / "ok.py"]
+        assert not any("node_modules" in path for path in visited)
+
+    def test_skip_dirs_relative_to_worktree(self, tmp_path):
+        """A worktree living under .guardkit/worktrees is still scanned."""
+        from guardkit.orchestrator.quality_gates.security_checker import SecurityChecker
+
+        worktree = tmp_path / ".guardkit" / "worktrees" / "TASK-001"
+        worktree.mkdir(parents=True)
+        (worktree / "app.py").write_text('API_KEY = "abc"\n')
+
+        findings = SecurityChecker(worktree).run_quick_checks()
+
+        assert [f.check_id for f in findings] == ["hardcoded-secrets"]
+
+    @staticmethod
+    def _git_repo(worktree):
+        import subprocess
+
+        def git(*args):
+            return subprocess.run(
+                ["git", "-C", str(worktree), *args], check=True, capture_output=True, text=True
+            ).stdout
+
+        git("init", "-q")
+        git("config", "user.email", "t@t")
+        git("config", "user.name", "t")
+        return git
+
+    def test_incremental_rescans_changes_and_carries_the_rest(self, temp_worktree):
+        """Unchanged files keep the previous scan's findings; only changes are read."""
+        from guardkit.orchestrator.quality_gates.security_checker import SecurityChecker
+
+        git = self._git_repo(temp_worktree)
+        (temp_worktree / "src" / "old.py").write_text('API_KEY = "old"\n')
+        (temp_worktree / "src" / "edited.py").write_text("x = 1\n")
+        git("add", "-A")
+        git("commit", "-q", "-m", "[guardkit-checkpoint] Turn 1 complete (tests: pass)")
+
+        # First incremental run has no previous scan to build on: full scan.
+        first = SecurityChecker(temp_worktree).run_quick_checks(incremental=True)
+        assert [f.file_path for f in first] == ["src/old.py"]
+
+        (temp_worktree / "src" / "edited.py").write_text("eval(x)\n")
+        (temp_worktree / "src" / "new.py").write_text("DEBUG = True\n")
+        checker = SecurityChecker(temp_worktree)
+        with patch.object(checker, "_scan_entry", wraps=checker._scan_entry) as scan:
+            findings = checker.run_quick_checks(incremental=True)
+
+        assert sorted(call.args[0].name for call in scan.call_args_list) == ["edited.py", "new.py"]
+        assert sorted(f.file_path for f in findings) == ["src/edited.py", "src/new.py", "src/old.py"]
+        assert sorted(findings, key=lambda f: f.file_path) == sorted(
+            checker.run_quick_checks(), key=lambda f: f.file_path
+        )
+
+    def test_incremental_rescans_files_the_cache_saw_at_other_content(self, temp_worktree):
+        """A file edited between the cached scan and the checkpoint is rescanned."""
+        from guardkit.orchestrator.quality_gates.security_checker import SecurityChecker
+
+        git = self._git_repo(temp_worktree)
+        (temp_worktree / "src" / "app.py").write_text("x = 1\n")
+        git("add", "-A")
+        git("commit", "-q", "-m", "base")
+        SecurityChecker(temp_worktree).run_quick_checks(incremental=True)
+
+        (temp_worktree / "src" / "app.py").write_text('PASSWORD = "p"\n')
+        git("commit", "-qam", "[guardkit-checkpoint] Turn 1 complete (tests: pass)")
+
+        findings = SecurityChecker(temp_worktree).run_quick_checks(incremental=True)
+
+        assert [f.check_id for f in findings] == ["hardcoded-secrets"]
+
+    def test_changed_check_set_voids_the_scan_cache(self, temp_worktree):
+        """Findings cached under another check set are not carried forward."""
+        from guardkit.orchestrator.quality_gates import security_checker as module
+
+        git = self._git_repo(temp_worktree)
+        (temp_worktree / "src" / "app.py").write_text("x = 1\nTODO_TOKEN = 1\n")
+        git("add", "-A")
+        git("commit", "-q", "-m", "[guardkit-checkpoint] Turn 1 complete (tests: pass)")
+        assert module.SecurityChecker(temp_worktree).run_quick_checks(incremental=True) == []
+
+        new_check = module.SecurityCheck(
+            check_id="todo-token",
+            severity="low",
+            description="TODO token",
+            recommendation="Remove it",
+            file_extensions={".py"},
+            substrings=["TODO_TOKEN"],
+        )
+        with patch.object(module, "UNIVERSAL_CHECKS", module.UNIVERSAL_CHECKS + [new_check]):
+            findings = module.SecurityChecker(temp_worktree).run_quick_checks(incremental=True)
+
+        assert [f.check_id for f in findings] == ["todo-token"]
+
+    def test_scan_cache_lives_in_the_git_dir(self, temp_worktree):
+        """Checkpoint commits (git add -A) never pick up the scan cache."""
+        from guardkit.orchestrator.quality_gates.security_checker import (
+            SCAN_CACHE_GIT_PATH,
+            SecurityChecker,
+        )
+
+        git = self._git_repo(temp_worktree)
+        (temp_worktree / "src" / "app.py").write_text("x = 1\n")
+
+        SecurityChecker(temp_worktree).run_quick_checks(incremental=True)
+
+        assert (temp_worktree / ".git" / SCAN_CACHE_GIT_PATH).is_file()
+        assert SCAN_CACHE_GIT_PATH not in git("status", "--porcelain", "--untracked-files=all")
+
+    def test_incremental_without_checkpoint_scans_everything(self, security_checker, create_python_file):
+        """No git repo (or no checkpoint) falls back to a full scan."""
+        create_python_file("bad.py", 'API_KEY = "abc"\n')
+
+        assert len(security_checker.run_quick_checks(incremental=True)) == 1
@@ -0,0 +1,202 @@
+"""Unit tests for the warm pytest worker (``guardkit.lib.pytest_worker``).
+
+The worker must be a drop-in for the cold ``<python> -m pytest`` subprocess
+the Coach runs: same exit codes, output ``parse_pytest_summary`` can read, a
+whole-run timeout that raises ``subprocess.TimeoutExpired``, clean module
+state between runs, and a transparent cold fallback when it cannot serve.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import patch
+
+import pytest
+
+from guardkit.lib import pytest_worker
+from guardkit.lib.pytest_summary import parse_pytest_summary
+from guardkit.lib.pytest_worker import (
+    PytestWorker,
+    PytestWorkerError,
+    pytest_worker_enabled,
+    run_pytest,
+    shutdown_pytest_workers,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="pytest worker requires os.fork"
+)
+
+# Runs inside the forked child must not inherit this session's plugins/ini.
+_ISOLATION_ARGV = ["-p", "no:cacheprovider", "-q", "-o", "addopts="]
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    (tmp_path / "counter.py").write_text("CALLS = []\n")
+    (tmp_path / "test_ok.py").write_text(
+        dedent(
+            """
+            import counter
+
+            def test_counter_starts_empty():
+                counter.CALLS.append(1)
+                assert counter.CALLS == [1]
+
+            def test_two():
+                assert 1 + 1 == 2
+            """
+        )
+    )
+    (tmp_path / "test_bad.py").write_text("def test_fails():\n    assert False\n")
+    (tmp_path / "test_slow.py").write_text(
+        "import time\n\ndef test_sleeps():\n    time.sleep(30)\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def worker(project):
+    w = PytestWorker(sys.executable, dict(os.environ), project)
+    w.start()
+    yield w
+    w.close()
+
+
+class TestPytestWorker:
+    def test_passing_run_reports_summary(self, worker, project):
+        result = worker.run([*_ISOLATION_ARGV, "test_ok.py"], cwd=project, timeout=60)
+
+        assert result.returncode == 0
+        summary = parse_pytest_summary(result.stdout)
+        assert summary.passed == 2
+        assert summary.failed == 0
+
+    def test_failing_run_returns_pytest_exit_code(self, worker, project):
+        result = worker.run([*_ISOLATION_ARGV, "test_bad.py"], cwd=project, timeout=60)
+
+        assert result.returncode == 1
+        assert parse_pytest_summary(result.stdout).failed == 1
+
+    def test_module_state_is_clean_between_runs(self, worker, project):
+        # counter.CALLS would be [1, 1] on the second run if the child's
+        # imports leaked back into the server.
+        for _ in range(2):
+            result = worker.run(
+                [*_ISOLATION_ARGV, "test_ok.py"], cwd=project, timeout=60
+            )
+            assert result.returncode == 0
+
+    def test_timeout_kills_run_and_raises(self, worker, project):
+        with pytest.raises(subprocess.TimeoutExpired):
+            worker.run([*_ISOLATION_ARGV, "test_slow.py"], cwd=project, timeout=1)
+        # The server survives a killed run.
+        assert worker.alive
+        result = worker.run([*_ISOLATION_ARGV, "test_ok.py"], cwd=project, timeout=60)
+        assert result.returncode == 0
+
+    def test_run_after_close_raises_worker_error(self, worker, project):
+        worker.close()
+        with pytest.raises(PytestWorkerError):
+            worker.run(["test_ok.py"], cwd=project, timeout=10)
+
+    def test_busy_server_wait_is_bounded_by_timeout(self, worker, project):
+        worker._lock.acquire()
+        try:
+            started = time.monotonic()
+            with pytest.raises(PytestWorkerError):
+                worker.run(["test_ok.py"], cwd=project, timeout=0.2)
+            assert time.monotonic() - started < 5
+        finally:
+            worker._lock.release()
+
+    def test_missing_interpreter_fails_to_start(self, project):
+        w = PytestWorker(str(project / "no-such-python"), dict(os.environ), project)
+        with pytest.raises(PytestWorkerError):
+            w.start()
+
+
+class TestRunPytest:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_COACH_PYTEST_WORKER", raising=False)
+        assert pytest_worker_enabled() is False
+
+    def test_disabled_runs_cold_subprocess(self, monkeypatch, project):
+        monkeypatch.delenv("GUARDKIT_COACH_PYTEST_WORKER", raising=False)
+        with patch.object(pytest_worker, "_get_worker") as get_worker:
+            result = run_pytest(
+                sys.executable, [*_ISOLATION_ARGV, "test_ok.py"],
+                cwd=project, env=dict(os.environ), timeout=60, worker_key=project,
+            )
+        get_worker.assert_not_called()
+        assert result.returncode == 0
+
+    def test_enabled_reuses_one_worker_per_key(self, monkeypatch, project):
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKER", "1")
+        try:
+            for _ in range(2):
+                result = run_pytest(
+                    sys.executable, [*_ISOLATION_ARGV, "test_ok.py"],
+                    cwd=project, env=dict(os.environ), timeout=60,
+                    worker_key=project,
+                )
+                assert result.returncode == 0
+            assert len(pytest_worker._workers) == 1
+            (pool,) = pytest_worker._workers.values()
+            assert pool._count == 1
+        finally:
+            shutdown_pytest_workers()
+
+    def test_worker_failure_falls_back_to_cold_run(self, monkeypatch, project):
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKER", "1")
+        with patch.object(
+            pytest_worker, "_get_worker", side_effect=PytestWorkerError("boom")
+        ):
+            result = run_pytest(
+                sys.executable, [*_ISOLATION_ARGV, "test_bad.py"],
+                cwd=project, env=dict(os.environ), timeout=60, worker_key=project,
+            )
+        assert result.returncode == 1
+        assert parse_pytest_summary(result.stdout).failed == 1
+
+    def test_concurrent_checkouts_get_distinct_servers(self, monkeypatch, project):
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKERS", "2")
+        env = dict(os.environ)
+        try:
+            first = pytest_worker._get_worker(sys.executable, env, project)
+            second = pytest_worker._get_worker(sys.executable, env, project)
+            assert first is not None and second is not None
+            assert first is not second
+            assert pytest_worker._get_worker(sys.executable, env, project) is None
+            for worker in (first, second):
+                pytest_worker._release_worker(sys.executable, env, project, worker)
+        finally:
+            shutdown_pytest_workers()
+
+    def test_saturated_pool_runs_cold_instead_of_waiting(self, monkeypatch, project):
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKER", "1")
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKERS", "1")
+        env = dict(os.environ)
+        try:
+            busy = pytest_worker._get_worker(sys.executable, env, project)
+            with patch.object(busy, "run") as worker_run:
+                result = run_pytest(
+                    sys.executable, [*_ISOLATION_ARGV, "test_ok.py"],
+                    cwd=project, env=env, timeout=60, worker_key=project,
+                )
+            worker_run.assert_not_called()
+            assert result.returncode == 0
+            pytest_worker._release_worker(sys.executable, env, project, busy)
+        finally:
+            shutdown_pytest_workers()
+
+    def test_pool_size_env_override(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKERS", "3")
+        assert pytest_worker.pytest_worker_pool_size() == 3
+
+        monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKERS", "0")
+        assert pytest_worker.pytest_worker_pool_size() == 1
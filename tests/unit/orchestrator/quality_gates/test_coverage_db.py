@@ -0,0 +1,162 @@
+"""Tests for the incremental coverage gate's per-worktree coverage database.
+
+Covers line remapping across zero-context hunks and the real
+pytest-under-coverage path: a later turn re-runs only the impacted tests,
+merges them into the database, and reports exactly what a full run would.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from guardkit.orchestrator.quality_gates.coverage_db import (
+    _line_mapper,
+    database_path,
+    load_database_meta,
+)
+from guardkit.orchestrator.quality_gates.coverage_gate import run_coverage_gate
+from guardkit.orchestrator.quality_gates.test_impact import load_index, snapshot_tree
+from guardkit.qa.diff_ingest import DiffHunk
+
+MODULE = (
+    "def add(a, b):\n"
+    "    return a + b\n"
+    "\n"
+    "\n"
+    "def sub(a, b):\n"
+    "    return a - b\n"
+    "\n"
+    "\n"
+    "def mul(a, b):\n"
+    "    return a * b\n"
+)
+
+TESTS = (
+    "from calc.ops import add, sub\n"
+    "\n"
+    "\n"
+    "def test_add():\n"
+    "    assert add(1, 2) == 3\n"
+    "\n"
+    "\n"
+    "def test_sub():\n"
+    "    assert sub(3, 2) == 1\n"
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("GUARDKIT_COACH_TEST_IMPACT", "1")
+    monkeypatch.delenv("GUARDKIT_COVERAGE_INCREMENTAL", raising=False)
+    (tmp_path / "calc").mkdir()
+    (tmp_path / "calc" / "__init__.py").write_text("")
+    (tmp_path / "calc" / "ops.py").write_text(MODULE)
+    (tmp_path / "test_calc.py").write_text(TESTS)
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(
+        tmp_path, "-c", "user.name=t", "-c", "user.email=t@example.com",
+        "commit", "-qm", "init",
+    )
+    return tmp_path
+
+
+def _gate(repo: Path) -> Dict[str, Any]:
+    result = run_coverage_gate(repo, ["calc/ops.py"], task_type="FEATURE", timeout=120)
+    assert result is not None
+    return result
+
+
+def _report(repo: Path) -> Dict[str, Any]:
+    raw = json.loads((repo / ".cov_output" / "coverage.json").read_text())
+    return {
+        Path(path).as_posix(): (info["executed_lines"], info["executed_branches"])
+        for path, info in raw["files"].items()
+    }
+
+
+class TestLineMapper:
+    def test_rewrite_drops_lines_and_shifts_the_rest(self) -> None:
+        remap = _line_mapper([DiffHunk(5, 2, 5, 3, "", "", ())])
+
+        assert [remap(n) for n in (4, 5, 6, 7)] == [4, None, None, 8]
+
+    def test_pure_insertion_sits_after_old_start(self) -> None:
+        remap = _line_mapper(
+            [DiffHunk(0, 0, 1, 1, "", "", ()), DiffHunk(2, 0, 4, 2, "", "", ())]
+        )
+
+        assert [remap(n) for n in (1, 2, 3)] == [2, 3, 6]
+
+    def test_deletion(self) -> None:
+        remap = _line_mapper([DiffHunk(2, 2, 1, 0, "", "", ())])
+
+        assert [remap(n) for n in (1, 2, 3, 4)] == [1, None, None, 2]
+
+
+class TestIncrementalGate:
+    def test_full_run_stores_database(self, repo: Path) -> None:
+        _gate(repo)
+
+        meta = load_database_meta(repo)
+        assert meta == {"tree": snapshot_tree(repo), "source": "calc"}
+        assert database_path(repo).exists()
+
+    def test_changed_line_reruns_impacted_tests_only(
+        self, repo: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        _gate(repo)
+        (repo / "calc" / "ops.py").write_text(
+            MODULE.replace("    return a - b\n", "    diff = a - b\n    return diff\n")
+        )
+
+        with caplog.at_level(logging.INFO):
+            incremental = _gate(repo)
+
+        assert "re-running 1 impacted test target(s)" in caplog.text
+        merged_report = _report(repo)
+        index = load_index(repo)
+        assert index is not None and index.tree == snapshot_tree(repo)
+        assert index.lines["calc/ops.py"][7] == ("test_calc.py::test_sub",)
+        assert load_database_meta(repo)["tree"] == index.tree
+
+        for leftover in (".coverage", ".cov_output"):
+            subprocess.run(["rm", "-rf", str(repo / leftover)], check=True)
+        full = _gate(repo)
+
+        assert incremental == full
+        assert merged_report == _report(repo)
+        assert [f["symbol"] for f in full["findings"]] == ["mul"]
+
+    def test_unchanged_tree_reports_from_database(
+        self, repo: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        first = _gate(repo)
+
+        with caplog.at_level(logging.INFO):
+            second = _gate(repo)
+
+        assert "reporting from the coverage database" in caplog.text
+        assert "running pytest under coverage" not in caplog.text
+        assert second == first
+
+    def test_kill_switch_keeps_full_runs(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GUARDKIT_COVERAGE_INCREMENTAL", "0")
+
+        _gate(repo)
+
+        assert load_database_meta(repo) is None
+        assert load_index(repo) is not None
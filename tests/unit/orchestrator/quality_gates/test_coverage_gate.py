@@ -149,6 +149,33 @@ class TestExtractPublicSymbols:
         assert len(symbols) == 1
         assert symbols[0]["name"] == "async_public"
 
+    def test_symbol_table_cached_by_content(
+        self, tmp_worktree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged source is parsed once; callers get independent copies."""
+        import ast
+
+        parses = []
+        real_parse = ast.parse
+        monkeypatch.setattr(
+            ast, "parse", lambda *a, **k: parses.append(1) or real_parse(*a, **k)
+        )
+        source = "def cached_symbol_probe():\n    pass\n"
+        (tmp_worktree / "a.py").write_text(source, encoding="utf-8")
+        (tmp_worktree / "b.py").write_text(source, encoding="utf-8")
+
+        first = _extract_public_symbols(tmp_worktree / "a.py")
+        first[0]["executed_lines"].append(2)
+        second = _extract_public_symbols(tmp_worktree / "b.py")
+
+        assert len(parses) <= 1
+        assert second[0]["executed_lines"] == []
+
+        (tmp_worktree / "b.py").write_text(source + "\ndef other():\n    pass\n")
+        assert [s["name"] for s in _extract_public_symbols(tmp_worktree / "b.py")] == [
+            "cached_symbol_probe", "other",
+        ]
+
 
 class TestMapExecutedLines:
     """Tests for _map_executed_lines_to_symbols."""
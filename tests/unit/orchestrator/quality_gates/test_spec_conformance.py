@@ -13,13 +13,17 @@ from pathlib import Path
 
 import pytest
 
+import guardkit.orchestrator.quality_gates.spec_conformance as scg
+
 from guardkit.orchestrator.quality_gates.spec_conformance import (
     AssertCommandRule,
     ByteParityRule,
     ConformanceBlock,
     TokenCoverageRule,
+    authority_digest,
     evaluate,
     evaluate_from_snapshot,
+    load_manifest,
     load_snapshot,
     parse_conformance_block,
     snapshot_paths,
@@ -613,6 +617,7 @@ class TestSnapshotRoundTrip:
         assert loaded is not None
         block, authority_bytes = loaded
         assert authority_bytes["R-1"] == b"AUTHORITATIVE\n"
+        assert load_manifest(snap) == {"R-1": authority_digest(b"AUTHORITATIVE\n")}
 
         # Green while the subject matches.
         assert evaluate_from_snapshot(snap, wt)["status"] == "passed"
@@ -693,3 +698,149 @@ class TestSnapshotRoundTrip:
     ) -> None:
         result = evaluate_from_snapshot(tmp_path / "nope", tmp_path)
         assert result["status"] == "absent"
+
+
+# ---------------------------------------------------------------------------
+# Memoized, pooled evaluation
+# ---------------------------------------------------------------------------
+
+
+class TestMemoAndPool:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("GUARDKIT_CONFORMANCE_CACHE", raising=False)
+        monkeypatch.setenv("GUARDKIT_CONFORMANCE_WORKERS", "4")
+        monkeypatch.setattr(scg, "_rule_cache", type(scg._rule_cache)())
+
+    def _count_diffs(self, monkeypatch: pytest.MonkeyPatch) -> list:
+        calls: list = []
+        real = scg._unified_diff
+
+        def _counting(*args, **kwargs):
+            calls.append(kwargs.get("rule_id"))
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(scg, "_unified_diff", _counting)
+        return calls
+
+    def _parity_block(self) -> ConformanceBlock:
+        return parse_conformance_block(
+            {
+                "rules": [
+                    {
+                        "id": "R-1",
+                        "type": "byte_parity",
+                        "authority": "docs/golden.txt",
+                        "subject": "src/foo.py",
+                    }
+                ]
+            }
+        )
+
+    def test_unchanged_rule_is_served_from_memo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "foo.py").write_text("drift\n")
+        diffs = self._count_diffs(monkeypatch)
+        block = self._parity_block()
+
+        first = evaluate(block, {"R-1": b"golden\n"}, tmp_path)
+        first["failures"][0]["detail"] = "mutated by caller"
+        second = evaluate(block, {"R-1": b"golden\n"}, tmp_path)
+
+        assert diffs == ["R-1"]
+        assert second["status"] == "failed"
+        assert "Unified diff" in second["failures"][0]["detail"]
+
+    def test_subject_or_authority_change_invalidates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "src").mkdir()
+        subject = tmp_path / "src" / "foo.py"
+        subject.write_text("drift\n")
+        block = self._parity_block()
+
+        assert evaluate(block, {"R-1": b"golden\n"}, tmp_path)["status"] == "failed"
+        assert evaluate(block, {"R-1": b"drift\n"}, tmp_path)["status"] == "passed"
+        subject.write_text("golden\n")
+        assert evaluate(block, {"R-1": b"golden\n"}, tmp_path)["status"] == "passed"
+
+    def test_new_glob_match_invalidates_token_coverage(self, tmp_path: Path) -> None:
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").write_text("def test_a(): pass\n")
+        block = parse_conformance_block(
+            {
+                "rules": [
+                    {
+                        "id": "R-2",
+                        "type": "token_coverage",
+                        "paths": ["src/**/*.py"],
+                        "require_test_tokens": {
+                            "paths": ["tests/**/*.py"],
+                            "tokens": ["config-only tier"],
+                        },
+                    }
+                ]
+            }
+        )
+
+        assert evaluate(block, {}, tmp_path)["status"] == "failed"
+        (tmp_path / "tests" / "test_b.py").write_text("# config-only tier\n")
+        assert evaluate(block, {}, tmp_path)["status"] == "passed"
+
+    def test_failures_keep_declared_order_under_the_pool(
+        self, tmp_path: Path
+    ) -> None:
+        rules = []
+        for n in range(6):
+            rules.append(
+                {
+                    "id": f"T-{n}",
+                    "type": "token_coverage",
+                    "paths": [f"missing_{n}.py"],
+                    "require_tokens": ["X"],
+                }
+            )
+            rules.append(
+                {"id": f"C-{n}", "type": "assert_command", "command": "exit 1"}
+            )
+        result = evaluate(parse_conformance_block({"rules": rules}), {}, tmp_path)
+
+        assert [f["rule_id"] for f in result["failures"]] == [r["id"] for r in rules]
+
+    def test_missing_authority_is_absent_before_commands_run(
+        self, tmp_path: Path
+    ) -> None:
+        marker = tmp_path / "ran"
+        block = parse_conformance_block(
+            {
+                "rules": [
+                    {"id": "C-1", "type": "assert_command", "command": "touch ran"},
+                    {
+                        "id": "R-1",
+                        "type": "byte_parity",
+                        "authority": "docs/golden.txt",
+                        "subject": "src/foo.py",
+                    },
+                ]
+            }
+        )
+
+        assert evaluate(block, {}, tmp_path)["status"] == "absent"
+        assert not marker.exists()
+
+    def test_kill_switch_recomputes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GUARDKIT_CONFORMANCE_CACHE", "0")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "foo.py").write_text("drift\n")
+        diffs = self._count_diffs(monkeypatch)
+        block = self._parity_block()
+
+        evaluate(block, {"R-1": b"golden\n"}, tmp_path)
+        evaluate(block, {"R-1": b"golden\n"}, tmp_path)
+
+        assert diffs == ["R-1", "R-1"]
+        assert len(scg._rule_cache) == 0
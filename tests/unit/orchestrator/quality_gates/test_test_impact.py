@@ -0,0 +1,282 @@
+"""Tests for test impact analysis (changed-impact test selection).
+
+Covers index construction from ``coverage json --show-contexts`` output,
+selection over a real git worktree (changed lines → node ids, full-selection
+fallbacks), the coverage gate's recording run, and the Coach hook.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from guardkit.orchestrator.quality_gates.coach_validator import CoachValidator
+from guardkit.orchestrator.quality_gates.coverage_gate import run_coverage_gate
+from guardkit.orchestrator.quality_gates.test_impact import (
+    TestImpactIndex,
+    build_index,
+    load_index,
+    save_index,
+    select_impacted_tests,
+    snapshot_tree,
+)
+
+MODULE = (
+    "def add(a, b):\n"
+    "    return a + b\n"
+    "\n"
+    "\n"
+    "def sub(a, b):\n"
+    "    return a - b\n"
+)
+
+TESTS = (
+    "from calc.ops import add, sub\n"
+    "\n"
+    "\n"
+    "def test_add():\n"
+    "    assert add(1, 2) == 3\n"
+    "\n"
+    "\n"
+    "def test_sub():\n"
+    "    assert sub(3, 2) == 1\n"
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "calc").mkdir()
+    (tmp_path / "calc" / "__init__.py").write_text("")
+    (tmp_path / "calc" / "ops.py").write_text(MODULE)
+    (tmp_path / "test_calc.py").write_text(TESTS)
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(
+        tmp_path, "-c", "user.name=t", "-c", "user.email=t@example.com",
+        "commit", "-qm", "init",
+    )
+    return tmp_path
+
+
+def _index_for(repo: Path) -> TestImpactIndex:
+    """Index as the coverage gate would record it for ``repo`` right now."""
+    tree = snapshot_tree(repo)
+    assert tree is not None
+    lines: Dict[str, Dict[int, tuple]] = {
+        "calc/ops.py": {
+            1: (),
+            2: ("test_calc.py::test_add",),
+            5: (),
+            6: ("test_calc.py::test_sub",),
+        },
+    }
+    return TestImpactIndex(tree=tree, lines=lines)
+
+
+# ---------------------------------------------------------------------------
+# Index model
+# ---------------------------------------------------------------------------
+
+
+class TestBuildIndex:
+    def test_strips_phase_and_skips_empty_context(self, tmp_path: Path) -> None:
+        report = {
+            "files": {
+                "calc.py": {
+                    "executed_lines": [1, 2],
+                    "contexts": {
+                        "1": [""],
+                        "2": ["test_calc.py::test_add|run", "test_calc.py::test_add|setup"],
+                    },
+                },
+            },
+        }
+
+        index = build_index(report, "abc123", tmp_path)
+
+        assert index.lines["calc.py"][1] == ()
+        assert index.lines["calc.py"][2] == ("test_calc.py::test_add",)
+
+    def test_absolute_paths_made_relative(self, tmp_path: Path) -> None:
+        report = {
+            "files": {
+                str(tmp_path / "pkg" / "mod.py"): {"contexts": {"3": ["t.py::x|run"]}},
+                "/elsewhere/other.py": {"contexts": {"1": ["t.py::y|run"]}},
+            },
+        }
+
+        index = build_index(report, "abc123", tmp_path)
+
+        assert index.measured_files == frozenset({"pkg/mod.py"})
+
+    def test_round_trip_and_unreadable_index(self, tmp_path: Path) -> None:
+        index = TestImpactIndex(tree="abc", lines={"a.py": {4: ("t.py::x",)}})
+        save_index(tmp_path, index)
+        assert load_index(tmp_path) == index
+
+        (tmp_path / ".cov_output" / "test_impact.json").write_text("{broken")
+        assert load_index(tmp_path) is None
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+class TestSelectImpactedTests:
+    def test_changed_line_selects_covering_test_only(self, repo: Path) -> None:
+        index = _index_for(repo)
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a - b", "a - b - 0"))
+
+        selection = select_impacted_tests(repo, index)
+
+        assert selection is not None
+        assert selection.targets == ("test_calc.py::test_sub",)
+        assert selection.changed_paths == ("calc/ops.py",)
+
+    def test_untested_hunk_widens_to_file(self, repo: Path) -> None:
+        index = _index_for(repo)
+        (repo / "calc" / "ops.py").write_text("VERSION = 2\n" + MODULE)
+
+        selection = select_impacted_tests(repo, index)
+
+        assert selection is not None
+        assert set(selection.targets) == {
+            "test_calc.py::test_add", "test_calc.py::test_sub",
+        }
+
+    def test_new_test_file_is_selected(self, repo: Path) -> None:
+        index = _index_for(repo)
+        (repo / "test_more.py").write_text("def test_more():\n    assert True\n")
+
+        selection = select_impacted_tests(repo, index)
+
+        assert selection is not None
+        assert selection.targets == ("test_more.py",)
+
+    def test_run_by_products_do_not_invalidate(self, repo: Path) -> None:
+        index = _index_for(repo)
+        (repo / ".coverage").write_text("data")
+        (repo / "NOTES.md").write_text("notes")
+
+        assert select_impacted_tests(repo, index) is None
+
+    @pytest.mark.parametrize(
+        "path, content",
+        [
+            ("conftest.py", "import pytest\n"),
+            ("settings.yaml", "key: value\n"),
+            ("requirements.txt", "requests>=2\n"),
+        ],
+    )
+    def test_unvouched_change_falls_back(
+        self, repo: Path, path: str, content: str
+    ) -> None:
+        index = _index_for(repo)
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a - b", "b - a"))
+        (repo / path).write_text(content)
+
+        assert select_impacted_tests(repo, index) is None
+
+    def test_unmeasured_module_falls_back(self, repo: Path) -> None:
+        (repo / "other.py").write_text("X = 1\n")
+        index = _index_for(repo)
+        (repo / "other.py").write_text("X = 2\n")
+
+        assert select_impacted_tests(repo, index) is None
+
+    def test_missing_index_falls_back(self, repo: Path) -> None:
+        assert select_impacted_tests(repo) is None
+
+    def test_unknown_tree_falls_back(self, repo: Path) -> None:
+        index = TestImpactIndex(tree="0" * 40, lines={"calc/ops.py": {}})
+        (repo / "calc" / "ops.py").write_text(MODULE + "\n")
+
+        assert select_impacted_tests(repo, index) is None
+
+
+# ---------------------------------------------------------------------------
+# Recording through the coverage gate
+# ---------------------------------------------------------------------------
+
+
+class TestCoverageGateRecording:
+    def test_gate_records_index_when_enabled(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GUARDKIT_COACH_TEST_IMPACT", "1")
+
+        result = run_coverage_gate(
+            repo, ["calc/ops.py"], task_type="FEATURE", timeout=120
+        )
+
+        assert result is not None
+        index = load_index(repo)
+        assert index is not None
+        assert index.tree == snapshot_tree(repo)
+        assert "test_calc.py::test_sub" in index.lines["calc/ops.py"][6]
+        assert "test_calc.py::test_add" not in index.lines["calc/ops.py"][6]
+
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a + b", "b + a"))
+        selection = select_impacted_tests(repo)
+        assert selection is not None
+        assert selection.targets == ("test_calc.py::test_add",)
+
+    def test_gate_records_nothing_when_disabled(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("GUARDKIT_COACH_TEST_IMPACT", raising=False)
+
+        run_coverage_gate(repo, ["calc/ops.py"], task_type="FEATURE", timeout=120)
+
+        assert load_index(repo) is None
+
+
+# ---------------------------------------------------------------------------
+# Coach hook
+# ---------------------------------------------------------------------------
+
+
+def _validator(repo: Path, wave_size: int = 1) -> CoachValidator:
+    return CoachValidator(
+        worktree_path=repo, task_id="TASK-TIA-001", wave_size=wave_size
+    )
+
+
+class TestCoachChangedImpact:
+    def test_detect_emits_changed_impact_selection(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GUARDKIT_COACH_TEST_IMPACT", "1")
+        save_index(repo, _index_for(repo))
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a + b", "b + a"))
+
+        cmd = _validator(repo)._detect_test_command("TASK-TIA-001")
+
+        assert cmd == "pytest test_calc.py::test_add -v --tb=short"
+
+    def test_parallel_wave_keeps_regular_ladder(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GUARDKIT_COACH_TEST_IMPACT", "1")
+        save_index(repo, _index_for(repo))
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a + b", "b + a"))
+
+        assert _validator(repo, wave_size=2)._detect_impacted_tests() is None
+
+    def test_disabled_keeps_regular_ladder(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("GUARDKIT_COACH_TEST_IMPACT", raising=False)
+        save_index(repo, _index_for(repo))
+        (repo / "calc" / "ops.py").write_text(MODULE.replace("a + b", "b + a"))
+
+        assert _validator(repo)._detect_impacted_tests() is None
@@ -0,0 +1,398 @@
+"""Dependency-driven (DAG) feature scheduler.
+
+Pins the ``dag`` scheduler contract: tasks are dispatched as soon as their
+dependency frontier is satisfied (no global wave barrier), the ready set is
+ranked by longest remaining critical path, and the post-wave gates fire as
+per-group frontier checkpoints that only block the group's dependents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from guardkit.orchestrator.dag_scheduler import (
+    SCHEDULER_DAG,
+    SCHEDULER_WAVES,
+    DagScheduler,
+    critical_path_priorities,
+    resolve_scheduler_mode,
+    task_duration_seconds,
+)
+from guardkit.orchestrator.feature_loader import (
+    Feature,
+    FeatureExecution,
+    FeatureOrchestration,
+    FeatureTask,
+    SmokeGates,
+)
+from guardkit.orchestrator.feature_orchestrator import (
+    DependencyError,
+    FeatureOrchestrator,
+    TaskExecutionResult,
+)
+from guardkit.orchestrator.instrumentation.emitter import NullEmitter
+from guardkit.orchestrator.instrumentation.schemas import WaveCompletedEvent
+from guardkit.worktrees import Worktree
+
+
+# ============================================================================
+# Pure scheduling helpers
+# ============================================================================
+
+
+class TestResolveSchedulerMode:
+    def test_defaults_to_waves(self, monkeypatch):
+        monkeypatch.delenv("GUARDKIT_FEATURE_SCHEDULER", raising=False)
+        assert resolve_scheduler_mode(None) == SCHEDULER_WAVES
+
+    def test_env_selects_dag(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_FEATURE_SCHEDULER", "DAG")
+        assert resolve_scheduler_mode(None) == SCHEDULER_DAG
+
+    def test_explicit_override_beats_env(self, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_FEATURE_SCHEDULER", "dag")
+        assert resolve_scheduler_mode("waves") == SCHEDULER_WAVES
+
+    def test_invalid_value_raises(self):
+        with pytest.raises(ValueError, match="Invalid feature scheduler"):
+            resolve_scheduler_mode("fifo")
+
+
+class TestTaskDuration:
+    def test_history_wins_over_estimate(self):
+        task = FeatureTask(
+            id="T1",
+            estimated_minutes=30,
+            started_at="2026-01-01T10:00:00",
+            completed_at="2026-01-01T10:05:00",
+        )
+        assert task_duration_seconds(task, lambda minutes: 9999) == 300.0
+
+    def test_estimate_floor_used_without_history(self):
+        task = FeatureTask(id="T1", estimated_minutes=10)
+        assert task_duration_seconds(task, lambda minutes: minutes * 60) == 600.0
+
+    def test_complexity_fallback_when_floor_is_zero(self):
+        task = FeatureTask(id="T1", complexity=3, estimated_minutes=0)
+        assert task_duration_seconds(task, lambda minutes: 0) == 3 * 360.0
+
+
+class TestCriticalPath:
+    def test_priority_is_longest_downstream_chain(self):
+        deps = {"A": [], "B": [], "C": ["A"], "D": ["C"], "E": ["B"]}
+        durations = {"A": 1.0, "B": 5.0, "C": 10.0, "D": 10.0, "E": 1.0}
+
+        priorities = critical_path_priorities(deps, durations)
+
+        assert priorities["D"] == 10.0
+        assert priorities["C"] == 20.0
+        assert priorities["A"] == 21.0
+        assert priorities["B"] == 6.0
+
+    def test_unknown_dependencies_ignored(self):
+        priorities = critical_path_priorities({"A": ["GHOST"]}, {"A": 2.0})
+        assert priorities == {"A": 2.0}
+
+    def test_cycle_raises(self):
+        with pytest.raises(ValueError, match="cycle"):
+            critical_path_priorities({"A": ["B"], "B": ["A"]}, {})
+
+
+class TestDagScheduler:
+    def _scheduler(self, resolved=()):
+        return DagScheduler(
+            parallel_groups=[["A", "B"], ["C", "D"]],
+            dependencies={"A": [], "B": [], "C": ["A"], "D": ["B"]},
+            priorities={"A": 5.0, "B": 50.0, "C": 1.0, "D": 40.0},
+            resolved_checkpoints=resolved,
+        )
+
+    def test_ready_ranked_by_priority(self):
+        assert self._scheduler().ready() == ["B", "A"]
+
+    def test_dependent_waits_for_gated_frontier_checkpoint(self):
+        scheduler = self._scheduler()
+        for task_id in ("A", "B"):
+            scheduler.mark_running(task_id)
+        scheduler.mark_done("A")
+
+        # A is done but group 1 has not closed (B still running).
+        assert scheduler.ready() == []
+        assert scheduler.checkpoints_due() == []
+
+        scheduler.mark_done("B")
+        assert scheduler.checkpoints_due() == [1]
+        scheduler.start_checkpoint(1)
+        assert scheduler.checkpoints_due() == []
+        assert scheduler.ready() == []
+
+        scheduler.resolve_checkpoint(1)
+        assert scheduler.ready() == ["D", "C"]
+
+    def test_independent_task_not_held_by_unrelated_group(self):
+        scheduler = DagScheduler(
+            parallel_groups=[["A", "SLOW"], ["C"]],
+            dependencies={"A": [], "SLOW": [], "C": []},
+            priorities={},
+        )
+        # C has no dependencies, so the wave-1 barrier does not apply to it.
+        assert set(scheduler.ready()) == {"A", "SLOW", "C"}
+
+    def test_previously_completed_waves_are_pre_resolved(self):
+        scheduler = self._scheduler(resolved=[1])
+        for task_id in ("A", "B"):
+            scheduler.mark_done(task_id)
+        assert scheduler.checkpoints_due() == []
+        assert scheduler.ready() == ["D", "C"]
+
+    def test_ungated_group_does_not_hold_dependents(self):
+        scheduler = DagScheduler(
+            parallel_groups=[["A", "B"], ["C"]],
+            dependencies={"A": [], "B": [], "C": ["A"]},
+            priorities={},
+            gated_groups=[],
+        )
+        scheduler.mark_running("B")
+        scheduler.mark_done("A")
+        assert scheduler.ready() == ["C"]
+
+
+# ============================================================================
+# FeatureOrchestrator dispatch loop
+# ============================================================================
+
+
+def _task(task_id: str, deps: List[str], minutes: int = 30) -> FeatureTask:
+    return FeatureTask(
+        id=task_id,
+        name=task_id,
+        file_path=Path(f"tasks/backlog/{task_id}.md"),
+        dependencies=deps,
+        estimated_minutes=minutes,
+    )
+
+
+@pytest.fixture
+def dag_feature() -> Feature:
+    """Wave 1: QUICK + SLOW; wave 2: AFTER_QUICK depends only on QUICK."""
+    return Feature(
+        id="FEAT-DAG",
+        name="DAG Feature",
+        tasks=[
+            _task("QUICK", []),
+            _task("SLOW", []),
+            _task("AFTER_QUICK", ["QUICK"]),
+            _task("AFTER_SLOW", ["SLOW"]),
+        ],
+        orchestration=FeatureOrchestration(
+            parallel_groups=[["QUICK", "SLOW"], ["AFTER_QUICK", "AFTER_SLOW"]],
+        ),
+        execution=FeatureExecution(),
+    )
+
+
+@pytest.fixture
+def worktree(tmp_path) -> Worktree:
+    path = tmp_path / "wt"
+    path.mkdir()
+    return Worktree(
+        task_id="FEAT-DAG", branch_name="autobuild/FEAT-DAG",
+        path=path, base_branch="main",
+    )
+
+
+@pytest.fixture
+def orchestrator(tmp_path) -> FeatureOrchestrator:
+    return FeatureOrchestrator(
+        repo_root=tmp_path,
+        worktree_manager=MagicMock(),
+        scheduler="dag",
+        stop_on_failure=False,
+    )
+
+
+def _install_fake_dispatch(
+    orchestrator: FeatureOrchestrator,
+    feature: Feature,
+    delays: Dict[str, float],
+    failures: tuple = (),
+) -> List[tuple]:
+    """Replace per-task execution with a sleep; record (event, id) order."""
+    events: List[tuple] = []
+
+    async def fake_execute(wave_number, task_ids, feature_, worktree_, **kwargs):
+        (task_id,) = task_ids
+        events.append(("start", task_id))
+        await asyncio.sleep(delays.get(task_id, 0.0))
+        events.append(("end", task_id))
+        success = task_id not in failures
+        for task in feature.tasks:
+            if task.id == task_id:
+                task.status = "completed" if success else "failed"
+        return [TaskExecutionResult(
+            task_id=task_id, success=success, total_turns=1,
+            final_decision="approved" if success else "max_turns_exceeded",
+        )]
+
+    def fake_checkpoint(wave_number, task_ids, feature_, worktree_, wave_result):
+        events.append(("checkpoint", wave_number))
+        return wave_result, False
+
+    orchestrator._execute_wave_parallel = fake_execute
+    orchestrator._run_frontier_checkpoint = fake_checkpoint
+    return events
+
+
+class TestDagDispatch:
+    def test_dependent_starts_before_slow_peer_finishes(
+        self, orchestrator, dag_feature, worktree
+    ):
+        events = _install_fake_dispatch(
+            orchestrator, dag_feature, {"QUICK": 0.0, "SLOW": 0.3}
+        )
+
+        wave_results = orchestrator._dag_phase(dag_feature, worktree)
+
+        assert events.index(("start", "AFTER_QUICK")) < events.index(("end", "SLOW"))
+        assert [w.wave_number for w in wave_results] == [1, 2]
+        assert all(w.all_succeeded for w in wave_results)
+
+    def test_checkpoint_runs_once_per_group(
+        self, orchestrator, dag_feature, worktree
+    ):
+        events = _install_fake_dispatch(orchestrator, dag_feature, {})
+
+        orchestrator._dag_phase(dag_feature, worktree)
+
+        assert events.count(("checkpoint", 1)) == 1
+        assert events.count(("checkpoint", 2)) == 1
+
+    def test_smoke_gated_frontier_holds_only_its_dependents(
+        self, orchestrator, dag_feature, worktree
+    ):
+        dag_feature.smoke_gates = SmokeGates(after_wave=1, command="true")
+        events = _install_fake_dispatch(
+            orchestrator, dag_feature, {"QUICK": 0.0, "SLOW": 0.2}
+        )
+
+        orchestrator._dag_phase(dag_feature, worktree)
+
+        # Group 1's smoke checkpoint waits for SLOW, and both dependents wait
+        # for the checkpoint.
+        checkpoint = events.index(("checkpoint", 1))
+        assert events.index(("end", "SLOW")) < checkpoint
+        assert checkpoint < events.index(("start", "AFTER_QUICK"))
+        assert checkpoint < events.index(("start", "AFTER_SLOW"))
+
+    def test_stop_on_failure_halts_further_dispatch(
+        self, orchestrator, dag_feature, worktree
+    ):
+        orchestrator.stop_on_failure = True
+        events = _install_fake_dispatch(
+            orchestrator, dag_feature, {}, failures=("QUICK",)
+        )
+
+        wave_results = orchestrator._dag_phase(dag_feature, worktree)
+
+        started = {task_id for kind, task_id in events if kind == "start"}
+        assert "AFTER_QUICK" not in started
+        assert "AFTER_SLOW" not in started
+        assert len(wave_results) == 1
+        assert not wave_results[0].all_succeeded
+
+    def test_max_parallel_bounds_in_flight_tasks(
+        self, orchestrator, dag_feature, worktree
+    ):
+        orchestrator._parallel_config.static_value = 1
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        async def fake_execute(wave_number, task_ids, feature_, worktree_, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return [TaskExecutionResult(
+                task_id=task_ids[0], success=True, total_turns=1,
+                final_decision="approved",
+            )]
+
+        orchestrator._execute_wave_parallel = fake_execute
+        orchestrator._run_frontier_checkpoint = (
+            lambda n, ids, f, w, result: (result, False)
+        )
+
+        orchestrator._dag_phase(dag_feature, worktree)
+
+        assert peak == 1
+
+    def test_each_frontier_emits_wave_completed_and_persists_current_wave(
+        self, orchestrator, dag_feature, worktree
+    ):
+        orchestrator._emitter = NullEmitter(capture=True)
+        _install_fake_dispatch(orchestrator, dag_feature, {"SLOW": 0.05})
+        recorded: List[int] = []
+        real_record = orchestrator._record_current_wave
+
+        def _record(feature, wave_number):
+            recorded.append(wave_number)
+            real_record(feature, wave_number)
+
+        orchestrator._record_current_wave = _record
+
+        orchestrator._dag_phase(dag_feature, worktree)
+
+        events = [
+            e for e in orchestrator._emitter.events
+            if isinstance(e, WaveCompletedEvent)
+        ]
+        assert sorted(e.wave_id for e in events) == ["wave-1", "wave-2"]
+        assert all(e.tasks_completed == 2 for e in events)
+        assert recorded == [1, 2]
+        assert dag_feature.execution.current_wave == 2
+
+    def test_manifest_change_bootstraps_with_nothing_in_flight(
+        self, orchestrator, dag_feature, worktree
+    ):
+        events = _install_fake_dispatch(
+            orchestrator, dag_feature, {"QUICK": 0.0, "SLOW": 0.2, "AFTER_QUICK": 0.1}
+        )
+        pending = iter([True])
+        orchestrator._bootstrap_pending = lambda wt, f: next(pending, False)
+        orchestrator._bootstrap_environment = (
+            lambda wt, feature=None: events.append(("bootstrap", None))
+        )
+
+        orchestrator._dag_phase(dag_feature, worktree)
+
+        assert events.count(("bootstrap", None)) == 1
+        before = events[: events.index(("bootstrap", None))]
+        started = [t for kind, t in before if kind == "start"]
+        ended = [t for kind, t in before if kind == "end"]
+        assert ("checkpoint", 1) in before
+        assert sorted(started) == sorted(ended)  # nothing running beside it
+
+    def test_unsatisfiable_frontier_raises(self, orchestrator, worktree):
+        feature = Feature(
+            id="FEAT-BAD",
+            name="bad",
+            tasks=[_task("X", ["Y"]), _task("Z", []), _task("Y", ["Z"])],
+            orchestration=FeatureOrchestration(
+                parallel_groups=[["X", "Z"], ["Y"]],
+            ),
+            smoke_gates=SmokeGates(after_wave="all", command="true"),
+        )
+        _install_fake_dispatch(orchestrator, feature, {})
+
+        with pytest.raises(DependencyError, match="X"):
+            orchestrator._dag_phase(feature, worktree)
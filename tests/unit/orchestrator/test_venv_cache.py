@@ -0,0 +1,215 @@
+"""Venv template cache: clone a bootstrapped venv into fresh worktrees.
+
+Pins the contract that a second worktree with the same manifests, install
+commands and interpreter gets a relocated clone of the first worktree's venv
+instead of a cold install, and that anything short of a working clone falls
+back to the cold path untouched.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from guardkit.orchestrator.environment_bootstrap import (
+    DetectedManifest,
+    EnvironmentBootstrapper,
+)
+from guardkit.orchestrator.venv_cache import (
+    VenvTemplate,
+    VenvTemplateCache,
+    relocate_venv,
+)
+
+
+def _make_venv(venv_dir: Path) -> Path:
+    subprocess.run(
+        [sys.executable, "-m", "venv", "--without-pip", str(venv_dir)],
+        check=True,
+        capture_output=True,
+    )
+    return venv_dir / "bin" / "python"
+
+
+def _site_packages(venv_dir: Path) -> Path:
+    return next(venv_dir.glob("lib/python*/site-packages"))
+
+
+def _worktree(tmp_path: Path, name: str, requirements: str = "requests\n") -> Path:
+    root = tmp_path / name
+    root.mkdir()
+    (root / "requirements.txt").write_text(requirements)
+    return root
+
+
+def _manifest(root: Path) -> DetectedManifest:
+    return DetectedManifest(
+        path=root / "requirements.txt",
+        stack="python",
+        is_lock_file=False,
+        install_command=[sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+    )
+
+
+class _FakeInstaller:
+    """Stands in for pip: records calls, drops an editable .pth into the venv."""
+
+    def __init__(self) -> None:
+        self.calls: List[Path] = []
+
+    def __call__(self, bootstrapper: EnvironmentBootstrapper, manifest) -> bool:
+        root = manifest.path.parent
+        self.calls.append(root)
+        venv = root / ".venv"
+        (_site_packages(venv) / "_editable_app.pth").write_text(f"{root}/src\n")
+        script = venv / "bin" / "app"
+        script.write_text(f"#!{venv}/bin/python\nprint('app')\n")
+        script.chmod(0o755)
+        return True
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> VenvTemplateCache:
+    monkeypatch.setenv("GUARDKIT_VENV_CACHE", "1")
+    return VenvTemplateCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def installer(monkeypatch) -> _FakeInstaller:
+    fake = _FakeInstaller()
+    monkeypatch.setattr(
+        EnvironmentBootstrapper, "_run_install", lambda self, m: fake(self, m)
+    )
+    monkeypatch.setattr(
+        EnvironmentBootstrapper,
+        "_ensure_worktree_venv",
+        lambda self, worktree, requires_python=None: _make_venv(worktree / ".venv"),
+    )
+    monkeypatch.setattr(
+        "guardkit.orchestrator.env_parity.analyze_env_parity",
+        lambda *a, **k: type("P", (), {"findings": []})(),
+    )
+    return fake
+
+
+class TestRelocateVenv:
+    def test_rewrites_whole_path_components_only(self, tmp_path):
+        venv = tmp_path / "venv"
+        (venv / "bin").mkdir(parents=True)
+        site = venv / "lib" / "python3.12" / "site-packages"
+        site.mkdir(parents=True)
+        script = venv / "bin" / "tool"
+        script.write_text("#!/wt/a/.venv/bin/python\n# /wt/ab stays\n")
+        script.chmod(0o755)
+        (site / "_app.pth").write_text("/wt/a\n")
+
+        assert relocate_venv(venv, "/wt/a", "/wt/b") == 2
+
+        assert script.read_text() == "#!/wt/b/.venv/bin/python\n# /wt/ab stays\n"
+        assert (site / "_app.pth").read_text() == "/wt/b\n"
+        assert os.access(script, os.X_OK)
+
+
+class TestBootstrapWithCache:
+    def test_second_worktree_clones_instead_of_installing(
+        self, tmp_path, cache, installer
+    ):
+        first = _worktree(tmp_path, "wt1")
+        result1 = EnvironmentBootstrapper(first, venv_cache=cache).bootstrap(
+            [_manifest(first)]
+        )
+        assert result1.success and not result1.venv_cache_hit
+        assert len(cache.entries()) == 1
+
+        second = _worktree(tmp_path, "wt2")
+        result2 = EnvironmentBootstrapper(second, venv_cache=cache).bootstrap(
+            [_manifest(second)]
+        )
+
+        assert result2.success and result2.venv_cache_hit
+        assert installer.calls == [first]
+        assert result2.venv_python == str(second / ".venv" / "bin" / "python")
+        venv = second / ".venv"
+        assert (_site_packages(venv) / "_editable_app.pth").read_text() == (
+            f"{second}/src\n"
+        )
+        app = subprocess.run(
+            [str(venv / "bin" / "app")], capture_output=True, text=True, check=True
+        )
+        assert app.stdout == "app\n"
+        assert not (second / ".venv.guardkit-fresh").exists()
+
+    def test_changed_manifest_misses(self, tmp_path, cache, installer):
+        first = _worktree(tmp_path, "wt1")
+        EnvironmentBootstrapper(first, venv_cache=cache).bootstrap([_manifest(first)])
+
+        second = _worktree(tmp_path, "wt2", requirements="requests\nrich\n")
+        result = EnvironmentBootstrapper(second, venv_cache=cache).bootstrap(
+            [_manifest(second)]
+        )
+
+        assert not result.venv_cache_hit
+        assert installer.calls == [first, second]
+        assert len(cache.entries()) == 2
+
+    def test_broken_template_falls_back_to_cold_install(
+        self, tmp_path, cache, installer
+    ):
+        first = _worktree(tmp_path, "wt1")
+        EnvironmentBootstrapper(first, venv_cache=cache).bootstrap([_manifest(first)])
+        (template,) = cache.entries()
+        (cache.root / template.key / "venv" / "bin" / "python").unlink()
+
+        second = _worktree(tmp_path, "wt2")
+        result = EnvironmentBootstrapper(second, venv_cache=cache).bootstrap(
+            [_manifest(second)]
+        )
+
+        assert result.success and not result.venv_cache_hit
+        assert installer.calls == [first, second]
+        assert (second / ".venv" / "bin" / "python").exists()
+
+    def test_declared_install_is_not_cached(self, tmp_path, cache, installer):
+        root = _worktree(tmp_path, "wt1")
+        manifest = _manifest(root)
+        manifest.declared = True
+
+        EnvironmentBootstrapper(root, venv_cache=cache).bootstrap([manifest])
+
+        assert cache.entries() == []
+
+    def test_disabled_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_VENV_CACHE", "0")
+        assert VenvTemplateCache.from_env() is None
+
+
+class TestEviction:
+    def _entry(self, cache: VenvTemplateCache, key: str, size: int, age_days: float):
+        entry = cache.root / key
+        (entry / "venv").mkdir(parents=True)
+        used = time.time() - age_days * 86400
+        cache._write_meta(
+            entry,
+            VenvTemplate(
+                key=key, source_root="/wt", python_version="3.12.0",
+                size_bytes=size, created_at=used, last_used=used,
+            ),
+        )
+
+    def test_evicts_expired_then_least_recently_used(self, tmp_path):
+        cache = VenvTemplateCache(tmp_path / "cache", max_bytes=250, max_age_days=7)
+        self._entry(cache, "old", 10, age_days=30)
+        self._entry(cache, "lru", 100, age_days=3)
+        self._entry(cache, "mid", 100, age_days=2)
+        self._entry(cache, "new", 100, age_days=1)
+
+        evicted = cache.evict()
+
+        assert evicted == ["old", "lru"]
+        assert sorted(t.key for t in cache.entries()) == ["mid", "new"]
@@ -5108,6 +5108,53 @@ File modified at: /src/c.py"""
 
         assert result["tests_passed"] == 25
 
+    # -------------- Literal Anchor Gating Tests --------------
+
+    def test_unanchored_text_skips_regexes(self, parser):
+        """Text without a pattern's literal anchor never reaches that regex."""
+        for name in (
+            "PHASE_MARKER_PATTERN",
+            "TESTS_PASSED_PATTERN",
+            "COVERAGE_PATTERN",
+            "ARCH_SCORE_PATTERN",
+            "TOOL_RESULT_CREATED_PATTERN",
+        ):
+            setattr(parser, name, MagicMock(side_effect=AssertionError(name)))
+
+        parser.parse_message("collected 4 items\n" + "tests/test_x.py ....\n" * 50_000)
+
+        assert parser.to_result() == {}
+
+    def test_anchor_seek_keeps_first_match(self, parser):
+        """Searching from the first anchor finds the same match as a full scan."""
+        parser.parse_message(
+            "x = 1\nPhases of work\n===== 7 passed, 1 failed in 2s =====\n"
+            "Phase 3: Implementation\nModified: a.py Created: b.py Modified: c.py\n"
+        )
+        result = parser.to_result()
+
+        assert result["phases"]["phase_3"]["text"] == "Implementation"
+        assert result["files_modified"] == ["a.py", "c.py"]
+        assert result["files_created"] == ["b.py"]
+
+    def test_ignorecase_gate_folds_special_letters(self, parser):
+        """Gates accept letters IGNORECASE treats as ASCII (e.g. long s)."""
+        parser.parse_message("12 tests paſſed")
+
+        assert parser.to_result()["tests_passed"] == 12
+
+    def test_file_sets_are_bounded(self, parser, monkeypatch):
+        """Accumulated file sets stop growing at MAX_TRACKED_FILES."""
+        monkeypatch.setattr(TaskWorkStreamParser, "MAX_TRACKED_FILES", 3)
+
+        for i in range(10):
+            parser.parse_message(f"Modified: src/f{i}.py")
+        parser.parse_message("Modified: src/" + "x" * 5000 + ".py")
+
+        assert parser.to_result()["files_modified"] == [
+            "src/f0.py", "src/f1.py", "src/f2.py",
+        ]
+
 
 class TestParseTaskWorkStream:
     """Test AgentInvoker._parse_task_work_stream method."""
@@ -0,0 +1,78 @@
+"""Coach independent-test runs route through the warm pytest worker when
+opted in (``GUARDKIT_COACH_PYTEST_WORKER``).
+
+The worker must receive exactly the argv the cold path would have run — the
+venv interpreter pin, the gated per-test ``--timeout`` and the unique
+``--basetemp`` — plus the same environment and whole-run timeout.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from guardkit.orchestrator.quality_gates import coach_validator as cv
+from guardkit.orchestrator.quality_gates.coach_validator import CoachValidator
+
+
+def _make_validator(tmp_path: Path, wave_size: int = 1) -> CoachValidator:
+    validator = CoachValidator(
+        worktree_path=tmp_path,
+        task_id="TASK-PTW-001",
+        test_command="pytest tests/test_a.py -v",
+        wave_size=wave_size,
+    )
+    validator._coach_test_execution = "subprocess"
+    validator._pytest_timeout_available_cache = True
+    return validator
+
+
+def _completed(returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        ["python"], returncode, stdout="1 passed in 0.01s", stderr=""
+    )
+
+
+def test_worker_receives_pinned_argv_when_enabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKER", "1")
+    monkeypatch.delenv("GUARDKIT_COACH_PYTEST_TIMEOUT", raising=False)
+    validator = _make_validator(tmp_path)
+
+    with patch.object(cv, "run_pytest", return_value=_completed()) as run, \
+            patch.object(cv.subprocess, "run") as cold:
+        result = validator.run_independent_tests()
+
+    cold.assert_not_called()
+    assert result.tests_passed is True
+    interpreter, argv = run.call_args.args
+    assert interpreter == validator._pytest_interpreter()
+    assert argv[:2] == ["tests/test_a.py", "-v"]
+    assert "--timeout" in argv
+    assert "--basetemp" in argv
+    kwargs = run.call_args.kwargs
+    assert kwargs["timeout"] == validator.test_timeout
+    assert kwargs["worker_key"] == validator.worktree_path
+
+
+def test_isolated_parallel_run_shares_worktree_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("GUARDKIT_COACH_PYTEST_WORKER", "1")
+    validator = _make_validator(tmp_path, wave_size=2)
+
+    with patch.object(cv, "run_pytest", return_value=_completed()) as run:
+        validator.run_independent_tests()
+
+    # The run directory is the isolated copy, the worker key is the worktree.
+    assert run.call_args.kwargs["cwd"] != validator.worktree_path
+    assert run.call_args.kwargs["worker_key"] == validator.worktree_path
+
+
+def test_cold_subprocess_when_disabled(tmp_path, monkeypatch):
+    monkeypatch.delenv("GUARDKIT_COACH_PYTEST_WORKER", raising=False)
+    validator = _make_validator(tmp_path)
+
+    with patch.object(cv, "run_pytest") as run, \
+            patch.object(cv.subprocess, "run", return_value=_completed()) as cold:
+        validator.run_independent_tests()
+
+    run.assert_not_called()
+    cmd = cold.call_args.args[0]
+    assert cmd[:3] == [validator._pytest_interpreter(), "-m", "pytest"]
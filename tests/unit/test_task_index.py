@@ -0,0 +1,130 @@
+"""Task-file index: mtime-validated listings instead of per-lookup rglob.
+
+Directory mtimes are backdated in most tests so listings count as stable
+(outside the racy window) and the index actually serves from its cache.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from guardkit.tasks.state_bridge import TaskStateBridge
+from guardkit.tasks.task_index import (
+    TaskIndex,
+    TaskLocation,
+    get_task_index,
+    load_task_post,
+    locate_task,
+)
+from guardkit.tasks.task_loader import TaskLoader
+
+STATES = ("backlog", "in_progress", "design_approved", "completed")
+
+
+def _backdate(root: Path, seconds: float = 60) -> None:
+    """Push every mtime under root into the past (stable for the index)."""
+    past = time.time() - seconds
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+
+
+def _task(root: Path, rel: str, status: str = "backlog") -> Path:
+    path = root / "tasks" / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: {path.stem}\nstatus: {status}\n---\n\n## Requirements\nDo it\n")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    _task(root, "backlog/TASK-A-001-first.md")
+    _task(root, "completed/2025/FEAT-X/TASK-C-001-old.md", "completed")
+    for i in range(50):
+        _task(root, f"completed/2025/FEAT-X/TASK-Z-{i:03d}.md", "completed")
+    _backdate(root)
+    return root
+
+
+class TestTaskIndex:
+    def test_locates_by_state_order_and_nesting(self, repo, tmp_path):
+        index = TaskIndex(repo, cache_dir=tmp_path / "cache")
+
+        assert index.locate("TASK-A-001", STATES) == TaskLocation(
+            "backlog", repo / "tasks" / "backlog" / "TASK-A-001-first.md"
+        )
+        assert index.locate("TASK-C-001", STATES).path == (
+            repo / "tasks" / "completed" / "2025" / "FEAT-X" / "TASK-C-001-old.md"
+        )
+        assert index.locate("TASK-C-001", ("backlog",)) is None
+        assert index.locate("TASK-NOPE", STATES) is None
+
+    def test_stable_tree_is_not_relisted(self, repo, tmp_path):
+        index = TaskIndex(repo, cache_dir=tmp_path / "cache")
+        index.locate("TASK-C-001", STATES)
+
+        with patch("guardkit.tasks.task_index.os.scandir") as scandir:
+            assert index.locate("TASK-Z-042", STATES) is not None
+        scandir.assert_not_called()
+
+    def test_added_file_is_seen(self, repo, tmp_path):
+        index = TaskIndex(repo, cache_dir=tmp_path / "cache")
+        assert index.locate("TASK-B-002", STATES) is None
+
+        new = _task(repo, "completed/2025/FEAT-X/TASK-B-002.md")
+
+        assert index.locate("TASK-B-002", STATES).path == new
+
+    def test_persisted_listing_is_reused_and_revalidated(self, repo, tmp_path):
+        TaskIndex(repo, cache_dir=tmp_path / "cache").locate("TASK-Z-049", STATES)
+
+        warm = TaskIndex(repo, cache_dir=tmp_path / "cache")
+        with patch("guardkit.tasks.task_index.os.scandir") as scandir:
+            assert warm.locate("TASK-Z-001", STATES) is not None
+        scandir.assert_not_called()
+
+        (repo / "tasks" / "completed" / "2025" / "FEAT-X" / "TASK-Z-001.md").unlink()
+        assert TaskIndex(repo, cache_dir=tmp_path / "cache").locate(
+            "TASK-Z-001", STATES
+        ) is None
+
+    def test_disabled_falls_back_to_rglob(self, repo, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_TASK_INDEX", "0")
+
+        assert get_task_index(repo) is None
+        assert locate_task("TASK-A-001", repo, STATES).state == "backlog"
+
+
+class TestCallers:
+    def test_state_bridge_move_updates_index(self, repo):
+        bridge = TaskStateBridge("TASK-A-001", repo)
+        state, path = bridge._get_current_state()
+        assert state == "backlog"
+
+        moved = bridge._move_task_to_state(path, "design_approved")
+        # Same mtime tick as the earlier listing must not matter.
+        _backdate(repo)
+
+        assert bridge._get_current_state() == ("design_approved", moved)
+        assert TaskLoader._find_task_file("TASK-A-001", repo) == moved
+
+    def test_loader_reuses_parsed_frontmatter(self, repo):
+        path = repo / "tasks" / "backlog" / "TASK-A-001-first.md"
+        first = TaskLoader.load_task("TASK-A-001", repo)
+        first["frontmatter"]["status"] = "mutated"
+
+        with patch("guardkit.tasks.task_index.frontmatter.load") as load:
+            again = TaskLoader.load_task("TASK-A-001", repo)
+        load.assert_not_called()
+        assert again["frontmatter"]["status"] == "backlog"
+
+        path.write_text(path.read_text().replace("backlog", "in_progress"))
+        _backdate(repo)
+        assert load_task_post(path)[0]["status"] == "in_progress"
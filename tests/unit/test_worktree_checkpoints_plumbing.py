@@ -0,0 +1,178 @@
+"""Plumbing checkpoint engine tests (write-tree/commit-tree under a short lock).
+
+Real git repos throughout: the engine's contract is "same commit as
+``git add -A && git commit``", which only real git can prove.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from guardkit.orchestrator.checkpoint_plumbing import (
+    PlumbingCheckpointEngine,
+    PlumbingUnavailable,
+)
+from guardkit.orchestrator.evidence_repos import EvidenceRepo
+from guardkit.orchestrator.worktree_checkpoints import (
+    _CHECKPOINT_ADD_ARGV,
+    WorktreeCheckpointManager,
+)
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(path), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _init_repo(path: Path, commit: bool = True) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, "init", "-q")
+    _git(path, "config", "user.email", "t@t")
+    _git(path, "config", "user.name", "t")
+    if commit:
+        (path / ".keep").write_text("x\n")
+        _git(path, "add", "-A")
+        _git(path, "commit", "-q", "-m", "init")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _plumbing_on(monkeypatch):
+    monkeypatch.delenv("GUARDKIT_CHECKPOINT_PLUMBING", raising=False)
+
+
+class TestPlumbingCheckpoint:
+    def test_commit_matches_porcelain_semantics(self, tmp_path):
+        repo = _init_repo(tmp_path / "wt")
+        (repo / "app.py").write_text("print('hi')\n")
+        (repo / "__pycache__").mkdir()
+        (repo / "__pycache__" / "app.cpython-312.pyc").write_bytes(b"junk")
+        manager = WorktreeCheckpointManager(worktree_path=repo, task_id="TASK-P")
+
+        checkpoint = manager.create_checkpoint(turn=1, tests_passed=True)
+
+        assert checkpoint.commit_hash == _git(repo, "rev-parse", "HEAD")
+        assert _git(repo, "log", "-1", "--format=%s") == checkpoint.message
+        assert _git(repo, "ls-tree", "-r", "--name-only", "HEAD").split() == [
+            ".keep", "app.py",
+        ]
+        # Real index installed: nothing staged or modified vs the new HEAD,
+        # only untracked junk and post-commit bookkeeping remain.
+        status = _git(repo, "status", "--porcelain").splitlines()
+        assert "?? __pycache__/" in status
+        assert all(line.startswith("??") for line in status)
+        assert "commit: [guardkit-checkpoint]" in _git(repo, "reflog", "-1")
+        assert not list((repo / ".git").glob("guardkit-checkpoint-index.*"))
+
+    def test_empty_turn_still_commits(self, tmp_path):
+        repo = _init_repo(tmp_path / "wt")
+        manager = WorktreeCheckpointManager(worktree_path=repo, task_id="TASK-P")
+        first = manager.create_checkpoint(turn=1, tests_passed=None)
+        second = manager.create_checkpoint(turn=2, tests_passed=None)
+
+        assert first.commit_hash != second.commit_hash
+        assert _git(repo, "rev-parse", "HEAD~1") == first.commit_hash
+
+    def test_restages_when_head_moved_after_snapshot(self, tmp_path):
+        repo = _init_repo(tmp_path / "wt")
+        (repo / "a.txt").write_text("a\n")
+        engine = PlumbingCheckpointEngine(repo)
+        snapshot = engine.snapshot(_CHECKPOINT_ADD_ARGV)
+
+        (repo / "b.txt").write_text("b\n")
+        _git(repo, "add", "b.txt")
+        _git(repo, "commit", "-q", "-m", "other task")
+        (repo / "c.txt").write_text("c\n")
+        moved_head = _git(repo, "rev-parse", "HEAD")
+
+        commit = engine.commit(snapshot, "ckpt", _CHECKPOINT_ADD_ARGV)
+
+        assert _git(repo, "rev-parse", f"{commit}^") == moved_head
+        assert set(_git(repo, "ls-tree", "--name-only", commit).split()) == {
+            ".keep", "a.txt", "b.txt", "c.txt",
+        }
+
+    def test_commit_hooks_force_porcelain(self, tmp_path):
+        repo = _init_repo(tmp_path / "wt")
+        hook = repo / ".git" / "hooks" / "pre-commit"
+        hook.write_text("#!/bin/sh\ntouch \"$(git rev-parse --git-dir)/hook-ran\"\n")
+        hook.chmod(0o755)
+
+        with pytest.raises(PlumbingUnavailable):
+            PlumbingCheckpointEngine(repo).snapshot(_CHECKPOINT_ADD_ARGV)
+
+        WorktreeCheckpointManager(worktree_path=repo, task_id="T").create_checkpoint(
+            turn=1, tests_passed=True
+        )
+        assert (repo / ".git" / "hook-ran").exists()
+
+    def test_unborn_head_falls_back_to_porcelain(self, tmp_path):
+        repo = _init_repo(tmp_path / "wt", commit=False)
+        (repo / "first.txt").write_text("1\n")
+
+        checkpoint = WorktreeCheckpointManager(
+            worktree_path=repo, task_id="T"
+        ).create_checkpoint(turn=1, tests_passed=True)
+
+        assert checkpoint.commit_hash == _git(repo, "rev-parse", "HEAD")
+
+    def test_kill_switch_uses_porcelain(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GUARDKIT_CHECKPOINT_PLUMBING", "0")
+        repo = _init_repo(tmp_path / "wt")
+        manager = WorktreeCheckpointManager(worktree_path=repo, task_id="T")
+
+        with patch.object(PlumbingCheckpointEngine, "snapshot") as snapshot:
+            checkpoint = manager.create_checkpoint(turn=1, tests_passed=True)
+
+        snapshot.assert_not_called()
+        assert checkpoint.commit_hash == _git(repo, "rev-parse", "HEAD")
+
+
+def test_evidence_repos_committed_concurrently(tmp_path):
+    worktree = _init_repo(tmp_path / "wt")
+    repos = [
+        EvidenceRepo(name=f"sib{i}", root=_init_repo(tmp_path / f"sib{i}"))
+        for i in range(3)
+    ]
+    for repo in repos:
+        (repo.root / "work.txt").write_text(repo.name)
+    manager = WorktreeCheckpointManager(
+        worktree_path=worktree, task_id="TASK-E", evidence_repos=repos
+    )
+
+    checkpoint = manager.create_checkpoint(turn=1, tests_passed=True)
+
+    assert set(checkpoint.evidence_commits) == {"sib0", "sib1", "sib2"}
+    for repo in repos:
+        assert checkpoint.evidence_commits[repo.name] == _git(repo.root, "rev-parse", "HEAD")
+        assert _git(repo.root, "show", "HEAD:work.txt") == repo.name
+
+
+def test_failed_worktree_commit_leaves_evidence_repos_untouched(tmp_path):
+    worktree = _init_repo(tmp_path / "wt")
+    repos = [
+        EvidenceRepo(name=f"sib{i}", root=_init_repo(tmp_path / f"sib{i}"))
+        for i in range(2)
+    ]
+    heads = {}
+    for repo in repos:
+        (repo.root / "work.txt").write_text(repo.name)
+        heads[repo.name] = _git(repo.root, "rev-parse", "HEAD")
+    manager = WorktreeCheckpointManager(
+        worktree_path=worktree, task_id="TASK-E", evidence_repos=repos
+    )
+    failure = subprocess.CalledProcessError(1, ["git", "commit-tree"])
+
+    with patch.object(manager, "_execute_git_checkpoint", side_effect=failure):
+        with pytest.raises(subprocess.CalledProcessError):
+            manager.create_checkpoint(turn=1, tests_passed=True)
+
+    for repo in repos:
+        assert _git(repo.root, "rev-parse", "HEAD") == heads[repo.name]
+        assert _git(repo.root, "status", "--porcelain") == "?? work.txt"
+        assert not list((repo.root / ".git").glob("guardkit-checkpoint-index.*"))